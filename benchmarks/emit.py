@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+
+"""
+Microbenchmark of :meth:`spotify.utils.EventEmitter.emit`.
+
+The benchmark emits an event with two arguments to 0, 1, and 10 listeners,
+each registered with one user argument, and reports the time per emit. This
+is done once with the previous event emitter, which stored the listeners in
+lists that were copied on every emit, and once with
+:class:`spotify.utils.EventEmitter`, which stores them in tuples that are
+replaced when listeners are added or removed::
+
+    python benchmarks/emit.py
+"""
+
+from __future__ import print_function, unicode_literals
+
+import collections
+import timeit
+
+from spotify import utils
+
+
+NUM_EMITS = 100000
+NUM_LISTENERS = [0, 1, 10]
+
+
+class ListEventEmitter(utils.EventEmitter):
+    """The event emitter as it was before listeners were stored in tuples."""
+
+    def __init__(self):
+        self._listeners = collections.defaultdict(list)
+
+    def on(self, event, listener, *user_args):
+        self._listeners[event].append(utils._Listener(
+            callback=listener, user_args=user_args, once=False))
+
+    def emit(self, event, *event_args):
+        queue = utils._deferred.queue
+        if queue is not None:
+            queue.append((self, event, event_args))
+            return
+        listeners = self._listeners[event][:]
+        dispatcher = self._get_dispatcher(event)
+        for listener in listeners:
+            args = list(event_args) + list(listener.user_args)
+            if dispatcher is not None:
+                dispatcher.dispatch(self, event, listener, args)
+                continue
+            result = listener.callback(*args)
+            if result is False:
+                self.off(event, listener.callback)
+
+
+def listener(*args):
+    pass
+
+
+def run(emitter_class, num_listeners):
+    emitter = emitter_class()
+    for i in range(num_listeners):
+        emitter.on('event', listener, i)
+    duration = timeit.timeit(
+        lambda: emitter.emit('event', 'foo', 'bar'), number=NUM_EMITS)
+    return duration / NUM_EMITS
+
+
+def main():
+    print('%-10s %12s %12s %12s' % ('listeners', 'list', 'tuple', 'speedup'))
+    for num_listeners in NUM_LISTENERS:
+        before = run(ListEventEmitter, num_listeners)
+        after = run(utils.EventEmitter, num_listeners)
+        print('%-10d %9.2f us %9.2f us %11.2fx' % (
+            num_listeners, before * 1e6, after * 1e6, before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+"""
+Benchmark of the time and memory it takes to import the parts of pyspotify a
+program uses.
+
+pyspotify imports its submodules the first time one of their public names is
+accessed, like ``spotify.Track``. This benchmark compares a program which only
+uses :class:`spotify.Link` and :class:`spotify.Track` with a program which
+imports all of pyspotify, like ``import spotify`` did before the submodules
+were imported lazily.
+
+Each import is measured in a fresh Python process. The time includes loading
+libspotify, but not starting the Python interpreter. The memory is the peak
+resident set size of the process, as reported by :func:`resource.getrusage`,
+and is only available on Unix systems.
+
+The lazy imports require Python 3.7 or newer. On older Python versions, both
+programs import all of pyspotify.
+
+The benchmark uses the pyspotify source checkout it is a part of. Run it
+with::
+
+    python benchmarks/import_footprint.py
+"""
+
+from __future__ import print_function, unicode_literals
+
+import os
+import subprocess
+import sys
+
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+NUM_RUNS = 10
+
+MEASURE = '''
+import resource, sys, time
+start = time.time()
+%s
+duration = time.time() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == 'darwin':
+    rss //= 1024
+modules = len([name for name in sys.modules if name.startswith('spotify')])
+print(duration, rss, modules)
+'''
+
+PROGRAMS = [
+    ('Link + Track', 'import spotify; spotify.Link; spotify.Track'),
+    ('everything', (
+        'import spotify\n'
+        'for name in spotify._SUBMODULES:\n'
+        '    spotify._import_submodule(name)')),
+]
+
+
+def measure(code):
+    output = subprocess.check_output(
+        [sys.executable, '-c', MEASURE % code], cwd=ROOT_DIR)
+    duration, rss, modules = output.split()
+    return float(duration), int(rss), int(modules)
+
+
+def benchmark(code):
+    results = sorted(measure(code) for _ in range(NUM_RUNS))
+    duration = results[len(results) // 2][0]
+    rss = min(rss for _, rss, _ in results)
+    modules = results[0][2]
+    return duration, rss, modules
+
+
+def main():
+    # Compile the library and the bytecode before measuring anything
+    measure(PROGRAMS[-1][1])
+
+    print('%-14s %15s %14s %8s' % ('program', 'import (median)', 'peak RSS',
+                                   'modules'))
+    for name, code in PROGRAMS:
+        duration, rss, modules = benchmark(code)
+        print('%-14s %14.3fs %11d KB %8d' % (name, duration, rss, modules))
+
+
+if __name__ == '__main__':
+    main()
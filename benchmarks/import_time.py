@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+"""
+Benchmark of the time it takes to import pyspotify.
+
+The import time is measured in fresh Python processes, both with the
+precompiled ``spotify._spotify`` module and with the fallback which parses the
+libspotify header and compiles the library with ``ffi.verify()`` at import
+time.
+
+A *cold* import is the first import after removing the ``spotify/__pycache__``
+directory, which holds both the Python bytecode and the library compiled by
+``ffi.verify()``. A *warm* import is any later import.
+
+The benchmark uses the pyspotify source checkout it is a part of. To build the
+precompiled module in the source checkout, run::
+
+    python setup.py build_ext --inplace
+
+Then run the benchmark::
+
+    python benchmarks/import_time.py
+"""
+
+from __future__ import print_function, unicode_literals
+
+import glob
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+PACKAGE_DIR = os.path.join(ROOT_DIR, 'spotify')
+NUM_WARM_RUNS = 10
+
+IMPORT_PRECOMPILED = 'import spotify'
+IMPORT_VERIFIED = (
+    'import sys; '
+    'sys.modules["spotify._spotify"] = None; '
+    'import spotify')
+
+
+def clear_caches():
+    shutil.rmtree(os.path.join(PACKAGE_DIR, '__pycache__'), True)
+    for filename in glob.glob(os.path.join(PACKAGE_DIR, '*.pyc')):
+        os.remove(filename)
+
+
+def time_import(code):
+    start = time.time()
+    subprocess.check_call([sys.executable, '-c', code], cwd=ROOT_DIR)
+    return time.time() - start
+
+
+def benchmark(code):
+    clear_caches()
+    cold = time_import(code)
+    warm = sorted(time_import(code) for _ in range(NUM_WARM_RUNS))
+    return cold, warm[len(warm) // 2]
+
+
+def main():
+    # Baseline for starting the Python interpreter without importing anything
+    interpreter = min(time_import('pass') for _ in range(NUM_WARM_RUNS))
+
+    modes = [('verify()', IMPORT_VERIFIED)]
+    if glob.glob(os.path.join(PACKAGE_DIR, '_spotify*.so')):
+        modes.append(('precompiled', IMPORT_PRECOMPILED))
+    else:
+        print(
+            'Precompiled module not found; '
+            'run "python setup.py build_ext --inplace" to build it.')
+
+    print('Interpreter startup: %.3fs (not subtracted below)' % interpreter)
+    print('%-12s %10s %14s' % ('mode', 'cold', 'warm (median)'))
+    for name, code in modes:
+        cold, warm = benchmark(code)
+        print('%-12s %9.3fs %13.3fs' % (name, cold, warm))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+
+"""
+Benchmark of the CPU time used by threads waiting in ``load()`` for an object
+to finish loading.
+
+The benchmark starts 100 threads that each call :func:`spotify.utils.load`
+on a track that finishes loading after two seconds, and reports the CPU time
+used by the process while the threads are waiting. This is done once without
+an event loop, where ``load()`` polls by processing events and sleeping for
+1 ms at a time, and once with an event loop running, where ``load()`` waits
+for the event loop to report that something has finished loading.
+
+To run without logging in to Spotify, the benchmark uses a stand-in for the
+session, and a stand-in for the track whose ``is_loaded`` becomes true when
+a timer fires and notifies the waiting threads, like libspotify's
+``metadata_updated`` callback does.
+
+The benchmark requires Python 3.3 or newer::
+
+    python benchmarks/load_cpu.py
+"""
+
+from __future__ import print_function, unicode_literals
+
+import threading
+import time
+
+import spotify
+from spotify import utils
+
+
+NUM_THREADS = 100
+LOAD_TIME = 2.0
+
+
+class StandInEventLoop(threading.Thread):
+    daemon = True
+
+    def __init__(self):
+        threading.Thread.__init__(self)
+        self.stopped = threading.Event()
+
+    def run(self):
+        self.stopped.wait()
+
+
+class StandInSession(object):
+    connection_state = spotify.ConnectionState.LOGGED_IN
+
+    def __init__(self, event_loop=None):
+        self._event_loop = event_loop
+        self._load_condition = threading.Condition()
+        self._load_generation = 0
+
+    def process_events(self):
+        return 0
+
+    def _notify_loaded(self):
+        with self._load_condition:
+            self._load_generation += 1
+            self._load_condition.notify_all()
+
+
+class SlowTrack(object):
+
+    def __init__(self, session):
+        self._session = session
+        self._loaded = threading.Event()
+
+    @property
+    def is_loaded(self):
+        return self._loaded.is_set()
+
+    def finish_loading(self):
+        self._loaded.set()
+        self._session._notify_loaded()
+
+
+def run(with_event_loop):
+    event_loop = None
+    if with_event_loop:
+        event_loop = StandInEventLoop()
+        event_loop.start()
+    session = StandInSession(event_loop)
+    track = SlowTrack(session)
+    threads = [
+        threading.Thread(
+            target=utils.load, args=(session, track), kwargs={'timeout': 10})
+        for _ in range(NUM_THREADS)]
+
+    start_cpu = time.process_time()
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    timer = threading.Timer(LOAD_TIME, track.finish_loading)
+    timer.start()
+    for thread in threads:
+        thread.join()
+    duration = time.time() - start
+    cpu_time = time.process_time() - start_cpu
+
+    if event_loop is not None:
+        event_loop.stopped.set()
+        event_loop.join()
+    return duration, cpu_time
+
+
+def main():
+    print('%-12s %12s %12s %10s' % (
+        'event loop', 'wall time', 'CPU time', 'CPU'))
+    for with_event_loop in [False, True]:
+        duration, cpu_time = run(with_event_loop)
+        print('%-12s %10.2f s %10.2f s %9.0f%%' % (
+            'yes' if with_event_loop else 'no', duration, cpu_time,
+            100 * cpu_time / duration))
+
+
+if __name__ == '__main__':
+    main()
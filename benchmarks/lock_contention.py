@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+"""
+Benchmark of lock contention between threads calling libspotify metadata
+functions.
+
+The benchmark starts 1, 4, and 16 reader threads that call the libspotify
+metadata function ``sp_error_message()`` as fast as they can for a few
+seconds, and reports the total throughput. This is done once with the default
+:attr:`spotify.LockMode.GLOBAL` lock mode and once with the
+:attr:`spotify.LockMode.GROUPED` lock mode.
+
+``sp_error_message()`` doesn't need a session, so the benchmark can run
+without logging in to Spotify::
+
+    python benchmarks/lock_contention.py
+"""
+
+from __future__ import print_function, unicode_literals
+
+import threading
+import time
+
+import spotify
+
+
+DURATION = 2.0
+THREAD_COUNTS = [1, 4, 16]
+
+
+def reader(deadline, counts, index):
+    func = spotify.lib.sp_error_message
+    calls = 0
+    while time.time() < deadline:
+        for _ in range(100):
+            func(0)
+        calls += 100
+    counts[index] = calls
+
+
+def run(num_threads):
+    counts = [0] * num_threads
+    deadline = time.time() + DURATION
+    threads = [
+        threading.Thread(target=reader, args=(deadline, counts, i))
+        for i in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / DURATION
+
+
+def main():
+    results = {}
+    for lock_mode in [spotify.LockMode.GLOBAL, spotify.LockMode.GROUPED]:
+        spotify.set_lock_mode(lock_mode)
+        for num_threads in THREAD_COUNTS:
+            results[(lock_mode, num_threads)] = run(num_threads)
+    spotify.set_lock_mode(spotify.LockMode.GLOBAL)
+
+    print('%-8s %16s %16s %8s' % (
+        'threads', 'global calls/s', 'grouped calls/s', 'ratio'))
+    for num_threads in THREAD_COUNTS:
+        global_rate = results[(spotify.LockMode.GLOBAL, num_threads)]
+        grouped_rate = results[(spotify.LockMode.GROUPED, num_threads)]
+        print('%-8d %16.0f %16.0f %8.2f' % (
+            num_threads, global_rate, grouped_rate,
+            grouped_rate / global_rate))
+
+
+if __name__ == '__main__':
+    main()
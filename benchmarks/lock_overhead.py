@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+
+"""
+Benchmark of the per-call overhead of pyspotify's locking in each lock mode.
+
+The benchmark measures the time of a call to the libspotify function
+``sp_error_message()`` through :attr:`spotify.lib`, and of a call to a
+trivial function decorated with :func:`spotify.serialized`, in each of the
+:class:`spotify.LockMode` lock modes. The time of a call to the unwrapped
+libspotify function is included as a baseline.
+
+``sp_error_message()`` doesn't need a session, so the benchmark can run
+without logging in to Spotify::
+
+    python benchmarks/lock_overhead.py
+"""
+
+from __future__ import print_function, unicode_literals
+
+import timeit
+
+import spotify
+
+
+NUM_CALLS = 200000
+NUM_REPEATS = 5
+
+LOCK_MODES = [
+    spotify.LockMode.GLOBAL,
+    spotify.LockMode.GROUPED,
+    spotify.LockMode.SINGLE_THREADED,
+]
+
+
+@spotify.serialized
+def serialized_func():
+    pass
+
+
+def time_per_call(func, *args):
+    timer = timeit.Timer(lambda: func(*args))
+    best = min(timer.repeat(repeat=NUM_REPEATS, number=NUM_CALLS))
+    return best / NUM_CALLS * 1e9
+
+
+def main():
+    baseline = time_per_call(spotify._lib_functions['sp_error_message'], 0)
+    print('Unwrapped sp_error_message(): %.0f ns per call' % baseline)
+    print()
+    print('%-16s %18s %10s %18s' % (
+        'lock mode', 'sp_error_message()', 'overhead', '@serialized'))
+    for lock_mode in LOCK_MODES:
+        spotify.set_lock_mode(lock_mode)
+        lib_call = time_per_call(spotify.lib.sp_error_message, 0)
+        serialized_call = time_per_call(serialized_func)
+        print('%-16s %15.0f ns %7.0f ns %15.0f ns' % (
+            lock_mode, lib_call, lib_call - baseline, serialized_call))
+    spotify.set_lock_mode(spotify.LockMode.GLOBAL)
+
+
+if __name__ == '__main__':
+    main()
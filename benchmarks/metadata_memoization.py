@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+
+"""
+Benchmark of repeated reads of track metadata, with and without
+:attr:`spotify.Session.memoize_metadata`.
+
+The benchmark loads a playlist, repeats its tracks until there are 10000
+tracks, and reads the ``name``, ``duration``, ``popularity``, ``starred``,
+and ``availability`` of all the tracks a few times. This is done once with
+memoization disabled and once with it enabled, and the time per track and
+round is reported for both, together with the number of calls into
+libspotify counted by :func:`spotify.profile`.
+
+The benchmark needs to log in to Spotify. Assuming a
+``spotify_appkey.key`` in the current dir, and a previous login with
+``remember_me=True``, give the benchmark the URI of a playlist to read::
+
+    python benchmarks/metadata_memoization.py \\
+        spotify:user:fiat500c:playlist:54k50VZdvtnIPt4d8RBCmZ
+"""
+
+from __future__ import print_function, unicode_literals
+
+import itertools
+import sys
+import time
+
+import spotify
+
+
+NUM_TRACKS = 10000
+NUM_ROUNDS = 5
+FIELDS = ['name', 'duration', 'popularity', 'starred', 'availability']
+
+
+def login():
+    session = spotify.Session()
+    loop = spotify.EventLoop(session)
+    loop.start()
+    session.relogin()
+    deadline = time.time() + 10
+    while session.connection_state is not spotify.ConnectionState.LOGGED_IN:
+        if time.time() > deadline:
+            sys.exit('Login failed')
+        time.sleep(0.1)
+    return session
+
+
+def get_tracks(session, playlist_uri):
+    playlist = session.get_playlist(playlist_uri).load()
+    tracks = [track.load() for track in playlist.tracks]
+    if not tracks:
+        sys.exit('The playlist is empty')
+    return list(itertools.islice(itertools.cycle(tracks), NUM_TRACKS))
+
+
+def read_fields(tracks):
+    for track in tracks:
+        for field in FIELDS:
+            getattr(track, field)
+
+
+def run(session, tracks, memoize):
+    session.memoize_metadata = memoize
+    read_fields(tracks)  # Warm up, and fill in the memoized values
+    with spotify.profile() as profile:
+        start = time.time()
+        for _ in range(NUM_ROUNDS):
+            read_fields(tracks)
+        duration = time.time() - start
+    session.memoize_metadata = False
+    return duration / NUM_ROUNDS / len(tracks), profile.count
+
+
+def main():
+    if len(sys.argv) != 2:
+        sys.exit(__doc__)
+    session = login()
+    tracks = get_tracks(session, sys.argv[1])
+
+    print('%-12s %16s %16s' % ('memoization', 'us per track', 'lib calls'))
+    for memoize in [False, True]:
+        time_per_track, num_calls = run(session, tracks, memoize)
+        print('%-12s %16.2f %16d' % (
+            'on' if memoize else 'off', time_per_track * 1000000, num_calls))
+
+
+if __name__ == '__main__':
+    main()
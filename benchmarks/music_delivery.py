@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+
+"""
+Benchmark of the throughput of the
+:attr:`~spotify.SessionEvent.MUSIC_DELIVERY` event.
+
+The benchmark delivers chunks of 2048 frames of 44.1 kHz stereo audio to a
+listener that does nothing, and reports the number of chunks and seconds of
+audio delivered per second, using the best of 5 runs. This is done once as
+audio was delivered before the music delivery formats were added, with a new
+:class:`spotify.AudioFormat` and a new bytestring for each chunk, and once
+for each :class:`spotify.MusicDeliveryFormat`.
+
+To run without logging in to Spotify, the benchmark does the work of the
+``music_delivery`` session callback using a stand-in for the session::
+
+    python benchmarks/music_delivery.py
+"""
+
+from __future__ import print_function, unicode_literals
+
+import timeit
+
+import spotify
+from spotify import ffi, utils
+from spotify.audio import _MusicDelivery
+
+
+NUM_DELIVERIES = 20000
+REPEAT = 5
+NUM_FRAMES = 2048
+SAMPLE_RATE = 44100
+CHANNELS = 2
+
+
+class StandInSession(utils.EventEmitter):
+    pass
+
+
+def null_listener(session, audio_format, frames, num_frames):
+    return num_frames
+
+
+def deliver_copy(session, sp_audioformat, frames, num_frames):
+    """Music delivery as it was before the music delivery formats."""
+    if session.num_listeners(spotify.SessionEvent.MUSIC_DELIVERY) == 0:
+        return 0
+    audio_format = spotify.AudioFormat(sp_audioformat)
+    buffer_ = ffi.buffer(frames, audio_format.frame_size() * num_frames)
+    frames_bytes = buffer_[:]
+    return session.call(
+        spotify.SessionEvent.MUSIC_DELIVERY,
+        session, audio_format, frames_bytes, num_frames)
+
+
+def make_deliver(delivery_format):
+    music_delivery = _MusicDelivery()
+
+    def deliver(session, sp_audioformat, frames, num_frames):
+        if session.num_listeners(spotify.SessionEvent.MUSIC_DELIVERY) == 0:
+            return 0
+        audio_format = music_delivery.get_audio_format(sp_audioformat)
+        frames = music_delivery.get_frames(
+            delivery_format, frames, num_frames)
+        return session.call(
+            spotify.SessionEvent.MUSIC_DELIVERY,
+            session, audio_format, frames, num_frames)
+
+    return deliver
+
+
+def run(deliver):
+    session = StandInSession()
+    session.on(spotify.SessionEvent.MUSIC_DELIVERY, null_listener)
+    sp_audioformat = ffi.new('sp_audioformat *')
+    sp_audioformat.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
+    sp_audioformat.sample_rate = SAMPLE_RATE
+    sp_audioformat.channels = CHANNELS
+    frames = ffi.cast(
+        'void *', ffi.new('int16_t[]', NUM_FRAMES * CHANNELS))
+    return min(timeit.repeat(
+        lambda: deliver(session, sp_audioformat, frames, NUM_FRAMES),
+        repeat=REPEAT, number=NUM_DELIVERIES))
+
+
+def main():
+    candidates = [('copy', deliver_copy)]
+    for delivery_format in [
+            spotify.MusicDeliveryFormat.BYTES,
+            spotify.MusicDeliveryFormat.MEMORYVIEW,
+            spotify.MusicDeliveryFormat.NUMPY]:
+        if delivery_format == spotify.MusicDeliveryFormat.NUMPY:
+            try:
+                import numpy  # noqa
+            except ImportError:
+                print('Skipping numpy: NumPy is not installed')
+                continue
+        candidates.append((delivery_format, make_deliver(delivery_format)))
+
+    print('%-12s %14s %16s' % ('format', 'chunks/s', 'audio s/s'))
+    for name, deliver in candidates:
+        duration = run(deliver)
+        chunks_per_second = NUM_DELIVERIES / duration
+        print('%-12s %14.0f %16.0f' % (
+            name, chunks_per_second,
+            chunks_per_second * NUM_FRAMES / SAMPLE_RATE))
+
+
+if __name__ == '__main__':
+    main()
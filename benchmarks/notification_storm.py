@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+
+"""
+Benchmark of the number of ``process_events()`` calls made by the event loop
+during a storm of ``notify_main_thread`` notifications.
+
+The benchmark sends 10000 notifications from 4 threads, in bursts of 100,
+to an event loop whose session spends 1 ms in each ``process_events()``
+call, and reports the number of ``process_events()`` calls made until all
+notifications are handled. This is done once with the previous event loop,
+which queued one item per notification and called ``process_events()`` once
+per item, and once with :class:`spotify.EventLoop`, which coalesces the
+notifications that arrive while it processes events into a single wakeup.
+
+To run without logging in to Spotify, the benchmark uses a stand-in for the
+session::
+
+    python benchmarks/notification_storm.py
+"""
+
+from __future__ import print_function, unicode_literals
+
+import threading
+import time
+
+try:
+    # Python 3
+    import queue
+except ImportError:
+    # Python 2
+    import Queue as queue
+
+import spotify
+
+
+NUM_NOTIFICATIONS = 10000
+NUM_THREADS = 4
+BURST_SIZE = 100
+PROCESS_TIME = 0.001
+
+
+class StandInSession(object):
+    _event_loop = None
+
+    def __init__(self):
+        self.num_calls = 0
+
+    def on(self, event, listener):
+        pass
+
+    def off(self, event, listener):
+        pass
+
+    def process_events(self):
+        self.num_calls += 1
+        time.sleep(PROCESS_TIME)
+        return 1000
+
+
+class QueueEventLoop(spotify.EventLoop):
+    """The event loop as it was before notifications were coalesced."""
+
+    def __init__(self, session):
+        spotify.EventLoop.__init__(self, session)
+        self._queue = queue.Queue()
+
+    def stop(self):
+        spotify.EventLoop.stop(self)
+        self._queue.put_nowait(1)
+
+    def run(self):
+        timeout = self._session.process_events() / 1000.0
+        while self._runnable:
+            try:
+                self._queue.get(timeout=timeout)
+            except queue.Empty:
+                pass
+            finally:
+                timeout = self._session.process_events() / 1000.0
+
+    def _on_notify_main_thread(self, session):
+        self._queue.put_nowait(1)
+
+
+def notify(event_loop, session):
+    for _ in range(NUM_NOTIFICATIONS // NUM_THREADS // BURST_SIZE):
+        for _ in range(BURST_SIZE):
+            event_loop._on_notify_main_thread(session)
+        time.sleep(PROCESS_TIME)
+
+
+def run(event_loop_class):
+    session = StandInSession()
+    event_loop = event_loop_class(session)
+    event_loop.start()
+    threads = [
+        threading.Thread(target=notify, args=(event_loop, session))
+        for _ in range(NUM_THREADS)]
+
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if isinstance(event_loop, QueueEventLoop):
+        while not event_loop._queue.empty():
+            time.sleep(PROCESS_TIME)
+    else:
+        while event_loop._wakeup.is_set():
+            time.sleep(PROCESS_TIME)
+    time.sleep(10 * PROCESS_TIME)
+    duration = time.time() - start
+
+    event_loop.stop()
+    event_loop.join()
+    return session.num_calls, duration, event_loop
+
+
+def main():
+    print('%-12s %12s %12s %12s' % (
+        'event loop', 'calls', 'wall time', 'latency'))
+    for event_loop_class in [QueueEventLoop, spotify.EventLoop]:
+        num_calls, duration, event_loop = run(event_loop_class)
+        if isinstance(event_loop, QueueEventLoop):
+            name, latency = 'queue', '-'
+        else:
+            stats = event_loop.stats
+            name = 'coalescing'
+            latency = '%.2f ms' % (
+                1000 * stats.notify_latency / max(stats.wakeups, 1))
+        print('%-12s %12d %10.2f s %12s' % (
+            name, num_calls, duration, latency))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+"""
+Benchmark of :class:`spotify.AudioProcessor`.
+
+The benchmark processes 60 seconds of 44.1 kHz stereo audio in chunks of 2048
+frames, as delivered by libspotify, with a few processing setups. It reports
+the mean and longest time spent per chunk, and the longest time as a share of
+the chunk's duration, which must stay well below 100% for playback to keep
+up. NumPy must be installed::
+
+    python benchmarks/processing.py
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import numpy
+
+import spotify
+from spotify import ffi
+
+
+AUDIO_DURATION = 60
+NUM_FRAMES = 2048
+SAMPLE_RATE = 44100
+CHANNELS = 2
+
+
+def run(processor):
+    sp_audioformat = ffi.new('sp_audioformat *')
+    sp_audioformat.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
+    sp_audioformat.sample_rate = SAMPLE_RATE
+    sp_audioformat.channels = CHANNELS
+    audio_format = spotify.AudioFormat(sp_audioformat)
+    t = numpy.arange(NUM_FRAMES * CHANNELS) / SAMPLE_RATE
+    frames = (16384 * numpy.sin(2 * numpy.pi * 440 * t)).astype(
+        numpy.int16).tobytes()
+    num_chunks = AUDIO_DURATION * SAMPLE_RATE // NUM_FRAMES
+
+    for _ in range(num_chunks):
+        processor.process(audio_format, frames, NUM_FRAMES)
+    return processor.stats
+
+
+def main():
+    candidates = [
+        ('float32', spotify.AudioProcessor()),
+        ('gain+mono', spotify.AudioProcessor(channels=1, gain=[1.0, 0.8])),
+        ('48 kHz', spotify.AudioProcessor(sample_rate=48000)),
+        ('48 kHz mono', spotify.AudioProcessor(sample_rate=48000, channels=1)),
+        ('48 kHz 32 taps', spotify.AudioProcessor(
+            sample_rate=48000, filter_taps=32)),
+    ]
+    print('%-16s %12s %12s %9s' % (
+        'setup', 'mean/chunk', 'max/chunk', 'max load'))
+    for name, processor in candidates:
+        stats = run(processor)
+        print('%-16s %9.3f ms %9.3f ms %8.2f%%' % (
+            name, 1000 * stats.process_time / stats.chunks,
+            1000 * stats.max_process_time, 100 * stats.max_load))
+
+
+if __name__ == '__main__':
+    main()
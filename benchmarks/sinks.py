@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+"""
+Benchmark of the audio sinks that don't need sound hardware.
+
+The benchmark delivers 60 seconds of 44.1 kHz stereo audio in chunks of 2048
+frames to :class:`spotify.NullSink`, :class:`spotify.RawFileSink`, and
+:class:`spotify.WavFileSink`, as libspotify would: frames that the sink
+doesn't consume are delivered again. It reports the wall time until the
+sink is turned off with all audio written, and how many times faster than
+real time the audio was delivered.
+
+To run without logging in to Spotify, the benchmark uses a stand-in for the
+session. The files are written to a temporary directory, which is removed
+afterwards::
+
+    python benchmarks/sinks.py
+"""
+
+from __future__ import print_function, unicode_literals
+
+import os
+import shutil
+import tempfile
+import time
+
+import spotify
+from spotify import ffi, utils
+
+
+AUDIO_DURATION = 60
+NUM_FRAMES = 2048
+SAMPLE_RATE = 44100
+CHANNELS = 2
+
+
+class StandInSession(utils.EventEmitter):
+    pass
+
+
+def run(create_sink):
+    session = StandInSession()
+    sink = create_sink(session)
+    sp_audioformat = ffi.new('sp_audioformat *')
+    sp_audioformat.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
+    sp_audioformat.sample_rate = SAMPLE_RATE
+    sp_audioformat.channels = CHANNELS
+    audio_format = spotify.AudioFormat(sp_audioformat)
+    frame_size = audio_format.frame_size()
+    frames = b'\x00' * NUM_FRAMES * frame_size
+    num_chunks = AUDIO_DURATION * SAMPLE_RATE // NUM_FRAMES
+
+    start = time.time()
+    for _ in range(num_chunks):
+        offset = 0
+        while offset < NUM_FRAMES:
+            num_frames = NUM_FRAMES - offset
+            consumed = session.call(
+                spotify.SessionEvent.MUSIC_DELIVERY, session, audio_format,
+                frames[offset * frame_size:], num_frames)
+            if consumed == 0:
+                time.sleep(0.001)
+            offset += consumed
+    sink.off()
+    return time.time() - start
+
+
+def main():
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        candidates = [
+            ('null', spotify.NullSink),
+            ('raw file', lambda session: spotify.RawFileSink(
+                session, os.path.join(tmp_dir, 'out.pcm'))),
+            ('wav file', lambda session: spotify.WavFileSink(
+                session, os.path.join(tmp_dir, 'out.wav'))),
+        ]
+        print('%-10s %12s %16s' % ('sink', 'wall time', 'realtime factor'))
+        for name, create_sink in candidates:
+            duration = run(create_sink)
+            print('%-10s %10.3f s %15.0fx' % (
+                name, duration, AUDIO_DURATION / duration))
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+"""
+Benchmark of the memory used by pyspotify's wrapper objects.
+
+The benchmark uses :mod:`tracemalloc` to measure the number of bytes
+allocated per wrapper object for many :class:`spotify.Track`,
+:class:`spotify.Album`, :class:`spotify.Artist`, :class:`spotify.User`,
+:class:`spotify.Link`, :class:`spotify.Image`, and
+:class:`spotify.PlaylistTrack` objects. Each class is compared with an
+equivalent class using a ``__dict__`` for its attributes, like the classes
+did before they got ``__slots__``.
+
+The wrappers are created around fake libspotify pointers, bypassing their
+constructors, so the benchmark doesn't need a session or the ``ffi.gc()``
+finalizers of the real wrappers. The fake pointers are included in both
+measurements.
+
+The benchmark requires Python 3.4 or newer::
+
+    python benchmarks/wrapper_memory.py
+"""
+
+from __future__ import print_function, unicode_literals
+
+import threading
+import tracemalloc
+
+import spotify
+
+
+NUM_OBJECTS = 100000
+
+
+def get_wrapper_classes():
+    return [
+        (spotify.Track, {'_sp_track': 'sp_track *'}),
+        (spotify.Album, {'_sp_album': 'sp_album *'}),
+        (spotify.Artist, {'_sp_artist': 'sp_artist *'}),
+        (spotify.User, {'_sp_user': 'sp_user *'}),
+        (spotify.Link, {'_sp_link': 'sp_link *'}),
+        (spotify.Image, {
+            '_sp_image': 'sp_image *',
+            '_load_event': threading.Event,
+            '_callback_handles': set}),
+        (spotify.PlaylistTrack, {
+            '_sp_playlist': 'sp_playlist *', '_index': int}),
+    ]
+
+
+def make_dict_wrapper_class(cls):
+    # A new class for each measurement, so that the instance dicts share
+    # their keys like the instance dicts of the original class would.
+    return type(str(cls.__name__), (object,), {})
+
+
+def make_value(kind, i):
+    if callable(kind):
+        return kind()
+    return spotify.ffi.cast(kind, i + 1)
+
+
+def measure(cls, attrs):
+    session = object()
+    tracemalloc.start()
+    start = tracemalloc.take_snapshot()
+    objects = []
+    for i in range(NUM_OBJECTS):
+        obj = cls.__new__(cls)
+        obj._session = session
+        for name, kind in attrs.items():
+            setattr(obj, name, make_value(kind, i))
+        objects.append(obj)
+    end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in end.compare_to(start, 'filename'))
+    del objects
+    return size / float(NUM_OBJECTS)
+
+
+def main():
+    print('%-14s %14s %14s %8s' % ('class', '__dict__', '__slots__', 'saved'))
+    for cls, attrs in get_wrapper_classes():
+        before = measure(make_dict_wrapper_class(cls), attrs)
+        after = measure(cls, attrs)
+        print('%-14s %12.0f B %12.0f B %7.0f%%' % (
+            cls.__name__, before, after, 100 * (before - after) / before))
+
+
+if __name__ == '__main__':
+    main()
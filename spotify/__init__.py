@@ -1,5 +1,7 @@
 from __future__ import unicode_literals
 
+import importlib
+import sys
 import threading
 
 
@@ -8,7 +10,9 @@ __version__ = '2.0.0b1'
 
 # Global reentrant lock to be held whenever libspotify functions are called or
 # libspotify owned data is worked on. This is the heart of pyspotify's thread
-# safety.
+# safety. With LockMode.GROUPED, the lock is replaced by a
+# _SharedExclusiveLock, and with LockMode.SINGLE_THREADED by a
+# _ThreadOwnerGuard, see set_lock_mode().
 _lock = threading.RLock()
 
 
@@ -52,8 +56,13 @@ def serialized(f):
     """
     import functools
 
+    name = '%s.%s' % (f.__module__, getattr(f, '__qualname__', f.__name__))
+
     @functools.wraps(f)
     def wrapper(*args, **kwargs):
+        lock_stats = _lock_stats
+        if lock_stats is not None:
+            return lock_stats.call(_lock, name, f, args, kwargs)
         with _lock:
             return f(*args, **kwargs)
     if not hasattr(wrapper, '__wrapped__'):
@@ -62,20 +71,383 @@ def serialized(f):
     return wrapper
 
 
+try:
+    # Python 3.3+
+    _get_ident = threading.get_ident
+except AttributeError:
+    # Python 2
+    import thread
+    _get_ident = thread.get_ident
+    del thread
+
+
+class _SharedExclusiveLock(object):
+    """Reentrant lock with an exclusive side and a shared side.
+
+    The exclusive side behaves like a :class:`threading.RLock` and is what the
+    :func:`serialized` decorator acquires when the lock is used as
+    :attr:`_lock`. The shared side may be held by any number of threads at the
+    same time, but never while another thread holds the exclusive side. A
+    thread that already holds the exclusive side may also take the shared
+    side, so that functions wrapped in the shared side can be called from
+    serialized code.
+
+    Waiting writers are preferred over new readers to avoid starving
+    libspotify calls that need exclusive access.
+
+    Internal class.
+    """
+
+    def __init__(self):
+        self._exclusive = threading.RLock()
+        self._cond = threading.Condition(threading.Lock())
+        self._owner = None
+        self._depth = 0
+        self._readers = 0
+
+    def acquire(self):
+        self._exclusive.acquire()
+        with self._cond:
+            if self._depth == 0:
+                self._owner = _get_ident()
+                while self._readers:
+                    self._cond.wait()
+            self._depth += 1
+        return True
+
+    def release(self):
+        with self._cond:
+            self._depth -= 1
+            if self._depth == 0:
+                self._owner = None
+                self._cond.notify_all()
+        self._exclusive.release()
+
+    __enter__ = acquire
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    def acquire_shared(self):
+        with self._cond:
+            ident = _get_ident()
+            while self._owner is not None and self._owner != ident:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_shared(self):
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+
+class _ThreadOwnerGuard(object):
+    """Replacement for the global lock that doesn't lock anything, but checks
+    that it is only used by the thread that created it.
+
+    Used as :attr:`_lock` in the :attr:`LockMode.SINGLE_THREADED` lock mode.
+
+    Internal class.
+    """
+
+    __slots__ = ['_owner']
+
+    def __init__(self):
+        self._owner = _get_ident()
+
+    # __enter__() and __exit__() are kept as simple as possible, as they are
+    # called for every call to a function decorated with serialized().
+
+    def __enter__(self):
+        if _get_ident() != self._owner:
+            self._fail()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def acquire(self, *args, **kwargs):
+        if _get_ident() != self._owner:
+            self._fail()
+        return True
+
+    def release(self):
+        pass
+
+    acquire_shared = acquire
+    release_shared = release
+
+    def _fail(self):
+        raise RuntimeError(
+            'pyspotify is in the single-threaded lock mode, and can only be '
+            'used from the thread that set the lock mode')
+
+
+class LockMode(object):
+    """Locking modes for calls to libspotify.
+
+    The lock mode is changed with :func:`set_lock_mode`.
+    """
+
+    GLOBAL = 'global'
+    """All calls to libspotify functions and all code blocks decorated with
+    :func:`serialized` are serialized by a single global lock.
+
+    This is the default lock mode.
+    """
+
+    GROUPED = 'grouped'
+    """libspotify functions are grouped by what they touch, and only calls
+    that conflict are serialized.
+
+    The groups are:
+
+    - *Metadata* functions only read data from libspotify objects, like
+      ``sp_track_duration()`` or ``sp_link_type()``. Calls to these may run
+      concurrently with each other.
+
+    - *Playlist* functions modify playlists or playlist containers, like
+      ``sp_playlist_add_tracks()``.
+
+    - *Session* functions include everything else, like
+      ``sp_session_process_events()``, and all functions that create or
+      release libspotify objects.
+
+    Playlist and session functions are serialized with each other, with all
+    metadata functions, and with all code blocks decorated with
+    :func:`serialized`, just like in the :attr:`GLOBAL` lock mode. They can't
+    be separated, as libspotify calls the playlist callbacks from
+    ``sp_session_process_events()``, and the order of playlist changes and
+    session events must be kept.
+    """
+
+    SINGLE_THREADED = 'single_threaded'
+    """pyspotify is used from a single thread only, and nothing is locked.
+
+    The libspotify functions on :attr:`spotify.lib` and the code blocks
+    decorated with :func:`serialized` only check that they are called from
+    the thread that set the lock mode, raising :exc:`RuntimeError` if they
+    aren't.
+
+    Use this mode if you create the :class:`~spotify.Session` and call
+    :meth:`~spotify.Session.process_events` from the same thread, and never
+    use pyspotify from any other thread. The :class:`~spotify.EventLoop` and
+    the :class:`~spotify.AsyncioEventLoop` cannot be used in this mode.
+
+    libspotify calls some session callbacks, like the one delivering music,
+    from its own threads. These are still dispatched as session events, but
+    the event listeners must not use pyspotify. Listeners registered with
+    :meth:`~spotify.utils.EventEmitter.once`, and listeners removed by
+    returning :class:`False`, may still be called from these threads.
+    """
+
+
+_lock_mode = LockMode.GLOBAL
+
+# The original, unwrapped libspotify functions, keyed by name. Used to
+# reinstall the library function wrappers when the lock mode changes.
+_lib_functions = {}
+
+# Collector of lock statistics, if enabled by spotify.enable_lock_stats().
+_lock_stats = None
+
+# The running spotify.Profile, if any, started by spotify.profile().
+_profiler = None
+
+
+def set_lock_mode(lock_mode):
+    """Change how calls to libspotify are serialized.
+
+    ``lock_mode`` is a :class:`LockMode` value. The lock mode must be changed
+    before the :class:`~spotify.Session` is created, as the lock cannot be
+    replaced while it may be in use.
+    """
+    global _lock, _lock_mode
+
+    if lock_mode not in (
+            LockMode.GLOBAL, LockMode.GROUPED, LockMode.SINGLE_THREADED):
+        raise ValueError('Unknown lock mode: %r' % lock_mode)
+    if _session_instance is not None:
+        raise RuntimeError(
+            'The lock mode must be set before the session is created')
+
+    if lock_mode == LockMode.GROUPED:
+        _lock = _SharedExclusiveLock()
+    elif lock_mode == LockMode.SINGLE_THREADED:
+        _lock = _ThreadOwnerGuard()
+    else:
+        _lock = threading.RLock()
+    if _lock_stats is not None:
+        _lock = _lock_stats.instrument(_lock)
+    _lock_mode = lock_mode
+    _install_lib_wrappers(lib)
+
+
+def get_lock_mode():
+    """Get the current :class:`LockMode`."""
+    return _lock_mode
+
+
+def _owner_checked(f):
+    """Decorator that checks that the decorated function is called from the
+    thread owning the :class:`_ThreadOwnerGuard` used as the global lock.
+
+    Used for wrapping libspotify functions in the
+    :attr:`LockMode.SINGLE_THREADED` lock mode.
+
+    Internal function.
+    """
+    import functools
+
+    guard = _lock
+
+    @functools.wraps(f)
+    def wrapper(*args, **kwargs):
+        if _get_ident() != guard._owner:
+            guard._fail()
+        return f(*args, **kwargs)
+    if not hasattr(wrapper, '__wrapped__'):
+        # Workaround for Python < 3.2
+        wrapper.__wrapped__ = f
+    return wrapper
+
+
+def _shared(f):
+    """Decorator that calls the decorated function while holding the shared
+    side of the global lock.
+
+    Used for wrapping libspotify metadata functions in the
+    :attr:`LockMode.GROUPED` lock mode.
+
+    Internal function.
+    """
+    import functools
+
+    @functools.wraps(f)
+    def wrapper(*args, **kwargs):
+        lock = _lock
+        lock.acquire_shared()
+        try:
+            return f(*args, **kwargs)
+        finally:
+            lock.release_shared()
+    if not hasattr(wrapper, '__wrapped__'):
+        # Workaround for Python < 3.2
+        wrapper.__wrapped__ = f
+    return wrapper
+
+
+_LOCK_GROUP_METADATA = 'metadata'
+_LOCK_GROUP_PLAYLIST = 'playlist'
+_LOCK_GROUP_SESSION = 'session'
+
+_METADATA_PREFIXES = (
+    'sp_album_', 'sp_albumbrowse_', 'sp_artist_', 'sp_artistbrowse_',
+    'sp_image_', 'sp_inbox_', 'sp_link_', 'sp_playlist_',
+    'sp_playlistcontainer_', 'sp_search_', 'sp_toplistbrowse_', 'sp_track_',
+    'sp_user_', 'pyspotify_fetch_')
+_PLAYLIST_PREFIXES = ('sp_playlist_', 'sp_playlistcontainer_')
+_MUTATING_WORDS = frozenset([
+    'add', 'clear', 'create', 'free', 'move', 'post', 'release', 'remove',
+    'rename', 'reorder', 'set', 'update'])
+
+
+def _get_lock_group(name):
+    """Get the lock group of the libspotify function with the given ``name``.
+
+    See :attr:`LockMode.GROUPED` for a description of the groups.
+
+    Internal function.
+    """
+    if name in ('sp_build_id', 'sp_error_message'):
+        return _LOCK_GROUP_METADATA
+    mutating = bool(_MUTATING_WORDS.intersection(name.split('_')))
+    if name.startswith(_PLAYLIST_PREFIXES) and mutating:
+        return _LOCK_GROUP_PLAYLIST
+    if name.startswith(_METADATA_PREFIXES) and not mutating:
+        return _LOCK_GROUP_METADATA
+    return _LOCK_GROUP_SESSION
+
+
 def _serialize_access_to_library(lib):
     """Modify CFFI library to serialize all calls to library functions.
 
     Internal function.
     """
     for name in dir(lib):
-        if name.startswith('sp_') and callable(getattr(lib, name)):
-            setattr(lib, name, serialized(getattr(lib, name)))
+        if (name.startswith(('sp_', 'pyspotify_')) and
+                callable(getattr(lib, name))):
+            _lib_functions[name] = getattr(lib, name)
+    _install_lib_wrappers(lib)
+
+
+def _install_lib_wrappers(lib):
+    """Wrap all library functions according to the current lock mode, with
+    lock statistics if enabled, and with profiling if a profile is running.
+
+    Internal function.
+    """
+    for name, func in _lib_functions.items():
+        if _profiler is not None:
+            # Innermost, so that the time waiting for the lock isn't included
+            func = _profiler.wrap(name, func)
+        shared = (
+            _lock_mode == LockMode.GROUPED and
+            _get_lock_group(name) == _LOCK_GROUP_METADATA)
+        if _lock_stats is not None:
+            wrapper = _lock_stats.wrap(name, func, _lock, shared=shared)
+        elif _lock_mode == LockMode.SINGLE_THREADED:
+            wrapper = _owner_checked(func)
+        elif shared:
+            wrapper = _shared(func)
+        else:
+            wrapper = serialized(func)
+        setattr(lib, name, wrapper)
+
+
+class _Lib(object):
+    """Namespace with the contents of a precompiled CFFI library.
+
+    The functions of a library compiled with CFFI's out-of-line API mode
+    cannot be replaced. The library's contents are thus copied to an instance
+    of this class, where :func:`_serialize_access_to_library` can wrap them.
+
+    Internal class.
+    """
+
+    def __init__(self, lib):
+        for name in dir(lib):
+            if not name.startswith('__'):
+                setattr(self, name, getattr(lib, name))
 
 
 def _build_ffi():
     """Build CFFI instance with knowledge of all libspotify types and a library
     object which wraps libspotify for use from Python.
 
+    If pyspotify has been installed with ``setup.py``, the precompiled
+    ``spotify._spotify`` module is used. Otherwise, e.g. when running
+    pyspotify from a source checkout, the libspotify header is parsed and the
+    library is compiled by :func:`_verify_ffi`.
+
+    Internal function.
+    """
+    try:
+        from spotify._spotify import ffi, lib
+    except ImportError:
+        ffi, lib = _verify_ffi()
+    else:
+        lib = _Lib(lib)
+
+    _serialize_access_to_library(lib)
+
+    return ffi, lib
+
+
+def _verify_ffi():
+    """Build CFFI instance and library object by parsing the libspotify header
+    file and compiling the library with :meth:`cffi.FFI.verify`.
+
     Internal function.
     """
     from distutils.version import StrictVersion
@@ -87,19 +459,22 @@ def _build_ffi():
         raise RuntimeError(
             'pyspotify requires cffi >= 0.7, but found %s' % cffi.__version__)
 
-    header_file = os.path.join(os.path.dirname(__file__), 'api.processed.h')
-    with open(header_file) as fh:
-        header = fh.read()
-        header += '#define SPOTIFY_API_VERSION ...\n'
+    def read(filename):
+        with open(os.path.join(os.path.dirname(__file__), filename)) as fh:
+            return fh.read()
+
+    header = read('api.processed.h')
+    header += '#define SPOTIFY_API_VERSION ...\n'
+    header += read('metadata.h')
+
+    source = '#include "libspotify/api.h"\n'
+    source += read('metadata.h')
+    source += read('metadata.c')
 
     ffi = cffi.FFI()
     ffi.cdef(header)
     lib = ffi.verify(
-        '#include "libspotify/api.h"',
-        libraries=[str('spotify')],
-        ext_package='spotify')
-
-    _serialize_access_to_library(lib)
+        source, libraries=[str('spotify')], ext_package='spotify')
 
     return ffi, lib
 
@@ -108,22 +483,97 @@ _setup_logging()
 ffi, lib = _build_ffi()
 
 
-from spotify.album import *  # noqa
-from spotify.artist import *  # noqa
-from spotify.audio import *  # noqa
-from spotify.config import *  # noqa
-from spotify.connection import *  # noqa
-from spotify.error import *  # noqa
-from spotify.eventloop import *  # noqa
-from spotify.image import *  # noqa
-from spotify.inbox import *  # noqa
-from spotify.link import *  # noqa
-from spotify.offline import *  # noqa
-from spotify.playlist import *  # noqa
-from spotify.search import *  # noqa
-from spotify.session import *  # noqa
-from spotify.sink import *  # noqa
-from spotify.social import *  # noqa
-from spotify.toplist import *  # noqa
-from spotify.track import *  # noqa
-from spotify.user import *  # noqa
+# The public API is imported from the submodules on first access, so that a
+# program only pays for importing the parts of pyspotify it actually uses.
+# Maps each submodule to the public names it defines. Keep in sync with the
+# submodules' __all__ lists.
+_SUBMODULES = {
+    'aio': ['AsyncioEventLoop'],
+    'album': ['Album', 'AlbumBrowser', 'AlbumType'],
+    'artist': ['Artist', 'ArtistBrowser', 'ArtistBrowserType'],
+    'audio': [
+        'AudioBufferStats', 'AudioFormat', 'Bitrate', 'MusicDeliveryFormat',
+        'SampleType',
+    ],
+    'cache': ['ObjectCache'],
+    'config': ['Config'],
+    'connection': ['ConnectionRule', 'ConnectionState', 'ConnectionType'],
+    'error': ['Error', 'ErrorType', 'LibError', 'Timeout'],
+    'eventloop': ['EventLoop', 'EventLoopStats'],
+    'image': ['Image', 'ImageFormat', 'ImageSize'],
+    'inbox': ['InboxPostResult'],
+    'link': ['Link', 'LinkType'],
+    'lockstats': [
+        'LockStats', 'LockStatsEntry', 'disable_lock_stats',
+        'enable_lock_stats', 'get_lock_stats'],
+    'metadata': [
+        'AlbumInfo', 'AlbumMetadata', 'ArtistInfo', 'ArtistMetadata',
+        'TrackInfo', 'TrackMetadata', 'fetch_metadata_many', 'snapshot_many'],
+    'offline': ['OfflineSyncStatus'],
+    'playlist': [
+        'Playlist', 'PlaylistContainer', 'PlaylistContainerEvent',
+        'PlaylistEvent', 'PlaylistFolder', 'PlaylistOfflineStatus',
+        'PlaylistTrack', 'PlaylistType', 'PlaylistUnseenTracks'],
+    'processing': ['AudioProcessor', 'ProcessingSink', 'ProcessingStats'],
+    'profiling': ['Profile', 'ProfileEntry', 'profile'],
+    'search': ['Search', 'SearchPlaylist', 'SearchType'],
+    'session': ['Session', 'SessionEvent', 'load_all'],
+    'sink': [
+        'AlsaSink', 'BufferedSink', 'NullSink', 'PortAudioSink',
+        'RawFileSink', 'SinkStats', 'TeeBranch', 'TeeBranchStats',
+        'TeePolicy', 'TeeSink', 'WavFileSink'],
+    'social': ['ScrobblingState', 'SocialProvider'],
+    'toplist': ['Toplist', 'ToplistRegion', 'ToplistType'],
+    'track': [
+        'LocalTrack', 'Track', 'TrackAvailability', 'TrackOfflineStatus'],
+    'user': ['User'],
+    'utils': [],
+}
+
+_PUBLIC_NAMES = dict(
+    (name, module_name)
+    for module_name, names in _SUBMODULES.items()
+    for name in names)
+
+# ``from spotify import *`` must import the lazily loaded names too, which it
+# only does if they are listed here.
+__all__ = sorted(set(_PUBLIC_NAMES) | set([
+    'LockMode', 'ffi', 'get_lock_mode', 'lib', 'serialized',
+    'set_lock_mode']))
+
+
+def _import_submodule(module_name):
+    """Import the submodule with the given name and add its public names to
+    the :mod:`spotify` namespace, like ``from spotify.<module_name> import *``
+    would.
+
+    Internal function.
+    """
+    module = importlib.import_module('spotify.%s' % module_name)
+    namespace = globals()
+    for name in _SUBMODULES[module_name]:
+        namespace.setdefault(name, getattr(module, name))
+    return module
+
+
+def __getattr__(name):
+    # Called on Python 3.7+ when ``name`` isn't found in the module, see
+    # PEP 562.
+    if name in _PUBLIC_NAMES:
+        _import_submodule(_PUBLIC_NAMES[name])
+        return globals()[name]
+    if name in _SUBMODULES:
+        return _import_submodule(name)
+    raise AttributeError(
+        'module %r has no attribute %r' % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_PUBLIC_NAMES) | set(_SUBMODULES))
+
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__() isn't supported, so import everything now.
+    for _module_name in sorted(_SUBMODULES):
+        _import_submodule(_module_name)
+    del _module_name
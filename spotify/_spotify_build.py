@@ -0,0 +1,36 @@
+"""CFFI build script for the precompiled ``spotify._spotify`` module.
+
+The script is used by ``setup.py`` through the ``cffi_modules`` setup
+argument, which builds the module ahead of time using CFFI's out-of-line API
+mode. When the precompiled module is available, importing pyspotify doesn't
+need to parse the libspotify header file or have a C compiler available.
+"""
+
+from __future__ import unicode_literals
+
+import os
+
+import cffi
+
+
+def read(filename):
+    with open(os.path.join(os.path.dirname(__file__), filename)) as fh:
+        return fh.read()
+
+
+header = read('api.processed.h')
+header += '#define SPOTIFY_API_VERSION ...\n'
+header += read('metadata.h')
+
+source = '#include "libspotify/api.h"\n'
+source += read('metadata.h')
+source += read('metadata.c')
+
+ffi = cffi.FFI()
+ffi.cdef(header)
+ffi.set_source(
+    str('spotify._spotify'), source, libraries=[str('spotify')])
+
+
+if __name__ == '__main__':
+    ffi.compile()
@@ -0,0 +1,228 @@
+from __future__ import unicode_literals
+
+import logging
+import threading
+
+import spotify
+
+
+__all__ = [
+    'AsyncioEventLoop',
+]
+
+logger = logging.getLogger(__name__)
+
+
+def _get_running_loop():
+    import asyncio
+
+    # Python 3.5.3+
+    get_running_loop = getattr(asyncio, '_get_running_loop', None)
+    if get_running_loop is None:
+        return None
+    return get_running_loop()
+
+
+class AsyncioEventLoop(object):
+    """Event loop for processing events from libspotify in an :mod:`asyncio`
+    event loop.
+
+    This is an alternative to :class:`~spotify.EventLoop` for applications
+    built on :mod:`asyncio`. Instead of running a thread of its own, it calls
+    :meth:`~spotify.Session.process_events` from the given asyncio event loop,
+    or the running event loop if ``loop`` isn't specified, falling back to
+    :func:`asyncio.get_event_loop` outside of a running event loop. It listens
+    to :attr:`~spotify.SessionEvent.NOTIFY_MAIN_THREAD` events to process
+    events as soon as libspotify asks for it, and else processes events again
+    after the timeout returned by :meth:`~spotify.Session.process_events`.
+
+    To use it, pass it your :class:`~spotify.Session` instance and call
+    :meth:`start`::
+
+        >>> session = spotify.Session()
+        >>> event_loop = spotify.AsyncioEventLoop(session)
+        >>> event_loop.start()
+
+    While the event loop is running, the ``*_async()`` methods, like
+    :meth:`Track.load_async() <spotify.Track.load_async>` and
+    :meth:`Session.search_async() <spotify.Session.search_async>`, return
+    :class:`asyncio.Future` objects that can be awaited without blocking the
+    event loop::
+
+        >>> track = await session.get_track(
+        ...     'spotify:track:3N2UhXZI4Gf64Ku3cCjz2g').load_async()
+        >>> search = await session.search_async('massive attack')
+
+    The ``*_async()`` methods must be called from the asyncio event loop's
+    thread.
+
+    The event loop requires :mod:`asyncio` from Python 3.5.2 or newer.
+
+    .. warning::
+
+        If you use :class:`AsyncioEventLoop` to process the libspotify events,
+        any event listeners you've registered will be called from the asyncio
+        event loop, and must not block.
+    """
+
+    def __init__(self, session, loop=None):
+        import asyncio  # Crash early if not available
+
+        self._session = session
+        if loop is None:
+            loop = _get_running_loop()
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        self.loop = loop
+        self._running = False
+        self._thread = None
+        self._timer = None
+        self._load_waiters = []
+        self._requests = {}
+
+    loop = None
+    """The :mod:`asyncio` event loop that libspotify events are processed
+    from."""
+
+    def start(self):
+        """Start processing events from the asyncio event loop.
+
+        Raises :exc:`RuntimeError` in the
+        :attr:`~spotify.LockMode.SINGLE_THREADED` lock mode.
+        """
+        if spotify.get_lock_mode() == spotify.LockMode.SINGLE_THREADED:
+            raise RuntimeError(
+                'The asyncio event loop cannot be used in the single-threaded '
+                'lock mode')
+        self._running = True
+        self._session.on(
+            spotify.SessionEvent.NOTIFY_MAIN_THREAD,
+            self._on_notify_main_thread)
+        if (not self.loop.is_running() or
+                _get_running_loop() is self.loop):
+            # The events will be processed in this thread, so a blocking
+            # load() called from it before the first processing must not
+            # wait for another thread to process them.
+            self._thread = threading.current_thread()
+        self._session._event_loop = self
+        self.loop.call_soon_threadsafe(self._process_events)
+
+    def stop(self):
+        """Stop processing events.
+
+        Futures returned by the ``*_async()`` methods that haven't completed
+        yet are cancelled.
+        """
+        self._running = False
+        if self._session._event_loop is self:
+            self._session._event_loop = None
+        self._session.off(
+            spotify.SessionEvent.NOTIFY_MAIN_THREAD,
+            self._on_notify_main_thread)
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for obj, future, timeout_handle in self._load_waiters:
+            timeout_handle.cancel()
+            future.cancel()
+        self._load_waiters = []
+        for future in self._requests:
+            future.cancel()
+        self._requests = {}
+
+    def is_alive(self):
+        """Whether the event loop is started and not stopped yet."""
+        return self._running
+
+    def _process_events(self):
+        if not self._running:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        self._thread = threading.current_thread()
+        # If processing the events fails, the events are processed again
+        # after this timeout, so that the event loop keeps running.
+        timeout = 1.0
+        try:
+            timeout = self._session.process_events() / 1000.0
+            self._check_load_waiters()
+        except Exception:
+            logger.exception('Processing events failed')
+        logger.debug('Processing events again in %.3fs', timeout)
+        self._timer = self.loop.call_later(timeout, self._process_events)
+
+    def _on_notify_main_thread(self, session):
+        # WARNING: This event listener is called from an internal libspotify
+        # thread. It must not block.
+        try:
+            self.loop.call_soon_threadsafe(self._process_events)
+        except RuntimeError:
+            logger.warning(
+                'asyncio event loop closed; dropped notification event')
+
+    def _load(self, obj, timeout=None):
+        future = self.loop.create_future()
+        if _check_loaded(obj, future):
+            return future
+        if timeout is None:
+            timeout = 10
+        timeout_handle = self.loop.call_later(
+            timeout, _set_timeout, future, timeout)
+        self._load_waiters.append((obj, future, timeout_handle))
+        return future
+
+    def _check_load_waiters(self):
+        # Only the objects that aren't loaded yet are checked, in the order
+        # they were requested.
+        pending = []
+        for obj, future, timeout_handle in self._load_waiters:
+            if _check_loaded(obj, future):
+                timeout_handle.cancel()
+            else:
+                pending.append((obj, future, timeout_handle))
+        self._load_waiters = pending
+
+    def _call(self, func, *args, **kwargs):
+        future = self.loop.create_future()
+
+        def callback(obj):
+            # Called when the request completes, while events are being
+            # processed.
+            self.loop.call_soon_threadsafe(self._set_completed, future, obj)
+
+        kwargs['callback'] = callback
+        # Keep the request alive until it completes, as nothing else may
+        # refer to it until the future is done.
+        self._requests[future] = func(*args, **kwargs)
+        return future
+
+    def _set_completed(self, future, obj):
+        self._requests.pop(future, None)
+        if future.done():
+            return
+        try:
+            spotify.Error.maybe_raise(obj.error)
+        except spotify.Error as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(obj)
+
+
+def _check_loaded(obj, future):
+    if future.done():
+        return True
+    try:
+        spotify.Error.maybe_raise(
+            getattr(obj, 'error', 0), ignores=[spotify.ErrorType.IS_LOADING])
+    except spotify.Error as exc:
+        future.set_exception(exc)
+        return True
+    if obj.is_loaded:
+        future.set_result(obj)
+        return True
+    return False
+
+
+def _set_timeout(future, timeout):
+    if not future.done():
+        future.set_exception(spotify.Timeout(timeout))
@@ -29,10 +29,31 @@ class Album(object):
         u'Forward / Return'
     """
 
+    __slots__ = ['_session', '_sp_album', '_memo', '__weakref__']
+
+    @classmethod
+    @serialized
+    def _cached(cls, session, sp_album, add_ref=True):
+        """
+        Get :class:`Album` instance for the given ``sp_album``. If it already
+        exists, it is retrieved from cache.
+
+        Internal method.
+        """
+        album = session._cache.get(sp_album)
+        if album is not None:
+            if not add_ref:
+                lib.sp_album_release(sp_album)
+            return album
+        album = Album(session, sp_album=sp_album, add_ref=add_ref)
+        session._cache[sp_album] = album
+        return album
+
     def __init__(self, session, uri=None, sp_album=None, add_ref=True):
         assert uri or sp_album, 'uri or sp_album is required'
 
         self._session = session
+        self._memo = None
 
         if uri is not None:
             album = spotify.Link(self._session, uri=uri).as_album()
@@ -64,7 +85,19 @@ class Album(object):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None):
+        """Load the album's data without blocking.
+
+        Returns an :class:`asyncio.Future` that is done when the album is
+        loaded, with the album as its result. If ``timeout`` is :class:`None`
+        the default timeout is used.
+
+        Requires a running :class:`AsyncioEventLoop`.
+        """
+        return utils.load_async(self._session, self, timeout=timeout)
+
     @property
+    @utils.memoized(mutable=True)
     def is_available(self):
         """Whether the album is available in the current region.
 
@@ -84,7 +117,7 @@ class Album(object):
         sp_artist = lib.sp_album_artist(self._sp_album)
         if sp_artist == ffi.NULL:
             return None
-        return spotify.Artist(self._session, sp_artist=sp_artist, add_ref=True)
+        return spotify.Artist._cached(self._session, sp_artist, add_ref=True)
 
     @serialized
     def cover(self, image_size=None):
@@ -121,6 +154,7 @@ class Album(object):
         return spotify.Link(self._session, sp_link=sp_link, add_ref=False)
 
     @property
+    @utils.memoized
     @serialized
     def name(self):
         """The album's name.
@@ -131,6 +165,7 @@ class Album(object):
         return name if name else None
 
     @property
+    @utils.memoized
     def year(self):
         """The album's release year.
 
@@ -141,6 +176,7 @@ class Album(object):
         return lib.sp_album_year(self._sp_album)
 
     @property
+    @utils.memoized
     def type(self):
         """The album's :class:`AlbumType`.
 
@@ -150,6 +186,22 @@ class Album(object):
             return None
         return AlbumType(lib.sp_album_type(self._sp_album))
 
+    def fetch_metadata(self):
+        """Get all the album's metadata at once, as a
+        :class:`~spotify.AlbumMetadata`.
+
+        See :meth:`Track.fetch_metadata`.
+        """
+        return spotify.fetch_metadata_many([self])[0]
+
+    def snapshot(self):
+        """Get an immutable snapshot of the album, as a
+        :class:`~spotify.AlbumInfo`.
+
+        See :meth:`Track.snapshot`.
+        """
+        return spotify.snapshot_many([self])[0]
+
     @property
     def link(self):
         """A :class:`Link` to the album."""
@@ -168,6 +220,16 @@ class Album(object):
         return spotify.AlbumBrowser(
             self._session, album=self, callback=callback)
 
+    def browse_async(self):
+        """Get an :class:`AlbumBrowser` for the album without blocking.
+
+        Returns an :class:`asyncio.Future` that is done when the browser is
+        done loading, with the :class:`AlbumBrowser` as its result.
+
+        Requires a running :class:`AsyncioEventLoop`.
+        """
+        return utils.call_async(self._session, self.browse)
+
 
 class AlbumBrowser(object):
     """An album browser for a Spotify album.
@@ -190,6 +252,7 @@ class AlbumBrowser(object):
 
         self._session = session
         self.complete_event = threading.Event()
+        self.future = utils.create_request_future(self)
         self._callback_handles = set()
 
         if sp_albumbrowse is None:
@@ -213,6 +276,15 @@ class AlbumBrowser(object):
     """:class:`threading.Event` that is set when the album browser is loaded.
     """
 
+    future = None
+    """:class:`concurrent.futures.Future` that is done when the album browser
+    is completed.
+
+    The future's result is the :class:`AlbumBrowser` itself, or a
+    :exc:`~spotify.LibError` if the request failed. The future is :class:`None`
+    if :mod:`concurrent.futures` isn't available.
+    """
+
     def __repr__(self):
         if self.is_loaded:
             return 'AlbumBrowser(%r)' % self.album.link.uri
@@ -266,7 +338,7 @@ class AlbumBrowser(object):
         sp_album = lib.sp_albumbrowse_album(self._sp_albumbrowse)
         if sp_album == ffi.NULL:
             return None
-        return Album(self._session, sp_album=sp_album, add_ref=True)
+        return Album._cached(self._session, sp_album, add_ref=True)
 
     @property
     @serialized
@@ -278,7 +350,7 @@ class AlbumBrowser(object):
         sp_artist = lib.sp_albumbrowse_artist(self._sp_albumbrowse)
         if sp_artist == ffi.NULL:
             return None
-        return spotify.Artist(self._session, sp_artist=sp_artist, add_ref=True)
+        return spotify.Artist._cached(self._session, sp_artist, add_ref=True)
 
     @property
     @serialized
@@ -314,9 +386,9 @@ class AlbumBrowser(object):
 
         @serialized
         def get_track(sp_albumbrowse, key):
-            return spotify.Track(
+            return spotify.Track._cached(
                 self._session,
-                sp_track=lib.sp_albumbrowse_track(sp_albumbrowse, key),
+                lib.sp_albumbrowse_track(sp_albumbrowse, key),
                 add_ref=True)
 
         return utils.Sequence(
@@ -347,6 +419,8 @@ def _albumbrowse_complete_callback(sp_albumbrowse, handle):
     (callback, album_browser) = ffi.from_handle(handle)
     album_browser._callback_handles.remove(handle)
     album_browser.complete_event.set()
+    utils.complete_request_future(album_browser)
+    album_browser._session._notify_loaded()
     if callback is not None:
         callback(album_browser)
 
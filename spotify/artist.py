@@ -30,10 +30,31 @@ class Artist(object):
         u'Rob Dougan'
     """
 
+    __slots__ = ['_session', '_sp_artist', '_memo', '__weakref__']
+
+    @classmethod
+    @serialized
+    def _cached(cls, session, sp_artist, add_ref=True):
+        """
+        Get :class:`Artist` instance for the given ``sp_artist``. If it already
+        exists, it is retrieved from cache.
+
+        Internal method.
+        """
+        artist = session._cache.get(sp_artist)
+        if artist is not None:
+            if not add_ref:
+                lib.sp_artist_release(sp_artist)
+            return artist
+        artist = Artist(session, sp_artist=sp_artist, add_ref=add_ref)
+        session._cache[sp_artist] = artist
+        return artist
+
     def __init__(self, session, uri=None, sp_artist=None, add_ref=True):
         assert uri or sp_artist, 'uri or sp_artist is required'
 
         self._session = session
+        self._memo = None
 
         if uri is not None:
             artist = spotify.Link(self._session, uri=uri).as_artist()
@@ -50,6 +71,7 @@ class Artist(object):
         return 'Artist(%r)' % self.link.uri
 
     @property
+    @utils.memoized
     @serialized
     def name(self):
         """The artist's name.
@@ -74,6 +96,17 @@ class Artist(object):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None):
+        """Load the artist's data without blocking.
+
+        Returns an :class:`asyncio.Future` that is done when the artist is
+        loaded, with the artist as its result. If ``timeout`` is :class:`None`
+        the default timeout is used.
+
+        Requires a running :class:`AsyncioEventLoop`.
+        """
+        return utils.load_async(self._session, self, timeout=timeout)
+
     @serialized
     def portrait(self, image_size=None):
         """The artist's portrait :class:`Image`.
@@ -109,6 +142,22 @@ class Artist(object):
             self._sp_artist, image_size)
         return spotify.Link(self._session, sp_link=sp_link, add_ref=False)
 
+    def fetch_metadata(self):
+        """Get all the artist's metadata at once, as a
+        :class:`~spotify.ArtistMetadata`.
+
+        See :meth:`Track.fetch_metadata`.
+        """
+        return spotify.fetch_metadata_many([self])[0]
+
+    def snapshot(self):
+        """Get an immutable snapshot of the artist, as an
+        :class:`~spotify.ArtistInfo`.
+
+        See :meth:`Track.snapshot`.
+        """
+        return spotify.snapshot_many([self])[0]
+
     @property
     def link(self):
         """A :class:`Link` to the artist."""
@@ -130,6 +179,17 @@ class Artist(object):
         return spotify.ArtistBrowser(
             self._session, artist=self, type=type, callback=callback)
 
+    def browse_async(self, type=None):
+        """Get an :class:`ArtistBrowser` for the artist without blocking.
+
+        ``type`` is used like in :meth:`browse`. Returns an
+        :class:`asyncio.Future` that is done when the browser is done loading,
+        with the :class:`ArtistBrowser` as its result.
+
+        Requires a running :class:`AsyncioEventLoop`.
+        """
+        return utils.call_async(self._session, self.browse, type=type)
+
 
 class ArtistBrowser(object):
     """An artist browser for a Spotify artist.
@@ -153,6 +213,7 @@ class ArtistBrowser(object):
 
         self._session = session
         self.complete_event = threading.Event()
+        self.future = utils.create_request_future(self)
         self._callback_handles = set()
 
         if sp_artistbrowse is None:
@@ -179,6 +240,15 @@ class ArtistBrowser(object):
     """:class:`threading.Event` that is set when the artist browser is loaded.
     """
 
+    future = None
+    """:class:`concurrent.futures.Future` that is done when the artist browser
+    is completed.
+
+    The future's result is the :class:`ArtistBrowser` itself, or a
+    :exc:`~spotify.LibError` if the request failed. The future is :class:`None`
+    if :mod:`concurrent.futures` isn't available.
+    """
+
     def __repr__(self):
         if self.is_loaded:
             return 'ArtistBrowser(%r)' % self.artist.link.uri
@@ -232,7 +302,7 @@ class ArtistBrowser(object):
         sp_artist = lib.sp_artistbrowse_artist(self._sp_artistbrowse)
         if sp_artist == ffi.NULL:
             return None
-        return Artist(self._session, sp_artist=sp_artist, add_ref=True)
+        return Artist._cached(self._session, sp_artist, add_ref=True)
 
     @property
     @serialized
@@ -274,9 +344,9 @@ class ArtistBrowser(object):
 
         @serialized
         def get_track(sp_artistbrowse, key):
-            return spotify.Track(
+            return spotify.Track._cached(
                 self._session,
-                sp_track=lib.sp_artistbrowse_track(sp_artistbrowse, key),
+                lib.sp_artistbrowse_track(sp_artistbrowse, key),
                 add_ref=True)
 
         return utils.Sequence(
@@ -298,9 +368,9 @@ class ArtistBrowser(object):
 
         @serialized
         def get_track(sp_artistbrowse, key):
-            return spotify.Track(
+            return spotify.Track._cached(
                 self._session,
-                sp_track=lib.sp_artistbrowse_tophit_track(
+                lib.sp_artistbrowse_tophit_track(
                     sp_artistbrowse, key),
                 add_ref=True)
 
@@ -326,9 +396,9 @@ class ArtistBrowser(object):
 
         @serialized
         def get_album(sp_artistbrowse, key):
-            return spotify.Album(
+            return spotify.Album._cached(
                 self._session,
-                sp_album=lib.sp_artistbrowse_album(sp_artistbrowse, key),
+                lib.sp_artistbrowse_album(sp_artistbrowse, key),
                 add_ref=True)
 
         return utils.Sequence(
@@ -350,9 +420,9 @@ class ArtistBrowser(object):
 
         @serialized
         def get_artist(sp_artistbrowse, key):
-            return spotify.Artist(
+            return spotify.Artist._cached(
                 self._session,
-                sp_artist=lib.sp_artistbrowse_similar_artist(
+                lib.sp_artistbrowse_similar_artist(
                     sp_artistbrowse, key),
                 add_ref=True)
 
@@ -384,6 +454,8 @@ def _artistbrowse_complete_callback(sp_artistbrowse, handle):
     (callback, artist_browser) = ffi.from_handle(handle)
     artist_browser._callback_handles.remove(handle)
     artist_browser.complete_event.set()
+    utils.complete_request_future(artist_browser)
+    artist_browser._session._notify_loaded()
     if callback is not None:
         callback(artist_browser)
 
@@ -2,13 +2,14 @@ from __future__ import unicode_literals
 
 import collections
 
-from spotify import utils
+from spotify import ffi, utils
 
 
 __all__ = [
     'AudioBufferStats',
     'AudioFormat',
     'Bitrate',
+    'MusicDeliveryFormat',
     'SampleType',
 ]
 
@@ -62,3 +63,107 @@ class AudioFormat(object):
             return 2 * self.channels
         else:
             raise ValueError('Unknown sample type: %d', self.sample_type)
+
+
+class MusicDeliveryFormat(object):
+    """Formats the audio frames can be passed to the
+    :attr:`~spotify.SessionEvent.MUSIC_DELIVERY` event listener in.
+
+    Set :attr:`Session.music_delivery_format
+    <spotify.Session.music_delivery_format>` to one of these to change the
+    format.
+    """
+
+    BYTES = 'bytes'
+    """The frames are copied into a new bytestring for each delivery.
+
+    This is the default. The bytestring can be kept by the listener.
+    """
+
+    MEMORYVIEW = 'memoryview'
+    """The frames are copied into a buffer that is reused for each delivery,
+    and passed to the listener as a :class:`memoryview` of the buffer.
+
+    The memoryview is only valid until the listener returns. Copy the data if
+    you need to keep it.
+    """
+
+    NUMPY = 'numpy'
+    """The frames are copied into a buffer that is reused for each delivery,
+    and passed to the listener as a NumPy ``int16`` array of shape
+    ``(num_frames, channels)`` viewing the buffer.
+
+    The array is only valid until the listener returns. Copy the data if you
+    need to keep it. Requires NumPy to be installed.
+    """
+
+
+class _MusicDelivery(object):
+    """Converts the audio frames delivered by libspotify to the
+    :class:`MusicDeliveryFormat` passed to the event listener.
+
+    The :class:`AudioFormat` is reused as long as the format doesn't change,
+    and the frames are copied into a buffer that is reused for each delivery
+    unless :attr:`MusicDeliveryFormat.BYTES` is used.
+
+    Internal class.
+    """
+
+    def __init__(self):
+        self._format_key = None
+        self._audio_format = None
+        self._frame_size = 0
+        self._buffer = bytearray()
+        self._buffer_ptr = ffi.from_buffer(self._buffer)
+        self._frames_key = None
+        self._frames = None
+        self._numpy = None
+
+    def get_audio_format(self, sp_audioformat):
+        key = (
+            sp_audioformat.sample_type, sp_audioformat.sample_rate,
+            sp_audioformat.channels)
+        if key != self._format_key:
+            # The struct is owned by libspotify and only valid during the
+            # callback, so the cached audio format gets a copy of its own.
+            own_sp_audioformat = ffi.new('sp_audioformat *')
+            own_sp_audioformat[0] = sp_audioformat[0]
+            audio_format = AudioFormat(own_sp_audioformat)
+            self._frame_size = audio_format.frame_size()
+            self._audio_format = audio_format
+            self._format_key = key
+            self._frames_key = None
+        return self._audio_format
+
+    def get_frames(self, delivery_format, frames, num_frames):
+        size = self._frame_size * num_frames
+        if delivery_format == MusicDeliveryFormat.BYTES:
+            return ffi.buffer(frames, size)[:]
+        if len(self._buffer) < size:
+            # A new buffer is allocated instead of resizing the old one, as
+            # resizing fails if the listener kept a view of it.
+            self._buffer = bytearray(size)
+            self._buffer_ptr = ffi.from_buffer(self._buffer)
+            self._frames_key = None
+        ffi.memmove(self._buffer_ptr, frames, size)
+        key = (delivery_format, num_frames)
+        if key != self._frames_key:
+            # The view of the buffer is reused for as long as the chunks
+            # have the same size.
+            self._frames = self._make_frames_view(
+                delivery_format, size, num_frames)
+            self._frames_key = key
+        return self._frames
+
+    def _make_frames_view(self, delivery_format, size, num_frames):
+        if delivery_format == MusicDeliveryFormat.MEMORYVIEW:
+            return memoryview(self._buffer)[:size]
+        if delivery_format == MusicDeliveryFormat.NUMPY:
+            if self._numpy is None:
+                import numpy
+                self._numpy = numpy
+            channels = self._audio_format.channels
+            return self._numpy.frombuffer(
+                self._buffer, dtype=self._numpy.int16,
+                count=num_frames * channels).reshape((num_frames, channels))
+        raise ValueError('Unknown music delivery format: %r' % delivery_format)
@@ -0,0 +1,120 @@
+from __future__ import unicode_literals
+
+import collections
+import weakref
+
+
+__all__ = [
+    'ObjectCache',
+]
+
+
+class ObjectCache(object):
+    """A mapping from sp_* objects to the Python objects wrapping them.
+
+    The session keeps one :class:`ObjectCache`, available as
+    :attr:`Session.object_cache <spotify.Session.object_cache>`. When
+    pyspotify gets a track, album, artist, user, playlist, or playlist
+    container from libspotify, it returns the existing wrapper object for
+    that sp_* object if there is one, instead of creating a new wrapper
+    object, finalizer, and libspotify reference each time::
+
+        >>> playlist.tracks[0] is playlist.tracks[0]
+        True
+
+    By default, the cache doesn't keep the wrapper objects alive, and can
+    only find them as long as they are kept alive somewhere else in the
+    application. If ``max_size`` is set, the ``max_size`` most recently used
+    wrapper objects are also kept alive by the cache, so that objects that
+    are used often, but not kept around by the application, aren't created
+    and destroyed over and over again::
+
+        >>> session.object_cache.max_size = 1000
+
+    :attr:`hits` and :attr:`misses` count the lookups in the cache, and can
+    be used to tune :attr:`max_size`.
+    """
+
+    def __init__(self, max_size=0):
+        self._objects = weakref.WeakValueDictionary()
+        self._recent = collections.OrderedDict()
+        self._max_size = 0
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    hits = None
+    """The number of lookups that found a wrapper object in the cache."""
+
+    misses = None
+    """The number of lookups that didn't find a wrapper object in the
+    cache."""
+
+    def __repr__(self):
+        return (
+            '<ObjectCache: %d objects, %d kept alive, %d hits, %d misses>' % (
+                len(self), len(self._recent), self.hits, self.misses))
+
+    def __contains__(self, key):
+        return key in self._objects
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._objects[key] = value
+        self._keep_alive(key, value)
+
+    def __len__(self):
+        return len(self._objects)
+
+    @property
+    def max_size(self):
+        """The maximum number of recently used wrapper objects kept alive by
+        the cache.
+
+        Defaults to 0, which means that the cache doesn't keep any objects
+        alive.
+        """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value):
+        if value < 0:
+            raise ValueError('max_size must be 0 or greater')
+        self._max_size = value
+        while len(self._recent) > value:
+            self._recent.popitem(last=False)
+
+    def get(self, key, default=None):
+        """Get the wrapper object for the sp_* object ``key``, or ``default``
+        if there is no wrapper object in the cache.
+
+        The lookup is counted as a hit or a miss.
+        """
+        value = self._objects.get(key)
+        if value is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._keep_alive(key, value)
+        return value
+
+    def clear(self):
+        """Remove all wrapper objects from the cache, and reset
+        :attr:`hits` and :attr:`misses`."""
+        self._objects.clear()
+        self._recent.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _keep_alive(self, key, value):
+        if not self._max_size:
+            return
+        self._recent.pop(key, None)
+        self._recent[key] = value
+        if len(self._recent) > self._max_size:
+            self._recent.popitem(last=False)
@@ -60,11 +60,29 @@ class LibError(Error):
         return not self.__eq__(other)
 
 
-for attr in dir(lib):
-    if attr.startswith('SP_ERROR_'):
-        name = attr.replace('SP_ERROR_', '')
-        error_no = getattr(lib, attr)
-        setattr(LibError, name, LibError(error_no))
+class _LibErrorConstant(object):
+    """Descriptor for a :exc:`LibError` constant, like ``LibError.NO_CACHE``.
+
+    Creating a :exc:`LibError` looks up its message in libspotify, so the
+    constant is created the first time it is accessed, and then replaces the
+    descriptor on the class.
+
+    Internal class.
+    """
+
+    def __init__(self, name, error_type):
+        self._name = name
+        self._error_type = error_type
+
+    def __get__(self, obj, cls):
+        error = LibError(self._error_type)
+        setattr(LibError, self._name, error)
+        return error
+
+
+for attr, error_no in utils.get_lib_constants('SP_ERROR_'):
+    name = attr.replace('SP_ERROR_', '')
+    setattr(LibError, name, _LibErrorConstant(name, error_no))
 
 
 class Timeout(Error):
@@ -1,24 +1,22 @@
 from __future__ import unicode_literals
 
+import collections
 import logging
 import threading
-
-try:
-    # Python 3
-    import queue
-except ImportError:
-    # Python 2
-    import Queue as queue
+import time
 
 import spotify
 
 
 __all__ = [
     'EventLoop',
+    'EventLoopStats',
 ]
 
 logger = logging.getLogger(__name__)
 
+_clock = getattr(time, 'perf_counter', time.time)
+
 
 class EventLoop(threading.Thread):
     """Event loop for automatically processing events from libspotify.
@@ -57,42 +55,124 @@ class EventLoop(threading.Thread):
 
         self._session = session
         self._runnable = True
-        self._queue = queue.Queue()
+        self._wakeup = threading.Event()
+        self._mutex = threading.Lock()
+        self._notified_at = None
+        self._stats = [0, 0, 0, 0.0, 0.0, 0.0, 0.0, None]
 
     def start(self):
-        """Start the event loop."""
+        """Start the event loop.
+
+        Raises :exc:`RuntimeError` in the
+        :attr:`~spotify.LockMode.SINGLE_THREADED` lock mode.
+        """
+        if spotify.get_lock_mode() == spotify.LockMode.SINGLE_THREADED:
+            raise RuntimeError(
+                'The event loop cannot be used in the single-threaded lock '
+                'mode')
         self._session.on(
             spotify.SessionEvent.NOTIFY_MAIN_THREAD,
             self._on_notify_main_thread)
-        threading.Thread.start(self)
+        # The session must know about the event loop before it runs, so that
+        # a load() right after start() waits for the event loop instead of
+        # processing events itself.
+        previous_event_loop = self._session._event_loop
+        self._session._event_loop = self
+        try:
+            threading.Thread.start(self)
+        except Exception:
+            self._session._event_loop = previous_event_loop
+            raise
 
     def stop(self):
         """Stop the event loop."""
         self._runnable = False
+        if self._session._event_loop is self:
+            self._session._event_loop = None
         self._session.off(
             spotify.SessionEvent.NOTIFY_MAIN_THREAD,
             self._on_notify_main_thread)
+        self._wakeup.set()
+
+    @property
+    def stats(self):
+        """An :class:`EventLoopStats` snapshot of the event loop's metrics.
+
+        The metrics are always recorded, as recording them is cheap compared
+        to processing events.
+        """
+        with self._mutex:
+            return EventLoopStats(*self._stats)
 
     def run(self):
         logger.debug('Spotify event loop started')
-        timeout = self._session.process_events() / 1000.0
+        timeout = self._process_events(None)
         while self._runnable:
-            try:
-                logger.debug('Waiting %.3fs for new events', timeout)
-                self._queue.get(timeout=timeout)
-            except queue.Empty:
-                logger.debug('Timeout reached; processing events')
-            else:
+            logger.debug('Waiting %.3fs for new events', timeout)
+            if self._wakeup.wait(timeout):
                 logger.debug('Notification received; processing events')
-            finally:
-                timeout = self._session.process_events() / 1000.0
+            else:
+                logger.debug('Timeout reached; processing events')
+            if not self._runnable:
+                break
+            with self._mutex:
+                # All notifications received since the last time events were
+                # processed are handled by a single process_events() call.
+                self._wakeup.clear()
+                notified_at = self._notified_at
+                self._notified_at = None
+            timeout = self._process_events(notified_at)
         logger.debug('Spotify event loop stopped')
 
+    def _process_events(self, notified_at):
+        start = _clock()
+        timeout = self._session.process_events() / 1000.0
+        duration = _clock() - start
+        with self._mutex:
+            stats = self._stats
+            stats[0] += 1
+            if notified_at is not None:
+                latency = start - notified_at
+                stats[2] += 1
+                stats[3] += latency
+                stats[4] = max(stats[4], latency)
+            stats[5] += duration
+            stats[6] = max(stats[6], duration)
+            stats[7] = timeout
+        return timeout
+
     def _on_notify_main_thread(self, session):
         # WARNING: This event listener is called from an internal libspotify
         # thread. It must not block.
-        try:
-            self._queue.put_nowait(1)
-        except queue.Full:
-            logger.warning(
-                'Event loop queue full; dropped notification event')
+        with self._mutex:
+            self._stats[1] += 1
+            if self._notified_at is None:
+                self._notified_at = _clock()
+            self._wakeup.set()
+
+
+class EventLoopStats(collections.namedtuple('EventLoopStats', [
+        'iterations', 'notifications', 'wakeups',
+        'notify_latency', 'max_notify_latency',
+        'process_time', 'max_process_time', 'timeout'])):
+    """Metrics of an :class:`EventLoop`, as returned by
+    :attr:`EventLoop.stats`.
+
+    ``iterations`` is the number of :meth:`~spotify.Session.process_events`
+    calls. ``notifications`` is the number of
+    :attr:`~spotify.SessionEvent.NOTIFY_MAIN_THREAD` events received, and
+    ``wakeups`` is the number of iterations started by one or more of them,
+    instead of by the timeout. Notifications arriving while events are being
+    processed are coalesced into a single wakeup, so ``notifications /
+    iterations`` is the number of notifications handled per iteration.
+
+    ``notify_latency`` and ``max_notify_latency`` are the total and longest
+    number of seconds from the first notification of a wakeup until
+    :meth:`~spotify.Session.process_events` was called.
+    ``process_time`` and ``max_process_time`` are the total and longest
+    number of seconds spent in :meth:`~spotify.Session.process_events`.
+
+    ``timeout`` is the number of seconds until the next call, as returned by
+    the most recent :meth:`~spotify.Session.process_events` call, or
+    :class:`None` if it hasn't been called yet.
+    """
@@ -31,6 +31,8 @@ class Image(object):
         u'data:image/jpeg;base64,/9j/4AAQSkZJRgABAQEBLAEsAAD'
     """
 
+    __slots__ = ['_session', '_sp_image', '_load_event', '_callback_handles']
+
     def __init__(self, session, uri=None, sp_image=None, add_ref=True):
         assert uri or sp_image, 'uri or sp_image is required'
 
@@ -48,15 +50,17 @@ class Image(object):
             lib.sp_image_add_ref(sp_image)
         self._sp_image = ffi.gc(sp_image, lib.sp_image_release)
 
-        self.load_event = threading.Event()
+        self._load_event = threading.Event()
         self._callback_handles = set()
 
     def __repr__(self):
         return 'Image(%r)' % self.link.uri
 
-    # FIXME The event is never set.
-    load_event = None
-    """:class:`threading.Event` that is set when the image is loaded."""
+    @property
+    def load_event(self):
+        """:class:`threading.Event` that is set when the image is loaded."""
+        # FIXME The event is never set.
+        return self._load_event
 
     @serialized
     def add_load_callback(self, callback):
@@ -109,6 +113,17 @@ class Image(object):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None):
+        """Load the image's data without blocking.
+
+        Returns an :class:`asyncio.Future` that is done when the image is
+        loaded, with the image as its result. If ``timeout`` is :class:`None`
+        the default timeout is used.
+
+        Requires a running :class:`AsyncioEventLoop`.
+        """
+        return utils.load_async(self._session, self, timeout=timeout)
+
     @property
     def format(self):
         """The :class:`ImageFormat` of the image.
@@ -167,6 +182,7 @@ def _image_load_callback(sp_image, handle):
         return
     (callback, image) = ffi.from_handle(handle)
     image._callback_handles.remove(handle)
+    image._session._notify_loaded()
     if callback is not None:
         callback(image)
 
@@ -27,6 +27,7 @@ class InboxPostResult(object):
 
         self._session = session
         self.complete_event = threading.Event()
+        self.future = utils.create_request_future(self)
         self._callback_handles = set()
 
         if sp_inbox is None:
@@ -61,6 +62,15 @@ class InboxPostResult(object):
     completed.
     """
 
+    future = None
+    """:class:`concurrent.futures.Future` that is done when the inbox post is
+    completed.
+
+    The future's result is the :class:`InboxPostResult` itself, or a
+    :exc:`~spotify.LibError` if the request failed. The future is :class:`None`
+    if :mod:`concurrent.futures` isn't available.
+    """
+
     def __repr__(self):
         if not self.complete_event.is_set():
             return '<InboxPostResult: pending>'
@@ -85,5 +95,6 @@ def _inboxpost_complete_callback(sp_inbox, handle):
     (callback, inbox_post_result) = ffi.from_handle(handle)
     inbox_post_result._callback_handles.remove(handle)
     inbox_post_result.complete_event.set()
+    utils.complete_request_future(inbox_post_result)
     if callback is not None:
         callback(inbox_post_result)
@@ -39,6 +39,8 @@ class Link(object):
         u'Get Lucky'
     """
 
+    __slots__ = ['_session', '_sp_link']
+
     def __init__(self, session, uri=None, sp_link=None, add_ref=True):
         assert uri or sp_link, 'uri or sp_link is required'
 
@@ -77,7 +79,7 @@ class Link(object):
         sp_track = lib.sp_link_as_track(self._sp_link)
         if sp_track == ffi.NULL:
             return None
-        return spotify.Track(self._session, sp_track=sp_track, add_ref=True)
+        return spotify.Track._cached(self._session, sp_track, add_ref=True)
 
     def as_track_offset(self):
         """Get the track offset in milliseconds from the link."""
@@ -93,7 +95,7 @@ class Link(object):
         sp_album = lib.sp_link_as_album(self._sp_link)
         if sp_album == ffi.NULL:
             return None
-        return spotify.Album(self._session, sp_album=sp_album, add_ref=True)
+        return spotify.Album._cached(self._session, sp_album, add_ref=True)
 
     @serialized
     def as_artist(self):
@@ -101,7 +103,7 @@ class Link(object):
         sp_artist = lib.sp_link_as_artist(self._sp_link)
         if sp_artist == ffi.NULL:
             return None
-        return spotify.Artist(self._session, sp_artist=sp_artist, add_ref=True)
+        return spotify.Artist._cached(self._session, sp_artist, add_ref=True)
 
     def as_playlist(self):
         """Make a :class:`Playlist` from the link."""
@@ -120,7 +122,7 @@ class Link(object):
         sp_user = lib.sp_link_as_user(self._sp_link)
         if sp_user == ffi.NULL:
             return None
-        return spotify.User(self._session, sp_user=sp_user, add_ref=True)
+        return spotify.User._cached(self._session, sp_user, add_ref=True)
 
     def as_image(self):
         """Make an :class:`Image` from the link."""
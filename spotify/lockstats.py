@@ -0,0 +1,370 @@
+from __future__ import unicode_literals
+
+import collections
+import functools
+import sys
+import threading
+import time
+
+import spotify
+
+
+__all__ = [
+    'LockStats',
+    'LockStatsEntry',
+    'disable_lock_stats',
+    'enable_lock_stats',
+    'get_lock_stats',
+]
+
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+
+def enable_lock_stats(num_samples=1000):
+    """Start recording statistics about the use of pyspotify's global lock.
+
+    When enabled, the time spent waiting for the lock, the time the lock is
+    held, and the number of lock acquisitions are recorded for each
+    libspotify function and each internal pyspotify function that holds the
+    lock. Only the outermost acquisition in each thread is recorded, so a
+    libspotify function called from a pyspotify function that already holds
+    the lock is counted as part of the pyspotify function. Use
+    :func:`get_lock_stats` to get the statistics.
+
+    ``num_samples`` is the number of most recent wait and hold times that are
+    kept for each function in each thread to calculate percentiles from.
+
+    The instrumentation is installed by replacing the lock and the library
+    function wrappers. While it is disabled, the only cost left is a check in
+    each function decorated with :func:`~spotify.serialized`. The statistics
+    are recorded per thread, and only merged by :func:`get_lock_stats`.
+    Enabling the lock statistics again resets all the recorded statistics.
+    """
+    collector = _LockStatsCollector(num_samples)
+    with spotify._lock:
+        base_lock = spotify._lock
+        if isinstance(base_lock, _InstrumentedLock):
+            base_lock = base_lock._lock
+        spotify._lock_stats = collector
+        spotify._lock = collector.instrument(base_lock)
+        spotify._install_lib_wrappers(spotify.lib)
+
+
+def disable_lock_stats():
+    """Stop recording lock statistics.
+
+    The statistics recorded so far are discarded.
+    """
+    if spotify._lock_stats is None:
+        return
+    with spotify._lock:
+        spotify._lock_stats = None
+        spotify._lock = spotify._lock._lock
+        spotify._install_lib_wrappers(spotify.lib)
+
+
+def get_lock_stats():
+    """Get a :class:`LockStats` snapshot of the lock statistics recorded so
+    far.
+
+    Returns :class:`None` if the lock statistics isn't enabled.
+    """
+    collector = spotify._lock_stats
+    if collector is None:
+        return None
+    return collector.snapshot()
+
+
+class LockStatsEntry(collections.namedtuple('LockStatsEntry', [
+        'name', 'count', 'wait_time', 'hold_time',
+        'max_wait_time', 'max_hold_time',
+        'wait_percentiles', 'hold_percentiles'])):
+    """Lock statistics for a single function.
+
+    ``name`` is the name of the libspotify function, like ``sp_track_name``,
+    or the full name of the pyspotify function, like
+    ``spotify.track.Track.name``.
+
+    ``count`` is the number of lock acquisitions. ``wait_time`` and
+    ``hold_time`` are the total number of seconds spent waiting for and
+    holding the lock. ``max_wait_time`` and ``max_hold_time`` are the longest
+    single wait and hold times.
+
+    ``wait_percentiles`` and ``hold_percentiles`` are dicts mapping the 50th,
+    90th, 99th, and 100th percentiles to the wait and hold time in seconds, as
+    calculated from the most recent samples.
+    """
+
+
+class LockStats(object):
+    """A snapshot of the lock statistics, as returned by
+    :func:`get_lock_stats`.
+
+    The snapshot is a mapping from function names to :class:`LockStatsEntry`
+    instances::
+
+        >>> import spotify
+        >>> spotify.enable_lock_stats()
+        # ...
+        >>> stats = spotify.get_lock_stats()
+        >>> stats['sp_session_process_events'].hold_percentiles[99]
+        0.00231
+        >>> [entry.name for entry in stats.top_holders(3)]
+        ['sp_session_process_events', 'spotify.track.Track.name', ...]
+    """
+
+    def __init__(self, entries, duration):
+        self.entries = entries
+        self.duration = duration
+
+    entries = None
+    """A dict mapping function names to :class:`LockStatsEntry` instances."""
+
+    duration = None
+    """The number of seconds the lock statistics have been recorded for."""
+
+    def __repr__(self):
+        return '<LockStats: %d functions, %d acquisitions>' % (
+            len(self.entries), self.count)
+
+    def __getitem__(self, name):
+        return self.entries[name]
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def count(self):
+        """The total number of lock acquisitions."""
+        return sum(entry.count for entry in self.entries.values())
+
+    @property
+    def wait_time(self):
+        """The total number of seconds spent waiting for the lock."""
+        return sum(entry.wait_time for entry in self.entries.values())
+
+    @property
+    def hold_time(self):
+        """The total number of seconds the lock has been held."""
+        return sum(entry.hold_time for entry in self.entries.values())
+
+    def top_holders(self, limit=10):
+        """The ``limit`` :class:`LockStatsEntry` instances with the longest
+        total hold time, sorted by decreasing hold time."""
+        return sorted(
+            self.entries.values(),
+            key=lambda entry: entry.hold_time, reverse=True)[:limit]
+
+    def top_waiters(self, limit=10):
+        """The ``limit`` :class:`LockStatsEntry` instances with the longest
+        total wait time, sorted by decreasing wait time."""
+        return sorted(
+            self.entries.values(),
+            key=lambda entry: entry.wait_time, reverse=True)[:limit]
+
+
+_PERCENTILES = (50, 90, 99, 100)
+
+
+def _percentiles(samples):
+    samples = sorted(samples)
+    if not samples:
+        return dict((percentile, 0.0) for percentile in _PERCENTILES)
+    return dict(
+        (percentile,
+         samples[max(0, -(-len(samples) * percentile // 100) - 1)])
+        for percentile in _PERCENTILES)
+
+
+class _LockStatsCollector(object):
+    """Collects lock statistics for :func:`get_lock_stats`.
+
+    Each thread records into a dict of its own, so recording doesn't need any
+    locking. The dicts are merged by :meth:`snapshot`.
+
+    Internal class.
+    """
+
+    def __init__(self, num_samples):
+        self._num_samples = num_samples
+        self._mutex = threading.Lock()
+        self._local = threading.local()
+        self._thread_entries = []
+        self._started = time.time()
+
+    def record(self, name, wait_time, hold_time):
+        entries = getattr(self._local, 'entries', None)
+        if entries is None:
+            entries = self._local.entries = {}
+            with self._mutex:
+                self._thread_entries.append(entries)
+        entry = entries.get(name)
+        if entry is None:
+            entry = entries[name] = [
+                0, 0.0, 0.0, 0.0, 0.0,
+                collections.deque(maxlen=self._num_samples),
+                collections.deque(maxlen=self._num_samples)]
+        entry[0] += 1
+        entry[1] += wait_time
+        entry[2] += hold_time
+        if wait_time > entry[3]:
+            entry[3] = wait_time
+        if hold_time > entry[4]:
+            entry[4] = hold_time
+        entry[5].append(wait_time)
+        entry[6].append(hold_time)
+
+    def snapshot(self):
+        with self._mutex:
+            thread_entries = list(self._thread_entries)
+        merged = {}
+        for entries in thread_entries:
+            # The copies are made without running any Python code, so they
+            # are safe while the thread keeps recording.
+            for name, entry in list(entries.items()):
+                totals = entry[:5]
+                wait_samples, hold_samples = list(entry[5]), list(entry[6])
+                if name not in merged:
+                    merged[name] = (totals, wait_samples, hold_samples)
+                    continue
+                merged_totals = merged[name][0]
+                for i in range(3):
+                    merged_totals[i] += totals[i]
+                for i in range(3, 5):
+                    merged_totals[i] = max(merged_totals[i], totals[i])
+                merged[name][1].extend(wait_samples)
+                merged[name][2].extend(hold_samples)
+        stats = {}
+        for name, (totals, wait_samples, hold_samples) in merged.items():
+            stats[name] = LockStatsEntry(
+                name, *totals,
+                wait_percentiles=_percentiles(wait_samples),
+                hold_percentiles=_percentiles(hold_samples))
+        return LockStats(stats, time.time() - self._started)
+
+    def instrument(self, lock):
+        """Wrap ``lock`` in a proxy that records lock statistics."""
+        return _InstrumentedLock(lock, self)
+
+    def call(self, lock, name, func, args, kwargs):
+        """Call ``func`` while holding ``lock``, and record lock statistics
+        under the given ``name``.
+
+        Used by functions decorated with :func:`~spotify.serialized`.
+        """
+        enter = getattr(lock, 'enter', None)
+        if enter is None:
+            # Lock statistics are being enabled or disabled by another thread
+            with lock:
+                return func(*args, **kwargs)
+        enter(name)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            lock.exit()
+
+    def wrap(self, name, func, lock, shared=False):
+        """Wrap the library function ``func`` so that it records lock
+        statistics under the given ``name``."""
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            lock.enter(name, shared)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                lock.exit()
+        if not hasattr(wrapper, '__wrapped__'):
+            # Workaround for Python < 3.2
+            wrapper.__wrapped__ = func
+        return wrapper
+
+
+class _InstrumentedLock(object):
+    """Proxy for the global lock that records lock statistics.
+
+    The proxy replaces :attr:`spotify._lock` while lock statistics are
+    enabled. Functions decorated with :func:`~spotify.serialized` pass their
+    name to :meth:`enter` through :meth:`_LockStatsCollector.call`, and pay
+    nothing but a check of :attr:`spotify._lock_stats` when the statistics are
+    disabled. Other users of the lock are recorded under the name of the
+    calling code. Reentrant acquisitions are part of the outermost
+    acquisition in the same thread, and aren't recorded on their own.
+
+    Internal class.
+    """
+
+    def __init__(self, lock, collector):
+        self._lock = lock
+        self._collector = collector
+        self._local = threading.local()
+
+    def enter(self, name, shared=False):
+        start = _clock()
+        if shared:
+            self._lock.acquire_shared()
+        else:
+            self._lock.acquire()
+        self._push(name, shared, start)
+
+    def exit(self):
+        name, shared, start, acquired = self._local.stack.pop()
+        released = _clock()
+        if shared:
+            self._lock.release_shared()
+        else:
+            self._lock.release()
+        if name is not None:
+            self._collector.record(
+                name, acquired - start, released - acquired)
+
+    def _push(self, name, shared, start):
+        acquired = _clock()
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        if stack:
+            # Reentrant acquisition, part of the outermost one's hold time
+            name = None
+        stack.append((name, shared, start, acquired))
+
+    def __enter__(self):
+        self.enter(_get_caller_name(sys._getframe(1)))
+        return self
+
+    def __exit__(self, *exc_info):
+        self.exit()
+
+    def acquire(self, blocking=True, timeout=-1):
+        start = _clock()
+        if blocking and timeout == -1:
+            acquired = self._lock.acquire()
+        elif timeout == -1:
+            acquired = self._lock.acquire(blocking)
+        else:
+            acquired = self._lock.acquire(blocking, timeout)
+        if not acquired:
+            return False
+        self._push(_get_caller_name(sys._getframe(1)), False, start)
+        return True
+
+    def release(self):
+        self.exit()
+
+    def acquire_shared(self):
+        self.enter(_get_caller_name(sys._getframe(1)), shared=True)
+
+    def release_shared(self):
+        self.exit()
+
+
+def _get_caller_name(frame):
+    code = frame.f_code
+    return '%s:%s' % (code.co_filename, code.co_name)
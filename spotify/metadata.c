@@ -0,0 +1,77 @@
+/*
+ * Implementation of the functions declared in spotify/metadata.h.
+ *
+ * Fields that libspotify only defines for loaded objects are left zeroed for
+ * objects that aren't loaded yet.
+ */
+
+#include <string.h>
+
+void pyspotify_fetch_track_metadata(sp_session *session, sp_track **tracks, int num_tracks, pyspotify_track_metadata *metadata) {
+  int i, j;
+  sp_track *track;
+  pyspotify_track_metadata *m;
+
+  for (i = 0; i < num_tracks; i++) {
+    track = tracks[i];
+    m = &metadata[i];
+    memset(m, 0, sizeof(*m));
+
+    m->error = sp_track_error(track);
+    m->is_loaded = sp_track_is_loaded(track);
+    m->name = sp_track_name(track);
+    m->duration = sp_track_duration(track);
+    m->disc = sp_track_disc(track);
+    m->index = sp_track_index(track);
+    m->album = sp_track_album(track);
+
+    if (!m->is_loaded) {
+      continue;
+    }
+
+    m->offline_status = sp_track_offline_get_status(track);
+    m->availability = sp_track_get_availability(session, track);
+    m->is_local = sp_track_is_local(session, track);
+    m->is_autolinked = sp_track_is_autolinked(session, track);
+    m->is_placeholder = sp_track_is_placeholder(track);
+    m->is_starred = sp_track_is_starred(session, track);
+    m->popularity = sp_track_popularity(track);
+    m->num_artists = sp_track_num_artists(track);
+    for (j = 0; j < m->num_artists && j < PYSPOTIFY_MAX_ARTISTS; j++) {
+      m->artists[j] = sp_track_artist(track, j);
+    }
+  }
+}
+
+void pyspotify_fetch_album_metadata(sp_album **albums, int num_albums, pyspotify_album_metadata *metadata) {
+  int i;
+  sp_album *album;
+  pyspotify_album_metadata *m;
+
+  for (i = 0; i < num_albums; i++) {
+    album = albums[i];
+    m = &metadata[i];
+    memset(m, 0, sizeof(*m));
+
+    m->is_loaded = sp_album_is_loaded(album);
+    m->name = sp_album_name(album);
+    m->artist = sp_album_artist(album);
+
+    if (!m->is_loaded) {
+      continue;
+    }
+
+    m->is_available = sp_album_is_available(album);
+    m->year = sp_album_year(album);
+    m->type = sp_album_type(album);
+  }
+}
+
+void pyspotify_fetch_artist_metadata(sp_artist **artists, int num_artists, pyspotify_artist_metadata *metadata) {
+  int i;
+
+  for (i = 0; i < num_artists; i++) {
+    metadata[i].is_loaded = sp_artist_is_loaded(artists[i]);
+    metadata[i].name = sp_artist_name(artists[i]);
+  }
+}
@@ -0,0 +1,49 @@
+/*
+ * Batched metadata extraction for tracks, albums, and artists.
+ *
+ * Each function fills one struct per object with all the object's metadata,
+ * so that a list of objects can be read with a single call from Python
+ * instead of one call per object and property. See spotify/metadata.py.
+ *
+ * This file is used both as C source and as CFFI declarations, and must
+ * only contain declarations that CFFI can parse.
+ */
+
+#define PYSPOTIFY_MAX_ARTISTS 16
+
+typedef struct pyspotify_track_metadata {
+  sp_error error;
+  bool is_loaded;
+  sp_track_offline_status offline_status;
+  sp_track_availability availability;
+  bool is_local;
+  bool is_autolinked;
+  bool is_placeholder;
+  bool is_starred;
+  const char *name;
+  int duration;
+  int popularity;
+  int disc;
+  int index;
+  sp_album *album;
+  int num_artists;
+  sp_artist *artists[16];
+} pyspotify_track_metadata;
+
+typedef struct pyspotify_album_metadata {
+  bool is_loaded;
+  bool is_available;
+  const char *name;
+  int year;
+  sp_albumtype type;
+  sp_artist *artist;
+} pyspotify_album_metadata;
+
+typedef struct pyspotify_artist_metadata {
+  bool is_loaded;
+  const char *name;
+} pyspotify_artist_metadata;
+
+void pyspotify_fetch_track_metadata(sp_session *session, sp_track **tracks, int num_tracks, pyspotify_track_metadata *metadata);
+void pyspotify_fetch_album_metadata(sp_album **albums, int num_albums, pyspotify_album_metadata *metadata);
+void pyspotify_fetch_artist_metadata(sp_artist **artists, int num_artists, pyspotify_artist_metadata *metadata);
@@ -0,0 +1,305 @@
+from __future__ import unicode_literals
+
+import collections
+
+import spotify
+from spotify import ffi, lib, serialized, utils
+
+
+__all__ = [
+    'AlbumInfo',
+    'AlbumMetadata',
+    'ArtistInfo',
+    'ArtistMetadata',
+    'TrackInfo',
+    'TrackMetadata',
+    'fetch_metadata_many',
+    'snapshot_many',
+]
+
+
+class TrackMetadata(collections.namedtuple('TrackMetadata', [
+        'error', 'is_loaded', 'offline_status', 'availability', 'is_local',
+        'is_autolinked', 'is_placeholder', 'starred', 'name', 'duration',
+        'popularity', 'disc', 'index', 'album', 'artists'])):
+    """All metadata about a :class:`~spotify.Track`, as returned by
+    :meth:`Track.fetch_metadata() <spotify.Track.fetch_metadata>`.
+
+    The fields have the same values as the track properties with the same
+    names, except that :attr:`error` never is raised as an exception.
+    """
+
+
+class AlbumMetadata(collections.namedtuple('AlbumMetadata', [
+        'is_loaded', 'is_available', 'name', 'year', 'type', 'artist'])):
+    """All metadata about an :class:`~spotify.Album`, as returned by
+    :meth:`Album.fetch_metadata() <spotify.Album.fetch_metadata>`.
+
+    The fields have the same values as the album properties with the same
+    names.
+    """
+
+
+class ArtistMetadata(collections.namedtuple('ArtistMetadata', [
+        'is_loaded', 'name'])):
+    """All metadata about an :class:`~spotify.Artist`, as returned by
+    :meth:`Artist.fetch_metadata() <spotify.Artist.fetch_metadata>`.
+
+    The fields have the same values as the artist properties with the same
+    names.
+    """
+
+
+class TrackInfo(collections.namedtuple('TrackInfo', [
+        'uri', 'error', 'is_loaded', 'offline_status', 'availability',
+        'is_local', 'is_autolinked', 'is_placeholder', 'starred', 'name',
+        'duration', 'popularity', 'disc', 'index', 'album', 'artists'])):
+    """An immutable snapshot of a :class:`~spotify.Track`, as returned by
+    :meth:`Track.snapshot() <spotify.Track.snapshot>`.
+
+    The fields are the same as in :class:`TrackMetadata`, and the ``uri`` of
+    the track's link. ``album`` is an :class:`AlbumInfo` and ``artists`` is a
+    tuple of :class:`ArtistInfo`, so a snapshot holds no references to
+    libspotify objects.
+    """
+
+    __slots__ = ()
+
+
+class AlbumInfo(collections.namedtuple('AlbumInfo', [
+        'uri', 'is_loaded', 'is_available', 'name', 'year', 'type',
+        'artist'])):
+    """An immutable snapshot of an :class:`~spotify.Album`, as returned by
+    :meth:`Album.snapshot() <spotify.Album.snapshot>`.
+
+    The fields are the same as in :class:`AlbumMetadata`, and the ``uri`` of
+    the album's link. ``artist`` is an :class:`ArtistInfo`.
+    """
+
+    __slots__ = ()
+
+
+class ArtistInfo(collections.namedtuple('ArtistInfo', [
+        'uri', 'is_loaded', 'name'])):
+    """An immutable snapshot of an :class:`~spotify.Artist`, as returned by
+    :meth:`Artist.snapshot() <spotify.Artist.snapshot>`.
+
+    The fields are the same as in :class:`ArtistMetadata`, and the ``uri`` of
+    the artist's link.
+    """
+
+    __slots__ = ()
+
+
+@serialized
+def fetch_metadata_many(objects):
+    """Get the metadata of many tracks, albums, and artists at once.
+
+    ``objects`` is a list of :class:`~spotify.Track`, :class:`~spotify.Album`,
+    and :class:`~spotify.Artist` instances, in any combination. Returns a list
+    with a :class:`TrackMetadata`, :class:`AlbumMetadata`, or
+    :class:`ArtistMetadata` for each of the objects, in the same order.
+
+    The metadata of all objects of the same type is read from libspotify with
+    a single call, which is much faster than reading the properties of the
+    objects one by one::
+
+        >>> playlist = session.get_playlist(
+        ...     'spotify:user:fiat500c:playlist:54k50VZdvtnIPt4d8RBCmZ')
+        >>> playlist.load()
+        >>> tracks = playlist.tracks
+        >>> [metadata.name for metadata in spotify.fetch_metadata_many(tracks)]
+        [u'Jahwar', u'Crackling Fire', ...]
+    """
+    objects = list(objects)
+    result = [None] * len(objects)
+    tracks, albums, artists = [], [], []
+    for i, obj in enumerate(objects):
+        if isinstance(obj, spotify.Track):
+            tracks.append((i, obj))
+        elif isinstance(obj, spotify.Album):
+            albums.append((i, obj))
+        elif isinstance(obj, spotify.Artist):
+            artists.append((i, obj))
+        else:
+            raise TypeError(
+                'Expected Track, Album, or Artist, got %r' % type(obj))
+    if tracks:
+        _fetch_track_metadata(tracks, result)
+    if albums:
+        _fetch_album_metadata(albums, result)
+    if artists:
+        _fetch_artist_metadata(artists, result)
+    return result
+
+
+def _fetch_track_metadata(tracks, result):
+    session = tracks[0][1]._session
+    sp_tracks = ffi.new(
+        'sp_track *[]', [track._sp_track for _, track in tracks])
+    sp_metadata = ffi.new('pyspotify_track_metadata[]', len(tracks))
+    lib.pyspotify_fetch_track_metadata(
+        session._sp_session, sp_tracks, len(tracks), sp_metadata)
+
+    for j, (i, track) in enumerate(tracks):
+        m = sp_metadata[j]
+        is_loaded = bool(m.is_loaded)
+        if is_loaded:
+            artists = [
+                _get_track_artist(session, track, m, k)
+                for k in range(m.num_artists)]
+        else:
+            artists = []
+        result[i] = TrackMetadata(
+            error=spotify.ErrorType(m.error),
+            is_loaded=is_loaded,
+            offline_status=(
+                spotify.TrackOfflineStatus(m.offline_status)
+                if is_loaded else None),
+            availability=(
+                spotify.TrackAvailability(m.availability)
+                if is_loaded else None),
+            is_local=bool(m.is_local) if is_loaded else None,
+            is_autolinked=bool(m.is_autolinked) if is_loaded else None,
+            is_placeholder=bool(m.is_placeholder) if is_loaded else None,
+            starred=bool(m.is_starred) if is_loaded else None,
+            name=utils.to_unicode(m.name) or None,
+            duration=m.duration or None,
+            popularity=m.popularity if is_loaded else None,
+            disc=m.disc or None,
+            index=m.index or None,
+            album=(
+                spotify.Album._cached(session, m.album, add_ref=True)
+                if m.album != ffi.NULL else None),
+            artists=artists)
+
+
+def _get_track_artist(session, track, m, k):
+    if k < lib.PYSPOTIFY_MAX_ARTISTS:
+        sp_artist = m.artists[k]
+    else:
+        sp_artist = lib.sp_track_artist(track._sp_track, k)
+    return spotify.Artist._cached(session, sp_artist, add_ref=True)
+
+
+def _fetch_album_metadata(albums, result):
+    sp_albums = ffi.new(
+        'sp_album *[]', [album._sp_album for _, album in albums])
+    sp_metadata = ffi.new('pyspotify_album_metadata[]', len(albums))
+    lib.pyspotify_fetch_album_metadata(sp_albums, len(albums), sp_metadata)
+
+    for j, (i, album) in enumerate(albums):
+        m = sp_metadata[j]
+        is_loaded = bool(m.is_loaded)
+        session = album._session
+        result[i] = AlbumMetadata(
+            is_loaded=is_loaded,
+            is_available=bool(m.is_available) if is_loaded else None,
+            name=utils.to_unicode(m.name) or None,
+            year=m.year if is_loaded else None,
+            type=spotify.AlbumType(m.type) if is_loaded else None,
+            artist=(
+                spotify.Artist._cached(session, m.artist, add_ref=True)
+                if m.artist != ffi.NULL else None))
+
+
+def _fetch_artist_metadata(artists, result):
+    sp_artists = ffi.new(
+        'sp_artist *[]', [artist._sp_artist for _, artist in artists])
+    sp_metadata = ffi.new('pyspotify_artist_metadata[]', len(artists))
+    lib.pyspotify_fetch_artist_metadata(
+        sp_artists, len(artists), sp_metadata)
+
+    for j, (i, artist) in enumerate(artists):
+        m = sp_metadata[j]
+        result[i] = ArtistMetadata(
+            is_loaded=bool(m.is_loaded),
+            name=utils.to_unicode(m.name) or None)
+
+
+@serialized
+def snapshot_many(objects):
+    """Get immutable snapshots of many tracks, albums, and artists at once.
+
+    ``objects`` is a list of :class:`~spotify.Track`, :class:`~spotify.Album`,
+    and :class:`~spotify.Artist` instances, in any combination. Returns a list
+    with a :class:`TrackInfo`, :class:`AlbumInfo`, or :class:`ArtistInfo` for
+    each of the objects, in the same order.
+
+    All the snapshots, including the snapshots of the tracks' albums and
+    artists, are read while holding the lock once, so they are consistent
+    with each other. The snapshots only contain plain Python values, and can
+    be used from any thread without calling into libspotify::
+
+        >>> [(t.name, t.album.name) for t in spotify.snapshot_many(tracks)]
+        [(u'Jahwar', u'Jahwar'), (u'Crackling Fire', u'Dark Matter'), ...]
+    """
+    objects = list(objects)
+    metadata = {}
+    pending = objects
+    while pending:
+        unique = collections.OrderedDict()
+        for obj in pending:
+            key = _get_sp_object(obj)
+            if key not in metadata:
+                unique[key] = obj
+        pending = []
+        fetched = fetch_metadata_many(unique.values())
+        for (key, obj), m in zip(unique.items(), fetched):
+            metadata[key] = m
+            if isinstance(m, TrackMetadata):
+                if m.album is not None:
+                    pending.append(m.album)
+                pending.extend(m.artists)
+            elif isinstance(m, AlbumMetadata) and m.artist is not None:
+                pending.append(m.artist)
+
+    snapshots = {}
+    return [_get_snapshot(obj, metadata, snapshots) for obj in objects]
+
+
+def _get_sp_object(obj):
+    if isinstance(obj, spotify.Track):
+        return obj._sp_track
+    elif isinstance(obj, spotify.Album):
+        return obj._sp_album
+    elif isinstance(obj, spotify.Artist):
+        return obj._sp_artist
+    raise TypeError('Expected Track, Album, or Artist, got %r' % type(obj))
+
+
+def _get_snapshot(obj, metadata, snapshots):
+    if obj is None:
+        return None
+    key = _get_sp_object(obj)
+    if key in snapshots:
+        return snapshots[key]
+    m = metadata[key]
+    fields = m._asdict()
+    if isinstance(m, TrackMetadata):
+        fields.update(
+            uri=_get_uri(lib.sp_link_create_from_track(key, 0)),
+            album=_get_snapshot(m.album, metadata, snapshots),
+            artists=tuple(
+                _get_snapshot(artist, metadata, snapshots)
+                for artist in m.artists))
+        snapshot = TrackInfo(**fields)
+    elif isinstance(m, AlbumMetadata):
+        fields.update(
+            uri=_get_uri(lib.sp_link_create_from_album(key)),
+            artist=_get_snapshot(m.artist, metadata, snapshots))
+        snapshot = AlbumInfo(**fields)
+    else:
+        fields.update(uri=_get_uri(lib.sp_link_create_from_artist(key)))
+        snapshot = ArtistInfo(**fields)
+    snapshots[key] = snapshot
+    return snapshot
+
+
+def _get_uri(sp_link):
+    if sp_link == ffi.NULL:
+        return None
+    try:
+        return utils.get_with_growing_buffer(lib.sp_link_as_string, sp_link)
+    finally:
+        lib.sp_link_release(sp_link)
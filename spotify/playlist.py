@@ -49,8 +49,11 @@ class Playlist(utils.EventEmitter):
 
         Internal method.
         """
-        if sp_playlist in session._cache:
-            return session._cache[sp_playlist]
+        playlist = session._cache.get(sp_playlist)
+        if playlist is not None:
+            if not add_ref:
+                lib.sp_playlist_release(sp_playlist)
+            return playlist
         playlist = Playlist(session, sp_playlist=sp_playlist, add_ref=add_ref)
         session._cache[sp_playlist] = playlist
         return playlist
@@ -107,6 +110,17 @@ class Playlist(utils.EventEmitter):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None):
+        """Load the playlist's data without blocking.
+
+        Returns an :class:`asyncio.Future` that is done when the playlist is
+        loaded, with the playlist as its result. If ``timeout`` is
+        :class:`None` the default timeout is used.
+
+        Requires a running :class:`AsyncioEventLoop`.
+        """
+        return utils.load_async(self._session, self, timeout=timeout)
+
     @property
     @serialized
     def tracks(self):
@@ -119,9 +133,9 @@ class Playlist(utils.EventEmitter):
 
         @serialized
         def get_track(sp_playlist, key):
-            return spotify.Track(
+            return spotify.Track._cached(
                 self._session,
-                sp_track=lib.sp_playlist_track(sp_playlist, key), add_ref=True)
+                lib.sp_playlist_track(sp_playlist, key), add_ref=True)
 
         # TODO Negative indexes
         # TODO Adding and removing tracks as if this was a regular list
@@ -179,9 +193,9 @@ class Playlist(utils.EventEmitter):
     @serialized
     def owner(self):
         """The :class:`User` object for the owner of the playlist."""
-        return spotify.User(
+        return spotify.User._cached(
             self._session,
-            sp_user=lib.sp_playlist_owner(self._sp_playlist), add_ref=True)
+            lib.sp_playlist_owner(self._sp_playlist), add_ref=True)
 
     @property
     def collaborative(self):
@@ -602,8 +616,8 @@ class _PlaylistCallbacks(object):
         playlist = Playlist._cached(
             spotify._session_instance, sp_playlist, add_ref=True)
         tracks = [
-            spotify.Track(
-                spotify._session_instance, sp_track=sp_tracks[i], add_ref=True)
+            spotify.Track._cached(
+                spotify._session_instance, sp_tracks[i], add_ref=True)
             for i in range(num_tracks)]
         playlist.emit(
             PlaylistEvent.TRACKS_ADDED, playlist, tracks, int(position))
@@ -645,6 +659,7 @@ class _PlaylistCallbacks(object):
         logger.debug('Playlist state changed')
         playlist = Playlist._cached(
             spotify._session_instance, sp_playlist, add_ref=True)
+        playlist._session._notify_loaded()
         playlist.emit(PlaylistEvent.PLAYLIST_STATE_CHANGED, playlist)
 
     @staticmethod
@@ -672,8 +687,8 @@ class _PlaylistCallbacks(object):
         logger.debug('Playlist track created changed')
         playlist = Playlist._cached(
             spotify._session_instance, sp_playlist, add_ref=True)
-        user = spotify.User(
-            spotify._session_instance, sp_user=sp_user, add_ref=True)
+        user = spotify.User._cached(
+            spotify._session_instance, sp_user, add_ref=True)
         playlist.emit(
             PlaylistEvent.TRACK_CREATED_CHANGED,
             playlist, int(position), user, int(when))
@@ -796,8 +811,11 @@ class PlaylistContainer(collections.MutableSequence, utils.EventEmitter):
 
         Internal method.
         """
-        if sp_playlistcontainer in session._cache:
-            return session._cache[sp_playlistcontainer]
+        playlist_container = session._cache.get(sp_playlistcontainer)
+        if playlist_container is not None:
+            if not add_ref:
+                lib.sp_playlistcontainer_release(sp_playlistcontainer)
+            return playlist_container
         playlist_container = PlaylistContainer(
             session,
             sp_playlistcontainer=sp_playlistcontainer, add_ref=add_ref)
@@ -845,6 +863,17 @@ class PlaylistContainer(collections.MutableSequence, utils.EventEmitter):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None):
+        """Load the playlist container's data without blocking.
+
+        Returns an :class:`asyncio.Future` that is done when the playlist
+        container is loaded, with the playlist container as its result. If
+        ``timeout`` is :class:`None` the default timeout is used.
+
+        Requires a running :class:`AsyncioEventLoop`.
+        """
+        return utils.load_async(self._session, self, timeout=timeout)
+
     def __len__(self):
         # Required by collections.Sequence
 
@@ -1055,9 +1084,9 @@ class PlaylistContainer(collections.MutableSequence, utils.EventEmitter):
     @serialized
     def owner(self):
         """The :class:`User` object for the owner of the playlist container."""
-        return spotify.User(
+        return spotify.User._cached(
             self._session,
-            sp_user=lib.sp_playlistcontainer_owner(self._sp_playlistcontainer),
+            lib.sp_playlistcontainer_owner(self._sp_playlistcontainer),
             add_ref=True)
 
     def get_unseen_tracks(self, playlist):
@@ -1236,6 +1265,7 @@ class _PlaylistContainerCallbacks(object):
         logger.debug('Playlist container loaded')
         playlist_container = PlaylistContainer._cached(
             spotify._session_instance, sp_playlistcontainer, add_ref=True)
+        playlist_container._session._notify_loaded()
         playlist_container.emit(
             PlaylistContainerEvent.CONTAINER_LOADED, playlist_container)
 
@@ -1258,6 +1288,8 @@ class PlaylistTrack(object):
     :class:`PlaylistTrack`.
     """
 
+    __slots__ = ['_session', '_sp_playlist', '_index']
+
     def __init__(self, session, sp_playlist, index):
         self._session = session
 
@@ -1272,9 +1304,9 @@ class PlaylistTrack(object):
     @serialized
     def track(self):
         """The :class:`~spotify.Track`."""
-        return spotify.Track(
+        return spotify.Track._cached(
             self._session,
-            sp_track=lib.sp_playlist_track(self._sp_playlist, self._index),
+            lib.sp_playlist_track(self._sp_playlist, self._index),
             add_ref=True)
 
     @property
@@ -1289,9 +1321,9 @@ class PlaylistTrack(object):
     @serialized
     def creator(self):
         """The :class:`~spotify.User` that added the track to the playlist."""
-        return spotify.User(
+        return spotify.User._cached(
             self._session,
-            sp_user=lib.sp_playlist_track_creator(
+            lib.sp_playlist_track_creator(
                 self._sp_playlist, self._index),
             add_ref=True)
 
@@ -1372,7 +1404,7 @@ class PlaylistUnseenTracks(collections.Sequence):
         sp_track = self._sp_tracks[key]
         if sp_track == ffi.NULL:
             return None
-        return spotify.Track(self._session, sp_track=sp_track, add_ref=True)
+        return spotify.Track._cached(self._session, sp_track, add_ref=True)
 
     def __repr__(self):
         return pprint.pformat(list(self))
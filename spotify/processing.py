@@ -0,0 +1,308 @@
+from __future__ import division, unicode_literals
+
+import collections
+import fractions
+import time
+
+import spotify
+from spotify.sink import Sink
+
+
+__all__ = [
+    'AudioProcessor',
+    'ProcessingSink',
+    'ProcessingStats',
+]
+
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+
+class ProcessingStats(collections.namedtuple('ProcessingStats', [
+        'chunks', 'frames', 'audio_duration', 'process_time',
+        'max_process_time', 'max_load'])):
+    """Statistics about the audio processed by an :class:`AudioProcessor`, as
+    returned by :attr:`AudioProcessor.stats`.
+
+    ``chunks`` is the number of chunks processed, and ``frames`` the total
+    number of input frames. ``audio_duration`` is the number of seconds of
+    audio processed. ``process_time`` and ``max_process_time`` are the total
+    and longest number of seconds spent processing a chunk.
+
+    ``max_load`` is the highest ratio of the time spent processing a chunk to
+    the duration of the audio in the chunk. If it approaches 1.0, the
+    processing can't keep up with playback.
+    """
+
+    @property
+    def load(self):
+        """The ratio of the time spent processing to the duration of the
+        audio processed."""
+        if not self.audio_duration:
+            return 0.0
+        return self.process_time / self.audio_duration
+
+
+class AudioProcessor(object):
+    """Converts the audio delivered by libspotify to ``float32`` samples,
+    with gain, downmixing, and resampling.
+
+    The audio is processed one chunk at a time with :meth:`process`, as it
+    is delivered to the :attr:`~spotify.SessionEvent.MUSIC_DELIVERY` event
+    listener. The work is vectorized with NumPy, which must be installed.
+
+    ``sample_rate`` is the output sample rate. If it differs from the sample
+    rate of the delivered audio, the audio is resampled by the rational
+    factor between the two rates, using a polyphase windowed-sinc filter with
+    ``filter_taps`` taps per phase. More taps give a steeper filter at a
+    higher cost. If :class:`None`, the audio isn't resampled.
+
+    ``channels`` is the number of output channels. If 1, the channels are
+    downmixed to mono. If :class:`None`, the number of channels is kept.
+
+    ``gain`` is the linear gain applied to the input channels before
+    downmixing, either a single number, or a sequence with one number per
+    input channel. It can be changed with :attr:`gain` at any time.
+
+    The filter state is carried from one chunk to the next, so the output is
+    the same as if all the audio was processed at once. The state is reset
+    when the input audio format, :attr:`sample_rate`, or :attr:`channels`
+    changes, or when :meth:`reset` is called.
+
+    Example::
+
+        >>> processor = spotify.AudioProcessor(sample_rate=48000, gain=0.5)
+        >>> output = processor.process(audio_format, frames, num_frames)
+        >>> output.dtype, output.shape
+        (dtype('float32'), (2229, 2))
+    """
+
+    def __init__(
+            self, sample_rate=None, channels=None, gain=1.0, filter_taps=16):
+        import numpy  # Crash early if not available
+        self._numpy = numpy
+
+        if filter_taps < 2 or filter_taps % 2:
+            raise ValueError('filter_taps must be an even number above 0')
+        self._filter_taps = filter_taps
+        self._gain = gain
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.reset_stats()
+
+    @property
+    def sample_rate(self):
+        """The output sample rate, or :class:`None` to keep the input's.
+
+        Changes take effect from the next chunk, and reset the filter state.
+        """
+        return self._sample_rate
+
+    @sample_rate.setter
+    def sample_rate(self, value):
+        self._sample_rate = value
+        self._format_key = None
+
+    @property
+    def channels(self):
+        """The number of output channels, or :class:`None` to keep the
+        input's.
+
+        Changes take effect from the next chunk, and reset the filter state.
+        """
+        return self._channels
+
+    @channels.setter
+    def channels(self, value):
+        if value is not None and value < 1:
+            raise ValueError('channels must be at least 1')
+        self._channels = value
+        self._format_key = None
+
+    @property
+    def gain(self):
+        """The linear gain, as a single number or one number per input
+        channel.
+
+        Changes take effect from the next chunk.
+        """
+        return self._gain
+
+    @gain.setter
+    def gain(self, value):
+        self._gain = value
+        self._mix = None
+
+    @property
+    def stats(self):
+        """A :class:`ProcessingStats` snapshot of the processing so far."""
+        return ProcessingStats(*self._stats)
+
+    def reset_stats(self):
+        """Reset the statistics."""
+        self._stats = [0, 0, 0.0, 0.0, 0.0, 0.0]
+
+    def reset(self):
+        """Reset the filter state, as if no audio was processed yet."""
+        self._format_key = None
+
+    def process(self, audio_format, frames, num_frames):
+        """Process a chunk of audio frames.
+
+        ``audio_format``, ``frames``, and ``num_frames`` are the arguments
+        passed to the :attr:`~spotify.SessionEvent.MUSIC_DELIVERY` event
+        listener. ``frames`` can be in any
+        :class:`~spotify.MusicDeliveryFormat`.
+
+        Returns a ``float32`` NumPy array of shape ``(num_frames, channels)``
+        with the output frames. The number of output frames differs from the
+        number of input frames if the audio is resampled.
+        """
+        np = self._numpy
+        start = _clock()
+
+        assert (
+            audio_format.sample_type == spotify.SampleType.INT16_NATIVE_ENDIAN)
+        in_channels = audio_format.channels
+        in_sample_rate = audio_format.sample_rate
+        format_key = (in_sample_rate, in_channels)
+        if format_key != self._format_key:
+            self._configure(in_sample_rate, in_channels)
+            self._format_key = format_key
+        if self._mix is None:
+            self._mix = self._make_mix_matrix(in_channels)
+
+        if isinstance(frames, np.ndarray):
+            samples = frames.reshape(-1)[:num_frames * in_channels]
+        else:
+            samples = np.frombuffer(
+                frames, dtype=np.int16, count=num_frames * in_channels)
+        samples = samples.reshape((num_frames, in_channels))
+
+        # Conversion to float32, gain, and downmixing in a single matrix
+        # multiplication.
+        output = np.dot(samples.astype(np.float32), self._mix)
+        if self._phases is not None:
+            output = self._resample(output)
+
+        duration = _clock() - start
+        audio_duration = num_frames / in_sample_rate
+        stats = self._stats
+        stats[0] += 1
+        stats[1] += num_frames
+        stats[2] += audio_duration
+        stats[3] += duration
+        stats[4] = max(stats[4], duration)
+        if audio_duration:
+            stats[5] = max(stats[5], duration / audio_duration)
+        return output
+
+    def _configure(self, in_sample_rate, in_channels):
+        np = self._numpy
+        self._mix = None
+        self._phases = None
+        out_channels = self.channels or in_channels
+        if out_channels not in (1, in_channels):
+            raise ValueError(
+                'Can only downmix %d channels to 1 channel, not %d channels'
+                % (in_channels, out_channels))
+        if self.sample_rate is None or self.sample_rate == in_sample_rate:
+            return
+
+        ratio = fractions.Fraction(self.sample_rate, in_sample_rate)
+        up, down = ratio.numerator, ratio.denominator
+        taps = self._filter_taps
+
+        # A low-pass filter at the upsampled rate, with the cutoff a bit
+        # below the lower of the two Nyquist frequencies, and the gain
+        # compensating for the zeros inserted when upsampling.
+        num_coefficients = taps * up
+        cutoff = 0.475 / max(up, down)
+        center = (num_coefficients - 1) / 2
+        n = np.arange(num_coefficients) - center
+        coefficients = (
+            2 * cutoff * up * np.sinc(2 * cutoff * n) *
+            np.kaiser(num_coefficients, 8.0))
+
+        # Row p holds the coefficients used for output frames falling on
+        # phase p of the upsampled signal.
+        self._phases = coefficients.reshape((taps, up)).T.astype(np.float32)
+        self._up = up
+        self._down = down
+        self._history = np.zeros((taps - 1, out_channels), dtype=np.float32)
+        self._time = 0
+        self._offsets = np.arange(taps)
+
+    def _make_mix_matrix(self, in_channels):
+        np = self._numpy
+        gain = np.ones(in_channels, dtype=np.float32) * np.asarray(
+            self._gain, dtype=np.float32)
+        mix = np.diag(gain / 32768)
+        if (self.channels or in_channels) == 1 and in_channels > 1:
+            mix = mix.sum(axis=1, keepdims=True) / in_channels
+        return mix.astype(np.float32)
+
+    def _resample(self, samples):
+        np = self._numpy
+        taps = self._filter_taps
+        up, down = self._up, self._down
+
+        # The previous chunk's last frames are kept in front of this chunk,
+        # so that the filter continues across the boundary.
+        buffer_ = np.concatenate((self._history, samples))
+        self._history = buffer_[len(buffer_) - (taps - 1):]
+
+        # Output frame n falls at self._time + n * down on the upsampled
+        # time line of this chunk, and needs the input frames up to the one
+        # at that time.
+        end = len(samples) * up
+        if self._time >= end:
+            self._time -= end
+            return np.zeros((0, samples.shape[1]), dtype=np.float32)
+        times = np.arange(self._time, end, down)
+        self._time = times[-1] + down - end
+
+        indexes = (times // up + taps - 1)[:, np.newaxis] - self._offsets
+        return np.einsum(
+            'nk,nkc->nc', self._phases[times % up], buffer_[indexes])
+
+
+class ProcessingSink(Sink):
+    """Audio sink that processes the audio with an :class:`AudioProcessor`,
+    and passes the result on to ``output``.
+
+    ``output`` is called with the ``float32`` NumPy array returned by
+    :meth:`AudioProcessor.process`, and the output sample rate, for each
+    chunk of audio delivered. Like the
+    :attr:`~spotify.SessionEvent.MUSIC_DELIVERY` event listener, it is called
+    from an internal libspotify thread, and must not block.
+
+    Example::
+
+        >>> import spotify
+        >>> session = spotify.Session()
+        >>> processor = spotify.AudioProcessor(sample_rate=48000)
+        >>> def on_audio(frames, sample_rate):
+        ...     pass  # Send the float32 frames downstream
+        ...
+        >>> audio = spotify.ProcessingSink(session, processor, on_audio)
+    """
+
+    def __init__(self, session, processor, output):
+        self._session = session
+        self.processor = processor
+        self._output = output
+
+        self.on()
+
+    processor = None
+    """The :class:`AudioProcessor` used by the sink."""
+
+    def _on_music_delivery(self, session, audio_format, frames, num_frames):
+        processed = self.processor.process(audio_format, frames, num_frames)
+        self._output(
+            processed, self.processor.sample_rate or audio_format.sample_rate)
+        return num_frames
+
+    def _close(self):
+        self.processor.reset()
@@ -0,0 +1,239 @@
+from __future__ import unicode_literals
+
+import collections
+import functools
+import io
+import sys
+import threading
+import time
+
+import spotify
+
+
+__all__ = [
+    'Profile',
+    'ProfileEntry',
+    'profile',
+]
+
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+# Frames from these modules belong to the library function wrappers, and are
+# skipped when looking for the code calling a libspotify function.
+_WRAPPER_MODULES = frozenset(['spotify', 'spotify.lockstats', __name__])
+
+
+def profile(trace_file=None, trace_every=100):
+    """Count and time all calls to libspotify functions.
+
+    Returns a :class:`Profile`, which records all calls to the functions on
+    :attr:`spotify.lib` while it is used as a context manager::
+
+        >>> import spotify
+        >>> with spotify.profile() as p:
+        ...     repr(session.playlist_container)
+        ...
+        >>> print(p.format(limit=3))
+        function                       calls   total ms  mean us  top caller
+        sp_playlistcontainer_playlist   1002     12.345   12.321  spotify...
+        ...
+
+    If ``trace_file`` is given, a trace of every ``trace_every`` call is
+    written to a file with that name. Each line of the trace has the tab
+    separated fields: the time of the call in seconds since the epoch, the
+    calling thread's ID, the libspotify function, the calling function, and
+    the duration of the call in seconds.
+
+    Only one profile can run at a time. The profiling only costs anything
+    while a profile is running.
+    """
+    return Profile(trace_file=trace_file, trace_every=trace_every)
+
+
+class ProfileEntry(collections.namedtuple('ProfileEntry', [
+        'name', 'count', 'time', 'max_time', 'callers'])):
+    """Profile of a single libspotify function.
+
+    ``name`` is the name of the libspotify function, like ``sp_track_name``.
+
+    ``count`` is the number of calls. ``time`` is the total number of seconds
+    spent in the function, and ``max_time`` is the longest single call.
+
+    ``callers`` is a dict mapping the full names of the calling functions,
+    like ``spotify.track.Track.name``, to the number of calls from them.
+    """
+
+    @property
+    def mean_time(self):
+        """The mean number of seconds spent in a call to the function."""
+        return self.time / self.count if self.count else 0.0
+
+
+class Profile(object):
+    """A profile of calls to libspotify functions, as returned by
+    :func:`profile`.
+
+    The profile records calls while it is used as a context manager, or
+    between calls to :meth:`start` and :meth:`stop`. The profile is a mapping
+    from libspotify function names to :class:`ProfileEntry` instances, and can
+    be read both while it is running and after it is stopped.
+    """
+
+    def __init__(self, trace_file=None, trace_every=100):
+        self.trace_file = trace_file
+        self.trace_every = trace_every
+        self._mutex = threading.Lock()
+        self._entries = {}
+        self._num_calls = 0
+        self._trace = None
+        self._started = None
+        self._stopped = None
+
+    def __repr__(self):
+        return '<Profile: %d functions, %d calls>' % (len(self), self.count)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def __getitem__(self, name):
+        return self.entries[name]
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def start(self):
+        """Start recording calls to libspotify functions.
+
+        Raises :exc:`RuntimeError` if another profile is running.
+        """
+        with spotify._lock:
+            if spotify._profiler is not None:
+                raise RuntimeError('Another profile is already running')
+            if self.trace_file is not None:
+                self._trace = io.open(self.trace_file, 'w', encoding='utf-8')
+            self._started = _clock()
+            self._stopped = None
+            spotify._profiler = self
+            spotify._install_lib_wrappers(spotify.lib)
+
+    def stop(self):
+        """Stop recording calls to libspotify functions."""
+        with spotify._lock:
+            if spotify._profiler is not self:
+                return
+            spotify._profiler = None
+            spotify._install_lib_wrappers(spotify.lib)
+            self._stopped = _clock()
+        with self._mutex:
+            if self._trace is not None:
+                self._trace.close()
+                self._trace = None
+
+    @property
+    def duration(self):
+        """The number of seconds the profile has been running for."""
+        if self._started is None:
+            return 0.0
+        return (self._stopped or _clock()) - self._started
+
+    @property
+    def entries(self):
+        """A dict mapping libspotify function names to
+        :class:`ProfileEntry` instances."""
+        with self._mutex:
+            return dict(
+                (name, ProfileEntry(
+                    name, entry[0], entry[1], entry[2], dict(entry[3])))
+                for name, entry in self._entries.items())
+
+    @property
+    def count(self):
+        """The total number of calls to libspotify functions."""
+        with self._mutex:
+            return self._num_calls
+
+    @property
+    def time(self):
+        """The total number of seconds spent in libspotify functions."""
+        return sum(entry.time for entry in self.entries.values())
+
+    def top(self, limit=10):
+        """The ``limit`` :class:`ProfileEntry` instances with the longest
+        total time, sorted by decreasing time."""
+        return sorted(
+            self.entries.values(),
+            key=lambda entry: entry.time, reverse=True)[:limit]
+
+    def format(self, limit=20):
+        """Format the ``limit`` functions with the longest total time as a
+        table, together with the function calling them the most."""
+        lines = ['%-40s %8s %10s %9s  %s' % (
+            'function', 'calls', 'total ms', 'mean us', 'top caller')]
+        for entry in self.top(limit):
+            top_caller = max(
+                entry.callers, key=lambda caller: entry.callers[caller])
+            lines.append('%-40s %8d %10.3f %9.3f  %s' % (
+                entry.name, entry.count, entry.time * 1000,
+                entry.mean_time * 1000000, top_caller))
+        return '\n'.join(lines)
+
+    def wrap(self, name, func):
+        """Wrap the library function ``func`` so that calls to it are
+        recorded under the given ``name``.
+
+        Internal method.
+        """
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = _clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._record(
+                    name, _get_caller(sys._getframe(1)), _clock() - start)
+        if not hasattr(wrapper, '__wrapped__'):
+            # Workaround for Python < 3.2
+            wrapper.__wrapped__ = func
+        return wrapper
+
+    def _record(self, name, caller, duration):
+        with self._mutex:
+            entry = self._entries.get(name)
+            if entry is None:
+                entry = self._entries[name] = [
+                    0, 0.0, 0.0, collections.defaultdict(int)]
+            entry[0] += 1
+            entry[1] += duration
+            if duration > entry[2]:
+                entry[2] = duration
+            entry[3][caller] += 1
+            self._num_calls += 1
+            if (self._trace is not None and
+                    self._num_calls % self.trace_every == 0):
+                self._trace.write('%.6f\t%d\t%s\t%s\t%.9f\n' % (
+                    time.time(), spotify._get_ident(), name, caller,
+                    duration))
+
+
+def _get_caller(frame):
+    while (frame is not None and
+            frame.f_globals.get('__name__') in _WRAPPER_MODULES):
+        frame = frame.f_back
+    if frame is None:
+        return '?'
+    code = frame.f_code
+    return '%s.%s' % (
+        frame.f_globals.get('__name__', '?'),
+        getattr(code, 'co_qualname', code.co_name))
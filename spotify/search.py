@@ -50,6 +50,7 @@ class Search(object):
         self.search_type = search_type
 
         self.complete_event = threading.Event()
+        self.future = utils.create_request_future(self)
         self._callback_handles = set()
 
         if sp_search is None:
@@ -75,6 +76,15 @@ class Search(object):
     complete_event = None
     """:class:`threading.Event` that is set when the search is completed."""
 
+    future = None
+    """:class:`concurrent.futures.Future` that is done when the search is
+    completed.
+
+    The future's result is the :class:`Search` itself, or a
+    :exc:`~spotify.LibError` if the request failed. The future is :class:`None`
+    if :mod:`concurrent.futures` isn't available.
+    """
+
     def __repr__(self):
         return 'Search(%r)' % self.link.uri
 
@@ -141,9 +151,9 @@ class Search(object):
 
         @serialized
         def get_track(sp_search, key):
-            return spotify.Track(
+            return spotify.Track._cached(
                 self._session,
-                sp_track=lib.sp_search_track(sp_search, key),
+                lib.sp_search_track(sp_search, key),
                 add_ref=True)
 
         return utils.Sequence(
@@ -178,9 +188,9 @@ class Search(object):
 
         @serialized
         def get_album(sp_search, key):
-            return spotify.Album(
+            return spotify.Album._cached(
                 self._session,
-                sp_album=lib.sp_search_album(sp_search, key),
+                lib.sp_search_album(sp_search, key),
                 add_ref=True)
 
         return utils.Sequence(
@@ -215,9 +225,9 @@ class Search(object):
 
         @serialized
         def get_artist(sp_search, key):
-            return spotify.Artist(
+            return spotify.Artist._cached(
                 self._session,
-                sp_artist=lib.sp_search_artist(sp_search, key),
+                lib.sp_search_artist(sp_search, key),
                 add_ref=True)
 
         return utils.Sequence(
@@ -326,6 +336,8 @@ def _search_complete_callback(sp_search, handle):
     (callback, search_result) = ffi.from_handle(handle)
     search_result._callback_handles.remove(handle)
     search_result.complete_event.set()
+    utils.complete_request_future(search_result)
+    search_result._session._notify_loaded()
     if callback is not None:
         callback(search_result)
 
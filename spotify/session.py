@@ -3,7 +3,7 @@ from __future__ import unicode_literals
 import functools
 import logging
 import operator
-import weakref
+import threading
 
 import spotify
 from spotify import ffi, lib, serialized, utils
@@ -12,6 +12,7 @@ from spotify import ffi, lib, serialized, utils
 __all__ = [
     'Session',
     'SessionEvent',
+    'load_all',
 ]
 
 logger = logging.getLogger(__name__)
@@ -59,8 +60,10 @@ class Session(utils.EventEmitter):
 
         self._sp_session = ffi.gc(sp_session_ptr[0], lib.sp_session_release)
 
-        self._cache = weakref.WeakValueDictionary()
+        self._cache = spotify.ObjectCache()
         self._emitters = []
+        self._load_condition = threading.Condition()
+        self._music_delivery = spotify.audio._MusicDelivery()
 
         self.offline = Offline(self)
         self.player = Player(self)
@@ -74,8 +77,10 @@ class Session(utils.EventEmitter):
     finding and returning existing alive wrapper objects for the sp_* object is
     about to create a wrapper for.
 
-    The cache *does not* keep objects alive. It's only a means for looking up
-    the objects if they are kept alive somewhere else in the application.
+    The cache only keeps objects alive if its
+    :attr:`~spotify.ObjectCache.max_size` is set. Otherwise, it's only a means
+    for looking up the objects if they are kept alive somewhere else in the
+    application.
 
     Internal attribute.
     """
@@ -113,6 +118,127 @@ class Session(utils.EventEmitter):
     """A :class:`~spotify.session.Social` instance for controlling social
     sharing."""
 
+    memoize_metadata = False
+    """Whether to remember the metadata of tracks, albums, and artists once
+    they are loaded.
+
+    If :class:`True`, properties like :attr:`Track.name` and
+    :attr:`Album.year`, which never change once the object is loaded, are only
+    read from libspotify the first time they are used after the object is
+    loaded. Properties that can change, like :attr:`Track.starred`,
+    :attr:`Track.availability`, and :attr:`Track.offline_status`, are read
+    again after the next :attr:`~SessionEvent.METADATA_UPDATED` event.
+
+    Defaults to :class:`False`.
+    """
+
+    defer_events = False
+    """Whether to call event listeners after libspotify is done processing
+    events, instead of while libspotify is processing events.
+
+    libspotify calls pyspotify's callbacks from within
+    :meth:`process_events`, while pyspotify's global lock is held. By default,
+    event listeners are called directly from the callbacks, so a slow
+    listener blocks all other threads using pyspotify. If :class:`True`, the
+    callbacks only record the events, and the listeners are called after
+    libspotify is done processing events and the lock is released, unless the
+    thread calling :meth:`process_events` holds the lock itself.
+
+    With deferred events:
+
+    - All events emitted during a :meth:`process_events` call are delivered
+      by the thread calling :meth:`process_events`, before it returns.
+
+    - The events are delivered in the order they were emitted, across the
+      session, playlists, and playlist containers.
+
+    - Events emitted from libspotify's internal threads, like
+      :attr:`~SessionEvent.NOTIFY_MAIN_THREAD` and
+      :attr:`~SessionEvent.MUSIC_DELIVERY`, are not deferred, and may be
+      delivered before events that were emitted earlier but deferred.
+
+    - Listeners see the objects as they are when the event is delivered,
+      which may include changes made after the event was emitted.
+
+    - Exceptions raised by listeners are logged, and don't stop the delivery
+      of the remaining events.
+
+    Defaults to :class:`False`.
+    """
+
+    _music_delivery_format = 'bytes'
+
+    @property
+    def music_delivery_format(self):
+        """The :class:`MusicDeliveryFormat` the audio frames are passed to the
+        :attr:`~SessionEvent.MUSIC_DELIVERY` event listener in.
+
+        Defaults to :attr:`MusicDeliveryFormat.BYTES`, which copies the frames
+        into a new bytestring for each delivery. With
+        :attr:`~MusicDeliveryFormat.MEMORYVIEW` or
+        :attr:`~MusicDeliveryFormat.NUMPY`, the frames are copied into a
+        buffer that is reused for each delivery instead, and the listener must
+        not keep the frames after it returns.
+
+        Raises :exc:`ImportError` if set to :attr:`~MusicDeliveryFormat.NUMPY`
+        and NumPy isn't installed.
+        """
+        return self._music_delivery_format
+
+    @music_delivery_format.setter
+    def music_delivery_format(self, value):
+        if value == spotify.MusicDeliveryFormat.NUMPY:
+            import numpy  # noqa: Crash early if not available
+        elif value not in (
+                spotify.MusicDeliveryFormat.BYTES,
+                spotify.MusicDeliveryFormat.MEMORYVIEW):
+            raise ValueError('Unknown music delivery format: %r' % value)
+        self._music_delivery_format = value
+
+    _event_loop = None
+    """The running :class:`EventLoop`, if any.
+
+    Internal attribute.
+    """
+
+    _load_condition = None
+    """A :class:`threading.Condition` notified by :meth:`_notify_loaded`.
+
+    Internal attribute.
+    """
+
+    _load_generation = 0
+    """The number of calls to :meth:`_notify_loaded` so far.
+
+    Internal attribute.
+    """
+
+    _metadata_generation = 0
+    """The number of :attr:`~SessionEvent.METADATA_UPDATED` events so far,
+    used for forgetting memoized metadata that may have changed.
+
+    Internal attribute.
+    """
+
+    @property
+    def object_cache(self):
+        """The :class:`ObjectCache` used for reusing the wrapper objects around
+        sp_* objects, like tracks, albums, artists, and users."""
+        return self._cache
+
+    def _notify_loaded(self):
+        """Wake up the threads waiting in :meth:`Track.load` and the other
+        ``load()`` methods for objects to finish loading.
+
+        Called from the libspotify callbacks that are called when something
+        may have finished loading.
+
+        Internal method.
+        """
+        with self._load_condition:
+            self._load_generation += 1
+            self._load_condition.notify_all()
+
     def login(self, username, password=None, remember_me=False, blob=None):
         """Authenticate to Spotify's servers.
 
@@ -179,7 +305,7 @@ class Session(utils.EventEmitter):
         sp_user = lib.sp_session_user(self._sp_session)
         if sp_user == ffi.NULL:
             return None
-        return spotify.User(self, sp_user=sp_user, add_ref=True)
+        return spotify.User._cached(self, sp_user, add_ref=True)
 
     def logout(self):
         """Log out the current user.
@@ -226,11 +352,27 @@ class Session(utils.EventEmitter):
 
         pyspotify provides an :class:`~spotify.EventLoop` that you can use for
         processing events when needed.
+
+        If :attr:`defer_events` is :class:`True`, the event listeners are
+        called after libspotify is done processing events, just before this
+        method returns.
         """
         next_timeout = ffi.new('int *')
 
-        spotify.Error.maybe_raise(lib.sp_session_process_events(
-            self._sp_session, next_timeout))
+        if not self.defer_events:
+            spotify.Error.maybe_raise(lib.sp_session_process_events(
+                self._sp_session, next_timeout))
+            return next_timeout[0]
+
+        events = []
+        previous = utils.defer_events(events)
+        try:
+            error = lib.sp_session_process_events(
+                self._sp_session, next_timeout)
+        finally:
+            utils.defer_events(previous)
+        utils.deliver_events(events)
+        spotify.Error.maybe_raise(error)
 
         return next_timeout[0]
 
@@ -449,6 +591,33 @@ class Session(utils.EventEmitter):
         """
         return spotify.Image(self, uri=uri)
 
+    def load_all(self, objects, timeout=None, return_exceptions=False):
+        """Block until the data of all the objects is loaded.
+
+        ``objects`` is an iterable of objects with a ``load()`` method, like
+        :class:`Track`, :class:`Album`, or :class:`Playlist`, in any
+        combination. All the objects are loaded at the same time, sharing a
+        single ``timeout``, which is much faster than loading them one by one::
+
+            >>> playlist = session.get_playlist(
+            ...     'spotify:user:fiat500c:playlist:54k50VZdvtnIPt4d8RBCmZ')
+            >>> tracks = session.load_all(playlist.load().tracks)
+
+        After ``timeout`` seconds :exc:`~spotify.Timeout` is raised for the
+        objects that aren't loaded yet. If ``timeout`` is :class:`None` the
+        default timeout is used.
+
+        An object failing to load doesn't stop the loading of the other
+        objects. When they are all done, the first error is raised. If
+        ``return_exceptions`` is :class:`True`, the errors are returned in
+        place of the failed objects instead.
+
+        Returns a list of the objects, in the same order.
+        """
+        return utils.load_all(
+            self, objects, timeout=timeout,
+            return_exceptions=return_exceptions)
+
     def search(
             self, query, callback=None,
             track_offset=0, track_count=20,
@@ -491,6 +660,33 @@ class Session(utils.EventEmitter):
             playlist_offset=playlist_offset, playlist_count=playlist_count,
             search_type=search_type)
 
+    def search_async(
+            self, query,
+            track_offset=0, track_count=20,
+            album_offset=0, album_count=20,
+            artist_offset=0, artist_count=20,
+            playlist_offset=0, playlist_count=20,
+            search_type=None):
+        """Search Spotify without blocking.
+
+        Takes the same arguments as :meth:`search`, except ``callback``.
+        Returns an :class:`asyncio.Future` that is done when the search
+        completes, with the :class:`Search` as its result::
+
+            >>> search = await session.search_async('massive attack')
+            >>> search.tracks[0]
+            Track(u'spotify:track:...')
+
+        Requires a running :class:`AsyncioEventLoop`.
+        """
+        return utils.call_async(
+            self, self.search, query,
+            track_offset=track_offset, track_count=track_count,
+            album_offset=album_offset, album_count=album_count,
+            artist_offset=artist_offset, artist_count=artist_count,
+            playlist_offset=playlist_offset, playlist_count=playlist_count,
+            search_type=search_type)
+
     def get_toplist(
             self, type=None, region=None, canonical_username=None,
             callback=None):
@@ -532,6 +728,20 @@ class Session(utils.EventEmitter):
             self, type=type, region=region,
             canonical_username=canonical_username, callback=callback)
 
+    def get_toplist_async(
+            self, type=None, region=None, canonical_username=None):
+        """Get a Spotify toplist without blocking.
+
+        Takes the same arguments as :meth:`get_toplist`, except ``callback``.
+        Returns an :class:`asyncio.Future` that is done when the toplist
+        request completes, with the :class:`Toplist` as its result.
+
+        Requires a running :class:`AsyncioEventLoop`.
+        """
+        return utils.call_async(
+            self, self.get_toplist, type=type, region=region,
+            canonical_username=canonical_username)
+
 
 class Offline(object):
     """Offline sync controller.
@@ -707,6 +917,19 @@ class Social(object):
             utils.to_char(username), utils.to_char(password)))
 
 
+def load_all(objects, timeout=None, return_exceptions=False):
+    """Block until the data of all the objects is loaded.
+
+    This is a shortcut for :meth:`Session.load_all` on the session the
+    objects belong to.
+    """
+    objects = list(objects)
+    if not objects:
+        return []
+    return objects[0]._session.load_all(
+        objects, timeout=timeout, return_exceptions=return_exceptions)
+
+
 class SessionEvent(object):
     """Session events.
 
@@ -823,7 +1046,8 @@ class SessionEvent(object):
     :param audio_format: the audio format
     :type audio_format: :class:`AudioFormat`
     :param frames: the audio frames
-    :type frames: bytestring
+    :type frames: bytestring, or as set by
+        :attr:`Session.music_delivery_format`
     :param num_frames: the number of frames
     :type num_frames: int
     :returns: the number of frames consumed
@@ -1031,6 +1255,8 @@ class _SessionCallbacks(object):
         if not spotify._session_instance:
             return
         logger.debug('Metadata updated')
+        spotify._session_instance._metadata_generation += 1
+        spotify._session_instance._notify_loaded()
         spotify._session_instance.emit(
             SessionEvent.METADATA_UPDATED, spotify._session_instance)
 
@@ -1068,19 +1294,19 @@ class _SessionCallbacks(object):
     @ffi.callback(
         'int(sp_session *, const sp_audioformat *, const void *, int)')
     def music_delivery(sp_session, sp_audioformat, frames, num_frames):
-        if not spotify._session_instance:
+        session = spotify._session_instance
+        if not session:
             return 0
-        if spotify._session_instance.num_listeners(
-                SessionEvent.MUSIC_DELIVERY) == 0:
+        if session.num_listeners(SessionEvent.MUSIC_DELIVERY) == 0:
             logger.debug('Music delivery, but no listener')
             return 0
-        audio_format = spotify.AudioFormat(sp_audioformat)
-        buffer_ = ffi.buffer(
-            frames, audio_format.frame_size() * num_frames)
-        frames_bytes = buffer_[:]
-        num_frames_consumed = spotify._session_instance.call(
+        music_delivery = session._music_delivery
+        audio_format = music_delivery.get_audio_format(sp_audioformat)
+        frames = music_delivery.get_frames(
+            session._music_delivery_format, frames, num_frames)
+        num_frames_consumed = session.call(
             SessionEvent.MUSIC_DELIVERY,
-            spotify._session_instance, audio_format, frames_bytes, num_frames)
+            session, audio_format, frames, num_frames)
         logger.debug(
             'Music delivery of %d frames, %d consumed', num_frames,
             num_frames_consumed)
@@ -1131,6 +1357,7 @@ class _SessionCallbacks(object):
         if not spotify._session_instance:
             return
         logger.debug('User info updated')
+        spotify._session_instance._notify_loaded()
         spotify._session_instance.emit(
             SessionEvent.USER_INFO_UPDATED, spotify._session_instance)
 
@@ -1,14 +1,35 @@
 from __future__ import unicode_literals
 
+import array
+import collections
+import io
+import logging
+import struct
 import sys
+import threading
+import time
 
 import spotify
+from spotify import utils
 
 __all__ = [
     'AlsaSink',
+    'BufferedSink',
+    'NullSink',
     'PortAudioSink',
+    'RawFileSink',
+    'SinkStats',
+    'TeeBranch',
+    'TeeBranchStats',
+    'TeePolicy',
+    'TeeSink',
+    'WavFileSink',
 ]
 
+logger = logging.getLogger(__name__)
+
+_clock = getattr(time, 'perf_counter', time.time)
+
 
 class Sink(object):
     def on(self):
@@ -41,7 +62,284 @@ class Sink(object):
         pass
 
 
-class AlsaSink(Sink):
+class BufferedSink(Sink):
+    """Base class for audio sinks that buffer the audio delivered by
+    libspotify in a ring buffer, so that libspotify's audio delivery thread
+    never waits for the audio device.
+
+    The :attr:`~spotify.SessionEvent.MUSIC_DELIVERY` listener copies as many
+    frames as there is room for into the ring buffer, and tells libspotify
+    how many frames were consumed. libspotify delivers the rest again later.
+    The audio device is fed from the other end of the ring buffer, either by
+    a consumer thread calling :meth:`_write`, or by the audio device pulling
+    frames with :meth:`_read` from a callback of its own.
+
+    The sink also answers the
+    :attr:`~spotify.SessionEvent.GET_AUDIO_BUFFER_STATS` event with the number
+    of frames in the ring buffer, and the number of times the audio device has
+    run out of frames since the last time libspotify asked. In pull mode,
+    :meth:`_read` counts these underruns. A consumer thread emptying the ring
+    buffer isn't an underrun, as the audio device may still have plenty of
+    frames buffered, so in push mode the subclass must call
+    :meth:`_record_underrun` when the audio device reports one.
+
+    ``buffer_duration`` is the number of seconds of audio the ring buffer can
+    hold. The ring buffer is allocated when the first frames are delivered,
+    and again if the audio format changes.
+
+    To make an audio sink, subclass :class:`BufferedSink`, and implement
+    :meth:`_open` and :meth:`_close_device`, and either :meth:`_write` or
+    set :attr:`_pull` to :class:`True` and call :meth:`_read` from the audio
+    device's callback. Call :meth:`on` at the end of ``__init__()``.
+    """
+
+    _pull = False
+    """Whether the audio device pulls frames with :meth:`_read`, instead of
+    a consumer thread pushing frames to :meth:`_write`."""
+
+    _write_size = 2048
+    """The maximum number of frames passed to :meth:`_write` at a time."""
+
+    _drain = False
+    """Whether the consumer thread writes the frames left in the ring buffer
+    when the sink is turned off, instead of discarding them."""
+
+    def __init__(self, session, buffer_duration=1.0):
+        self._session = session
+        self._buffer_duration = buffer_duration
+        self._format_key = None
+        self._ring = None
+        self._frame_size = 0
+        self._consumer = None
+        self._running = False
+        self._data_available = threading.Event()
+        self._starved = True
+        self._underruns = 0
+        self._underruns_reported = 0
+
+    def on(self):
+        Sink.on(self)
+        assert self._session.num_listeners(
+            spotify.SessionEvent.GET_AUDIO_BUFFER_STATS) == 0
+        self._session.on(
+            spotify.SessionEvent.GET_AUDIO_BUFFER_STATS,
+            self._on_get_audio_buffer_stats)
+
+    def off(self):
+        self._session.off(
+            spotify.SessionEvent.GET_AUDIO_BUFFER_STATS,
+            self._on_get_audio_buffer_stats)
+        Sink.off(self)
+
+    def _on_music_delivery(self, session, audio_format, frames, num_frames):
+        assert (
+            audio_format.sample_type == spotify.SampleType.INT16_NATIVE_ENDIAN)
+
+        format_key = (
+            audio_format.sample_type, audio_format.sample_rate,
+            audio_format.channels)
+        if format_key != self._format_key:
+            if self._ring is not None and self._ring.num_frames:
+                # Let the audio device play the frames of the old format
+                # before it is reopened for the new format.
+                return 0
+            self._close()
+            self._frame_size = audio_format.frame_size()
+            self._ring = _RingBuffer(
+                int(audio_format.sample_rate * self._buffer_duration),
+                self._frame_size)
+            self._open(audio_format)
+            self._format_key = format_key
+            if not self._pull:
+                self._running = True
+                self._consumer = threading.Thread(
+                    target=self._consume, name='BufferedSinkConsumer')
+                self._consumer.daemon = True
+                self._consumer.start()
+
+        num_frames_consumed = self._ring.write(frames, num_frames)
+        if num_frames_consumed and not self._pull:
+            self._data_available.set()
+        return num_frames_consumed
+
+    def _on_get_audio_buffer_stats(self, session):
+        ring = self._ring
+        underruns = self._underruns
+        stutter = underruns - self._underruns_reported
+        self._underruns_reported = underruns
+        return spotify.AudioBufferStats(
+            ring.num_frames if ring is not None else 0, stutter)
+
+    def _consume(self):
+        # Runs in the consumer thread, which is the only thread reading from
+        # the ring buffer.
+        while self._running:
+            self._data_available.clear()
+            ring = self._ring
+            data = ring.read(self._write_size) if ring is not None else b''
+            if not data:
+                self._data_available.wait(0.1)
+                continue
+            self._starved = False
+            self._write_safely(data)
+        while self._drain and self._ring is not None:
+            data = self._ring.read(self._write_size)
+            if not data:
+                break
+            self._write_safely(data)
+
+    def _write_safely(self, data):
+        try:
+            self._write(data)
+        except Exception:
+            logger.exception('Writing to audio device failed')
+
+    def _read(self, num_frames):
+        """Read ``num_frames`` frames from the ring buffer.
+
+        If there isn't enough frames in the ring buffer, the frames are padded
+        with silence, and an underrun is counted.
+
+        Call this method from the audio device's callback if :attr:`_pull` is
+        :class:`True`.
+        """
+        ring = self._ring
+        if ring is None:
+            return b''
+        data = ring.read(num_frames)
+        if data:
+            self._starved = False
+        missing = num_frames * self._frame_size - len(data)
+        if missing:
+            self._record_underrun()
+            data += b'\x00' * missing
+        return data
+
+    def _record_underrun(self):
+        """Count an underrun of the audio device.
+
+        Called by :meth:`_read`, and by subclasses using a consumer thread
+        when the audio device reports that it ran out of frames. An underrun
+        is only counted after frames have been read from the ring buffer, and
+        not again until more frames have been read. Thus, waiting for the
+        first frames isn't an underrun.
+        """
+        if not self._starved:
+            self._starved = True
+            self._underruns += 1
+
+    def _open(self, audio_format):
+        """Open the audio device for the given :class:`AudioFormat`.
+
+        Called from libspotify's audio delivery thread when the first frames
+        are delivered, and when the audio format changes.
+        """
+        raise NotImplementedError
+
+    def _write(self, data):
+        """Write the frames in the bytestring ``data`` to the audio device.
+
+        Called from the consumer thread, and may block until the audio device
+        is ready for more frames.
+        """
+        raise NotImplementedError
+
+    def _close_device(self):
+        """Close the audio device opened by :meth:`_open`."""
+        pass
+
+    def _close(self):
+        self._running = False
+        self._data_available.set()
+        consumer = self._consumer
+        if consumer is not None and consumer is not threading.current_thread():
+            consumer.join()
+        self._consumer = None
+        if self._format_key is not None:
+            self._close_device()
+        self._format_key = None
+        self._ring = None
+        self._starved = True
+
+
+class _RingBuffer(object):
+    """A single-producer, single-consumer ring buffer of audio frames.
+
+    One thread may call :meth:`write` while another thread calls
+    :meth:`read`, without any locking. The producer only updates the number
+    of bytes written, and the consumer the number of bytes read, and each
+    only reads the other's counter to find the free space or the available
+    data.
+
+    Internal class.
+    """
+
+    def __init__(self, capacity, frame_size):
+        self.frame_size = frame_size
+        self._size = capacity * frame_size
+        self._buffer = bytearray(self._size)
+        self._view = memoryview(self._buffer)
+        self._written = 0
+        self._read = 0
+
+    @property
+    def capacity(self):
+        """The number of frames the ring buffer can hold."""
+        return self._size // self.frame_size
+
+    @property
+    def num_frames(self):
+        """The number of frames in the ring buffer."""
+        return (self._written - self._read) // self.frame_size
+
+    @property
+    def free_frames(self):
+        """The number of frames there is room for in the ring buffer."""
+        return (self._size - (self._written - self._read)) // self.frame_size
+
+    def write(self, frames, num_frames):
+        """Copy as many of the frames as there is room for into the ring
+        buffer, and return the number of frames copied."""
+        written = self._written
+        free = self._size - (written - self._read)
+        size = min(num_frames, free // self.frame_size) * self.frame_size
+        if size == 0:
+            return 0
+        source = _byte_view(frames)
+        start = written % self._size
+        first = min(size, self._size - start)
+        self._view[start:start + first] = source[:first]
+        if first < size:
+            self._view[:size - first] = source[first:size]
+        self._written = written + size
+        return size // self.frame_size
+
+    def read(self, num_frames):
+        """Remove up to ``num_frames`` frames from the ring buffer, and return
+        them as a bytestring."""
+        read = self._read
+        size = min(num_frames * self.frame_size, self._written - read)
+        if size == 0:
+            return b''
+        start = read % self._size
+        first = min(size, self._size - start)
+        data = self._view[start:start + first].tobytes()
+        if first < size:
+            data += self._view[:size - first].tobytes()
+        self._read = read + size
+        return data
+
+
+def _byte_view(frames):
+    view = memoryview(frames)
+    if view.ndim != 1 or view.itemsize != 1:
+        # E.g. a NumPy array of frames, see
+        # :attr:`MusicDeliveryFormat.NUMPY <spotify.MusicDeliveryFormat.NUMPY>`
+        view = view.cast('B')
+    return view
+
+
+class AlsaSink(BufferedSink):
     """Audio sink for systems using ALSA, e.g. most Linux systems.
 
     This audio sink requires `pyalsaaudio
@@ -52,6 +350,9 @@ class AlsaSink(Sink):
     The ``card`` keyword argument is passed on to :class:`alsaaudio.PCM`.
     Please refer to the pyalsaaudio documentation for details.
 
+    The audio is buffered as described for :class:`BufferedSink`, and written
+    to the ALSA device from a consumer thread.
+
     Example::
 
         >>> import spotify
@@ -67,8 +368,8 @@ class AlsaSink(Sink):
         # Listen to music...
     """
 
-    def __init__(self, session, card='default'):
-        self._session = session
+    def __init__(self, session, card='default', buffer_duration=1.0):
+        BufferedSink.__init__(self, session, buffer_duration=buffer_duration)
         self._card = card
 
         import alsaaudio  # Crash early if not available
@@ -77,30 +378,27 @@ class AlsaSink(Sink):
 
         self.on()
 
-    def _on_music_delivery(self, session, audio_format, frames, num_frames):
-        assert (
-            audio_format.sample_type == spotify.SampleType.INT16_NATIVE_ENDIAN)
+    def _open(self, audio_format):
+        self._device = self._alsaaudio.PCM(
+            mode=self._alsaaudio.PCM_NORMAL, card=self._card)
+        if sys.byteorder == 'little':
+            self._device.setformat(self._alsaaudio.PCM_FORMAT_S16_LE)
+        else:
+            self._device.setformat(self._alsaaudio.PCM_FORMAT_S16_BE)
+        self._device.setrate(audio_format.sample_rate)
+        self._device.setchannels(audio_format.channels)
+        self._device.setperiodsize(self._write_size)
 
-        if self._device is None:
-            self._device = self._alsaaudio.PCM(
-                mode=self._alsaaudio.PCM_NONBLOCK, card=self._card)
-            if sys.byteorder == 'little':
-                self._device.setformat(self._alsaaudio.PCM_FORMAT_S16_LE)
-            else:
-                self._device.setformat(self._alsaaudio.PCM_FORMAT_S16_BE)
-            self._device.setrate(audio_format.sample_rate)
-            self._device.setchannels(audio_format.channels)
-            self._device.setperiodsize(num_frames * audio_format.frame_size())
-
-        return self._device.write(frames)
+    def _write(self, data):
+        self._device.write(data)
 
-    def _close(self):
+    def _close_device(self):
         if self._device is not None:
             self._device.close()
             self._device = None
 
 
-class PortAudioSink(Sink):
+class PortAudioSink(BufferedSink):
     """Audio sink for `PortAudio <http://www.portaudio.com/>`_.
 
     PortAudio is available for many platforms, including Linux, OS X, and
@@ -111,12 +409,17 @@ class PortAudioSink(Sink):
     Debian/Ubuntu you can install the package ``python-pyaudio`` or
     ``python3-pyaudio``.
 
+    The audio is buffered as described for :class:`BufferedSink`, and pulled
+    from the buffer by pyaudio's stream callback.
+
     For an example, see the :class:`AlsaSink` example. Just replace
     ``AlsaSink`` with ``PortAudioSink``.
     """
 
-    def __init__(self, session):
-        self._session = session
+    _pull = True
+
+    def __init__(self, session, buffer_duration=1.0):
+        BufferedSink.__init__(self, session, buffer_duration=buffer_duration)
 
         import pyaudio  # Crash early if not available
         self._pyaudio = pyaudio
@@ -125,27 +428,663 @@ class PortAudioSink(Sink):
 
         self.on()
 
+    def _open(self, audio_format):
+        self._stream = self._device.open(
+            format=self._pyaudio.paInt16, channels=audio_format.channels,
+            rate=audio_format.sample_rate, output=True,
+            stream_callback=self._on_stream_callback)
+
+    def _on_stream_callback(self, in_data, frame_count, time_info, status):
+        # Called from PortAudio's thread when it needs more frames.
+        return (self._read(frame_count), self._pyaudio.paContinue)
+
+    def _close_device(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+
+class SinkStats(collections.namedtuple('SinkStats', [
+        'deliveries', 'frames', 'audio_duration', 'elapsed'])):
+    """Statistics about the audio delivered to a sink, as returned by
+    :attr:`NullSink.stats`.
+
+    ``deliveries`` is the number of
+    :attr:`~spotify.SessionEvent.MUSIC_DELIVERY` events, and ``frames`` the
+    total number of frames delivered. ``audio_duration`` is the number of
+    seconds of audio delivered, and ``elapsed`` the number of seconds from the
+    first to the last delivery.
+    """
+
+    @property
+    def frames_per_second(self):
+        """The number of frames delivered per second."""
+        if not self.elapsed:
+            return 0.0
+        return self.frames / self.elapsed
+
+    @property
+    def realtime_factor(self):
+        """The number of seconds of audio delivered per second.
+
+        A factor of 1.0 means that audio is delivered as fast as it is played.
+        """
+        if not self.elapsed:
+            return 0.0
+        return self.audio_duration / self.elapsed
+
+
+class NullSink(Sink):
+    """Audio sink that consumes all frames without playing them.
+
+    The sink counts the frames delivered, making it useful for running
+    without sound hardware, and for measuring how fast audio is delivered.
+    Use :attr:`stats` to get the statistics::
+
+        >>> import spotify
+        >>> session = spotify.Session()
+        >>> audio = spotify.NullSink(session)
+        # Login, play a track, etc...
+        >>> audio.stats.realtime_factor
+        3.7911437072913356
+    """
+
+    def __init__(self, session):
+        self._session = session
+        self.reset_stats()
+
+        self.on()
+
+    @property
+    def stats(self):
+        """A :class:`SinkStats` snapshot of the audio delivered so far."""
+        elapsed = 0.0
+        if self._started is not None:
+            elapsed = self._last - self._started
+        return SinkStats(
+            self._deliveries, self._frames, self._audio_duration, elapsed)
+
+    def reset_stats(self):
+        """Reset the statistics."""
+        self._deliveries = 0
+        self._frames = 0
+        self._audio_duration = 0.0
+        self._started = None
+        self._last = None
+
+    def _on_music_delivery(self, session, audio_format, frames, num_frames):
+        now = _clock()
+        if self._started is None:
+            self._started = now
+        self._last = now
+        self._deliveries += 1
+        self._frames += num_frames
+        self._audio_duration += num_frames / float(audio_format.sample_rate)
+        return num_frames
+
+
+class RawFileSink(BufferedSink):
+    """Audio sink that writes the audio to files as raw PCM data.
+
+    The audio is written as native endian 16-bit samples, with the channels
+    interleaved, as delivered by libspotify.
+
+    If ``path`` contains ``{index}``, the audio of each track is written to
+    a file of its own, and ``{index}`` is replaced with the number of the
+    track, starting at 1. A new file is started after the
+    :attr:`~spotify.SessionEvent.END_OF_TRACK` event. Otherwise, all audio is
+    written to the one file, which is continued, and not overwritten, when
+    the sink is turned back on or the audio format changes. Files are created
+    when the first frames are written to them.
+
+    The audio is buffered as described for :class:`BufferedSink`, and written
+    to the file from a consumer thread, so a slow disk never blocks
+    libspotify's audio delivery thread. ``buffering`` is the size in bytes of
+    the file's write buffer.
+
+    Example::
+
+        >>> import spotify
+        >>> session = spotify.Session()
+        >>> audio = spotify.RawFileSink(session, 'track-{index:02d}.pcm')
+        # Login, play tracks, etc...
+        >>> audio.off()
+    """
+
+    _drain = True
+
+    def __init__(
+            self, session, path, buffer_duration=1.0,
+            buffering=io.DEFAULT_BUFFER_SIZE):
+        BufferedSink.__init__(self, session, buffer_duration=buffer_duration)
+        self._path = path
+        self._buffering = buffering
+        self._audio_format = None
+        self._file = None
+        self._index = 0
+        self.paths = []
+        self._rotate_at = collections.deque()
+        self._num_bytes = 0
+
+        self.on()
+
+    paths = None
+    """The paths of the files written to so far."""
+
+    def on(self):
+        BufferedSink.on(self)
+        self._session.on(
+            spotify.SessionEvent.END_OF_TRACK, self._on_end_of_track)
+
+    def off(self):
+        """Turn off the audio sink.
+
+        This disconnects the sink from the relevant session events, writes
+        the buffered audio, and finishes the current file.
+        """
+        self._session.off(
+            spotify.SessionEvent.END_OF_TRACK, self._on_end_of_track)
+        BufferedSink.off(self)
+
+    def _on_end_of_track(self, session):
+        # The file is switched when the consumer thread has written all
+        # frames delivered before the event.
+        ring = self._ring
+        if ring is not None and '{index' in self._path:
+            self._rotate_at.append(ring._written)
+
+    def _open(self, audio_format):
+        self._audio_format = audio_format
+        self._rotate_at.clear()
+        self._num_bytes = 0
+
+    def _write(self, data):
+        while self._rotate_at and (
+                self._rotate_at[0] <= self._num_bytes + len(data)):
+            split = self._rotate_at.popleft() - self._num_bytes
+            if split > 0:
+                self._write_file(data[:split])
+                self._num_bytes += split
+                data = data[split:]
+            self._close_file()
+        if data:
+            self._write_file(data)
+            self._num_bytes += len(data)
+
+    def _write_file(self, data):
+        if self._file is None:
+            if '{index' in self._path:
+                self._index += 1
+                path = self._path.format(index=self._index)
+            else:
+                path = self._path
+            if path in self.paths:
+                # Continue the file written to before the sink was closed
+                self._file = io.open(path, 'r+b', buffering=self._buffering)
+                self._file.seek(0, io.SEEK_END)
+            else:
+                self._file = io.open(path, 'wb', buffering=self._buffering)
+                self.paths.append(path)
+            self._start_file(self._file)
+        self._file.write(data)
+
+    def _start_file(self, file_):
+        # file_ is positioned at the end of the audio already in the file
+        pass
+
+    def _finish_file(self, file_):
+        pass
+
+    def _close_file(self):
+        if self._file is not None:
+            self._finish_file(self._file)
+            self._file.close()
+            self._file = None
+
+    def _close_device(self):
+        self._close_file()
+
+
+class WavFileSink(RawFileSink):
+    """Audio sink that writes the audio to WAV files.
+
+    The WAV header is written with zero lengths when the file is created, and
+    patched with the real lengths when the file is finished, either after the
+    :attr:`~spotify.SessionEvent.END_OF_TRACK` event, or when the sink is
+    turned off with :meth:`off`.
+
+    See :class:`RawFileSink` for the arguments and how the audio is split in
+    one file per track.
+
+    Example::
+
+        >>> import spotify
+        >>> session = spotify.Session()
+        >>> audio = spotify.WavFileSink(session, 'track-{index:02d}.wav')
+        # Login, play tracks, etc...
+        >>> audio.off()
+    """
+
+    _header = struct.Struct(str('<4sI4s4sIHHIIHH4sI'))
+
+    def _start_file(self, file_):
+        if file_.tell():
+            self._data_size = file_.tell() - self._header.size
+        else:
+            self._data_size = 0
+            file_.write(self._pack_header(0))
+
+    def _write_file(self, data):
+        if sys.byteorder == 'big':
+            samples = array.array(str('h'), data)
+            samples.byteswap()
+            if utils.PY2:
+                data = samples.tostring()
+            else:
+                data = samples.tobytes()
+        RawFileSink._write_file(self, data)
+        self._data_size += len(data)
+
+    def _finish_file(self, file_):
+        file_.seek(0)
+        file_.write(self._pack_header(self._data_size))
+
+    def _pack_header(self, data_size):
+        channels = self._audio_format.channels
+        sample_rate = self._audio_format.sample_rate
+        block_align = channels * 2
+        return self._header.pack(
+            b'RIFF', 36 + data_size, b'WAVE', b'fmt ', 16, 1, channels,
+            sample_rate, sample_rate * block_align, block_align, 16,
+            b'data', data_size)
+
+
+class TeePolicy(object):
+    """What a :class:`TeeSink` does when a branch's ring buffer is full.
+
+    Pass one of these to :meth:`TeeSink.add_branch`.
+    """
+
+    BACKPRESSURE = 'backpressure'
+    """Tell libspotify that only as many frames were consumed as there is room
+    for in the branch's ring buffer. libspotify delivers the rest again later.
+
+    This is the default. A slow branch slows down the delivery to all
+    branches, without blocking libspotify's audio delivery thread.
+    """
+
+    BLOCK = 'block'
+    """Block libspotify's audio delivery thread until there is room in the
+    branch's ring buffer.
+
+    A slow branch slows down the delivery to all branches. Only use this for
+    branches that are expected to keep up, like a file sink.
+    """
+
+    DROP = 'drop'
+    """Drop the frames there isn't room for in the branch's ring buffer.
+
+    A slow branch loses frames, without affecting the other branches.
+    """
+
+
+class TeeBranchStats(collections.namedtuple('TeeBranchStats', [
+        'policy', 'buffered_frames', 'lag', 'max_lag', 'delivered_frames',
+        'dropped_frames', 'blocked_time'])):
+    """Statistics about a :class:`TeeBranch`, as returned by
+    :attr:`TeeBranch.stats`.
+
+    ``policy`` is the branch's :class:`TeePolicy`. ``buffered_frames`` is the
+    number of frames delivered to the tee, but not yet consumed by the
+    branch's listener, and ``lag`` the number of seconds of audio they make
+    up. ``max_lag`` is the highest lag seen after a delivery.
+
+    ``delivered_frames`` is the number of frames consumed by the branch's
+    listener, and ``dropped_frames`` the number of frames dropped because the
+    branch's ring buffer was full. ``blocked_time`` is the number of seconds
+    libspotify's audio delivery thread has been blocked waiting for room in
+    the branch's ring buffer.
+    """
+
+
+class TeeSink(Sink):
+    """Audio sink that passes the audio delivered by libspotify on to any
+    number of branches, e.g. to play, record, and meter the same audio.
+
+    Only one :attr:`~spotify.SessionEvent.MUSIC_DELIVERY` listener can be
+    connected to the session. The tee is that listener, and each branch
+    added with :meth:`add_branch` stands in for the session towards its own
+    audio sink or listener::
+
+        >>> import spotify
+        >>> session = spotify.Session()
+        >>> tee = spotify.TeeSink(session)
+        >>> speakers = spotify.AlsaSink(tee.add_branch())
+        >>> recorder = spotify.WavFileSink(
+        ...     tee.add_branch(spotify.TeePolicy.BLOCK), 'out.wav')
+
+    Each branch has a ring buffer holding ``buffer_duration`` seconds of
+    audio, which the tee copies the delivered frames into. A thread per
+    branch passes the frames on to the branch's listener, so that one slow
+    listener doesn't hold up the others. What happens when a branch's ring
+    buffer is full is decided by the branch's :class:`TeePolicy`.
+
+    The :attr:`~spotify.SessionEvent.END_OF_TRACK` event is passed on to each
+    branch once the branch's listener has consumed all frames delivered
+    before it, so that e.g. a :class:`RawFileSink` connected to a branch
+    starts a new file for each track.
+
+    The tee answers the :attr:`~spotify.SessionEvent.GET_AUDIO_BUFFER_STATS`
+    event with the number of frames buffered for the branch with the fewest
+    buffered frames, including the frames buffered by the branch's own sink,
+    and the total stutter reported by the branches' sinks. Thus, libspotify
+    keeps delivering audio as long as any branch is running low.
+    """
+
+    def __init__(self, session, buffer_duration=1.0):
+        self._session = session
+        self._buffer_duration = buffer_duration
+        self._branches = ()
+        self._lock = threading.RLock()
+        self._format_key = None
+        self._audio_format = None
+
+        self.on()
+
+    @property
+    def branches(self):
+        """The branches of the tee, as a tuple of :class:`TeeBranch`."""
+        return self._branches
+
+    def add_branch(self, policy=TeePolicy.BACKPRESSURE, buffer_duration=None):
+        """Add a branch to the tee.
+
+        ``policy`` is the :class:`TeePolicy` used when the branch's ring
+        buffer is full. ``buffer_duration`` is the number of seconds of audio
+        the ring buffer can hold, and defaults to the tee's
+        ``buffer_duration``.
+
+        Returns a :class:`TeeBranch`, to pass to an audio sink instead of the
+        session.
+        """
+        if policy not in (
+                TeePolicy.BACKPRESSURE, TeePolicy.BLOCK, TeePolicy.DROP):
+            raise ValueError('Unknown tee policy: %r' % (policy,))
+        if buffer_duration is None:
+            buffer_duration = self._buffer_duration
+        branch = TeeBranch(policy, buffer_duration)
+        with self._lock:
+            if self._format_key is not None:
+                branch._open(self._audio_format)
+            self._branches = self._branches + (branch,)
+        return branch
+
+    def remove_branch(self, branch):
+        """Remove a branch added with :meth:`add_branch`.
+
+        Frames buffered for the branch are discarded. The branch's sink isn't
+        turned off.
+        """
+        with self._lock:
+            self._branches = tuple(
+                b for b in self._branches if b is not branch)
+        branch._close()
+
+    def on(self):
+        Sink.on(self)
+        assert self._session.num_listeners(
+            spotify.SessionEvent.GET_AUDIO_BUFFER_STATS) == 0
+        self._session.on(
+            spotify.SessionEvent.GET_AUDIO_BUFFER_STATS,
+            self._on_get_audio_buffer_stats)
+        self._session.on(
+            spotify.SessionEvent.END_OF_TRACK, self._on_end_of_track)
+
+    def off(self):
+        self._session.off(
+            spotify.SessionEvent.END_OF_TRACK, self._on_end_of_track)
+        self._session.off(
+            spotify.SessionEvent.GET_AUDIO_BUFFER_STATS,
+            self._on_get_audio_buffer_stats)
+        Sink.off(self)
+
+    def _on_end_of_track(self, session):
+        for branch in self._branches:
+            branch._end_of_track()
+
     def _on_music_delivery(self, session, audio_format, frames, num_frames):
         assert (
             audio_format.sample_type == spotify.SampleType.INT16_NATIVE_ENDIAN)
 
-        if self._stream is None:
-            self._stream = self._device.open(
-                format=self._pyaudio.paInt16, channels=audio_format.channels,
-                rate=audio_format.sample_rate, output=True)
-
-        # XXX write() is a blocking call. There are two non-blocking
-        # alternatives:
-        # 1) Only feed write() with the number of frames returned by
-        # self._stream.get_write_available() on each call. This causes buffer
-        # underruns every third or fourth write().
-        # 2) Let pyaudio call a callback function when it needs data, but then
-        # we need to introduce a thread safe buffer here which is filled when
-        # libspotify got data and drained when pyaudio needs data.
-        self._stream.write(frames, num_frames=num_frames)
+        format_key = (
+            audio_format.sample_type, audio_format.sample_rate,
+            audio_format.channels)
+        if format_key != self._format_key:
+            with self._lock:
+                if any(branch.buffered_frames for branch in self._branches):
+                    # Let the branches pass on the frames of the old format
+                    # before their ring buffers are replaced.
+                    return 0
+                for branch in self._branches:
+                    branch._close()
+                    branch._open(audio_format)
+                self._audio_format = audio_format
+                self._format_key = format_key
+
+        branches = self._branches
+        for branch in branches:
+            ring = branch._ring
+            if ring is None:
+                continue  # Removed since the branches were looked up
+            if branch.policy == TeePolicy.BACKPRESSURE:
+                num_frames = min(num_frames, ring.free_frames)
+            elif branch.policy == TeePolicy.BLOCK:
+                num_frames = min(num_frames, ring.capacity)
+        if num_frames == 0:
+            return 0
+        for branch in branches:
+            if branch.policy == TeePolicy.BLOCK:
+                branch._wait_for_room(num_frames)
+        for branch in branches:
+            branch._write(frames, num_frames)
         return num_frames
 
+    def _on_get_audio_buffer_stats(self, session):
+        samples = None
+        stutter = 0
+        for branch in self._branches:
+            branch_samples = branch.buffered_frames
+            if branch.num_listeners(
+                    spotify.SessionEvent.GET_AUDIO_BUFFER_STATS):
+                stats = branch.call(
+                    spotify.SessionEvent.GET_AUDIO_BUFFER_STATS, branch)
+                branch_samples += stats.samples
+                stutter += stats.stutter
+            if samples is None or branch_samples < samples:
+                samples = branch_samples
+        return spotify.AudioBufferStats(samples or 0, stutter)
+
     def _close(self):
-        if self._stream is not None:
-            self._stream.close()
-            self._stream = None
+        with self._lock:
+            for branch in self._branches:
+                branch._close()
+            self._format_key = None
+            self._audio_format = None
+
+
+class TeeBranch(utils.EventEmitter):
+    """A branch of a :class:`TeeSink`, created by :meth:`TeeSink.add_branch`.
+
+    The branch stands in for the session towards an audio sink, or any other
+    :attr:`~spotify.SessionEvent.MUSIC_DELIVERY`,
+    :attr:`~spotify.SessionEvent.END_OF_TRACK`, or
+    :attr:`~spotify.SessionEvent.GET_AUDIO_BUFFER_STATS` listener connected
+    to it with :meth:`on`. The listener is called the same way the session
+    would call it, from the branch's own thread. The frames are always passed
+    as a bytestring. Frames that the listener doesn't consume are delivered
+    again, like libspotify does. If no listener is connected, the frames are
+    discarded.
+
+    :attr:`~spotify.SessionEvent.END_OF_TRACK` is emitted from the branch's
+    thread, after the frames delivered to the tee before the event have been
+    consumed by the branch's listener.
+    """
+
+    _write_size = 2048
+    """The maximum number of frames passed to the listener at a time."""
+
+    _retry_interval = 0.005
+    """Seconds to wait before delivering frames the listener didn't consume
+    again."""
+
+    def __init__(self, policy, buffer_duration):
+        super(TeeBranch, self).__init__()
+        self.policy = policy
+        self._buffer_duration = buffer_duration
+        self._ring = None
+        self._sample_rate = 0
+        self._pending_frames = 0
+        self._pump = None
+        self._running = False
+        self._data_available = threading.Event()
+        self._room_available = threading.Event()
+        self._delivered_frames = 0
+        self._dropped_frames = 0
+        self._blocked_time = 0.0
+        self._max_lag = 0.0
+        # Ring buffer byte positions at which END_OF_TRACK is to be emitted
+        self._end_of_track_at = collections.deque()
+
+    policy = None
+    """The branch's :class:`TeePolicy`."""
+
+    @property
+    def buffered_frames(self):
+        """The number of frames delivered to the tee, but not yet consumed by
+        the branch's listener."""
+        ring = self._ring
+        if ring is None:
+            return 0
+        return ring.num_frames + self._pending_frames
+
+    @property
+    def stats(self):
+        """A :class:`TeeBranchStats` snapshot of the branch."""
+        buffered_frames = self.buffered_frames
+        return TeeBranchStats(
+            policy=self.policy,
+            buffered_frames=buffered_frames,
+            lag=self._lag(buffered_frames),
+            max_lag=self._max_lag,
+            delivered_frames=self._delivered_frames,
+            dropped_frames=self._dropped_frames,
+            blocked_time=self._blocked_time)
+
+    def _lag(self, buffered_frames):
+        if not self._sample_rate:
+            return 0.0
+        return buffered_frames / float(self._sample_rate)
+
+    def _open(self, audio_format):
+        self._end_of_track_at.clear()
+        self._ring = _RingBuffer(
+            int(audio_format.sample_rate * self._buffer_duration),
+            audio_format.frame_size())
+        self._sample_rate = audio_format.sample_rate
+        self._running = True
+        self._pump = threading.Thread(
+            target=self._run_pump, args=(self._ring, audio_format),
+            name='TeeBranchPump')
+        self._pump.daemon = True
+        self._pump.start()
+
+    def _close(self):
+        self._running = False
+        self._data_available.set()
+        self._room_available.set()
+        pump = self._pump
+        if pump is not None and pump is not threading.current_thread():
+            pump.join()
+        self._pump = None
+        self._ring = None
+        self._pending_frames = 0
+
+    def _end_of_track(self):
+        ring = self._ring
+        if ring is None or not self._running:
+            self._emit_end_of_track()
+            return
+        self._end_of_track_at.append(ring._written)
+        self._data_available.set()
+
+    def _emit_end_of_track(self):
+        try:
+            self.emit(spotify.SessionEvent.END_OF_TRACK, self)
+        except Exception:
+            logger.exception('End of track listener of tee branch failed')
+
+    def _wait_for_room(self, num_frames):
+        # Called from libspotify's audio delivery thread.
+        ring = self._ring
+        if ring is None or ring.free_frames >= num_frames:
+            return
+        start = _clock()
+        while self._running:
+            self._room_available.clear()
+            if ring.free_frames >= num_frames:
+                break
+            self._room_available.wait(0.1)
+        self._blocked_time += _clock() - start
+
+    def _write(self, frames, num_frames):
+        # Called from libspotify's audio delivery thread.
+        ring = self._ring
+        if ring is None:
+            return
+        num_frames_written = ring.write(frames, num_frames)
+        self._dropped_frames += num_frames - num_frames_written
+        if num_frames_written:
+            self._data_available.set()
+        self._max_lag = max(self._max_lag, self._lag(self.buffered_frames))
+
+    def _run_pump(self, ring, audio_format):
+        # Runs in the branch's thread, which is the only thread reading from
+        # the ring buffer.
+        data = b''
+        end_of_track_at = self._end_of_track_at
+        while self._running:
+            if not data:
+                self._data_available.clear()
+                num_frames = self._write_size
+                if end_of_track_at:
+                    if end_of_track_at[0] <= ring._read:
+                        end_of_track_at.popleft()
+                        self._emit_end_of_track()
+                        continue
+                    # Stop at the end of the track
+                    num_frames = min(num_frames, (
+                        end_of_track_at[0] - ring._read) // ring.frame_size)
+                data = ring.read(num_frames)
+                if not data:
+                    self._data_available.wait(0.1)
+                    continue
+                self._pending_frames = len(data) // ring.frame_size
+                self._room_available.set()
+            num_frames = len(data) // ring.frame_size
+            num_frames_consumed = self._deliver(audio_format, data, num_frames)
+            self._delivered_frames += num_frames_consumed
+            self._pending_frames = num_frames - num_frames_consumed
+            data = data[num_frames_consumed * ring.frame_size:]
+            if data:
+                time.sleep(self._retry_interval)
+
+    def _deliver(self, audio_format, data, num_frames):
+        if self.num_listeners(spotify.SessionEvent.MUSIC_DELIVERY) == 0:
+            return num_frames
+        try:
+            return self.call(
+                spotify.SessionEvent.MUSIC_DELIVERY, self, audio_format, data,
+                num_frames)
+        except Exception:
+            logger.exception('Audio delivery to tee branch failed')
+            return num_frames
@@ -38,6 +38,7 @@ class Toplist(object):
         self.canonical_username = canonical_username
 
         self.complete_event = threading.Event()
+        self.future = utils.create_request_future(self)
         self._callback_handles = set()
 
         if sp_toplistbrowse is None:
@@ -68,6 +69,15 @@ class Toplist(object):
     completed.
     """
 
+    future = None
+    """:class:`concurrent.futures.Future` that is done when the toplist request
+    is completed.
+
+    The future's result is the :class:`Toplist` itself, or a
+    :exc:`~spotify.LibError` if the request failed. The future is :class:`None`
+    if :mod:`concurrent.futures` isn't available.
+    """
+
     def __repr__(self):
         return 'Toplist(type=%r, region=%r, canonical_username=%r)' % (
             self.type, self.region, self.canonical_username)
@@ -122,9 +132,9 @@ class Toplist(object):
 
         @serialized
         def get_track(sp_toplistbrowse, key):
-            return spotify.Track(
+            return spotify.Track._cached(
                 self._session,
-                sp_track=lib.sp_toplistbrowse_track(sp_toplistbrowse, key),
+                lib.sp_toplistbrowse_track(sp_toplistbrowse, key),
                 add_ref=True)
 
         return utils.Sequence(
@@ -147,9 +157,9 @@ class Toplist(object):
 
         @serialized
         def get_album(sp_toplistbrowse, key):
-            return spotify.Album(
+            return spotify.Album._cached(
                 self._session,
-                sp_album=lib.sp_toplistbrowse_album(sp_toplistbrowse, key),
+                lib.sp_toplistbrowse_album(sp_toplistbrowse, key),
                 add_ref=True)
 
         return utils.Sequence(
@@ -172,9 +182,9 @@ class Toplist(object):
 
         @serialized
         def get_artist(sp_toplistbrowse, key):
-            return spotify.Artist(
+            return spotify.Artist._cached(
                 self._session,
-                sp_artist=lib.sp_toplistbrowse_artist(sp_toplistbrowse, key),
+                lib.sp_toplistbrowse_artist(sp_toplistbrowse, key),
                 add_ref=True)
 
         return utils.Sequence(
@@ -195,6 +205,8 @@ def _toplistbrowse_complete_callback(sp_toplistbrowse, handle):
     (callback, toplist) = ffi.from_handle(handle)
     toplist._callback_handles.remove(handle)
     toplist.complete_event.set()
+    utils.complete_request_future(toplist)
+    toplist._session._notify_loaded()
     if callback is not None:
         callback(toplist)
 
@@ -25,13 +25,34 @@ class Track(object):
         u'Get Lucky'
     """
 
+    __slots__ = ['_session', '_sp_track', '_memo', '__weakref__']
+
     # TODO Review all maybe_raise() calls to check if they should ignore
     # ErrorType.IS_LOADING
 
+    @classmethod
+    @serialized
+    def _cached(cls, session, sp_track, add_ref=True):
+        """
+        Get :class:`Track` instance for the given ``sp_track``. If it already
+        exists, it is retrieved from cache.
+
+        Internal method.
+        """
+        track = session._cache.get(sp_track)
+        if track is not None:
+            if not add_ref:
+                lib.sp_track_release(sp_track)
+            return track
+        track = Track(session, sp_track=sp_track, add_ref=add_ref)
+        session._cache[sp_track] = track
+        return track
+
     def __init__(self, session, uri=None, sp_track=None, add_ref=True):
         assert uri or sp_track, 'uri or sp_track is required'
 
         self._session = session
+        self._memo = None
 
         if uri is not None:
             track = spotify.Link(self._session, uri=uri).as_track()
@@ -71,7 +92,19 @@ class Track(object):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None):
+        """Load the track's data without blocking.
+
+        Returns an :class:`asyncio.Future` that is done when the track is
+        loaded, with the track as its result. If ``timeout`` is :class:`None`
+        the default timeout is used.
+
+        Requires a running :class:`AsyncioEventLoop`.
+        """
+        return utils.load_async(self._session, self, timeout=timeout)
+
     @property
+    @utils.memoized(mutable=True)
     def offline_status(self):
         """The :class:`TrackOfflineStatus` of the track.
 
@@ -88,6 +121,7 @@ class Track(object):
             lib.sp_track_offline_get_status(self._sp_track))
 
     @property
+    @utils.memoized(mutable=True)
     def availability(self):
         """The :class:`TrackAvailability` of the track.
 
@@ -101,6 +135,7 @@ class Track(object):
             self._session._sp_session, self._sp_track))
 
     @property
+    @utils.memoized
     def is_local(self):
         """Whether the track is a local track.
 
@@ -113,6 +148,7 @@ class Track(object):
             self._session._sp_session, self._sp_track))
 
     @property
+    @utils.memoized(mutable=True)
     def is_autolinked(self):
         """Whether the track is a autolinked to another track.
 
@@ -139,13 +175,14 @@ class Track(object):
             self.error, ignores=[spotify.ErrorType.IS_LOADING])
         if not self.is_loaded:
             return None
-        return Track(
+        return Track._cached(
             self._session,
-            sp_track=lib.sp_track_get_playable(
+            lib.sp_track_get_playable(
                 self._session._sp_session, self._sp_track),
             add_ref=True)
 
     @property
+    @utils.memoized
     def is_placeholder(self):
         """Whether the track is a placeholder for a non-track object in the
         playlist.
@@ -172,6 +209,7 @@ class Track(object):
         return bool(lib.sp_track_is_placeholder(self._sp_track))
 
     @property
+    @utils.memoized(mutable=True)
     def starred(self):
         """Whether the track is starred by the current user.
 
@@ -192,6 +230,8 @@ class Track(object):
         spotify.Error.maybe_raise(lib.sp_track_set_starred(
             self._session._sp_session, tracks, len(tracks),
             bool(value)))
+        if self._memo is not None:
+            self._memo.pop('starred', None)
 
     @property
     @serialized
@@ -206,9 +246,9 @@ class Track(object):
 
         @serialized
         def get_artist(sp_track, key):
-            return spotify.Artist(
+            return spotify.Artist._cached(
                 self._session,
-                sp_artist=lib.sp_track_artist(sp_track, key),
+                lib.sp_track_artist(sp_track, key),
                 add_ref=True)
 
         return utils.Sequence(
@@ -229,9 +269,10 @@ class Track(object):
         sp_album = lib.sp_track_album(self._sp_track)
         if sp_album == ffi.NULL:
             return None
-        return spotify.Album(self._session, sp_album=sp_album, add_ref=True)
+        return spotify.Album._cached(self._session, sp_album, add_ref=True)
 
     @property
+    @utils.memoized
     @serialized
     def name(self):
         """The track's name.
@@ -243,6 +284,7 @@ class Track(object):
         return name if name else None
 
     @property
+    @utils.memoized
     def duration(self):
         """The track's duration in milliseconds.
 
@@ -253,6 +295,7 @@ class Track(object):
         return duration if duration else None
 
     @property
+    @utils.memoized(mutable=True)
     def popularity(self):
         """The track's popularity in the range 0-100, 0 if undefined.
 
@@ -285,6 +328,29 @@ class Track(object):
         index = lib.sp_track_index(self._sp_track)
         return index if index else None
 
+    def fetch_metadata(self):
+        """Get all the track's metadata at once, as a
+        :class:`~spotify.TrackMetadata`.
+
+        This reads all the metadata from libspotify with a single call, which
+        is much faster than reading the properties one by one. Use
+        :func:`~spotify.fetch_metadata_many` to get the metadata of many
+        tracks at once.
+        """
+        return spotify.fetch_metadata_many([self])[0]
+
+    def snapshot(self):
+        """Get an immutable snapshot of the track, as a
+        :class:`~spotify.TrackInfo`.
+
+        The snapshot holds all the track's metadata, its URI, and snapshots
+        of its album and artists, all read while holding the lock once. The
+        snapshot only contains plain Python values, and can be used without
+        calling into libspotify. Use :func:`~spotify.snapshot_many` to get
+        snapshots of many tracks at once.
+        """
+        return spotify.snapshot_many([self])[0]
+
     @property
     def link(self):
         """A :class:`Link` to the track."""
@@ -306,6 +372,8 @@ class LocalTrack(Track):
     there are more details in Hallon's docs.
     """
 
+    __slots__ = ()
+
     def __init__(
             self, session, artist=None, title=None, album=None, length=None):
         artist = utils.to_char_or_null(artist)
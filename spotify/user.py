@@ -22,6 +22,26 @@ class User(object):
         u'jodal'
     """
 
+    __slots__ = ['_session', '_sp_user', '__weakref__']
+
+    @classmethod
+    @serialized
+    def _cached(cls, session, sp_user, add_ref=True):
+        """
+        Get :class:`User` instance for the given ``sp_user``. If it already
+        exists, it is retrieved from cache.
+
+        Internal method.
+        """
+        user = session._cache.get(sp_user)
+        if user is not None:
+            if not add_ref:
+                lib.sp_user_release(sp_user)
+            return user
+        user = User(session, sp_user=sp_user, add_ref=add_ref)
+        session._cache[sp_user] = user
+        return user
+
     def __init__(self, session, uri=None, sp_user=None, add_ref=True):
         assert uri or sp_user, 'uri or sp_user is required'
 
@@ -69,6 +89,17 @@ class User(object):
         """
         return utils.load(self._session, self, timeout=timeout)
 
+    def load_async(self, timeout=None):
+        """Load the user's data without blocking.
+
+        Returns an :class:`asyncio.Future` that is done when the user is
+        loaded, with the user as its result. If ``timeout`` is :class:`None`
+        the default timeout is used.
+
+        Requires a running :class:`AsyncioEventLoop`.
+        """
+        return utils.load_async(self._session, self, timeout=timeout)
+
     @property
     def link(self):
         """A :class:`Link` to the user."""
@@ -2,14 +2,26 @@ from __future__ import unicode_literals
 
 import collections
 import functools
+import logging
 import pprint
 import sys
+import threading
 import time
 
+try:
+    # Python 3.2+, or Python 2 with the "futures" backport
+    import concurrent.futures
+except ImportError:
+    concurrent = None
+
 import spotify
 from spotify import ffi, lib, serialized
 
 
+logger = logging.getLogger(__name__)
+
+_clock = getattr(time, 'perf_counter', time.time)
+
 PY2 = sys.version_info[0] == 2
 
 if PY2:  # pragma: no branch
@@ -22,11 +34,19 @@ else:
     binary_type = bytes
 
 
+# Guards all changes to EventEmitter listener tuples. The tuples are replaced
+# rather than changed, so emit() reads them without taking this lock.
+_listeners_lock = threading.Lock()
+
+
 class EventEmitter(object):
     """Mixin for adding event emitter functionality to a class."""
 
     def __init__(self):
-        self._listeners = collections.defaultdict(list)
+        # Maps events to tuples of listeners. The tuples are never changed,
+        # but replaced by :meth:`on` and :meth:`off`, so that :meth:`emit`
+        # can iterate over them without copying or locking.
+        self._listeners = {}
 
     @serialized
     def on(self, event, listener, *user_args):
@@ -39,8 +59,24 @@ class EventEmitter(object):
         If the listener function returns :class:`False`, it is removed and will
         not be called the next time the ``event`` is emitted.
         """
-        self._listeners[event].append(
-            _Listener(callback=listener, user_args=user_args))
+        self._add_listener(event, _Listener(
+            callback=listener, user_args=user_args, once=False))
+
+    @serialized
+    def once(self, event, listener, *user_args):
+        """Register a ``listener`` to be called the next time ``event`` is
+        emitted only.
+
+        The listener is removed before it is called, and is called with the
+        same arguments as if it was registered with :meth:`on`.
+        """
+        self._add_listener(event, _Listener(
+            callback=listener, user_args=user_args, once=True))
+
+    def _add_listener(self, event, listener):
+        with _listeners_lock:
+            self._listeners[event] = (
+                self._listeners.get(event, ()) + (listener,))
 
     @serialized
     def off(self, event=None, listener=None):
@@ -53,29 +89,187 @@ class EventEmitter(object):
         object will be removed.
         """
         if event is None:
-            events = self._listeners.keys()
+            events = list(self._listeners.keys())
         else:
             events = [event]
         for event in events:
-            if listener is None:
-                self._listeners[event] = []
-            else:
-                self._listeners[event] = [
-                    l for l in self._listeners[event]
-                    if l.callback is not listener]
+            self._remove_callback(event, listener)
+
+    # The methods below are called from emit(), which may run in one of
+    # libspotify's threads. They don't use the serialized decorator, which
+    # only allows the owner thread in the single-threaded lock mode, but
+    # change the listener tuples while holding _listeners_lock.
+
+    def _remove_callback(self, event, callback):
+        with _listeners_lock:
+            listeners = ()
+            if callback is not None:
+                listeners = tuple(
+                    other for other in self._listeners.get(event, ())
+                    if other.callback is not callback)
+            self._set_listeners(event, listeners)
+
+    def _remove_once_listener(self, event, listener):
+        # Returns whether ``listener`` was still registered, so that a
+        # listener registered with :meth:`once` is only called by the first
+        # of several threads emitting the event at the same time.
+        with _listeners_lock:
+            listeners = self._listeners.get(event, ())
+            remaining = tuple(
+                other for other in listeners if other is not listener)
+            if len(remaining) == len(listeners):
+                return False
+            self._set_listeners(event, remaining)
+            return True
+
+    def _set_listeners(self, event, listeners):
+        if listeners:
+            self._listeners[event] = listeners
+        else:
+            self._listeners.pop(event, None)
 
     def emit(self, event, *event_args):
         """Call the registered listeners for ``event``.
 
         The listeners will be called with any extra arguments passed to
         :meth:`emit` first, and then the extra arguments passed to :meth:`on`
+
+        If the event is emitted while :meth:`Session.process_events()
+        <spotify.Session.process_events>` is running in the same thread with
+        :attr:`Session.defer_events <spotify.Session.defer_events>` enabled,
+        the listeners are called when :meth:`~spotify.Session.process_events`
+        is done instead.
         """
-        listeners = self._listeners[event][:]
+        queue = _deferred.queue
+        if queue is not None:
+            queue.append((self, event, event_args))
+            return
+        listeners = self._listeners.get(event)
+        if not listeners:
+            return
+        dispatcher = self._get_dispatcher(event)
+        listener_stats = self._listener_stats
         for listener in listeners:
-            args = list(event_args) + list(listener.user_args)
-            result = listener.callback(*args)
+            if listener.once and not self._remove_once_listener(
+                    event, listener):
+                continue
+            # The event arguments differ from emit to emit, so the arguments
+            # can't be joined in advance, only skipped when there are no user
+            # arguments.
+            if listener.user_args:
+                args = event_args + listener.user_args
+            else:
+                args = event_args
+            if dispatcher is not None:
+                dispatcher.dispatch(self, event, listener, args)
+                continue
+            if listener_stats is None:
+                result = listener.callback(*args)
+            else:
+                result = self._call_listener(event, listener.callback, args)
             if result is False:
-                self.off(event, listener.callback)
+                self._remove_callback(event, listener.callback)
+
+    _listener_stats = None
+
+    def enable_listener_stats(
+            self, slow_threshold=None, slow_listener_hook=None):
+        """Start recording how long each listener takes to handle events.
+
+        For each event and listener, the number of calls, and the total and
+        longest time spent in the listener are recorded. Use
+        :meth:`get_listener_stats` to get the statistics. Enabling the
+        listener statistics again resets all the recorded statistics.
+
+        If ``slow_threshold`` is a number of seconds, a warning is logged
+        each time a listener takes longer than that to return. If
+        ``slow_listener_hook`` is given, it is called with the emitter, the
+        event, the listener's name, and the duration in seconds instead of
+        logging the warning.
+
+        Listeners called by an executor, see :meth:`set_executor`, are timed
+        in the executor.
+        """
+        self._listener_stats = _ListenerStatsCollector(
+            slow_threshold, slow_listener_hook)
+
+    def disable_listener_stats(self):
+        """Stop recording listener statistics.
+
+        The statistics recorded so far are discarded.
+        """
+        self._listener_stats = None
+
+    def get_listener_stats(self):
+        """Get the listener statistics recorded so far.
+
+        Returns a dict mapping ``(event, name)`` tuples to
+        :class:`ListenerStats` instances, where ``name`` is the qualified name
+        of the listener function, like ``myapp.Player.on_tracks_added``.
+        Returns :class:`None` if the listener statistics isn't enabled.
+        """
+        listener_stats = self._listener_stats
+        if listener_stats is None:
+            return None
+        return listener_stats.snapshot()
+
+    def _call_listener(self, event, callback, args):
+        listener_stats = self._listener_stats
+        if listener_stats is None:
+            return callback(*args)
+        start = _clock()
+        try:
+            return callback(*args)
+        finally:
+            listener_stats.record(self, event, callback, _clock() - start)
+
+    _dispatchers = None
+
+    @serialized
+    def set_executor(self, executor, event=None):
+        """Call the listeners for ``event`` using ``executor`` instead of
+        calling them directly from the thread emitting the event.
+
+        ``executor`` can be a :class:`concurrent.futures.Executor`, like a
+        :class:`~concurrent.futures.ThreadPoolExecutor`, or an
+        :mod:`asyncio` event loop, or :class:`None` to call the listeners
+        directly again. If ``event`` is :class:`None`, the executor is used
+        for all events that don't have an executor of their own.
+
+        Each listener is called with one event at a time, in the order the
+        events were emitted, while different listeners may be called
+        concurrently. The listeners' return values are ignored, except that a
+        listener returning :class:`False` is removed, as when called directly.
+        Exceptions raised by the listeners are logged.
+        """
+        if self._dispatchers is None:
+            self._dispatchers = {}
+        if executor is None:
+            self._dispatchers.pop(event, None)
+        else:
+            self._dispatchers[event] = _Dispatcher(executor)
+
+    def get_dispatch_stats(self, event=None):
+        """Get :class:`DispatchStats` for the executor used to call the
+        listeners for ``event``.
+
+        If ``event`` is :class:`None`, the stats of the executor set for all
+        events are returned. Returns :class:`None` if the listeners are called
+        directly.
+        """
+        dispatcher = self._get_dispatcher(event)
+        if dispatcher is None:
+            return None
+        return dispatcher.get_stats()
+
+    def _get_dispatcher(self, event):
+        dispatchers = self._dispatchers
+        if not dispatchers:
+            return None
+        dispatcher = dispatchers.get(event)
+        if dispatcher is None:
+            dispatcher = dispatchers.get(None)
+        return dispatcher
 
     def num_listeners(self, event=None):
         """Return the number of listeners for ``event``.
@@ -84,9 +278,10 @@ class EventEmitter(object):
         ``event`` is :class:`None`.
         """
         if event is not None:
-            return len(self._listeners[event])
+            return len(self._listeners.get(event, ()))
         else:
-            return sum(len(l) for l in self._listeners.values())
+            return sum(
+                len(listeners) for listeners in self._listeners.values())
 
     def call(self, event, *event_args):
         """Call the single registered listener for ``event``.
@@ -100,16 +295,208 @@ class EventEmitter(object):
         # XXX It would be a lot better for debugging if this error was raised
         # when registering the second listener instead of when the event is
         # emitted.
-        assert self.num_listeners(event) == 1, (
+        listeners = self._listeners.get(event, ())
+        assert len(listeners) == 1, (
             'Expected exactly 1 event listener, found %d listeners' %
-            self.num_listeners(event))
-        listener = self._listeners[event][0]
-        args = list(event_args) + list(listener.user_args)
-        return listener.callback(*args)
+            len(listeners))
+        listener = listeners[0]
+        if listener.once:
+            self._remove_once_listener(event, listener)
+        return self._call_listener(
+            event, listener.callback, event_args + listener.user_args)
+
+
+class DispatchStats(collections.namedtuple('DispatchStats', [
+        'queue_depth', 'max_queue_depth', 'dispatched',
+        'latency', 'max_latency'])):
+    """Statistics about the listener calls made by an executor, as returned
+    by :meth:`EventEmitter.get_dispatch_stats`.
+
+    ``queue_depth`` is the number of listener calls waiting to be made, and
+    ``max_queue_depth`` the highest number of waiting calls seen so far. A
+    growing queue depth means that the listeners can't keep up with the rate
+    of events.
+
+    ``dispatched`` is the number of listener calls made. ``latency`` and
+    ``max_latency`` are the total and longest number of seconds from when an
+    event was emitted until the listener was called.
+    """
+
+
+class _Dispatcher(object):
+    """Calls event listeners using an executor, keeping the calls to each
+    listener in order.
+
+    Internal class.
+    """
+
+    def __init__(self, executor):
+        if hasattr(executor, 'submit'):
+            self._submit = executor.submit
+        elif hasattr(executor, 'call_soon_threadsafe'):
+            self._submit = executor.call_soon_threadsafe
+        else:
+            raise TypeError(
+                'Expected an executor or an asyncio event loop, got %r' %
+                executor)
+        self._mutex = threading.Lock()
+        self._queues = {}
+        self._stats = [0, 0, 0, 0.0, 0.0]
+
+    def dispatch(self, emitter, event, listener, args):
+        # Each listener has its own queue of calls, which is worked through
+        # by a single task at a time, so that the listener is called with
+        # one event at a time, in order.
+        key = id(listener)
+        with self._mutex:
+            queue = self._queues.get(key)
+            schedule = queue is None
+            if schedule:
+                queue = self._queues[key] = collections.deque()
+            queue.append((emitter, event, listener, args, _clock()))
+            stats = self._stats
+            stats[0] += 1
+            stats[1] = max(stats[1], stats[0])
+        if schedule:
+            self._submit(self._run, key)
+
+    def get_stats(self):
+        with self._mutex:
+            return DispatchStats(*self._stats)
+
+    def _run(self, key):
+        while True:
+            with self._mutex:
+                queue = self._queues[key]
+                if not queue:
+                    del self._queues[key]
+                    return
+                emitter, event, listener, args, emitted = queue.popleft()
+                latency = _clock() - emitted
+                stats = self._stats
+                stats[0] -= 1
+                stats[2] += 1
+                stats[3] += latency
+                stats[4] = max(stats[4], latency)
+            try:
+                result = emitter._call_listener(
+                    event, listener.callback, args)
+            except Exception:
+                logger.exception('Event listener for %r failed', event)
+            else:
+                if result is False:
+                    emitter._remove_callback(event, listener.callback)
+
+
+class ListenerStats(collections.namedtuple('ListenerStats', [
+        'event', 'name', 'count', 'total_time', 'max_time'])):
+    """Statistics about the calls to a single event listener, as returned by
+    :meth:`EventEmitter.get_listener_stats`.
+
+    ``event`` is the event the listener was called for, and ``name`` the
+    qualified name of the listener function. ``count`` is the number of
+    calls. ``total_time`` and ``max_time`` are the total and longest number
+    of seconds spent in the listener.
+    """
+
+
+class _ListenerStatsCollector(object):
+    """Records the time spent in event listeners.
+
+    Internal class.
+    """
+
+    def __init__(self, slow_threshold=None, slow_listener_hook=None):
+        self._slow_threshold = slow_threshold
+        self._slow_listener_hook = slow_listener_hook
+        self._mutex = threading.Lock()
+        self._entries = {}
+
+    def record(self, emitter, event, callback, duration):
+        name = _get_callback_name(callback)
+        key = (event, name)
+        with self._mutex:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = [0, 0.0, 0.0]
+            entry[0] += 1
+            entry[1] += duration
+            entry[2] = max(entry[2], duration)
+        threshold = self._slow_threshold
+        if threshold is None or duration < threshold:
+            return
+        if self._slow_listener_hook is not None:
+            self._slow_listener_hook(emitter, event, name, duration)
+        else:
+            logger.warning(
+                'Event listener %s for %r took %.3fs', name, event, duration)
+
+    def snapshot(self):
+        with self._mutex:
+            return {
+                key: ListenerStats(key[0], key[1], *entry)
+                for key, entry in self._entries.items()}
+
+
+def _get_callback_name(callback):
+    name = getattr(callback, '__qualname__', None)
+    if name is None:
+        name = getattr(callback, '__name__', None)
+        cls = getattr(callback, 'im_class', None)
+        if name is not None and cls is not None:
+            # Bound or unbound method on Python 2
+            name = '%s.%s' % (cls.__name__, name)
+    if name is None:
+        return repr(callback)
+    module = getattr(callback, '__module__', None)
+    if module is None:
+        return name
+    return '%s.%s' % (module, name)
+
+
+class _DeferredEvents(threading.local):
+    # Holds the list of events emitted by the current thread while their
+    # delivery is deferred, see :attr:`spotify.Session.defer_events`. The
+    # class attribute makes the lookup in :meth:`EventEmitter.emit` cheap
+    # for threads that have never deferred events.
+    queue = None
+
+
+_deferred = _DeferredEvents()
+
+
+def defer_events(queue):
+    """Make :meth:`EventEmitter.emit` append events emitted by the current
+    thread to the list ``queue`` instead of calling the listeners.
+
+    If ``queue`` is :class:`None`, events are delivered immediately again.
+    Returns the previous queue, so that it can be restored.
+
+    Internal function.
+    """
+    previous = _deferred.queue
+    _deferred.queue = queue
+    return previous
+
+
+def deliver_events(events):
+    """Call the listeners of events that were deferred by
+    :func:`defer_events`, in the order the events were emitted.
+
+    Exceptions raised by listeners are logged, and don't stop the delivery
+    of the remaining events.
+
+    Internal function.
+    """
+    for emitter, event, event_args in events:
+        try:
+            emitter.emit(event, *event_args)
+        except Exception:
+            logger.exception('Event listener for %r failed', event)
 
 
 class _Listener(collections.namedtuple(
-        'Listener', ['callback', 'user_args'])):
+        'Listener', ['callback', 'user_args', 'once'])):
     """An listener of events from an :class:`EventEmitter`"""
 
 
@@ -151,14 +538,33 @@ def make_enum(lib_prefix, enum_prefix=''):
     """
 
     def wrapper(cls):
-        for attr in dir(lib):
-            if attr.startswith(lib_prefix):
-                name = attr.replace(lib_prefix, enum_prefix)
-                cls.add(name, getattr(lib, attr))
+        for attr, value in get_lib_constants(lib_prefix):
+            name = attr.replace(lib_prefix, enum_prefix)
+            cls.add(name, value)
         return cls
     return wrapper
 
 
+_lib_constants = None
+
+
+def get_lib_constants(lib_prefix):
+    """Get a list of ``(name, value)`` pairs for all constants in
+    :attr:`spotify.lib` starting with ``lib_prefix``.
+
+    The library is only searched for constants the first time this function is
+    called, instead of once for every enum and constant table built from it.
+    """
+    global _lib_constants
+    if _lib_constants is None:
+        _lib_constants = [
+            (attr, getattr(lib, attr))
+            for attr in dir(lib) if attr.startswith('SP_')]
+    return [
+        (attr, value) for attr, value in _lib_constants
+        if attr.startswith(lib_prefix)]
+
+
 def get_with_fixed_buffer(buffer_length, func, *args):
     """Get a unicode string from a C function that takes a fixed-size buffer.
 
@@ -210,6 +616,10 @@ def load(session, obj, timeout=None):
     no timeout, since no timeout would cause programs to potentially hang
     forever without any information to help debug the issue.
 
+    If an :class:`~spotify.EventLoop` is running, this blocks until the event
+    loop reports that something may have finished loading, instead of
+    processing events itself.
+
     The method returns ``self`` to allow for chaining of calls.
     """
     if session.connection_state is not spotify.ConnectionState.LOGGED_IN:
@@ -219,6 +629,9 @@ def load(session, obj, timeout=None):
         timeout = 10
     deadline = time.time() + timeout
 
+    if _is_event_loop_running(session):
+        _wait_until_loaded(session, obj, timeout, deadline)
+
     while not obj.is_loaded:
         session.process_events()
         spotify.Error.maybe_raise(
@@ -242,6 +655,235 @@ def load(session, obj, timeout=None):
     return obj
 
 
+# The longest time to wait for a notification before checking if the object
+# is loaded anyway, in case it finished loading without any of the callbacks
+# notifying waiters being called.
+_MAX_LOAD_WAIT = 1.0
+
+
+def _is_event_loop_running(session):
+    event_loop = session._event_loop
+    # An EventLoop is itself the thread processing events, while an
+    # AsyncioEventLoop processes events in the thread running the asyncio
+    # event loop.
+    return (
+        event_loop is not None and event_loop.is_alive() and
+        threading.current_thread() not in (
+            event_loop, getattr(event_loop, '_thread', None)))
+
+
+def _wait_until_loaded(session, obj, timeout, deadline):
+    while True:
+        # The generation is read before checking the object, so a
+        # notification arriving in between makes us check again instead of
+        # being missed.
+        generation = session._load_generation
+        if obj.is_loaded:
+            return
+        spotify.Error.maybe_raise(
+            getattr(obj, 'error', 0), ignores=[spotify.ErrorType.IS_LOADING])
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            raise spotify.Timeout(timeout)
+        _wait_for_notification(session, generation, remaining)
+
+
+def _wait_for_notification(session, generation, timeout):
+    # The objects must not be checked while holding the condition, as the
+    # notifications are sent while holding the library lock.
+    condition = session._load_condition
+    with condition:
+        if session._load_generation == generation:
+            condition.wait(min(timeout, _MAX_LOAD_WAIT))
+
+
+def load_all(session, objects, timeout=None, return_exceptions=False):
+    """Block until all the objects' data is loaded.
+
+    Like :func:`load`, but for many objects at once, sharing a single
+    ``timeout`` for all of them. After each time events are processed, only
+    the objects that aren't loaded yet are checked again.
+
+    An object failing to load doesn't stop the loading of the other objects.
+    Once all objects are loaded, have failed, or the ``timeout`` is reached,
+    the first error is raised, either a :exc:`~spotify.LibError` or a
+    :exc:`~spotify.Timeout`. If ``return_exceptions`` is :class:`True`, the
+    errors are returned in place of the objects instead of being raised.
+
+    Returns a list of the objects, in the same order.
+    """
+    if session.connection_state is not spotify.ConnectionState.LOGGED_IN:
+        raise RuntimeError('Session must be logged in to load objects')
+
+    if timeout is None:
+        timeout = 10
+    deadline = time.time() + timeout
+
+    objects = list(objects)
+    results = list(objects)
+    pending = list(range(len(objects)))
+    use_event_loop = _is_event_loop_running(session)
+
+    while True:
+        generation = session._load_generation
+        still_pending = []
+        for i in pending:
+            obj = objects[i]
+            try:
+                is_loaded = obj.is_loaded
+                spotify.Error.maybe_raise(
+                    getattr(obj, 'error', 0),
+                    ignores=[spotify.ErrorType.IS_LOADING])
+            except spotify.Error as exc:
+                results[i] = exc
+                continue
+            if not is_loaded:
+                still_pending.append(i)
+        pending = still_pending
+        if not pending:
+            break
+
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            for i in pending:
+                results[i] = spotify.Timeout(timeout)
+            break
+
+        if use_event_loop:
+            _wait_for_notification(session, generation, remaining)
+        else:
+            # See load() for why this is a tight loop.
+            session.process_events()
+            time.sleep(0.001)
+
+    if not return_exceptions:
+        for result in results:
+            if isinstance(result, spotify.Error):
+                raise result
+    return results
+
+
+def load_async(session, obj, timeout=None):
+    """Load the object's data without blocking.
+
+    Like :func:`load`, but returns an :class:`asyncio.Future` that is done
+    when the object is loaded, instead of blocking until it is. The future's
+    result is the object itself. If the object fails to load, or isn't loaded
+    after ``timeout`` seconds, the future's exception is a
+    :exc:`~spotify.LibError` or a :exc:`~spotify.Timeout`.
+
+    Requires a running :class:`~spotify.AsyncioEventLoop`.
+    """
+    if session.connection_state is not spotify.ConnectionState.LOGGED_IN:
+        raise RuntimeError('Session must be logged in to load objects')
+    return _get_asyncio_event_loop(session)._load(obj, timeout=timeout)
+
+
+def call_async(session, func, *args, **kwargs):
+    """Call a function that takes a ``callback`` keyword argument, like
+    :meth:`~spotify.Session.search`, without blocking.
+
+    Returns an :class:`asyncio.Future` that is done when the callback is
+    called. The future's result is the object passed to the callback, or a
+    :exc:`~spotify.LibError` if the object's ``error`` is set.
+
+    Requires a running :class:`~spotify.AsyncioEventLoop`.
+    """
+    return _get_asyncio_event_loop(session)._call(func, *args, **kwargs)
+
+
+def _get_asyncio_event_loop(session):
+    event_loop = session._event_loop
+    if not (isinstance(event_loop, spotify.AsyncioEventLoop) and
+            event_loop.is_alive()):
+        raise RuntimeError(
+            'An AsyncioEventLoop must be running to use the async methods')
+    return event_loop
+
+
+def create_request_future(request):
+    """Create a :class:`concurrent.futures.Future` for the result of an
+    asynchronous libspotify request, like a :class:`~spotify.Search`.
+
+    The future is already running, so it cannot be cancelled. It keeps the
+    request alive until it is done, so that one can wait for the future
+    without keeping a reference to the request.
+
+    Returns :class:`None` if :mod:`concurrent.futures` isn't available.
+
+    Internal function.
+    """
+    if concurrent is None:
+        return None
+    future = concurrent.futures.Future()
+    future.set_running_or_notify_cancel()
+    future._request = request
+    return future
+
+
+def complete_request_future(request):
+    """Complete the request's future with the request as its result, or with
+    a :exc:`~spotify.LibError` if the request failed.
+
+    Called from the request's completion callback.
+
+    Internal function.
+    """
+    future = request.future
+    if future is None or future.done():
+        return
+    del future._request
+    try:
+        spotify.Error.maybe_raise(request.error)
+    except spotify.Error as exc:
+        future.set_exception(exc)
+    else:
+        future.set_result(request)
+
+
+def memoized(func=None, mutable=False):
+    """Decorator for memoizing a property of a wrapper object once the object
+    is loaded.
+
+    The memoization is only used if :attr:`Session.memoize_metadata
+    <spotify.Session.memoize_metadata>` is :class:`True`. The values are kept
+    in the ``_memo`` dict of the wrapper object, and are only stored if the
+    object was loaded before the property was read, so that a value read
+    while the object is still loading isn't kept.
+
+    If ``mutable`` is :class:`True`, the value is forgotten the next time
+    :attr:`~spotify.SessionEvent.METADATA_UPDATED` is emitted, as the value
+    may have changed.
+
+    Can be used both as ``@memoized`` and as ``@memoized(mutable=True)``.
+
+    Internal function.
+    """
+    if func is None:
+        return functools.partial(memoized, mutable=mutable)
+
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self):
+        session = self._session
+        if not session.memoize_metadata:
+            return func(self)
+        generation = session._metadata_generation if mutable else None
+        memo = self._memo
+        entry = memo.get(name) if memo is not None else None
+        if entry is not None and entry[0] == generation:
+            return entry[1]
+        is_loaded = self.is_loaded
+        value = func(self)
+        if is_loaded:
+            if memo is None:
+                memo = self._memo = {}
+            memo[name] = (generation, value)
+        return value
+    return wrapper
+
+
 class Sequence(collections.Sequence):
     """Helper class for making sequences from a length and getitem function.
 
@@ -2,7 +2,6 @@ from __future__ import unicode_literals
 
 import gc
 import platform
-import weakref
 
 try:
     # Python 3.3+
@@ -16,7 +15,10 @@ import cffi
 # Import the module so that ffi.verify() is run before cffi.verifier is used
 import spotify  # noqa
 
-cffi.verifier.cleanup_tmpdir()
+# cffi.verifier is only imported if the precompiled spotify._spotify module
+# wasn't found, and ffi.verify() was used instead.
+if hasattr(cffi, 'verifier'):
+    cffi.verifier.cleanup_tmpdir()
 
 
 # TODO Review all use of ffi.cast() in the tests. Lots of `ffi.cast('sp_foo *',
@@ -48,8 +50,11 @@ def buffer_writer(string):
 def create_session():
     """Creates a :class:`spotify.Session` mock for testing."""
     session = mock.Mock()
-    session._cache = weakref.WeakValueDictionary()
+    session._cache = spotify.ObjectCache()
     session._emitters = []
+    session.memoize_metadata = False
+    session._metadata_generation = 0
+    session._event_loop = None
     return session
 
 
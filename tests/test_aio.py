@@ -0,0 +1,268 @@
+from __future__ import unicode_literals
+
+import sys
+import threading
+import unittest
+
+try:
+    # Python 3.4+
+    import asyncio
+except ImportError:
+    asyncio = None
+
+import spotify
+from spotify import utils
+import tests
+from tests import mock
+
+
+class Loadable(object):
+
+    def __init__(self, is_loaded=False, error=spotify.ErrorType.OK):
+        self.is_loaded = is_loaded
+        self.error = error
+
+
+@unittest.skipIf(sys.version_info < (3, 5, 2), 'Requires asyncio')
+class AsyncioEventLoopTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = tests.create_session()
+        self.session.connection_state = spotify.ConnectionState.LOGGED_IN
+        self.session.process_events.return_value = 10
+        self.asyncio_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.asyncio_loop)
+        self.loop = spotify.AsyncioEventLoop(
+            self.session, loop=self.asyncio_loop)
+
+    def tearDown(self):
+        self.loop.stop()
+        self.asyncio_loop.close()
+        asyncio.set_event_loop(None)
+
+    def run_loop(self, timeout=0.05):
+        self.asyncio_loop.run_until_complete(asyncio.sleep(timeout))
+
+    def test_start_registers_notify_main_thread_listener(self):
+        self.loop.start()
+
+        self.session.on.assert_called_once_with(
+            spotify.SessionEvent.NOTIFY_MAIN_THREAD,
+            self.loop._on_notify_main_thread)
+
+    def test_cannot_be_started_in_single_threaded_lock_mode(self):
+        spotify.set_lock_mode(spotify.LockMode.SINGLE_THREADED)
+        self.addCleanup(spotify.set_lock_mode, spotify.LockMode.GLOBAL)
+
+        with self.assertRaises(RuntimeError):
+            self.loop.start()
+
+        self.assertFalse(self.loop.is_alive())
+        self.assertEqual(self.session.on.call_count, 0)
+
+    def test_stop_unregisters_notify_main_thread_listener(self):
+        self.loop.stop()
+
+        self.session.off.assert_called_once_with(
+            spotify.SessionEvent.NOTIFY_MAIN_THREAD,
+            self.loop._on_notify_main_thread)
+
+    def test_uses_running_asyncio_event_loop_by_default(self):
+        loops = []
+        self.asyncio_loop.call_soon(
+            lambda: loops.append(spotify.AsyncioEventLoop(self.session)))
+        self.run_loop(0.01)
+
+        self.assertIs(loops[0].loop, self.asyncio_loop)
+
+    def test_uses_current_asyncio_event_loop_outside_of_running_loop(self):
+        loop = spotify.AsyncioEventLoop(self.session)
+
+        self.assertIs(loop.loop, self.asyncio_loop)
+
+    def test_session_knows_about_running_event_loop(self):
+        self.assertFalse(self.loop.is_alive())
+
+        self.loop.start()
+
+        self.assertTrue(self.loop.is_alive())
+        self.assertIs(self.session._event_loop, self.loop)
+
+        self.loop.stop()
+
+        self.assertFalse(self.loop.is_alive())
+        self.assertIsNone(self.session._event_loop)
+
+    def test_processes_events_again_after_timeout(self):
+        self.loop.start()
+
+        self.run_loop(0.05)
+
+        self.assertGreater(self.session.process_events.call_count, 2)
+
+    @mock.patch('spotify.aio.logger')
+    def test_processes_events_again_after_failure(self, logger_mock):
+        self.session.process_events.side_effect = Exception('foo')
+        self.loop.start()
+
+        self.run_loop(0.01)
+
+        self.assertEqual(self.session.process_events.call_count, 1)
+        self.assertEqual(logger_mock.exception.call_count, 1)
+        self.assertIsNotNone(self.loop._timer)
+
+    def test_does_not_process_events_after_stop(self):
+        self.loop.start()
+        self.run_loop(0.015)
+        self.loop.stop()
+        self.session.process_events.reset_mock()
+
+        self.run_loop(0.03)
+
+        self.assertEqual(self.session.process_events.call_count, 0)
+
+    def test_notify_main_thread_processes_events_soon(self):
+        self.session.process_events.return_value = 10000
+        self.loop.start()
+        self.run_loop(0.01)
+        self.assertEqual(self.session.process_events.call_count, 1)
+
+        thread = threading.Thread(
+            target=self.loop._on_notify_main_thread, args=(self.session,))
+        thread.start()
+        thread.join()
+        self.run_loop(0.01)
+
+        self.assertEqual(self.session.process_events.call_count, 2)
+
+    def test_blocking_load_in_asyncio_thread_processes_events(self):
+        self.loop.start()
+        self.run_loop(0.01)
+
+        self.assertFalse(utils._is_event_loop_running(self.session))
+
+    def test_blocking_load_in_asyncio_thread_before_first_processing(self):
+        self.loop.start()
+
+        self.assertEqual(self.session.process_events.call_count, 0)
+        self.assertFalse(utils._is_event_loop_running(self.session))
+
+    def test_start_from_other_thread_than_running_asyncio_event_loop(self):
+        started = threading.Event()
+
+        def start():
+            self.loop.start()
+            started.set()
+
+        self.asyncio_loop.call_soon(
+            lambda: threading.Thread(target=start).start())
+        while not started.is_set():
+            self.run_loop(0.01)
+
+        self.assertIs(self.loop._thread, threading.current_thread())
+
+    def test_blocking_load_in_other_thread_waits_for_event_loop(self):
+        self.loop.start()
+        self.run_loop(0.01)
+        result = []
+
+        thread = threading.Thread(
+            target=lambda: result.append(
+                utils._is_event_loop_running(self.session)))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(result, [True])
+
+    def test_load_async_of_loaded_object_is_done_at_once(self):
+        self.loop.start()
+        obj = Loadable(is_loaded=True)
+
+        future = utils.load_async(self.session, obj)
+
+        self.assertTrue(future.done())
+        self.assertIs(future.result(), obj)
+
+    def test_load_async_is_done_when_object_is_loaded(self):
+        self.loop.start()
+        obj = Loadable()
+
+        future = utils.load_async(self.session, obj)
+        self.run_loop(0.02)
+        self.assertFalse(future.done())
+
+        obj.is_loaded = True
+        self.run_loop(0.02)
+
+        self.assertIs(future.result(), obj)
+        self.assertEqual(self.loop._load_waiters, [])
+
+    def test_load_async_fails_if_object_fails_to_load(self):
+        self.loop.start()
+        obj = Loadable()
+
+        future = utils.load_async(self.session, obj)
+        obj.error = spotify.ErrorType.OTHER_PERMANENT
+        self.run_loop(0.02)
+
+        self.assertIsInstance(future.exception(), spotify.LibError)
+
+    def test_load_async_fails_on_timeout(self):
+        self.loop.start()
+
+        future = utils.load_async(self.session, Loadable(), timeout=0.01)
+        self.run_loop(0.03)
+
+        self.assertIsInstance(future.exception(), spotify.Timeout)
+
+    def test_load_async_is_cancelled_when_event_loop_stops(self):
+        self.loop.start()
+
+        future = utils.load_async(self.session, Loadable())
+        self.loop.stop()
+
+        self.assertTrue(future.cancelled())
+
+    def test_load_async_requires_logged_in_session(self):
+        self.loop.start()
+        self.session.connection_state = spotify.ConnectionState.LOGGED_OUT
+
+        with self.assertRaises(RuntimeError):
+            utils.load_async(self.session, Loadable())
+
+    def test_load_async_requires_running_event_loop(self):
+        with self.assertRaises(RuntimeError):
+            utils.load_async(self.session, Loadable())
+
+    def test_call_async_is_done_when_callback_is_called(self):
+        self.loop.start()
+        func = mock.Mock()
+        obj = Loadable(is_loaded=True)
+
+        future = utils.call_async(self.session, func, 'foo', bar=1)
+        self.assertFalse(future.done())
+        func.call_args[1]['callback'](obj)
+        self.run_loop(0.01)
+
+        func.assert_called_once_with('foo', bar=1, callback=mock.ANY)
+        self.assertIs(future.result(), obj)
+        self.assertEqual(self.loop._requests, {})
+
+    def test_call_async_keeps_request_alive_until_done(self):
+        self.loop.start()
+        func = mock.Mock()
+
+        future = utils.call_async(self.session, func)
+
+        self.assertIs(self.loop._requests[future], func.return_value)
+
+    def test_call_async_fails_if_request_fails(self):
+        self.loop.start()
+        func = mock.Mock()
+        obj = Loadable(error=spotify.ErrorType.OTHER_PERMANENT)
+
+        future = utils.call_async(self.session, func)
+        func.call_args[1]['callback'](obj)
+        self.run_loop(0.01)
+
+        self.assertIsInstance(future.exception(), spotify.LibError)
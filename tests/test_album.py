@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 
 import unittest
+import weakref
 
 import spotify
 from spotify import utils
@@ -49,6 +50,25 @@ class AlbumTest(unittest.TestCase):
 
         lib_mock.sp_album_add_ref.assert_called_with(sp_album)
 
+    def test_cached_album(self, lib_mock):
+        sp_album = spotify.ffi.new('int *')
+
+        result1 = spotify.Album._cached(self.session, sp_album)
+        result2 = spotify.Album._cached(self.session, sp_album)
+
+        self.assertIsInstance(result1, spotify.Album)
+        self.assertIs(result1, result2)
+        lib_mock.sp_album_add_ref.assert_called_once_with(sp_album)
+
+    def test_cached_album_releases_new_ref_if_already_cached(self, lib_mock):
+        sp_album = spotify.ffi.new('int *')
+        album = spotify.Album._cached(self.session, sp_album)
+
+        result = spotify.Album._cached(self.session, sp_album, add_ref=False)
+
+        self.assertIs(result, album)
+        lib_mock.sp_album_release.assert_called_once_with(sp_album)
+
     def test_releases_sp_album_when_album_dies(self, lib_mock):
         sp_album = spotify.ffi.new('int *')
 
@@ -58,6 +78,14 @@ class AlbumTest(unittest.TestCase):
 
         lib_mock.sp_album_release.assert_called_with(sp_album)
 
+    def test_has_no_instance_dict(self, lib_mock):
+        sp_album = spotify.ffi.new('int *')
+
+        album = spotify.Album(self.session, sp_album=sp_album)
+
+        self.assertFalse(hasattr(album, '__dict__'))
+        self.assertIs(weakref.ref(album)(), album)
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_repr(self, link_mock, lib_mock):
         link_instance_mock = link_mock.return_value
@@ -88,6 +116,28 @@ class AlbumTest(unittest.TestCase):
 
         load_mock.assert_called_with(self.session, album, timeout=10)
 
+    @mock.patch('spotify.utils.load_async')
+    def test_load_async(self, load_async_mock, lib_mock):
+        sp_album = spotify.ffi.new('int *')
+        album = spotify.Album(self.session, sp_album=sp_album)
+        load_async_mock.return_value = mock.sentinel.future
+
+        result = album.load_async(10)
+
+        load_async_mock.assert_called_with(self.session, album, timeout=10)
+        self.assertIs(result, mock.sentinel.future)
+
+    @mock.patch('spotify.utils.call_async')
+    def test_browse_async(self, call_async_mock, lib_mock):
+        sp_album = spotify.ffi.new('int *')
+        album = spotify.Album(self.session, sp_album=sp_album)
+        call_async_mock.return_value = mock.sentinel.future
+
+        result = album.browse_async()
+
+        call_async_mock.assert_called_once_with(self.session, album.browse)
+        self.assertIs(result, mock.sentinel.future)
+
     def test_is_available(self, lib_mock):
         lib_mock.sp_album_is_available.return_value = 1
         sp_album = spotify.ffi.new('int *')
@@ -246,6 +296,28 @@ class AlbumTest(unittest.TestCase):
         lib_mock.sp_album_is_loaded.assert_called_once_with(sp_album)
         self.assertIsNone(result)
 
+    @mock.patch('spotify.fetch_metadata_many')
+    def test_fetch_metadata(self, fetch_mock, lib_mock):
+        sp_album = spotify.ffi.new('int *')
+        album = spotify.Album(self.session, sp_album=sp_album)
+        fetch_mock.return_value = [mock.sentinel.metadata]
+
+        result = album.fetch_metadata()
+
+        fetch_mock.assert_called_once_with([album])
+        self.assertEqual(result, mock.sentinel.metadata)
+
+    @mock.patch('spotify.snapshot_many')
+    def test_snapshot(self, snapshot_mock, lib_mock):
+        sp_album = spotify.ffi.new('int *')
+        album = spotify.Album(self.session, sp_album=sp_album)
+        snapshot_mock.return_value = [mock.sentinel.snapshot]
+
+        result = album.snapshot()
+
+        snapshot_mock.assert_called_once_with([album])
+        self.assertEqual(result, mock.sentinel.snapshot)
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_link_creates_link_to_album(self, link_mock, lib_mock):
         sp_album = spotify.ffi.new('int *')
@@ -311,6 +383,24 @@ class AlbumBrowserTest(unittest.TestCase):
         result.complete_event.wait(3)
         callback.assert_called_with(result)
 
+    def test_future_is_done_when_browser_completes(self, lib_mock):
+        sp_album = spotify.ffi.new('int *')
+        album = spotify.Album(self.session, sp_album=sp_album)
+        sp_albumbrowse = spotify.ffi.cast(
+            'sp_albumbrowse *', spotify.ffi.new('int *'))
+        lib_mock.sp_albumbrowse_create.return_value = sp_albumbrowse
+        lib_mock.sp_albumbrowse_error.return_value = spotify.ErrorType.OK
+
+        result = album.browse()
+        self.assertFalse(result.future.done())
+
+        albumbrowse_complete_cb = (
+            lib_mock.sp_albumbrowse_create.call_args[0][2])
+        userdata = lib_mock.sp_albumbrowse_create.call_args[0][3]
+        albumbrowse_complete_cb(sp_albumbrowse, userdata)
+
+        self.assertIs(result.future.result(timeout=3), result)
+
     def test_browser_is_gone_before_callback_is_called(self, lib_mock):
         sp_album = spotify.ffi.new('int *')
         album = spotify.Album(self.session, sp_album=sp_album)
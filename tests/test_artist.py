@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 
 import unittest
+import weakref
 
 import spotify
 from spotify import utils
@@ -51,6 +52,25 @@ class ArtistTest(unittest.TestCase):
 
         lib_mock.sp_artist_add_ref.assert_called_with(sp_artist)
 
+    def test_cached_artist(self, lib_mock):
+        sp_artist = spotify.ffi.new('int *')
+
+        result1 = spotify.Artist._cached(self.session, sp_artist)
+        result2 = spotify.Artist._cached(self.session, sp_artist)
+
+        self.assertIsInstance(result1, spotify.Artist)
+        self.assertIs(result1, result2)
+        lib_mock.sp_artist_add_ref.assert_called_once_with(sp_artist)
+
+    def test_cached_artist_releases_new_ref_if_already_cached(self, lib_mock):
+        sp_artist = spotify.ffi.new('int *')
+        artist = spotify.Artist._cached(self.session, sp_artist)
+
+        result = spotify.Artist._cached(self.session, sp_artist, add_ref=False)
+
+        self.assertIs(result, artist)
+        lib_mock.sp_artist_release.assert_called_once_with(sp_artist)
+
     def test_releases_sp_artist_when_artist_dies(self, lib_mock):
         sp_artist = spotify.ffi.new('int *')
 
@@ -60,6 +80,14 @@ class ArtistTest(unittest.TestCase):
 
         lib_mock.sp_artist_release.assert_called_with(sp_artist)
 
+    def test_has_no_instance_dict(self, lib_mock):
+        sp_artist = spotify.ffi.new('int *')
+
+        artist = spotify.Artist(self.session, sp_artist=sp_artist)
+
+        self.assertFalse(hasattr(artist, '__dict__'))
+        self.assertIs(weakref.ref(artist)(), artist)
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_repr(self, link_mock, lib_mock):
         link_instance_mock = link_mock.return_value
@@ -111,6 +139,31 @@ class ArtistTest(unittest.TestCase):
 
         load_mock.assert_called_with(self.session, artist, timeout=10)
 
+    @mock.patch('spotify.utils.load_async')
+    def test_load_async(self, load_async_mock, lib_mock):
+        sp_artist = spotify.ffi.new('int *')
+        artist = spotify.Artist(self.session, sp_artist=sp_artist)
+        load_async_mock.return_value = mock.sentinel.future
+
+        result = artist.load_async(10)
+
+        load_async_mock.assert_called_with(self.session, artist, timeout=10)
+        self.assertIs(result, mock.sentinel.future)
+
+    @mock.patch('spotify.utils.call_async')
+    def test_browse_async(self, call_async_mock, lib_mock):
+        sp_artist = spotify.ffi.new('int *')
+        artist = spotify.Artist(self.session, sp_artist=sp_artist)
+        call_async_mock.return_value = mock.sentinel.future
+
+        result = artist.browse_async(
+            type=spotify.ArtistBrowserType.NO_TRACKS)
+
+        call_async_mock.assert_called_once_with(
+            self.session, artist.browse,
+            type=spotify.ArtistBrowserType.NO_TRACKS)
+        self.assertIs(result, mock.sentinel.future)
+
     @mock.patch('spotify.image.lib', spec=spotify.lib)
     def test_portrait(self, image_lib_mock, lib_mock):
         sp_image_id = spotify.ffi.new('char[]', b'portrait-id')
@@ -163,6 +216,28 @@ class ArtistTest(unittest.TestCase):
             self.session, sp_link=sp_link, add_ref=False)
         self.assertEqual(result, mock.sentinel.link)
 
+    @mock.patch('spotify.fetch_metadata_many')
+    def test_fetch_metadata(self, fetch_mock, lib_mock):
+        sp_artist = spotify.ffi.new('int *')
+        artist = spotify.Artist(self.session, sp_artist=sp_artist)
+        fetch_mock.return_value = [mock.sentinel.metadata]
+
+        result = artist.fetch_metadata()
+
+        fetch_mock.assert_called_once_with([artist])
+        self.assertEqual(result, mock.sentinel.metadata)
+
+    @mock.patch('spotify.snapshot_many')
+    def test_snapshot(self, snapshot_mock, lib_mock):
+        sp_artist = spotify.ffi.new('int *')
+        artist = spotify.Artist(self.session, sp_artist=sp_artist)
+        snapshot_mock.return_value = [mock.sentinel.snapshot]
+
+        result = artist.snapshot()
+
+        snapshot_mock.assert_called_once_with([artist])
+        self.assertEqual(result, mock.sentinel.snapshot)
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_link_creates_link_to_artist(self, link_mock, lib_mock):
         sp_artist = spotify.ffi.new('int *')
@@ -231,6 +306,24 @@ class ArtistBrowserTest(unittest.TestCase):
         result.complete_event.wait(3)
         callback.assert_called_with(result)
 
+    def test_future_fails_if_browser_fails(self, lib_mock):
+        sp_artist = spotify.ffi.new('int *')
+        artist = spotify.Artist(self.session, sp_artist=sp_artist)
+        sp_artistbrowse = spotify.ffi.cast(
+            'sp_artistbrowse *', spotify.ffi.new('int *'))
+        lib_mock.sp_artistbrowse_create.return_value = sp_artistbrowse
+        lib_mock.sp_artistbrowse_error.return_value = (
+            spotify.ErrorType.OTHER_PERMANENT)
+
+        result = artist.browse()
+        artistbrowse_complete_cb = (
+            lib_mock.sp_artistbrowse_create.call_args[0][3])
+        userdata = lib_mock.sp_artistbrowse_create.call_args[0][4]
+        artistbrowse_complete_cb(sp_artistbrowse, userdata)
+
+        self.assertIsInstance(
+            result.future.exception(timeout=3), spotify.LibError)
+
     def test_browser_is_gone_before_callback_is_called(self, lib_mock):
         sp_artist = spotify.ffi.new('int *')
         artist = spotify.Artist(self.session, sp_artist=sp_artist)
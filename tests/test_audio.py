@@ -2,7 +2,13 @@ from __future__ import unicode_literals
 
 import unittest
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 import spotify
+from spotify.audio import _MusicDelivery
 
 
 class AudioBufferStatsTest(unittest.TestCase):
@@ -69,3 +75,87 @@ class SampleTypeTest(unittest.TestCase):
 
     def test_has_constants(self):
         self.assertEqual(spotify.SampleType.INT16_NATIVE_ENDIAN, 0)
+
+
+class MusicDeliveryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.sp_audioformat = spotify.ffi.new('sp_audioformat *')
+        self.sp_audioformat.sample_type = (
+            spotify.SampleType.INT16_NATIVE_ENDIAN)
+        self.sp_audioformat.sample_rate = 44100
+        self.sp_audioformat.channels = 2
+        self.frames = spotify.ffi.new('int16_t[]', [1, 2, 3, 4, 5, 6])
+        self.music_delivery = _MusicDelivery()
+
+    def get_frames(self, delivery_format, num_frames=3):
+        self.music_delivery.get_audio_format(self.sp_audioformat)
+        return self.music_delivery.get_frames(
+            delivery_format, spotify.ffi.cast('void *', self.frames),
+            num_frames)
+
+    def test_audio_format_is_a_copy(self):
+        audio_format = self.music_delivery.get_audio_format(
+            self.sp_audioformat)
+
+        self.assertNotEqual(
+            audio_format._sp_audioformat, self.sp_audioformat)
+        self.assertEqual(audio_format.sample_rate, 44100)
+        self.assertEqual(audio_format.channels, 2)
+
+    def test_audio_format_is_reused_while_format_is_unchanged(self):
+        audio_format1 = self.music_delivery.get_audio_format(
+            self.sp_audioformat)
+        audio_format2 = self.music_delivery.get_audio_format(
+            self.sp_audioformat)
+        self.sp_audioformat.sample_rate = 48000
+        audio_format3 = self.music_delivery.get_audio_format(
+            self.sp_audioformat)
+
+        self.assertIs(audio_format1, audio_format2)
+        self.assertIsNot(audio_format2, audio_format3)
+        self.assertEqual(audio_format3.sample_rate, 48000)
+
+    def test_bytes(self):
+        frames = self.get_frames(spotify.MusicDeliveryFormat.BYTES)
+
+        self.assertIsInstance(frames, bytes)
+        self.assertEqual(frames, spotify.ffi.buffer(self.frames)[:])
+
+    def test_memoryview(self):
+        frames = self.get_frames(spotify.MusicDeliveryFormat.MEMORYVIEW)
+
+        self.assertIsInstance(frames, memoryview)
+        self.assertEqual(frames.tobytes(), spotify.ffi.buffer(self.frames)[:])
+
+    def test_memoryview_buffer_is_reused(self):
+        self.get_frames(spotify.MusicDeliveryFormat.MEMORYVIEW)
+        buffer_ = self.music_delivery._buffer
+
+        frames = self.get_frames(
+            spotify.MusicDeliveryFormat.MEMORYVIEW, num_frames=2)
+
+        self.assertIs(self.music_delivery._buffer, buffer_)
+        self.assertEqual(len(frames), 8)
+
+    def test_memoryview_buffer_is_replaced_if_too_small(self):
+        frames1 = self.get_frames(
+            spotify.MusicDeliveryFormat.MEMORYVIEW, num_frames=2)
+
+        frames2 = self.get_frames(
+            spotify.MusicDeliveryFormat.MEMORYVIEW, num_frames=3)
+
+        self.assertEqual(len(frames1), 8)
+        self.assertEqual(len(frames2), 12)
+
+    @unittest.skipIf(numpy is None, 'Requires NumPy')
+    def test_numpy(self):
+        frames = self.get_frames(spotify.MusicDeliveryFormat.NUMPY)
+
+        self.assertEqual(frames.dtype, numpy.int16)
+        self.assertEqual(frames.shape, (3, 2))
+        self.assertEqual(frames.tolist(), [[1, 2], [3, 4], [5, 6]])
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            self.get_frames('foo')
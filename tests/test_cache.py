@@ -0,0 +1,103 @@
+from __future__ import unicode_literals
+
+import unittest
+
+import spotify
+import tests
+
+
+class Wrapper(object):
+    pass
+
+
+class ObjectCacheTest(unittest.TestCase):
+
+    def test_get_returns_cached_object(self):
+        cache = spotify.ObjectCache()
+        obj = Wrapper()
+        cache['foo'] = obj
+
+        self.assertIs(cache.get('foo'), obj)
+        self.assertIs(cache['foo'], obj)
+        self.assertIn('foo', cache)
+        self.assertEqual(len(cache), 1)
+
+    def test_get_returns_default_if_not_cached(self):
+        cache = spotify.ObjectCache()
+
+        self.assertIsNone(cache.get('foo'))
+        self.assertEqual(cache.get('foo', 'bar'), 'bar')
+        with self.assertRaises(KeyError):
+            cache['foo']
+
+    def test_counts_hits_and_misses(self):
+        cache = spotify.ObjectCache()
+        obj = Wrapper()
+        cache['foo'] = obj
+
+        cache.get('foo')
+        cache.get('foo')
+        cache.get('bar')
+
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 1)
+
+    def test_does_not_keep_objects_alive_by_default(self):
+        cache = spotify.ObjectCache()
+        cache['foo'] = Wrapper()
+
+        tests.gc_collect()
+
+        self.assertNotIn('foo', cache)
+        self.assertEqual(len(cache), 0)
+
+    def test_keeps_most_recently_used_objects_alive(self):
+        cache = spotify.ObjectCache(max_size=2)
+        cache['foo'] = Wrapper()
+        cache['bar'] = Wrapper()
+        cache.get('foo')
+        cache['baz'] = Wrapper()
+
+        tests.gc_collect()
+
+        self.assertIn('foo', cache)
+        self.assertNotIn('bar', cache)
+        self.assertIn('baz', cache)
+
+    def test_reducing_max_size_stops_keeping_objects_alive(self):
+        cache = spotify.ObjectCache(max_size=2)
+        cache['foo'] = Wrapper()
+        cache['bar'] = Wrapper()
+
+        cache.max_size = 1
+        tests.gc_collect()
+
+        self.assertNotIn('foo', cache)
+        self.assertIn('bar', cache)
+
+    def test_max_size_cannot_be_negative(self):
+        with self.assertRaises(ValueError):
+            spotify.ObjectCache(max_size=-1)
+
+    def test_clear_removes_objects_and_resets_counters(self):
+        cache = spotify.ObjectCache(max_size=1)
+        obj = Wrapper()
+        cache['foo'] = obj
+        cache.get('foo')
+        cache.get('bar')
+
+        cache.clear()
+
+        self.assertNotIn('foo', cache)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 0)
+
+    def test_repr(self):
+        cache = spotify.ObjectCache(max_size=1)
+        obj = Wrapper()
+        cache['foo'] = obj
+        cache.get('foo')
+
+        self.assertEqual(
+            repr(cache),
+            '<ObjectCache: 1 objects, 1 kept alive, 1 hits, 0 misses>')
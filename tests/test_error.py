@@ -68,6 +68,13 @@ class LibErrorTest(unittest.TestCase):
             spotify.LibError.BAD_API_VERSION,
             spotify.LibError(spotify.ErrorType.BAD_API_VERSION))
 
+    def test_error_constants_are_created_on_first_access(self):
+        error = spotify.LibError.NO_CACHE
+
+        self.assertIsInstance(error, spotify.LibError)
+        self.assertEqual(error.error_type, spotify.ErrorType.NO_CACHE)
+        self.assertIs(spotify.LibError.__dict__['NO_CACHE'], error)
+
 
 class ErrorTypeTest(unittest.TestCase):
 
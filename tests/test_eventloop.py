@@ -1,15 +1,9 @@
 from __future__ import unicode_literals
 
+import threading
 import time
 import unittest
 
-try:
-    # Python 3
-    import queue
-except ImportError:
-    # Python 2
-    import Queue as queue
-
 import spotify
 from tests import mock
 
@@ -33,6 +27,15 @@ class EventLoopTest(unittest.TestCase):
     def test_has_a_descriptive_thread_name(self):
         self.assertEqual(self.loop.name, 'SpotifyEventLoop')
 
+    def test_cannot_be_started_in_single_threaded_lock_mode(self):
+        spotify.set_lock_mode(spotify.LockMode.SINGLE_THREADED)
+        self.addCleanup(spotify.set_lock_mode, spotify.LockMode.GLOBAL)
+
+        with self.assertRaises(RuntimeError):
+            self.loop.start()
+
+        self.assertFalse(self.loop.is_alive())
+
     def test_can_be_started_and_stopped_and_joined(self):
         self.assertFalse(self.loop.is_alive())
 
@@ -57,6 +60,36 @@ class EventLoopTest(unittest.TestCase):
             spotify.SessionEvent.NOTIFY_MAIN_THREAD,
             self.loop._on_notify_main_thread)
 
+    def test_session_knows_about_running_event_loop(self):
+        self.loop.start()
+
+        self.assertIs(self.session._event_loop, self.loop)
+
+        self.loop.stop()
+
+        self.assertIsNone(self.session._event_loop)
+
+    def test_session_knows_about_event_loop_before_thread_starts(self):
+        event_loops = []
+
+        def start(thread):
+            event_loops.append(self.session._event_loop)
+
+        with mock.patch.object(threading.Thread, 'start', start):
+            self.loop.start()
+
+        self.assertEqual(event_loops, [self.loop])
+
+    def test_session_forgets_event_loop_if_thread_fails_to_start(self):
+        self.session._event_loop = None
+
+        with mock.patch.object(
+                threading.Thread, 'start', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.loop.start()
+
+        self.assertIsNone(self.session._event_loop)
+
     def test_run_immediately_process_events(self):
         self.loop._runnable = False  # Short circuit run()
         self.loop.run()
@@ -64,25 +97,85 @@ class EventLoopTest(unittest.TestCase):
         self.session.process_events.assert_called_once_with()
 
     def test_processes_events_if_no_notify_main_thread_before_timeout(self):
-        self.loop._queue = mock.Mock(spec=queue.Queue)
-        self.loop._queue.get = lambda timeout: time.sleep(timeout)
         self.loop.start()
 
         time.sleep(0.25)
         self.loop.stop()
         self.assertGreaterEqual(self.session.process_events.call_count, 3)
 
-    def test_puts_on_queue_on_notify_main_thread(self):
-        self.loop._queue = mock.Mock(spec=queue.Queue)
+    def test_sets_wakeup_flag_on_notify_main_thread(self):
+        self.loop._on_notify_main_thread(self.session)
+
+        self.assertTrue(self.loop._wakeup.is_set())
+        self.assertEqual(self.loop.stats.notifications, 1)
+
+    def test_processes_events_soon_after_notify_main_thread(self):
+        self.session.process_events.return_value = 10000
+        self.loop.start()
+        time.sleep(0.05)
 
         self.loop._on_notify_main_thread(self.session)
+        time.sleep(0.05)
+
+        self.assertEqual(self.session.process_events.call_count, 2)
+        self.assertEqual(self.loop.stats.wakeups, 1)
 
-        self.loop._queue.put_nowait.assert_called_once_with(mock.ANY)
+    def test_coalesces_notifications_while_processing_events(self):
+        processing = threading.Event()
+        proceed = threading.Event()
 
-    def test_on_notify_main_thread_fails_nicely_if_queue_is_full(self):
-        self.loop._queue = mock.Mock(spec=queue.Queue)
-        self.loop._queue.put_nowait.side_effect = queue.Full
+        def process_events():
+            if self.session.process_events.call_count == 2:
+                processing.set()
+                proceed.wait(1)
+            return 10000
 
+        self.session.process_events.side_effect = process_events
+        self.loop.start()
+        time.sleep(0.05)
         self.loop._on_notify_main_thread(self.session)
+        processing.wait(1)
+
+        for _ in range(100):
+            self.loop._on_notify_main_thread(self.session)
+        proceed.set()
+        time.sleep(0.05)
+
+        self.assertEqual(self.session.process_events.call_count, 3)
+        stats = self.loop.stats
+        self.assertEqual(stats.iterations, 3)
+        self.assertEqual(stats.notifications, 101)
+        self.assertEqual(stats.wakeups, 2)
+
+    def test_stats_before_start(self):
+        stats = self.loop.stats
+
+        self.assertEqual(stats.iterations, 0)
+        self.assertEqual(stats.notifications, 0)
+        self.assertIsNone(stats.timeout)
+
+    def test_stats_records_process_events_timing_and_timeout(self):
+        self.loop._process_events(None)
+
+        stats = self.loop.stats
+        self.assertEqual(stats.iterations, 1)
+        self.assertEqual(stats.wakeups, 0)
+        self.assertGreaterEqual(stats.process_time, 0)
+        self.assertEqual(stats.max_process_time, stats.process_time)
+        self.assertEqual(stats.timeout, self.timeout)
+
+    @mock.patch('spotify.eventloop._clock')
+    def test_stats_records_notify_latency(self, clock_mock):
+        clock_mock.side_effect = [1.0, 3.0, 3.5, 5.0, 5.5]
+        self.loop._on_notify_main_thread(self.session)
+        self.loop._on_notify_main_thread(self.session)
+
+        self.loop._process_events(self.loop._notified_at)
+        self.loop._process_events(4.5)
 
-        self.loop._queue.put_nowait.assert_called_once_with(mock.ANY)
+        stats = self.loop.stats
+        self.assertEqual(stats.wakeups, 2)
+        self.assertEqual(stats.notify_latency, 2.5)
+        self.assertEqual(stats.max_notify_latency, 2.0)
+        self.assertEqual(stats.process_time, 1.0)
+        self.assertEqual(stats.max_process_time, 0.5)
@@ -58,6 +58,13 @@ class ImageTest(unittest.TestCase):
 
         lib_mock.sp_image_release.assert_called_with(sp_image)
 
+    def test_has_no_instance_dict(self, lib_mock):
+        sp_image = spotify.ffi.new('int *')
+
+        image = spotify.Image(self.session, sp_image=sp_image)
+
+        self.assertFalse(hasattr(image, '__dict__'))
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_repr(self, link_mock, lib_mock):
         link_instance_mock = link_mock.return_value
@@ -173,6 +180,17 @@ class ImageTest(unittest.TestCase):
 
         load_mock.assert_called_with(self.session, image, timeout=10)
 
+    @mock.patch('spotify.utils.load_async')
+    def test_load_async(self, load_async_mock, lib_mock):
+        sp_image = spotify.ffi.new('int *')
+        image = spotify.Image(self.session, sp_image=sp_image)
+        load_async_mock.return_value = mock.sentinel.future
+
+        result = image.load_async(10)
+
+        load_async_mock.assert_called_with(self.session, image, timeout=10)
+        self.assertIs(result, mock.sentinel.future)
+
     def test_format(self, lib_mock):
         lib_mock.sp_image_is_loaded.return_value = 1
         lib_mock.sp_image_format.return_value = int(spotify.ImageFormat.JPEG)
@@ -247,14 +265,17 @@ class ImageTest(unittest.TestCase):
         self.assertIsNone(result)
 
     def test_data_uri_fails_if_unknown_image_format(self, lib_mock):
+        lib_mock.sp_image_format.return_value = int(
+            spotify.ImageFormat.UNKNOWN)
         sp_image = spotify.ffi.new('int *')
-        image = spotify.Image(self.session, sp_image=sp_image)
-        image.__dict__['format'] = mock.Mock(
-            return_value=spotify.ImageFormat.UNKNOWN)
-        image.__dict__['data'] = mock.Mock(return_value=b'01234\x006789')
 
-        with self.assertRaises(ValueError):
-            image.data_uri
+        prop_mock = mock.PropertyMock()
+        with mock.patch.object(spotify.Image, 'data', prop_mock):
+            image = spotify.Image(self.session, sp_image=sp_image)
+            prop_mock.return_value = b'01234\x006789'
+
+            with self.assertRaises(ValueError):
+                image.data_uri
 
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_link_creates_link_to_image(self, link_mock, lib_mock):
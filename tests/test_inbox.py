@@ -108,6 +108,24 @@ class InboxPostResultTest(unittest.TestCase):
         result.complete_event.wait(3)
         callback.assert_called_with(result)
 
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_inbox_post_future_is_done_when_post_completes(
+            self, track_lib_mock, lib_mock):
+        sp_track1 = spotify.ffi.new('int *')
+        track1 = spotify.Track(self.session, sp_track=sp_track1)
+        sp_inbox = spotify.ffi.cast('sp_inbox *', spotify.ffi.new('int *'))
+        lib_mock.sp_inbox_post_tracks.return_value = sp_inbox
+        lib_mock.sp_inbox_error.return_value = spotify.ErrorType.OK
+
+        result = spotify.InboxPostResult(self.session, 'alice', track1)
+        self.assertFalse(result.future.done())
+
+        inboxpost_complete_cb = lib_mock.sp_inbox_post_tracks.call_args[0][5]
+        userdata = lib_mock.sp_inbox_post_tracks.call_args[0][6]
+        inboxpost_complete_cb(sp_inbox, userdata)
+
+        self.assertIs(result.future.result(timeout=3), result)
+
     @mock.patch('spotify.track.lib', spec=spotify.lib)
     def test_inbox_post_where_result_is_gone_before_callback_is_called(
             self, track_lib_mock, lib_mock):
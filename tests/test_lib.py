@@ -1,8 +1,13 @@
 from __future__ import unicode_literals
 
+import importlib
+import sys
+import threading
+import types
 import unittest
 
 import spotify
+from tests import mock
 
 
 class LibTest(unittest.TestCase):
@@ -13,3 +18,270 @@ class LibTest(unittest.TestCase):
 
     def test_SPOTIFY_API_VERSION_macro(self):
         self.assertEqual(spotify.lib.SPOTIFY_API_VERSION, 12)
+
+
+class BuildFfiTest(unittest.TestCase):
+
+    @mock.patch('spotify._serialize_access_to_library')
+    def test_uses_precompiled_module_if_available(self, serialize_mock):
+        compiled_module = types.ModuleType(str('spotify._spotify'))
+        compiled_module.ffi = mock.sentinel.ffi
+        compiled_module.lib = types.ModuleType(str('lib'))
+        compiled_module.lib.sp_foo = mock.sentinel.sp_foo
+        compiled_module.lib.SP_FOO = 1
+
+        with mock.patch.dict(
+                'sys.modules', {'spotify._spotify': compiled_module}):
+            ffi, lib = spotify._build_ffi()
+
+        self.assertIs(ffi, mock.sentinel.ffi)
+        self.assertIsInstance(lib, spotify._Lib)
+        self.assertIs(lib.sp_foo, mock.sentinel.sp_foo)
+        self.assertEqual(lib.SP_FOO, 1)
+        serialize_mock.assert_called_once_with(lib)
+
+    @mock.patch('spotify._serialize_access_to_library')
+    @mock.patch('spotify._verify_ffi')
+    def test_falls_back_to_verify_if_precompiled_module_is_missing(
+            self, verify_mock, serialize_mock):
+        verify_mock.return_value = (mock.sentinel.ffi, mock.sentinel.lib)
+
+        with mock.patch.dict('sys.modules', {'spotify._spotify': None}):
+            ffi, lib = spotify._build_ffi()
+
+        self.assertIs(ffi, mock.sentinel.ffi)
+        self.assertIs(lib, mock.sentinel.lib)
+        serialize_mock.assert_called_once_with(mock.sentinel.lib)
+
+
+class LockModeTest(unittest.TestCase):
+
+    def tearDown(self):
+        spotify.set_lock_mode(spotify.LockMode.GLOBAL)
+
+    def test_global_is_the_default_lock_mode(self):
+        self.assertEqual(spotify.get_lock_mode(), spotify.LockMode.GLOBAL)
+
+    def test_set_lock_mode_to_grouped_replaces_lock(self):
+        spotify.set_lock_mode(spotify.LockMode.GROUPED)
+
+        self.assertEqual(spotify.get_lock_mode(), spotify.LockMode.GROUPED)
+        self.assertIsInstance(spotify._lock, spotify._SharedExclusiveLock)
+
+    def test_set_lock_mode_back_to_global_restores_rlock(self):
+        spotify.set_lock_mode(spotify.LockMode.GROUPED)
+        spotify.set_lock_mode(spotify.LockMode.GLOBAL)
+
+        self.assertNotIsInstance(spotify._lock, spotify._SharedExclusiveLock)
+
+    def test_lib_functions_works_in_grouped_mode(self):
+        spotify.set_lock_mode(spotify.LockMode.GROUPED)
+
+        self.assertEqual(
+            spotify.ffi.string(spotify.lib.sp_error_message(0)),
+            b'No error')
+
+    def test_single_threaded_lock_mode_replaces_lock_with_guard(self):
+        spotify.set_lock_mode(spotify.LockMode.SINGLE_THREADED)
+
+        self.assertIsInstance(spotify._lock, spotify._ThreadOwnerGuard)
+
+    def test_lib_functions_work_in_single_threaded_lock_mode(self):
+        spotify.set_lock_mode(spotify.LockMode.SINGLE_THREADED)
+
+        self.assertEqual(
+            spotify.ffi.string(spotify.lib.sp_error_message(0)),
+            b'No error')
+
+    def test_lib_functions_fail_in_other_threads_in_single_threaded_mode(
+            self):
+        spotify.set_lock_mode(spotify.LockMode.SINGLE_THREADED)
+        errors = []
+
+        def run():
+            try:
+                spotify.lib.sp_error_message(0)
+            except RuntimeError as exc:
+                errors.append(exc)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(len(errors), 1)
+
+    def test_set_lock_mode_back_to_global_wraps_functions_again(self):
+        spotify.set_lock_mode(spotify.LockMode.SINGLE_THREADED)
+        spotify.set_lock_mode(spotify.LockMode.GLOBAL)
+
+        self.assertIsNot(
+            spotify.lib.sp_error_message,
+            spotify._lib_functions['sp_error_message'])
+
+    def test_serialized_code_works_in_single_threaded_lock_mode(self):
+        spotify.set_lock_mode(spotify.LockMode.SINGLE_THREADED)
+
+        self.assertEqual(spotify.serialized(lambda: 42)(), 42)
+
+    def test_serialized_code_fails_in_other_threads_in_single_threaded_mode(
+            self):
+        spotify.set_lock_mode(spotify.LockMode.SINGLE_THREADED)
+        func = spotify.serialized(lambda: 42)
+        errors = []
+
+        def run():
+            try:
+                func()
+            except RuntimeError as exc:
+                errors.append(exc)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(len(errors), 1)
+
+    def test_set_unknown_lock_mode_fails(self):
+        with self.assertRaises(ValueError):
+            spotify.set_lock_mode('foo')
+
+    def test_set_lock_mode_fails_if_session_exists(self):
+        with mock.patch('spotify._session_instance', mock.sentinel.session):
+            with self.assertRaises(RuntimeError):
+                spotify.set_lock_mode(spotify.LockMode.GROUPED)
+
+
+class LockGroupTest(unittest.TestCase):
+
+    def test_getters_are_metadata_functions(self):
+        for name in [
+                'sp_track_duration', 'sp_link_type', 'sp_album_name',
+                'sp_playlist_num_tracks', 'sp_error_message',
+                'pyspotify_fetch_track_metadata']:
+            self.assertEqual(
+                spotify._get_lock_group(name), spotify._LOCK_GROUP_METADATA)
+
+    def test_playlist_mutators_are_playlist_functions(self):
+        for name in [
+                'sp_playlist_add_tracks', 'sp_playlist_rename',
+                'sp_playlistcontainer_move_playlist',
+                'sp_playlist_track_set_seen']:
+            self.assertEqual(
+                spotify._get_lock_group(name), spotify._LOCK_GROUP_PLAYLIST)
+
+    def test_other_functions_are_session_functions(self):
+        for name in [
+                'sp_session_process_events', 'sp_track_add_ref',
+                'sp_track_release', 'sp_link_create_from_string',
+                'sp_track_set_starred', 'sp_offline_time_left']:
+            self.assertEqual(
+                spotify._get_lock_group(name), spotify._LOCK_GROUP_SESSION)
+
+
+class SharedExclusiveLockTest(unittest.TestCase):
+
+    def setUp(self):
+        self.lock = spotify._SharedExclusiveLock()
+
+    def run_in_thread(self, func):
+        done = threading.Event()
+
+        def target():
+            func()
+            done.set()
+
+        thread = threading.Thread(target=target)
+        thread.daemon = True
+        thread.start()
+        return done
+
+    def test_shared_side_can_be_held_by_multiple_threads(self):
+        self.lock.acquire_shared()
+
+        def func():
+            self.lock.acquire_shared()
+            self.lock.release_shared()
+
+        self.assertTrue(self.run_in_thread(func).wait(1))
+        self.lock.release_shared()
+
+    def test_shared_side_waits_for_exclusive_side(self):
+        self.lock.acquire()
+
+        def func():
+            self.lock.acquire_shared()
+            self.lock.release_shared()
+
+        done = self.run_in_thread(func)
+        self.assertFalse(done.wait(0.1))
+
+        self.lock.release()
+        self.assertTrue(done.wait(1))
+
+    def test_exclusive_side_waits_for_shared_side(self):
+        self.lock.acquire_shared()
+
+        def func():
+            with self.lock:
+                pass
+
+        done = self.run_in_thread(func)
+        self.assertFalse(done.wait(0.1))
+
+        self.lock.release_shared()
+        self.assertTrue(done.wait(1))
+
+    def test_exclusive_side_is_reentrant(self):
+        with self.lock:
+            with self.lock:
+                pass
+
+    def test_exclusive_owner_can_take_shared_side(self):
+        with self.lock:
+            self.lock.acquire_shared()
+            self.lock.release_shared()
+
+
+class LazyImportTest(unittest.TestCase):
+
+    def test_public_names_match_submodules(self):
+        for module_name, names in spotify._SUBMODULES.items():
+            module = importlib.import_module('spotify.%s' % module_name)
+            self.assertEqual(
+                sorted(getattr(module, '__all__', [])), sorted(names))
+
+    def test_public_name_is_imported_from_submodule_on_access(self):
+        spotify.__dict__.pop('LinkType', None)
+
+        self.assertIs(spotify.LinkType, spotify.link.LinkType)
+        self.assertIs(spotify.__dict__['LinkType'], spotify.link.LinkType)
+
+    def test_submodule_is_imported_on_access(self):
+        self.assertIs(spotify.session, sys.modules['spotify.session'])
+
+    @unittest.skipIf(
+        sys.version_info < (3, 7), 'Requires module level __getattr__')
+    def test_unknown_name_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            spotify.NoSuchThing
+
+    @unittest.skipIf(
+        sys.version_info < (3, 7), 'Requires module level __dir__')
+    def test_dir_includes_names_not_yet_imported(self):
+        self.assertIn('Track', dir(spotify))
+        self.assertIn('enable_lock_stats', dir(spotify))
+
+    def test_star_import_includes_lazily_imported_names(self):
+        namespace = {}
+        exec('from spotify import *', namespace)
+
+        for module_name in spotify._SUBMODULES:
+            module = importlib.import_module('spotify.%s' % module_name)
+            for name in getattr(module, '__all__', []):
+                # Names already imported are in the namespace even without
+                # __all__, so check __all__ itself too.
+                self.assertIn(name, spotify.__all__)
+                self.assertIs(namespace[name], getattr(module, name))
+        for name in ['ffi', 'lib', 'serialized']:
+            self.assertIn(name, spotify.__all__)
+            self.assertIs(namespace[name], getattr(spotify, name))
@@ -54,6 +54,13 @@ class LinkTest(unittest.TestCase):
 
         lib_mock.sp_link_release.assert_called_with(sp_link)
 
+    def test_has_no_instance_dict(self, lib_mock):
+        sp_link = spotify.ffi.new('int *')
+
+        link = spotify.Link(self.session, sp_link=sp_link)
+
+        self.assertFalse(hasattr(link, '__dict__'))
+
     def test_repr(self, lib_mock):
         sp_link = spotify.ffi.new('int *')
         lib_mock.sp_link_create_from_string.return_value = sp_link
@@ -1,10 +1,11 @@
 from __future__ import unicode_literals
 
+import threading
 import unittest
 import time
 
 import spotify
-from spotify.utils import load
+from spotify.utils import load, load_all
 import tests
 from tests import mock
 
@@ -104,3 +105,175 @@ class LoadableTest(unittest.TestCase):
         result = foo.load()
 
         self.assertEqual(result, foo)
+
+    def test_load_waits_for_notification_if_event_loop_is_running(
+            self, is_loaded_mock, time_mock):
+        self.start_event_loop()
+        is_loaded_mock.side_effect = [False, True, True]
+        time_mock.time.side_effect = time.time
+        threading.Timer(0.01, self.notify_loaded).start()
+
+        foo = Foo(self.session)
+        foo.load()
+
+        self.assertEqual(self.session.process_events.call_count, 0)
+        self.assertEqual(time_mock.sleep.call_count, 0)
+        self.assertEqual(self.session._load_generation, 1)
+
+    def test_load_raises_error_on_timeout_if_event_loop_is_running(
+            self, is_loaded_mock, time_mock):
+        self.start_event_loop()
+        is_loaded_mock.return_value = False
+        time_mock.time.side_effect = time.time
+
+        foo = Foo(self.session)
+        with self.assertRaises(spotify.Timeout):
+            foo.load(timeout=0)
+
+        self.assertEqual(self.session.process_events.call_count, 0)
+
+    def test_load_processes_events_if_called_from_event_loop_thread(
+            self, is_loaded_mock, time_mock):
+        self.start_event_loop()
+        self.session._event_loop = threading.current_thread()
+        is_loaded_mock.side_effect = [False, False, True]
+        time_mock.time.side_effect = time.time
+
+        foo = Foo(self.session)
+        foo.load()
+
+        self.assertEqual(self.session.process_events.call_count, 1)
+
+    def start_event_loop(self):
+        self.session._event_loop = mock.Mock(spec=spotify.EventLoop)
+        self.session._event_loop.is_alive.return_value = True
+        self.session._load_condition = threading.Condition()
+        self.session._load_generation = 0
+
+    def notify_loaded(self):
+        with self.session._load_condition:
+            self.session._load_generation += 1
+            self.session._load_condition.notify_all()
+
+
+class Bar(object):
+
+    def __init__(self, session, is_loaded=(True,), error=None):
+        self._session = session
+        self._is_loaded = list(is_loaded)
+        self.is_loaded_calls = 0
+        if error is not None:
+            self.error = error
+
+    @property
+    def is_loaded(self):
+        self.is_loaded_calls += 1
+        if len(self._is_loaded) > 1:
+            return self._is_loaded.pop(0)
+        return self._is_loaded[0]
+
+
+@mock.patch('spotify.utils.time')
+class LoadAllTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = tests.create_session()
+        self.session.connection_state = spotify.ConnectionState.LOGGED_IN
+
+    def test_raises_error_if_not_logged_in(self, time_mock):
+        self.session.connection_state = spotify.ConnectionState.LOGGED_OUT
+
+        with self.assertRaises(RuntimeError):
+            load_all(self.session, [Bar(self.session)])
+
+    def test_returns_objects_in_same_order(self, time_mock):
+        objects = [Bar(self.session), Bar(self.session)]
+
+        result = load_all(self.session, iter(objects))
+
+        self.assertEqual(result, objects)
+        self.assertEqual(self.session.process_events.call_count, 0)
+
+    def test_only_checks_objects_that_are_not_loaded_yet(self, time_mock):
+        time_mock.time.side_effect = time.time
+        bar1 = Bar(self.session)
+        bar2 = Bar(self.session, is_loaded=[False, False, True])
+
+        load_all(self.session, [bar1, bar2])
+
+        self.assertEqual(self.session.process_events.call_count, 2)
+        self.assertEqual(bar1.is_loaded_calls, 1)
+        self.assertEqual(bar2.is_loaded_calls, 3)
+
+    def test_error_does_not_stop_loading_of_other_objects(self, time_mock):
+        time_mock.time.side_effect = time.time
+        bar1 = Bar(
+            self.session, is_loaded=[False],
+            error=spotify.ErrorType.OTHER_PERMANENT)
+        bar2 = Bar(self.session, is_loaded=[False, True])
+
+        with self.assertRaises(spotify.LibError) as ctx:
+            load_all(self.session, [bar1, bar2])
+
+        self.assertEqual(
+            ctx.exception.error_type, spotify.ErrorType.OTHER_PERMANENT)
+        self.assertEqual(bar1.is_loaded_calls, 1)
+        self.assertEqual(bar2.is_loaded_calls, 2)
+
+    def test_returns_exceptions_in_place_of_failed_objects(self, time_mock):
+        bar1 = Bar(
+            self.session, is_loaded=[False],
+            error=spotify.ErrorType.OTHER_PERMANENT)
+        bar2 = Bar(self.session)
+
+        result = load_all(self.session, [bar1, bar2], return_exceptions=True)
+
+        self.assertIsInstance(result[0], spotify.LibError)
+        self.assertIs(result[1], bar2)
+
+    def test_objects_not_loaded_before_timeout_fail(self, time_mock):
+        time_mock.time.side_effect = time.time
+        bar1 = Bar(self.session, is_loaded=[False])
+        bar2 = Bar(self.session)
+
+        result = load_all(
+            self.session, [bar1, bar2], timeout=0, return_exceptions=True)
+
+        self.assertIsInstance(result[0], spotify.Timeout)
+        self.assertIs(result[1], bar2)
+
+        with self.assertRaises(spotify.Timeout):
+            load_all(self.session, [bar1, bar2], timeout=0)
+
+    def test_waits_for_notification_if_event_loop_is_running(
+            self, time_mock):
+        time_mock.time.side_effect = time.time
+        self.session._event_loop = mock.Mock(spec=spotify.EventLoop)
+        self.session._event_loop.is_alive.return_value = True
+        self.session._load_condition = threading.Condition()
+        self.session._load_generation = 0
+        bar = Bar(self.session, is_loaded=[False, True])
+
+        def notify_loaded():
+            with self.session._load_condition:
+                self.session._load_generation += 1
+                self.session._load_condition.notify_all()
+        threading.Timer(0.01, notify_loaded).start()
+
+        load_all(self.session, [bar])
+
+        self.assertEqual(self.session.process_events.call_count, 0)
+        self.assertEqual(bar.is_loaded_calls, 2)
+
+    def test_load_all_shortcut_uses_session_of_objects(self, time_mock):
+        objects = [Bar(self.session), Bar(self.session)]
+        self.session.load_all.return_value = mock.sentinel.result
+
+        result = spotify.load_all(objects, timeout=3)
+
+        self.session.load_all.assert_called_once_with(
+            objects, timeout=3, return_exceptions=False)
+        self.assertEqual(result, mock.sentinel.result)
+
+    def test_load_all_shortcut_without_objects(self, time_mock):
+        self.assertEqual(spotify.load_all([]), [])
@@ -0,0 +1,230 @@
+from __future__ import unicode_literals
+
+import threading
+import unittest
+
+import spotify
+from spotify import lockstats
+from tests import mock
+
+
+@spotify.serialized
+def serialized_func():
+    return 42
+
+
+@spotify.serialized
+def serialized_lib_func():
+    return spotify.lib.sp_error_message(0)
+
+
+class LockStatsTest(unittest.TestCase):
+
+    def tearDown(self):
+        spotify.disable_lock_stats()
+        spotify.set_lock_mode(spotify.LockMode.GLOBAL)
+
+    def test_lock_stats_is_disabled_by_default(self):
+        self.assertIsNone(spotify.get_lock_stats())
+
+    def test_enable_replaces_lock_with_instrumented_lock(self):
+        spotify.enable_lock_stats()
+
+        self.assertIsInstance(spotify._lock, lockstats._InstrumentedLock)
+
+    def test_disable_restores_original_lock(self):
+        original_lock = spotify._lock
+        spotify.enable_lock_stats()
+
+        spotify.disable_lock_stats()
+
+        self.assertIs(spotify._lock, original_lock)
+        self.assertIsNone(spotify.get_lock_stats())
+
+    def test_records_lib_function_calls(self):
+        spotify.enable_lock_stats()
+
+        spotify.lib.sp_error_message(0)
+        spotify.lib.sp_error_message(0)
+
+        entry = spotify.get_lock_stats()['sp_error_message']
+        self.assertEqual(entry.name, 'sp_error_message')
+        self.assertEqual(entry.count, 2)
+        self.assertGreaterEqual(entry.wait_time, 0)
+        self.assertGreaterEqual(entry.hold_time, 0)
+
+    def test_records_serialized_function_calls(self):
+        spotify.enable_lock_stats()
+
+        self.assertEqual(serialized_func(), 42)
+
+        stats = spotify.get_lock_stats()
+        self.assertIn('tests.test_lockstats.serialized_func', stats)
+        self.assertEqual(
+            stats['tests.test_lockstats.serialized_func'].count, 1)
+
+    def test_records_only_outermost_acquisition(self):
+        spotify.enable_lock_stats()
+
+        serialized_lib_func()
+
+        stats = spotify.get_lock_stats()
+        self.assertEqual(
+            stats['tests.test_lockstats.serialized_lib_func'].count, 1)
+        self.assertNotIn('sp_error_message', stats)
+        self.assertEqual(stats.count, 1)
+
+    def test_merges_calls_recorded_in_other_threads(self):
+        spotify.enable_lock_stats()
+        thread = threading.Thread(target=serialized_func)
+        thread.start()
+        thread.join()
+
+        serialized_func()
+
+        self.assertEqual(
+            spotify.get_lock_stats()[
+                'tests.test_lockstats.serialized_func'].count, 2)
+
+    def test_records_calls_in_grouped_lock_mode(self):
+        spotify.set_lock_mode(spotify.LockMode.GROUPED)
+        spotify.enable_lock_stats()
+
+        spotify.lib.sp_error_message(0)
+
+        self.assertIsInstance(
+            spotify._lock._lock, spotify._SharedExclusiveLock)
+        self.assertEqual(spotify.get_lock_stats()['sp_error_message'].count, 1)
+
+    def test_lock_is_still_exclusive_when_instrumented(self):
+        spotify.enable_lock_stats()
+        acquired = threading.Event()
+
+        def func():
+            with spotify._lock:
+                acquired.set()
+
+        with spotify._lock:
+            thread = threading.Thread(target=func)
+            thread.daemon = True
+            thread.start()
+            self.assertFalse(acquired.wait(0.1))
+
+        self.assertTrue(acquired.wait(1))
+
+    def test_failed_non_blocking_acquire_is_not_recorded(self):
+        spotify.enable_lock_stats()
+        acquired = []
+
+        def func():
+            acquired.append(spotify._lock.acquire(False))
+
+        with spotify._lock:
+            thread = threading.Thread(target=func)
+            thread.start()
+            thread.join()
+
+        self.assertEqual(acquired, [False])
+        names = list(spotify.get_lock_stats())
+        self.assertFalse(any(name.endswith(':func') for name in names))
+
+    def test_successful_non_blocking_acquire_is_recorded(self):
+        spotify.enable_lock_stats()
+
+        self.assertTrue(spotify._lock.acquire(False))
+        spotify._lock.release()
+
+        names = list(spotify.get_lock_stats())
+        self.assertTrue(any(
+            name.endswith(':test_successful_non_blocking_acquire_is_recorded')
+            for name in names))
+
+    @mock.patch('spotify.lockstats.sys')
+    def test_serialized_functions_are_named_without_frame_inspection(
+            self, sys_mock):
+        spotify.enable_lock_stats()
+
+        serialized_func()
+
+        self.assertEqual(sys_mock._getframe.call_count, 0)
+        self.assertEqual(
+            spotify.get_lock_stats()[
+                'tests.test_lockstats.serialized_func'].count, 1)
+
+
+class LockStatsSnapshotTest(unittest.TestCase):
+
+    def setUp(self):
+        self.collector = lockstats._LockStatsCollector(num_samples=100)
+
+    def test_snapshot_sums_recorded_times(self):
+        self.collector.record('foo', 1.0, 2.0)
+        self.collector.record('foo', 3.0, 4.0)
+
+        entry = self.collector.snapshot()['foo']
+
+        self.assertEqual(entry.count, 2)
+        self.assertEqual(entry.wait_time, 4.0)
+        self.assertEqual(entry.hold_time, 6.0)
+        self.assertEqual(entry.max_wait_time, 3.0)
+        self.assertEqual(entry.max_hold_time, 4.0)
+
+    def test_snapshot_merges_threads(self):
+        self.collector.record('foo', 1.0, 2.0)
+        thread = threading.Thread(
+            target=self.collector.record, args=('foo', 3.0, 1.0))
+        thread.start()
+        thread.join()
+
+        entry = self.collector.snapshot()['foo']
+
+        self.assertEqual(entry.count, 2)
+        self.assertEqual(entry.wait_time, 4.0)
+        self.assertEqual(entry.hold_time, 3.0)
+        self.assertEqual(entry.max_wait_time, 3.0)
+        self.assertEqual(entry.max_hold_time, 2.0)
+        self.assertEqual(entry.wait_percentiles[100], 3.0)
+
+    def test_snapshot_calculates_percentiles(self):
+        for i in range(1, 101):
+            self.collector.record('foo', 0.0, float(i))
+
+        entry = self.collector.snapshot()['foo']
+
+        self.assertEqual(entry.hold_percentiles[50], 50.0)
+        self.assertEqual(entry.hold_percentiles[90], 90.0)
+        self.assertEqual(entry.hold_percentiles[99], 99.0)
+        self.assertEqual(entry.hold_percentiles[100], 100.0)
+
+    def test_percentiles_are_calculated_from_most_recent_samples(self):
+        for i in range(200):
+            self.collector.record('foo', 0.0, float(i))
+
+        entry = self.collector.snapshot()['foo']
+
+        self.assertEqual(entry.count, 200)
+        self.assertEqual(entry.hold_percentiles[50], 149.0)
+
+    def test_top_holders_are_sorted_by_total_hold_time(self):
+        self.collector.record('foo', 5.0, 1.0)
+        self.collector.record('bar', 1.0, 3.0)
+        self.collector.record('baz', 0.0, 2.0)
+
+        snapshot = self.collector.snapshot()
+
+        self.assertEqual(
+            [entry.name for entry in snapshot.top_holders(2)],
+            ['bar', 'baz'])
+        self.assertEqual(
+            [entry.name for entry in snapshot.top_waiters(1)], ['foo'])
+
+    def test_snapshot_totals(self):
+        self.collector.record('foo', 1.0, 2.0)
+        self.collector.record('bar', 3.0, 4.0)
+
+        snapshot = self.collector.snapshot()
+
+        self.assertEqual(len(snapshot), 2)
+        self.assertEqual(snapshot.count, 2)
+        self.assertEqual(snapshot.wait_time, 4.0)
+        self.assertEqual(snapshot.hold_time, 6.0)
@@ -0,0 +1,282 @@
+from __future__ import unicode_literals
+
+import unittest
+
+import spotify
+import tests
+from tests import mock
+
+
+def metadata_writer(**fields):
+    """Creates a function that writes the given ``fields`` to the metadata
+    struct of each object passed to a ``pyspotify_fetch_*_metadata()``
+    function.
+    """
+
+    def func(*args):
+        num_objects, metadata = args[-2:]
+        for i in range(num_objects):
+            for name, value in fields.items():
+                setattr(metadata[i], name, value)
+
+    return func
+
+
+@mock.patch('spotify.artist.lib', spec=spotify.lib)
+@mock.patch('spotify.album.lib', spec=spotify.lib)
+@mock.patch('spotify.track.lib', spec=spotify.lib)
+@mock.patch('spotify.metadata.lib', spec=spotify.lib)
+class FetchMetadataManyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = tests.create_session()
+        self.name = spotify.ffi.new('char[]', b'Foo')
+        self.empty = spotify.ffi.new('char[]', b'')
+
+    def create_track(self):
+        return spotify.Track(
+            self.session, sp_track=spotify.ffi.cast('sp_track *', 42))
+
+    def create_album(self):
+        return spotify.Album(
+            self.session, sp_album=spotify.ffi.cast('sp_album *', 43))
+
+    def create_artist(self):
+        return spotify.Artist(
+            self.session, sp_artist=spotify.ffi.cast('sp_artist *', 44))
+
+    def test_fetches_track_metadata(
+            self, lib_mock, track_lib_mock, album_lib_mock, artist_lib_mock):
+        sp_album = spotify.ffi.cast('sp_album *', 45)
+        sp_artist = spotify.ffi.cast('sp_artist *', 46)
+
+        def func(sp_session, sp_tracks, num_tracks, metadata):
+            metadata_writer(
+                error=spotify.ErrorType.OK, is_loaded=1,
+                offline_status=spotify.TrackOfflineStatus.DONE,
+                availability=spotify.TrackAvailability.AVAILABLE,
+                is_starred=1, name=self.name, duration=60000,
+                popularity=42, disc=1, index=3, album=sp_album,
+                num_artists=1)(sp_tracks, num_tracks, metadata)
+            metadata[0].artists[0] = sp_artist
+        lib_mock.pyspotify_fetch_track_metadata.side_effect = func
+        lib_mock.PYSPOTIFY_MAX_ARTISTS = 16
+        track = self.create_track()
+
+        result = spotify.fetch_metadata_many([track])
+
+        self.assertEqual(len(result), 1)
+        metadata = result[0]
+        self.assertIsInstance(metadata, spotify.TrackMetadata)
+        self.assertEqual(metadata.error, spotify.ErrorType.OK)
+        self.assertIs(metadata.is_loaded, True)
+        self.assertEqual(
+            metadata.offline_status, spotify.TrackOfflineStatus.DONE)
+        self.assertEqual(
+            metadata.availability, spotify.TrackAvailability.AVAILABLE)
+        self.assertIs(metadata.is_local, False)
+        self.assertIs(metadata.starred, True)
+        self.assertEqual(metadata.name, 'Foo')
+        self.assertEqual(metadata.duration, 60000)
+        self.assertEqual(metadata.popularity, 42)
+        self.assertEqual(metadata.disc, 1)
+        self.assertEqual(metadata.index, 3)
+        self.assertEqual(metadata.album._sp_album, sp_album)
+        album_lib_mock.sp_album_add_ref.assert_called_with(sp_album)
+        self.assertEqual(len(metadata.artists), 1)
+        self.assertEqual(metadata.artists[0]._sp_artist, sp_artist)
+        artist_lib_mock.sp_artist_add_ref.assert_called_with(sp_artist)
+
+    def test_fields_of_unloaded_track_are_none(
+            self, lib_mock, track_lib_mock, album_lib_mock, artist_lib_mock):
+        lib_mock.pyspotify_fetch_track_metadata.side_effect = (
+            metadata_writer(
+                error=spotify.ErrorType.IS_LOADING, name=self.empty))
+        track = self.create_track()
+
+        metadata = spotify.fetch_metadata_many([track])[0]
+
+        self.assertEqual(metadata.error, spotify.ErrorType.IS_LOADING)
+        self.assertIs(metadata.is_loaded, False)
+        self.assertIsNone(metadata.offline_status)
+        self.assertIsNone(metadata.starred)
+        self.assertIsNone(metadata.name)
+        self.assertIsNone(metadata.duration)
+        self.assertIsNone(metadata.popularity)
+        self.assertIsNone(metadata.album)
+        self.assertEqual(metadata.artists, [])
+
+    def test_gets_artists_that_dont_fit_in_struct_one_by_one(
+            self, lib_mock, track_lib_mock, album_lib_mock, artist_lib_mock):
+        sp_artist = spotify.ffi.cast('sp_artist *', 46)
+
+        def func(sp_session, sp_tracks, num_tracks, metadata):
+            metadata_writer(is_loaded=1, name=self.name, num_artists=2)(
+                sp_tracks, num_tracks, metadata)
+            metadata[0].artists[0] = sp_artist
+        lib_mock.pyspotify_fetch_track_metadata.side_effect = func
+        lib_mock.PYSPOTIFY_MAX_ARTISTS = 1
+        lib_mock.sp_track_artist.return_value = sp_artist
+        track = self.create_track()
+
+        metadata = spotify.fetch_metadata_many([track])[0]
+
+        self.assertEqual(len(metadata.artists), 2)
+        lib_mock.sp_track_artist.assert_called_once_with(track._sp_track, 1)
+        self.assertEqual(metadata.artists[1]._sp_artist, sp_artist)
+
+    def test_fetches_album_metadata(
+            self, lib_mock, track_lib_mock, album_lib_mock, artist_lib_mock):
+        lib_mock.pyspotify_fetch_album_metadata.side_effect = (
+            metadata_writer(
+                is_loaded=1, is_available=1, name=self.name, year=2013,
+                type=spotify.AlbumType.SINGLE))
+        album = self.create_album()
+
+        metadata = spotify.fetch_metadata_many([album])[0]
+
+        self.assertEqual(metadata, spotify.AlbumMetadata(
+            is_loaded=True, is_available=True, name='Foo', year=2013,
+            type=spotify.AlbumType.SINGLE, artist=None))
+
+    def test_fetches_artist_metadata(
+            self, lib_mock, track_lib_mock, album_lib_mock, artist_lib_mock):
+        lib_mock.pyspotify_fetch_artist_metadata.side_effect = (
+            metadata_writer(is_loaded=1, name=self.name))
+        artist = self.create_artist()
+
+        metadata = spotify.fetch_metadata_many([artist])[0]
+
+        self.assertEqual(
+            metadata, spotify.ArtistMetadata(is_loaded=True, name='Foo'))
+
+    def test_fetches_each_type_with_one_call_and_keeps_order(
+            self, lib_mock, track_lib_mock, album_lib_mock, artist_lib_mock):
+        lib_mock.pyspotify_fetch_track_metadata.side_effect = (
+            metadata_writer(name=self.name))
+        lib_mock.pyspotify_fetch_album_metadata.side_effect = (
+            metadata_writer(name=self.name))
+        lib_mock.pyspotify_fetch_artist_metadata.side_effect = (
+            metadata_writer(name=self.name))
+        objects = [
+            self.create_track(), self.create_artist(), self.create_track(),
+            self.create_album()]
+
+        result = spotify.fetch_metadata_many(objects)
+
+        self.assertEqual(
+            [type(metadata) for metadata in result],
+            [spotify.TrackMetadata, spotify.ArtistMetadata,
+             spotify.TrackMetadata, spotify.AlbumMetadata])
+        self.assertEqual(lib_mock.pyspotify_fetch_track_metadata.call_count, 1)
+        self.assertEqual(
+            lib_mock.pyspotify_fetch_track_metadata.call_args[0][2], 2)
+        self.assertEqual(lib_mock.pyspotify_fetch_album_metadata.call_count, 1)
+        self.assertEqual(
+            lib_mock.pyspotify_fetch_artist_metadata.call_count, 1)
+
+    def test_fails_on_other_objects(
+            self, lib_mock, track_lib_mock, album_lib_mock, artist_lib_mock):
+        with self.assertRaises(TypeError):
+            spotify.fetch_metadata_many(['spotify:track:foo'])
+
+        self.assertEqual(lib_mock.pyspotify_fetch_track_metadata.call_count, 0)
+
+
+@mock.patch('spotify.artist.lib', spec=spotify.lib)
+@mock.patch('spotify.album.lib', spec=spotify.lib)
+@mock.patch('spotify.track.lib', spec=spotify.lib)
+@mock.patch('spotify.metadata.lib', spec=spotify.lib)
+class SnapshotManyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = tests.create_session()
+        self.name = spotify.ffi.new('char[]', b'Foo')
+        self.sp_link = spotify.ffi.cast('sp_link *', 50)
+
+    def create_track(self):
+        return spotify.Track(
+            self.session, sp_track=spotify.ffi.cast('sp_track *', 42))
+
+    def create_artist(self):
+        return spotify.Artist(
+            self.session, sp_artist=spotify.ffi.cast('sp_artist *', 44))
+
+    def test_snapshots_track_with_album_and_artists(
+            self, lib_mock, track_lib_mock, album_lib_mock, artist_lib_mock):
+        sp_album = spotify.ffi.cast('sp_album *', 45)
+        sp_artist = spotify.ffi.cast('sp_artist *', 46)
+
+        def func(sp_session, sp_tracks, num_tracks, metadata):
+            metadata_writer(
+                is_loaded=1, name=self.name, duration=60000, album=sp_album,
+                num_artists=1)(sp_tracks, num_tracks, metadata)
+            metadata[0].artists[0] = sp_artist
+        lib_mock.pyspotify_fetch_track_metadata.side_effect = func
+        lib_mock.pyspotify_fetch_album_metadata.side_effect = (
+            metadata_writer(is_loaded=1, name=self.name, artist=sp_artist))
+        lib_mock.pyspotify_fetch_artist_metadata.side_effect = (
+            metadata_writer(is_loaded=1, name=self.name))
+        lib_mock.PYSPOTIFY_MAX_ARTISTS = 16
+        lib_mock.sp_link_create_from_track.return_value = self.sp_link
+        lib_mock.sp_link_create_from_album.return_value = self.sp_link
+        lib_mock.sp_link_create_from_artist.return_value = self.sp_link
+        lib_mock.sp_link_as_string.side_effect = tests.buffer_writer(
+            'spotify:foo')
+        track = self.create_track()
+
+        result = spotify.snapshot_many([track])
+
+        self.assertEqual(len(result), 1)
+        snapshot = result[0]
+        self.assertIsInstance(snapshot, spotify.TrackInfo)
+        self.assertEqual(snapshot.uri, 'spotify:foo')
+        self.assertEqual(snapshot.name, 'Foo')
+        self.assertEqual(snapshot.duration, 60000)
+        self.assertEqual(snapshot.album, spotify.AlbumInfo(
+            uri='spotify:foo', is_loaded=True, is_available=False,
+            name='Foo', year=0, type=spotify.AlbumType.ALBUM,
+            artist=spotify.ArtistInfo(
+                uri='spotify:foo', is_loaded=True, name='Foo')))
+        self.assertEqual(snapshot.artists, (snapshot.album.artist,))
+        self.assertIs(snapshot.artists[0], snapshot.album.artist)
+        lib_mock.sp_link_create_from_track.assert_called_once_with(
+            track._sp_track, 0)
+        self.assertEqual(
+            lib_mock.pyspotify_fetch_artist_metadata.call_count, 1)
+        self.assertEqual(lib_mock.sp_link_release.call_count, 3)
+
+    def test_snapshot_is_immutable(
+            self, lib_mock, track_lib_mock, album_lib_mock, artist_lib_mock):
+        lib_mock.pyspotify_fetch_artist_metadata.side_effect = (
+            metadata_writer(is_loaded=1, name=self.name))
+        lib_mock.sp_link_create_from_artist.return_value = self.sp_link
+        lib_mock.sp_link_as_string.side_effect = tests.buffer_writer(
+            'spotify:artist:foo')
+
+        snapshot = spotify.snapshot_many([self.create_artist()])[0]
+
+        self.assertEqual(snapshot, spotify.ArtistInfo(
+            uri='spotify:artist:foo', is_loaded=True, name='Foo'))
+        with self.assertRaises(AttributeError):
+            snapshot.name = 'Bar'
+        with self.assertRaises(AttributeError):
+            snapshot.__dict__
+
+    def test_uri_is_none_if_link_cannot_be_created(
+            self, lib_mock, track_lib_mock, album_lib_mock, artist_lib_mock):
+        lib_mock.pyspotify_fetch_artist_metadata.side_effect = (
+            metadata_writer(name=self.name))
+        lib_mock.sp_link_create_from_artist.return_value = spotify.ffi.NULL
+
+        snapshot = spotify.snapshot_many([self.create_artist()])[0]
+
+        self.assertIsNone(snapshot.uri)
+        self.assertEqual(lib_mock.sp_link_release.call_count, 0)
+
+    def test_fails_on_other_objects(
+            self, lib_mock, track_lib_mock, album_lib_mock, artist_lib_mock):
+        with self.assertRaises(TypeError):
+            spotify.snapshot_many(['spotify:track:foo'])
+
+        self.assertEqual(lib_mock.pyspotify_fetch_track_metadata.call_count, 0)
@@ -126,6 +126,17 @@ class PlaylistTest(unittest.TestCase):
 
         load_mock.assert_called_with(self.session, playlist, timeout=10)
 
+    @mock.patch('spotify.utils.load_async')
+    def test_load_async(self, load_async_mock, lib_mock):
+        sp_playlist = spotify.ffi.new('int *')
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+        load_async_mock.return_value = mock.sentinel.future
+
+        result = playlist.load_async(10)
+
+        load_async_mock.assert_called_with(self.session, playlist, timeout=10)
+        self.assertIs(result, mock.sentinel.future)
+
     @mock.patch('spotify.track.lib', spec=spotify.lib)
     def test_tracks(self, track_lib_mock, lib_mock):
         sp_track = spotify.ffi.cast('sp_track *', spotify.ffi.new('int *'))
@@ -148,6 +159,21 @@ class PlaylistTest(unittest.TestCase):
         lib_mock.sp_playlist_track.assert_called_with(sp_playlist, 0)
         track_lib_mock.sp_track_add_ref.assert_called_with(sp_track)
 
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_tracks_returns_same_track_object_each_time(
+            self, track_lib_mock, lib_mock):
+        sp_track = spotify.ffi.cast('sp_track *', spotify.ffi.new('int *'))
+        lib_mock.sp_playlist_num_tracks.return_value = 1
+        lib_mock.sp_playlist_track.return_value = sp_track
+        sp_playlist = spotify.ffi.new('int *')
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+        track1 = playlist.tracks[0]
+        track2 = playlist.tracks[0]
+
+        self.assertIs(track1, track2)
+        self.assertEqual(track_lib_mock.sp_track_add_ref.call_count, 1)
+
     def test_tracks_if_no_tracks(self, lib_mock):
         lib_mock.sp_playlist_num_tracks.return_value = 0
         sp_playlist = spotify.ffi.new('int *')
@@ -829,6 +855,25 @@ class PlaylistCallbacksTest(unittest.TestCase):
             mock.call(sp_tracks[2]),
         ])
 
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_tracks_added_callback_records_listener_stats(
+            self, track_lib_mock, lib_mock):
+        callback = mock.Mock()
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist._cached(
+            self.session, sp_playlist=sp_playlist)
+        playlist.enable_listener_stats()
+        playlist.on(spotify.PlaylistEvent.TRACKS_ADDED, callback)
+        sp_tracks = [spotify.ffi.cast('sp_track *', 43)]
+
+        _PlaylistCallbacks.tracks_added(
+            sp_playlist, sp_tracks, len(sp_tracks), 0, spotify.ffi.NULL)
+
+        stats = list(playlist.get_listener_stats().values())
+        self.assertEqual(len(stats), 1)
+        self.assertEqual(stats[0].event, spotify.PlaylistEvent.TRACKS_ADDED)
+        self.assertEqual(stats[0].count, 1)
+
     def test_tracks_removed_callback(self, lib_mock):
         callback = mock.Mock()
         sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
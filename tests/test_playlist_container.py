@@ -56,7 +56,7 @@ class PlaylistContainerTest(unittest.TestCase):
     def test_repr(self, link_mock, user_mock, lib_mock):
         link_instance_mock = link_mock.return_value
         link_instance_mock.uri = 'foo'
-        user_instance_mock = user_mock.return_value
+        user_instance_mock = user_mock._cached.return_value
         user_instance_mock.link = link_instance_mock
         lib_mock.sp_playlistcontainer_num_playlists.return_value = 0
         sp_playlistcontainer = spotify.ffi.new('int *')
@@ -91,6 +91,19 @@ class PlaylistContainerTest(unittest.TestCase):
         load_mock.assert_called_with(
             self.session, playlist_container, timeout=10)
 
+    @mock.patch('spotify.utils.load_async')
+    def test_load_async(self, load_async_mock, lib_mock):
+        sp_playlistcontainer = spotify.ffi.new('int *')
+        playlist_container = spotify.PlaylistContainer(
+            self.session, sp_playlistcontainer=sp_playlistcontainer)
+        load_async_mock.return_value = mock.sentinel.future
+
+        result = playlist_container.load_async(10)
+
+        load_async_mock.assert_called_with(
+            self.session, playlist_container, timeout=10)
+        self.assertIs(result, mock.sentinel.future)
+
     def test_len(self, lib_mock):
         lib_mock.sp_playlistcontainer_num_playlists.return_value = 8
         sp_playlistcontainer = spotify.ffi.new('int *')
@@ -928,7 +941,7 @@ class PlaylistContainerTest(unittest.TestCase):
 
     @mock.patch('spotify.User', spec=spotify.User)
     def test_owner(self, user_mock, lib_mock):
-        user_mock.return_value = mock.sentinel.user
+        user_mock._cached.return_value = mock.sentinel.user
         sp_user = spotify.ffi.new('int *')
         lib_mock.sp_playlistcontainer_owner.return_value = sp_user
         sp_playlistcontainer = spotify.ffi.new('int *')
@@ -939,8 +952,8 @@ class PlaylistContainerTest(unittest.TestCase):
 
         lib_mock.sp_playlistcontainer_owner.assert_called_with(
             sp_playlistcontainer)
-        user_mock.assert_called_with(
-            self.session, sp_user=sp_user, add_ref=True)
+        user_mock._cached.assert_called_with(
+            self.session, sp_user, add_ref=True)
         self.assertEqual(result, mock.sentinel.user)
 
     def test_get_unseen_tracks(self, lib_mock):
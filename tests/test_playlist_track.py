@@ -13,6 +13,13 @@ class PlaylistTrackTest(unittest.TestCase):
     def setUp(self):
         self.session = tests.create_session()
 
+    def test_has_no_instance_dict(self, lib_mock):
+        sp_playlist = spotify.ffi.new('int *')
+
+        playlist_track = spotify.PlaylistTrack(self.session, sp_playlist, 0)
+
+        self.assertFalse(hasattr(playlist_track, '__dict__'))
+
     @mock.patch('spotify.track.lib', spec=spotify.lib)
     def test_track(self, track_lib_mock, lib_mock):
         sp_track = spotify.ffi.cast('sp_track *', spotify.ffi.new('int *'))
@@ -0,0 +1,326 @@
+from __future__ import division, unicode_literals
+
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import spotify
+from tests import mock
+
+
+def create_audio_format(sample_rate=44100, channels=2):
+    audio_format = mock.Mock()
+    audio_format.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
+    audio_format.sample_rate = sample_rate
+    audio_format.channels = channels
+    audio_format.frame_size.return_value = 2 * channels
+    return audio_format
+
+
+def create_sine(num_frames, frequency, sample_rate=44100, channels=2):
+    t = numpy.arange(num_frames) / sample_rate
+    wave = 16384 * numpy.sin(2 * numpy.pi * frequency * t)
+    return numpy.repeat(
+        wave[:, numpy.newaxis], channels, axis=1).astype(numpy.int16)
+
+
+class ProcessingStatsTest(unittest.TestCase):
+
+    def test_load(self):
+        stats = spotify.ProcessingStats(
+            chunks=10, frames=44100, audio_duration=1.0, process_time=0.01,
+            max_process_time=0.002, max_load=0.02)
+
+        self.assertAlmostEqual(stats.load, 0.01)
+
+    def test_load_without_audio(self):
+        stats = spotify.ProcessingStats(0, 0, 0.0, 0.0, 0.0, 0.0)
+
+        self.assertEqual(stats.load, 0.0)
+
+
+@unittest.skipIf(numpy is None, 'Requires NumPy')
+class AudioProcessorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.audio_format = create_audio_format()
+
+    def test_converts_int16_to_float32(self):
+        processor = spotify.AudioProcessor()
+        frames = numpy.array(
+            [[16384, -32768], [0, 8192]], dtype=numpy.int16).tobytes()
+
+        output = processor.process(self.audio_format, frames, 2)
+
+        self.assertEqual(output.dtype, numpy.float32)
+        self.assertEqual(output.tolist(), [[0.5, -1.0], [0.0, 0.25]])
+
+    def test_accepts_all_music_delivery_formats(self):
+        processor = spotify.AudioProcessor()
+        samples = numpy.array([[16384, 8192]], dtype=numpy.int16)
+
+        for frames in [samples.tobytes(), memoryview(samples.tobytes()),
+                       samples.reshape(-1)]:
+            output = processor.process(self.audio_format, frames, 1)
+
+            self.assertEqual(output.tolist(), [[0.5, 0.25]])
+
+    def test_only_processes_num_frames(self):
+        processor = spotify.AudioProcessor()
+        frames = numpy.array([[0, 0], [16384, 16384]], dtype=numpy.int16)
+
+        output = processor.process(self.audio_format, frames.tobytes(), 1)
+
+        self.assertEqual(output.tolist(), [[0.0, 0.0]])
+
+    def test_gain(self):
+        processor = spotify.AudioProcessor(gain=0.5)
+        frames = numpy.array([[16384, 8192]], dtype=numpy.int16).tobytes()
+
+        output = processor.process(self.audio_format, frames, 1)
+
+        self.assertEqual(output.tolist(), [[0.25, 0.125]])
+
+    def test_gain_per_channel(self):
+        processor = spotify.AudioProcessor(gain=[1.0, 0.0])
+        frames = numpy.array([[16384, 8192]], dtype=numpy.int16).tobytes()
+
+        output = processor.process(self.audio_format, frames, 1)
+
+        self.assertEqual(output.tolist(), [[0.5, 0.0]])
+
+    def test_changing_gain_takes_effect_from_next_chunk(self):
+        processor = spotify.AudioProcessor()
+        frames = numpy.array([[16384, 8192]], dtype=numpy.int16).tobytes()
+        processor.process(self.audio_format, frames, 1)
+
+        processor.gain = 2.0
+        output = processor.process(self.audio_format, frames, 1)
+
+        self.assertEqual(processor.gain, 2.0)
+        self.assertEqual(output.tolist(), [[1.0, 0.5]])
+
+    def test_downmix_to_mono(self):
+        processor = spotify.AudioProcessor(channels=1, gain=[1.0, 0.5])
+        frames = numpy.array([[16384, 16384]], dtype=numpy.int16).tobytes()
+
+        output = processor.process(self.audio_format, frames, 1)
+
+        self.assertEqual(output.tolist(), [[0.375]])
+
+    def test_fails_if_channels_cannot_be_mixed(self):
+        processor = spotify.AudioProcessor(channels=3)
+        frames = numpy.zeros((1, 2), dtype=numpy.int16).tobytes()
+
+        with self.assertRaises(ValueError):
+            processor.process(self.audio_format, frames, 1)
+
+    def test_fails_if_channels_is_below_one(self):
+        with self.assertRaises(ValueError):
+            spotify.AudioProcessor(channels=0)
+
+    def test_fails_if_filter_taps_is_odd(self):
+        with self.assertRaises(ValueError):
+            spotify.AudioProcessor(filter_taps=15)
+
+    def test_does_not_resample_at_same_sample_rate(self):
+        processor = spotify.AudioProcessor(sample_rate=44100)
+        frames = create_sine(2048, 1000)
+
+        output = processor.process(self.audio_format, frames.tobytes(), 2048)
+
+        numpy.testing.assert_allclose(output, frames / 32768)
+
+    def test_resamples_by_rational_factor(self):
+        processor = spotify.AudioProcessor(sample_rate=48000)
+        frames = create_sine(44100, 1000)
+
+        output = processor.process(self.audio_format, frames.tobytes(), 44100)
+
+        self.assertEqual(output.shape, (48000, 2))
+        self.assertEqual(output.dtype, numpy.float32)
+
+    def test_resampling_keeps_amplitude_in_passband(self):
+        processor = spotify.AudioProcessor(sample_rate=48000)
+        frames = create_sine(44100, 1000)
+
+        output = processor.process(self.audio_format, frames.tobytes(), 44100)
+
+        # Skip the filter's delay
+        peak = numpy.abs(output[1000:]).max()
+        self.assertAlmostEqual(peak, 0.5, places=2)
+
+    def test_resampling_removes_frequencies_above_output_nyquist(self):
+        processor = spotify.AudioProcessor(sample_rate=22050)
+        frames = create_sine(44100, 17000)
+
+        output = processor.process(self.audio_format, frames.tobytes(), 44100)
+
+        self.assertEqual(output.shape, (22050, 2))
+        self.assertLess(numpy.abs(output[1000:]).max(), 0.01)
+
+    def test_resampling_in_chunks_equals_resampling_at_once(self):
+        frames = create_sine(10000, 440)
+        at_once = spotify.AudioProcessor(sample_rate=48000).process(
+            self.audio_format, frames.tobytes(), 10000)
+
+        processor = spotify.AudioProcessor(sample_rate=48000)
+        chunks = []
+        offset = 0
+        for size in [1, 7, 2048, 0, 3000, 1024, 10000]:
+            chunk = frames[offset:offset + size]
+            chunks.append(processor.process(
+                self.audio_format, chunk.tobytes(), len(chunk)))
+            offset += len(chunk)
+        in_chunks = numpy.concatenate(chunks)
+
+        self.assertEqual(in_chunks.shape, at_once.shape)
+        numpy.testing.assert_allclose(in_chunks, at_once, atol=1e-6)
+
+    def test_downmixes_and_resamples(self):
+        processor = spotify.AudioProcessor(sample_rate=48000, channels=1)
+        frames = create_sine(4410, 1000)
+
+        output = processor.process(self.audio_format, frames.tobytes(), 4410)
+
+        self.assertEqual(output.shape, (4800, 1))
+
+    def test_format_change_resets_filter_state(self):
+        processor = spotify.AudioProcessor(sample_rate=48000)
+        frames = create_sine(441, 1000)
+        first = processor.process(self.audio_format, frames.tobytes(), 441)
+
+        processor.process(
+            create_audio_format(sample_rate=22050, channels=1),
+            frames[:, 0].tobytes(), 441)
+        again = processor.process(self.audio_format, frames.tobytes(), 441)
+
+        numpy.testing.assert_allclose(again, first)
+
+    def test_changing_sample_rate_takes_effect_from_next_chunk(self):
+        processor = spotify.AudioProcessor()
+        frames = create_sine(4410, 1000)
+        processor.process(self.audio_format, frames.tobytes(), 4410)
+
+        processor.sample_rate = 48000
+        output = processor.process(self.audio_format, frames.tobytes(), 4410)
+
+        self.assertEqual(processor.sample_rate, 48000)
+        self.assertEqual(output.shape, (4800, 2))
+
+    def test_changing_channels_takes_effect_from_next_chunk(self):
+        processor = spotify.AudioProcessor()
+        frames = numpy.array([[16384, 8192]], dtype=numpy.int16).tobytes()
+        processor.process(self.audio_format, frames, 1)
+
+        processor.channels = 1
+        output = processor.process(self.audio_format, frames, 1)
+
+        self.assertEqual(processor.channels, 1)
+        self.assertEqual(output.tolist(), [[0.375]])
+
+    def test_setting_channels_below_one_fails(self):
+        processor = spotify.AudioProcessor()
+
+        with self.assertRaises(ValueError):
+            processor.channels = 0
+
+    def test_reset(self):
+        processor = spotify.AudioProcessor(sample_rate=48000)
+        frames = create_sine(441, 1000)
+        first = processor.process(self.audio_format, frames.tobytes(), 441)
+
+        processor.reset()
+        again = processor.process(self.audio_format, frames.tobytes(), 441)
+
+        numpy.testing.assert_allclose(again, first)
+
+    @mock.patch('spotify.processing._clock')
+    def test_stats(self, clock_mock):
+        clock_mock.side_effect = [10.0, 10.01, 20.0, 20.002]
+        processor = spotify.AudioProcessor()
+        frames = numpy.zeros((4410, 2), dtype=numpy.int16).tobytes()
+
+        processor.process(self.audio_format, frames, 4410)
+        processor.process(self.audio_format, frames, 2205)
+        stats = processor.stats
+
+        self.assertEqual(stats.chunks, 2)
+        self.assertEqual(stats.frames, 6615)
+        self.assertAlmostEqual(stats.audio_duration, 0.15)
+        self.assertAlmostEqual(stats.process_time, 0.012)
+        self.assertAlmostEqual(stats.max_process_time, 0.01)
+        self.assertAlmostEqual(stats.max_load, 0.1)
+        self.assertAlmostEqual(stats.load, 0.08)
+
+    def test_reset_stats(self):
+        processor = spotify.AudioProcessor()
+        frames = numpy.zeros((1, 2), dtype=numpy.int16).tobytes()
+        processor.process(self.audio_format, frames, 1)
+
+        processor.reset_stats()
+
+        self.assertEqual(processor.stats.chunks, 0)
+        self.assertEqual(processor.stats.frames, 0)
+
+
+@unittest.skipIf(numpy is None, 'Requires NumPy')
+class ProcessingSinkTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = mock.Mock()
+        self.session.num_listeners.return_value = 0
+        self.processor = spotify.AudioProcessor(sample_rate=48000)
+        self.output = mock.Mock()
+        self.sink = spotify.ProcessingSink(
+            self.session, self.processor, self.output)
+
+    def test_init_connects_to_music_delivery_event(self):
+        self.session.on.assert_called_once_with(
+            spotify.SessionEvent.MUSIC_DELIVERY, self.sink._on_music_delivery)
+
+    def test_passes_processed_audio_to_output(self):
+        frames = numpy.zeros((4410, 2), dtype=numpy.int16).tobytes()
+
+        num_consumed = self.sink._on_music_delivery(
+            self.session, create_audio_format(), frames, 4410)
+
+        self.assertEqual(num_consumed, 4410)
+        self.assertEqual(self.output.call_count, 1)
+        processed, sample_rate = self.output.call_args[0]
+        self.assertEqual(processed.shape, (4800, 2))
+        self.assertEqual(sample_rate, 48000)
+
+    def test_passes_input_sample_rate_if_not_resampling(self):
+        self.processor.sample_rate = None
+        frames = numpy.zeros((1, 2), dtype=numpy.int16).tobytes()
+
+        self.sink._on_music_delivery(
+            self.session, create_audio_format(sample_rate=22050), frames, 1)
+
+        self.assertEqual(self.output.call_args[0][1], 22050)
+
+    def test_passes_changed_sample_rate_with_matching_frames(self):
+        frames = numpy.zeros((4410, 2), dtype=numpy.int16).tobytes()
+        self.sink._on_music_delivery(
+            self.session, create_audio_format(), frames, 4410)
+
+        self.processor.sample_rate = 22050
+        self.sink._on_music_delivery(
+            self.session, create_audio_format(), frames, 4410)
+
+        processed, sample_rate = self.output.call_args[0]
+        self.assertEqual(sample_rate, 22050)
+        self.assertEqual(processed.shape, (2205, 2))
+
+    def test_off_disconnects_and_resets_processor(self):
+        self.processor.reset = mock.Mock()
+
+        self.sink.off()
+
+        self.session.off.assert_called_once_with(
+            spotify.SessionEvent.MUSIC_DELIVERY, self.sink._on_music_delivery)
+        self.processor.reset.assert_called_once_with()
@@ -0,0 +1,120 @@
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import spotify
+
+
+def call_error_message():
+    return spotify.lib.sp_error_message(0)
+
+
+@spotify.serialized
+def serialized_call_error_message():
+    return spotify.lib.sp_error_message(0)
+
+
+class ProfileTest(unittest.TestCase):
+
+    def tearDown(self):
+        if spotify._profiler is not None:
+            spotify._profiler.stop()
+        spotify.disable_lock_stats()
+
+    def test_no_profile_is_running_by_default(self):
+        self.assertIsNone(spotify._profiler)
+
+    def test_records_lib_function_calls(self):
+        with spotify.profile() as p:
+            spotify.lib.sp_error_message(0)
+            spotify.lib.sp_error_message(0)
+
+        entry = p['sp_error_message']
+        self.assertEqual(entry.name, 'sp_error_message')
+        self.assertEqual(entry.count, 2)
+        self.assertGreaterEqual(entry.time, 0)
+        self.assertGreaterEqual(entry.time, entry.max_time)
+        self.assertEqual(p.count, 2)
+        self.assertEqual(len(p), 1)
+
+    def test_attributes_calls_to_calling_function(self):
+        with spotify.profile() as p:
+            call_error_message()
+
+        self.assertEqual(
+            p['sp_error_message'].callers,
+            {'tests.test_profiling.call_error_message': 1})
+
+    def test_skips_serialized_wrapper_when_attributing_calls(self):
+        with spotify.profile() as p:
+            serialized_call_error_message()
+
+        self.assertEqual(
+            p['sp_error_message'].callers,
+            {'tests.test_profiling.serialized_call_error_message': 1})
+
+    def test_stops_recording_when_stopped(self):
+        with spotify.profile() as p:
+            spotify.lib.sp_error_message(0)
+
+        spotify.lib.sp_error_message(0)
+
+        self.assertIsNone(spotify._profiler)
+        self.assertEqual(p['sp_error_message'].count, 1)
+        self.assertGreater(p.duration, 0)
+
+    def test_only_one_profile_can_run_at_a_time(self):
+        with spotify.profile():
+            with self.assertRaises(RuntimeError):
+                spotify.profile().start()
+
+    def test_works_together_with_lock_stats(self):
+        spotify.enable_lock_stats()
+
+        with spotify.profile() as p:
+            spotify.lib.sp_error_message(0)
+
+        self.assertEqual(p['sp_error_message'].count, 1)
+        self.assertEqual(spotify.get_lock_stats()['sp_error_message'].count, 1)
+
+    def test_writes_every_nth_call_to_trace_file(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        trace_file = os.path.join(tmp_dir, 'trace.tsv')
+
+        with spotify.profile(trace_file=trace_file, trace_every=2):
+            for _ in range(5):
+                call_error_message()
+
+        with open(trace_file) as fh:
+            lines = fh.read().splitlines()
+        self.assertEqual(len(lines), 2)
+        fields = lines[0].split('\t')
+        self.assertEqual(len(fields), 5)
+        self.assertEqual(fields[2], 'sp_error_message')
+        self.assertEqual(fields[3], 'tests.test_profiling.call_error_message')
+
+    def test_format_includes_function_and_top_caller(self):
+        with spotify.profile() as p:
+            call_error_message()
+
+        output = p.format()
+
+        self.assertIn('sp_error_message', output)
+        self.assertIn('tests.test_profiling.call_error_message', output)
+
+
+class ProfileEntryTest(unittest.TestCase):
+
+    def test_mean_time(self):
+        entry = spotify.ProfileEntry('sp_foo', 4, 2.0, 1.0, {})
+
+        self.assertEqual(entry.mean_time, 0.5)
+
+    def test_mean_time_without_calls_is_zero(self):
+        entry = spotify.ProfileEntry('sp_foo', 0, 0.0, 0.0, {})
+
+        self.assertEqual(entry.mean_time, 0.0)
@@ -62,6 +62,49 @@ class SearchTest(unittest.TestCase):
         result.complete_event.wait(3)
         callback.assert_called_with(result)
 
+    def test_search_complete_wakes_up_threads_waiting_for_load(
+            self, lib_mock):
+        sp_search = spotify.ffi.cast('sp_search *', spotify.ffi.new('int *'))
+        lib_mock.sp_search_create.return_value = sp_search
+
+        spotify.Search(self.session, query='alice')
+
+        search_complete_cb = lib_mock.sp_search_create.call_args[0][11]
+        userdata = lib_mock.sp_search_create.call_args[0][12]
+        search_complete_cb(sp_search, userdata)
+
+        self.session._notify_loaded.assert_called_once_with()
+
+    def test_search_future_is_done_when_search_completes(self, lib_mock):
+        sp_search = spotify.ffi.cast('sp_search *', spotify.ffi.new('int *'))
+        lib_mock.sp_search_create.return_value = sp_search
+        lib_mock.sp_search_error.return_value = spotify.ErrorType.OK
+
+        result = spotify.Search(self.session, query='alice')
+        self.assertFalse(result.future.done())
+
+        search_complete_cb = lib_mock.sp_search_create.call_args[0][11]
+        userdata = lib_mock.sp_search_create.call_args[0][12]
+        search_complete_cb(sp_search, userdata)
+
+        self.assertIs(result.future.result(timeout=3), result)
+
+    def test_search_future_fails_if_search_fails(self, lib_mock):
+        sp_search = spotify.ffi.cast('sp_search *', spotify.ffi.new('int *'))
+        lib_mock.sp_search_create.return_value = sp_search
+        lib_mock.sp_search_error.return_value = (
+            spotify.ErrorType.OTHER_PERMANENT)
+
+        result = spotify.Search(self.session, query='alice')
+        search_complete_cb = lib_mock.sp_search_create.call_args[0][11]
+        userdata = lib_mock.sp_search_create.call_args[0][12]
+        search_complete_cb(sp_search, userdata)
+
+        with self.assertRaises(spotify.LibError) as ctx:
+            result.future.result(timeout=3)
+        self.assertEqual(
+            ctx.exception.error_type, spotify.ErrorType.OTHER_PERMANENT)
+
     def test_search_where_result_is_gone_before_callback_is_called(
             self, lib_mock):
 
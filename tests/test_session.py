@@ -300,6 +300,65 @@ class SessionTest(unittest.TestCase):
         with self.assertRaises(spotify.Error):
             session.process_events()
 
+    def test_process_events_calls_listeners_directly_by_default(
+            self, lib_mock):
+        session = create_session(lib_mock)
+        listener_mock = mock.Mock()
+        session.on(spotify.SessionEvent.METADATA_UPDATED, listener_mock)
+
+        def func(sp_session, int_ptr):
+            session.emit(spotify.SessionEvent.METADATA_UPDATED, session)
+            self.assertEqual(listener_mock.call_count, 1)
+            return spotify.ErrorType.OK
+
+        lib_mock.sp_session_process_events.side_effect = func
+
+        session.process_events()
+
+        listener_mock.assert_called_once_with(session)
+
+    def test_process_events_defers_events_until_lib_is_done(self, lib_mock):
+        session = create_session(lib_mock)
+        session.defer_events = True
+        emitter = spotify.utils.EventEmitter()
+        calls = []
+        session.on(
+            spotify.SessionEvent.METADATA_UPDATED,
+            lambda session: calls.append('metadata_updated'))
+        emitter.on('foo', lambda: calls.append('foo'))
+
+        def func(sp_session, int_ptr):
+            session.emit(spotify.SessionEvent.METADATA_UPDATED, session)
+            emitter.emit('foo')
+            self.assertEqual(calls, [])
+            int_ptr[0] = 5500
+            return spotify.ErrorType.OK
+
+        lib_mock.sp_session_process_events.side_effect = func
+
+        timeout = session.process_events()
+
+        self.assertEqual(calls, ['metadata_updated', 'foo'])
+        self.assertEqual(timeout, 5500)
+
+    def test_process_events_delivers_deferred_events_if_it_fails(
+            self, lib_mock):
+        session = create_session(lib_mock)
+        session.defer_events = True
+        listener_mock = mock.Mock()
+        session.on(spotify.SessionEvent.METADATA_UPDATED, listener_mock)
+
+        def func(sp_session, int_ptr):
+            session.emit(spotify.SessionEvent.METADATA_UPDATED, session)
+            return spotify.ErrorType.BAD_API_VERSION
+
+        lib_mock.sp_session_process_events.side_effect = func
+
+        with self.assertRaises(spotify.Error):
+            session.process_events()
+
+        listener_mock.assert_called_once_with(session)
+
     @mock.patch('spotify.playlist.lib', spec=spotify.lib)
     def test_playlist_container(self, playlist_lib_mock, lib_mock):
         lib_mock.sp_session_playlistcontainer.return_value = spotify.ffi.new(
@@ -570,6 +629,18 @@ class SessionTest(unittest.TestCase):
         self.assertIs(result, mock.sentinel.link)
         link_mock.assert_called_with(session, uri='spotify:any:foo')
 
+    @mock.patch('spotify.utils.load_all')
+    def test_load_all(self, load_all_mock, lib_mock):
+        session = create_session(lib_mock)
+        load_all_mock.return_value = mock.sentinel.result
+
+        result = session.load_all(mock.sentinel.objects, timeout=10)
+
+        load_all_mock.assert_called_once_with(
+            session, mock.sentinel.objects, timeout=10,
+            return_exceptions=False)
+        self.assertEqual(result, mock.sentinel.result)
+
     @mock.patch('spotify.Track')
     def test_get_track(self, track_mock, lib_mock):
         session = create_session(lib_mock)
@@ -646,6 +717,22 @@ class SessionTest(unittest.TestCase):
             playlist_offset=0, playlist_count=20,
             search_type=None)
 
+    @mock.patch('spotify.utils.call_async')
+    def test_search_async(self, call_async_mock, lib_mock):
+        session = create_session(lib_mock)
+        call_async_mock.return_value = mock.sentinel.future
+
+        result = session.search_async('alice', track_count=5)
+
+        self.assertIs(result, mock.sentinel.future)
+        call_async_mock.assert_called_with(
+            session, session.search, 'alice',
+            track_offset=0, track_count=5,
+            album_offset=0, album_count=20,
+            artist_offset=0, artist_count=20,
+            playlist_offset=0, playlist_count=20,
+            search_type=None)
+
     @mock.patch('spotify.Toplist')
     def test_toplist(self, toplist_mock, lib_mock):
         session = create_session(lib_mock)
@@ -659,6 +746,19 @@ class SessionTest(unittest.TestCase):
             session, type=spotify.ToplistType.TRACKS, region='NO',
             canonical_username=None, callback=None)
 
+    @mock.patch('spotify.utils.call_async')
+    def test_toplist_async(self, call_async_mock, lib_mock):
+        session = create_session(lib_mock)
+        call_async_mock.return_value = mock.sentinel.future
+
+        result = session.get_toplist_async(
+            type=spotify.ToplistType.TRACKS, region='NO')
+
+        self.assertIs(result, mock.sentinel.future)
+        call_async_mock.assert_called_with(
+            session, session.get_toplist, type=spotify.ToplistType.TRACKS,
+            region='NO', canonical_username=None)
+
 
 @mock.patch('spotify.session.lib', spec=spotify.lib)
 class OfflineTest(unittest.TestCase):
@@ -1058,6 +1158,24 @@ class SessionCallbacksTest(unittest.TestCase):
 
         callback.assert_called_once_with(session)
 
+    def test_metadata_updated_callback_forgets_changeable_metadata(
+            self, lib_mock):
+        session = create_session(lib_mock)
+        generation = session._metadata_generation
+
+        _SessionCallbacks.metadata_updated(session._sp_session)
+
+        self.assertEqual(session._metadata_generation, generation + 1)
+
+    def test_metadata_updated_callback_wakes_up_threads_waiting_for_load(
+            self, lib_mock):
+        session = create_session(lib_mock)
+        generation = session._load_generation
+
+        _SessionCallbacks.metadata_updated(session._sp_session)
+
+        self.assertEqual(session._load_generation, generation + 1)
+
     def test_connection_error_callback(self, lib_mock):
         callback = mock.Mock()
         session = create_session(lib_mock)
@@ -1108,11 +1226,63 @@ class SessionCallbacksTest(unittest.TestCase):
 
         callback.assert_called_once_with(
             session, mock.ANY, mock.ANY, num_frames)
-        self.assertEqual(
-            callback.call_args[0][1]._sp_audioformat, sp_audioformat)
+        self.assertEqual(callback.call_args[0][1].channels, 2)
         self.assertEqual(callback.call_args[0][2][:5], b'abc\x00\x00')
         self.assertEqual(result, num_frames)
 
+    def test_music_delivery_callback_reuses_audio_format(self, lib_mock):
+        sp_audioformat = spotify.ffi.new('sp_audioformat *')
+        sp_audioformat.channels = 2
+        frames = spotify.ffi.new('char[]', 40)
+        frames_void_ptr = spotify.ffi.cast('void *', frames)
+        callback = mock.Mock(return_value=10)
+        session = create_session(lib_mock)
+        session.on('music_delivery', callback)
+
+        _SessionCallbacks.music_delivery(
+            session._sp_session, sp_audioformat, frames_void_ptr, 10)
+        _SessionCallbacks.music_delivery(
+            session._sp_session, sp_audioformat, frames_void_ptr, 10)
+        sp_audioformat.channels = 1
+        _SessionCallbacks.music_delivery(
+            session._sp_session, sp_audioformat, frames_void_ptr, 10)
+
+        audio_formats = [c[0][1] for c in callback.call_args_list]
+        self.assertIs(audio_formats[0], audio_formats[1])
+        self.assertIsNot(audio_formats[1], audio_formats[2])
+        self.assertEqual(audio_formats[2].channels, 1)
+
+    def test_music_delivery_callback_with_memoryview(self, lib_mock):
+        sp_audioformat = spotify.ffi.new('sp_audioformat *')
+        sp_audioformat.channels = 2
+        frames = spotify.ffi.new('char[]', 40)
+        frames[0:3] = [b'a', b'b', b'c']
+        frames_void_ptr = spotify.ffi.cast('void *', frames)
+        callback = mock.Mock(return_value=10)
+        session = create_session(lib_mock)
+        session.music_delivery_format = spotify.MusicDeliveryFormat.MEMORYVIEW
+        session.on('music_delivery', callback)
+
+        _SessionCallbacks.music_delivery(
+            session._sp_session, sp_audioformat, frames_void_ptr, 10)
+
+        frames_view = callback.call_args[0][2]
+        self.assertIsInstance(frames_view, memoryview)
+        self.assertEqual(len(frames_view), 40)
+        self.assertEqual(frames_view.tobytes()[:5], b'abc\x00\x00')
+
+    def test_music_delivery_format_defaults_to_bytes(self, lib_mock):
+        session = create_session(lib_mock)
+
+        self.assertEqual(
+            session.music_delivery_format, spotify.MusicDeliveryFormat.BYTES)
+
+    def test_music_delivery_format_fails_if_unknown(self, lib_mock):
+        session = create_session(lib_mock)
+
+        with self.assertRaises(ValueError):
+            session.music_delivery_format = 'foo'
+
     def test_music_delivery_without_callback_does_not_consume(self, lib_mock):
         session = create_session(lib_mock)
 
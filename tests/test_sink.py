@@ -1,11 +1,334 @@
 from __future__ import unicode_literals
 
+import array
+import os
+import shutil
+import struct
+import tempfile
+import threading
+import time
 import unittest
 
 import spotify
+from spotify import utils
+from spotify.sink import _RingBuffer
 from tests import mock
 
 
+def create_audio_format(sample_rate=44100, channels=2):
+    audio_format = mock.Mock()
+    audio_format.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
+    audio_format.sample_rate = sample_rate
+    audio_format.channels = channels
+    audio_format.frame_size.return_value = 2 * channels
+    return audio_format
+
+
+def wait_for(condition, timeout=1.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.001)
+    return condition()
+
+
+class RingBufferTest(unittest.TestCase):
+
+    def setUp(self):
+        self.ring = _RingBuffer(4, 2)
+
+    def test_capacity(self):
+        self.assertEqual(self.ring.capacity, 4)
+
+    def test_write_and_read(self):
+        num_frames = self.ring.write(b'aabbcc', 3)
+
+        self.assertEqual(num_frames, 3)
+        self.assertEqual(self.ring.num_frames, 3)
+        self.assertEqual(self.ring.read(2), b'aabb')
+        self.assertEqual(self.ring.num_frames, 1)
+        self.assertEqual(self.ring.read(2), b'cc')
+        self.assertEqual(self.ring.read(2), b'')
+
+    def test_write_only_as_many_frames_as_there_is_room_for(self):
+        self.ring.write(b'aabbcc', 3)
+
+        num_frames = self.ring.write(b'ddeeff', 3)
+
+        self.assertEqual(num_frames, 1)
+        self.assertEqual(self.ring.read(4), b'aabbccdd')
+
+    def test_write_to_full_ring_buffer(self):
+        self.ring.write(b'aabbccdd', 4)
+
+        self.assertEqual(self.ring.write(b'ee', 1), 0)
+
+    def test_write_and_read_wraps_around(self):
+        self.ring.write(b'aabbcc', 3)
+        self.ring.read(2)
+
+        self.ring.write(b'ddeeff', 3)
+
+        self.assertEqual(self.ring.num_frames, 4)
+        self.assertEqual(self.ring.read(4), b'ccddeeff')
+
+    def test_write_accepts_buffers(self):
+        self.ring.write(memoryview(b'aabb'), 2)
+        self.ring.write(bytearray(b'cc'), 1)
+
+        self.assertEqual(self.ring.read(3), b'aabbcc')
+
+    @unittest.skipIf(utils.PY2, 'Requires memoryview.cast()')
+    def test_write_accepts_arrays_of_samples(self):
+        samples = array.array('h', [1, 2])
+
+        self.ring.write(samples, 2)
+
+        self.assertEqual(self.ring.read(2), samples.tobytes())
+
+    def test_write_from_one_thread_and_read_from_another(self):
+        ring = _RingBuffer(16, 2)
+        frames = bytes(bytearray(range(200)))
+        result = []
+
+        def consume():
+            while len(result) < len(frames) // 2:
+                data = ring.read(3)
+                result.extend(data[i:i + 2] for i in range(0, len(data), 2))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        offset = 0
+        while offset < len(frames):
+            num_frames = (len(frames) - offset) // 2
+            offset += 2 * ring.write(frames[offset:], num_frames)
+        consumer.join(5)
+
+        self.assertEqual(b''.join(result), frames)
+
+
+class Sink(spotify.BufferedSink):
+
+    def __init__(self, session, buffer_duration=1.0):
+        spotify.BufferedSink.__init__(
+            self, session, buffer_duration=buffer_duration)
+        self.opened = []
+        self.written = []
+        self.closed = 0
+        self.write_event = threading.Event()
+        self.on()
+
+    def _open(self, audio_format):
+        self.opened.append(audio_format)
+
+    def _write(self, data):
+        self.write_event.wait(1)
+        self.written.append(data)
+
+    def _close_device(self):
+        self.closed += 1
+
+
+class PullSink(Sink):
+    _pull = True
+
+
+class BufferedSinkTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = mock.Mock()
+        self.session.num_listeners.return_value = 0
+        self.audio_format = create_audio_format(sample_rate=4)
+
+    def tearDown(self):
+        self.sink.write_event.set()
+        self.sink.off()
+
+    def test_init_connects_to_music_delivery_event(self):
+        self.sink = Sink(self.session)
+
+        self.session.on.assert_any_call(
+            spotify.SessionEvent.MUSIC_DELIVERY, self.sink._on_music_delivery)
+
+    def test_init_connects_to_get_audio_buffer_stats_event(self):
+        self.sink = Sink(self.session)
+
+        self.session.on.assert_any_call(
+            spotify.SessionEvent.GET_AUDIO_BUFFER_STATS,
+            self.sink._on_get_audio_buffer_stats)
+
+    def test_off_disconnects_from_events(self):
+        self.sink = Sink(self.session)
+
+        self.sink.off()
+
+        self.session.off.assert_any_call(
+            spotify.SessionEvent.MUSIC_DELIVERY, self.sink._on_music_delivery)
+        self.session.off.assert_any_call(
+            spotify.SessionEvent.GET_AUDIO_BUFFER_STATS,
+            self.sink._on_get_audio_buffer_stats)
+
+    def test_music_delivery_opens_device(self):
+        self.sink = Sink(self.session)
+
+        self.sink._on_music_delivery(
+            self.session, self.audio_format, b'\x00' * 8, 2)
+
+        self.assertEqual(self.sink.opened, [self.audio_format])
+        self.assertEqual(self.sink._ring.capacity, 4)
+
+    def test_music_delivery_consumes_frames_there_is_room_for(self):
+        self.sink = Sink(self.session)
+
+        num_frames_consumed = self.sink._on_music_delivery(
+            self.session, self.audio_format, b'\x00' * 24, 6)
+
+        self.assertEqual(num_frames_consumed, 4)
+
+    def test_consumer_thread_writes_frames_to_device(self):
+        self.sink = Sink(self.session)
+        self.sink.write_event.set()
+
+        self.sink._on_music_delivery(
+            self.session, self.audio_format, b'aaaabbbb', 2)
+
+        self.assertTrue(wait_for(lambda: self.sink.written))
+        self.assertEqual(self.sink.written, [b'aaaabbbb'])
+
+    def test_music_delivery_does_not_wait_for_device(self):
+        self.sink = Sink(self.session)
+
+        self.sink._on_music_delivery(
+            self.session, self.audio_format, b'\x00' * 16, 4)
+        self.assertTrue(wait_for(lambda: self.sink._ring.num_frames == 0))
+        num_frames_consumed = self.sink._on_music_delivery(
+            self.session, self.audio_format, b'\x00' * 16, 4)
+
+        self.assertEqual(num_frames_consumed, 4)
+        self.assertEqual(self.sink.written, [])
+
+    def test_audio_buffer_stats(self):
+        self.sink = PullSink(self.session)
+        self.sink._on_music_delivery(
+            self.session, self.audio_format, b'\x00' * 12, 3)
+
+        stats = self.sink._on_get_audio_buffer_stats(self.session)
+
+        self.assertEqual(stats, spotify.AudioBufferStats(3, 0))
+
+    def test_audio_buffer_stats_without_frames(self):
+        self.sink = Sink(self.session)
+
+        stats = self.sink._on_get_audio_buffer_stats(self.session)
+
+        self.assertEqual(stats, spotify.AudioBufferStats(0, 0))
+
+    def test_consumer_keeping_up_is_not_a_stutter(self):
+        self.sink = Sink(self.session)
+        self.sink.write_event.set()
+
+        for _ in range(5):
+            self.sink._on_music_delivery(
+                self.session, self.audio_format, b'\x00' * 8, 2)
+            self.assertTrue(wait_for(lambda: self.sink._ring.num_frames == 0))
+        self.assertTrue(wait_for(lambda: len(self.sink.written) == 5))
+        stats = self.sink._on_get_audio_buffer_stats(self.session)
+
+        self.assertEqual(stats, spotify.AudioBufferStats(0, 0))
+
+    def test_underrun_reported_by_device_is_a_stutter(self):
+        self.sink = Sink(self.session)
+        self.sink.write_event.set()
+        self.sink._on_music_delivery(
+            self.session, self.audio_format, b'\x00' * 8, 2)
+        self.assertTrue(wait_for(lambda: self.sink.written))
+        self.sink._record_underrun()
+
+        stats1 = self.sink._on_get_audio_buffer_stats(self.session)
+        stats2 = self.sink._on_get_audio_buffer_stats(self.session)
+
+        self.assertEqual(stats1.stutter, 1)
+        self.assertEqual(stats2.stutter, 0)
+
+    def test_format_change_waits_for_buffer_to_drain(self):
+        self.sink = Sink(self.session)
+        self.sink._on_music_delivery(
+            self.session, self.audio_format, b'\x00' * 16, 4)
+        self.sink._on_music_delivery(
+            self.session, self.audio_format, b'\x00' * 4, 1)
+        new_audio_format = create_audio_format(sample_rate=8, channels=1)
+
+        num_frames_consumed = self.sink._on_music_delivery(
+            self.session, new_audio_format, b'\x00' * 4, 2)
+        self.assertEqual(num_frames_consumed, 0)
+
+        self.sink.write_event.set()
+        self.assertTrue(wait_for(lambda: self.sink._ring.num_frames == 0))
+        num_frames_consumed = self.sink._on_music_delivery(
+            self.session, new_audio_format, b'\x00' * 4, 2)
+
+        self.assertEqual(num_frames_consumed, 2)
+        self.assertEqual(self.sink.closed, 1)
+        self.assertEqual(
+            self.sink.opened, [self.audio_format, new_audio_format])
+        self.assertEqual(self.sink._ring.capacity, 8)
+
+    def test_off_stops_consumer_and_closes_device(self):
+        self.sink = Sink(self.session)
+        self.sink._on_music_delivery(
+            self.session, self.audio_format, b'\x00' * 4, 1)
+        consumer = self.sink._consumer
+
+        self.sink.write_event.set()
+        self.sink.off()
+
+        self.assertFalse(consumer.is_alive())
+        self.assertEqual(self.sink.closed, 1)
+        self.assertIsNone(self.sink._ring)
+
+    def test_off_without_delivery_does_not_close_device(self):
+        self.sink = Sink(self.session)
+
+        self.sink.off()
+
+        self.assertEqual(self.sink.closed, 0)
+
+    def test_pull_sink_has_no_consumer_thread(self):
+        self.sink = PullSink(self.session)
+
+        self.sink._on_music_delivery(
+            self.session, self.audio_format, b'aaaabbbb', 2)
+
+        self.assertIsNone(self.sink._consumer)
+        self.assertEqual(self.sink.written, [])
+
+    def test_pull_sink_read(self):
+        self.sink = PullSink(self.session)
+        self.sink._on_music_delivery(
+            self.session, self.audio_format, b'aaaabbbb', 2)
+
+        self.assertEqual(self.sink._read(1), b'aaaa')
+        self.assertEqual(self.sink._underruns, 0)
+
+    def test_pull_sink_read_pads_with_silence_and_counts_underrun(self):
+        self.sink = PullSink(self.session)
+        self.sink._on_music_delivery(
+            self.session, self.audio_format, b'aaaa', 1)
+
+        self.assertEqual(self.sink._read(2), b'aaaa\x00\x00\x00\x00')
+        self.assertEqual(self.sink._read(1), b'\x00\x00\x00\x00')
+
+        self.assertEqual(self.sink._underruns, 1)
+
+    def test_pull_sink_read_before_delivery_is_not_an_underrun(self):
+        self.sink = PullSink(self.session)
+        self.sink._on_music_delivery(
+            self.session, self.audio_format, b'', 0)
+
+        self.assertEqual(self.sink._read(1), b'\x00\x00\x00\x00')
+
+        self.assertEqual(self.sink._underruns, 0)
+
+
 class AlsaSinkTest(unittest.TestCase):
 
     def setUp(self):
@@ -15,8 +338,11 @@ class AlsaSinkTest(unittest.TestCase):
         with mock.patch.dict('sys.modules', {'alsaaudio': self.alsaaudio}):
             self.sink = spotify.AlsaSink(self.session)
 
+    def tearDown(self):
+        self.sink.off()
+
     def test_init_connects_to_music_delivery_event(self):
-        self.session.on.assert_called_with(
+        self.session.on.assert_any_call(
             spotify.SessionEvent.MUSIC_DELIVERY, self.sink._on_music_delivery)
 
     def test_off_disconnects_from_music_delivery_event(self):
@@ -24,12 +350,14 @@ class AlsaSinkTest(unittest.TestCase):
 
         self.sink.off()
 
-        self.session.off.assert_called_with(
+        self.session.off.assert_any_call(
             spotify.SessionEvent.MUSIC_DELIVERY, mock.ANY)
 
     def test_off_closes_audio_device(self):
         device_mock = mock.Mock()
-        self.sink._device = device_mock
+        self.alsaaudio.PCM.return_value = device_mock
+        self.sink._on_music_delivery(
+            mock.sentinel.session, create_audio_format(), b'\x00' * 4, 1)
 
         self.sink.off()
 
@@ -37,78 +365,62 @@ class AlsaSinkTest(unittest.TestCase):
         self.assertIsNone(self.sink._device)
 
     def test_on_connects_to_music_delivery_event(self):
-        self.assertEqual(self.session.on.call_count, 1)
+        self.assertEqual(self.session.on.call_count, 2)
 
         self.sink.off()
         self.sink.on()
 
-        self.assertEqual(self.session.on.call_count, 2)
+        self.assertEqual(self.session.on.call_count, 4)
 
     def test_music_delivery_creates_device_if_needed(self):
         device = mock.Mock()
         self.alsaaudio.PCM.return_value = device
-        audio_format = mock.Mock()
-        audio_format.frame_size.return_value = 4
-        audio_format.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
-        num_frames = 2048
+        audio_format = create_audio_format()
 
         self.sink._on_music_delivery(
-            mock.sentinel.session, audio_format, mock.sentinel.frames,
-            num_frames)
+            mock.sentinel.session, audio_format, b'\x00' * 4, 1)
 
         self.alsaaudio.PCM.assert_called_with(
-            mode=self.alsaaudio.PCM_NONBLOCK, card='default')
+            mode=self.alsaaudio.PCM_NORMAL, card='default')
         device.setformat.assert_called_with(mock.ANY)
         device.setrate.assert_called_with(audio_format.sample_rate)
         device.setchannels.assert_called_with(audio_format.channels)
-        device.setperiodsize.assert_called_with(2048 * 4)
+        device.setperiodsize.assert_called_with(2048)
 
     def test_sets_little_endian_format_if_little_endian_system(self):
         device = mock.Mock()
         self.alsaaudio.PCM.return_value = device
-        audio_format = mock.Mock()
-        audio_format.frame_size.return_value = 4
-        audio_format.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
-        num_frames = 2048
 
         with mock.patch('spotify.sink.sys') as sys_mock:
             sys_mock.byteorder = 'little'
 
             self.sink._on_music_delivery(
-                mock.sentinel.session, audio_format, mock.sentinel.frames,
-                num_frames)
+                mock.sentinel.session, create_audio_format(), b'\x00' * 4, 1)
 
         device.setformat.assert_called_with(self.alsaaudio.PCM_FORMAT_S16_LE)
 
     def test_sets_big_endian_format_if_big_endian_system(self):
         device = mock.Mock()
         self.alsaaudio.PCM.return_value = device
-        audio_format = mock.Mock()
-        audio_format.frame_size.return_value = 4
-        audio_format.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
-        num_frames = 2048
 
         with mock.patch('spotify.sink.sys') as sys_mock:
             sys_mock.byteorder = 'big'
 
             self.sink._on_music_delivery(
-                mock.sentinel.session, audio_format, mock.sentinel.frames,
-                num_frames)
+                mock.sentinel.session, create_audio_format(), b'\x00' * 4, 1)
 
         device.setformat.assert_called_with(self.alsaaudio.PCM_FORMAT_S16_BE)
 
-    def test_music_delivery_writes_frames_to_stream(self):
-        self.sink._device = mock.Mock()
-        audio_format = mock.Mock()
-        audio_format.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
+    def test_music_delivery_writes_frames_to_device(self):
+        device = mock.Mock()
+        self.alsaaudio.PCM.return_value = device
 
         num_consumed_frames = self.sink._on_music_delivery(
-            mock.sentinel.session, audio_format, mock.sentinel.frames,
-            mock.sentinel.num_frames)
+            mock.sentinel.session, create_audio_format(), b'aaaabbbb', 2)
 
-        self.sink._device.write.assert_called_with(mock.sentinel.frames)
-        self.assertEqual(
-            num_consumed_frames, self.sink._device.write.return_value)
+        self.assertEqual(num_consumed_frames, 2)
+        self.assertTrue(wait_for(lambda: device.write.called))
+        device.write.assert_called_with(b'aaaabbbb')
 
 
 class PortAudioSinkTest(unittest.TestCase):
@@ -125,7 +437,7 @@ class PortAudioSinkTest(unittest.TestCase):
         self.assertEqual(self.sink._device, self.pyaudio.PyAudio.return_value)
 
     def test_init_connects_to_music_delivery_event(self):
-        self.session.on.assert_called_with(
+        self.session.on.assert_any_call(
             spotify.SessionEvent.MUSIC_DELIVERY, self.sink._on_music_delivery)
 
     def test_off_disconnects_from_music_delivery_event(self):
@@ -133,12 +445,13 @@ class PortAudioSinkTest(unittest.TestCase):
 
         self.sink.off()
 
-        self.session.off.assert_called_with(
+        self.session.off.assert_any_call(
             spotify.SessionEvent.MUSIC_DELIVERY, mock.ANY)
 
     def test_off_closes_audio_stream(self):
-        stream_mock = mock.Mock()
-        self.sink._stream = stream_mock
+        self.sink._on_music_delivery(
+            mock.sentinel.session, create_audio_format(), b'\x00' * 4, 1)
+        stream_mock = self.sink._stream
 
         self.sink.off()
 
@@ -146,36 +459,599 @@ class PortAudioSinkTest(unittest.TestCase):
         self.assertIsNone(self.sink._stream)
 
     def test_on_connects_to_music_delivery_event(self):
-        self.assertEqual(self.session.on.call_count, 1)
+        self.assertEqual(self.session.on.call_count, 2)
 
         self.sink.off()
         self.sink.on()
 
-        self.assertEqual(self.session.on.call_count, 2)
+        self.assertEqual(self.session.on.call_count, 4)
 
     def test_music_delivery_creates_stream_if_needed(self):
-        audio_format = mock.Mock()
-        audio_format.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
+        audio_format = create_audio_format()
 
         self.sink._on_music_delivery(
-            mock.sentinel.session, audio_format, mock.sentinel.frames,
-            mock.sentinel.num_frames)
+            mock.sentinel.session, audio_format, b'\x00' * 4, 1)
 
         self.sink._device.open.assert_called_with(
             format=self.pyaudio.paInt16, channels=audio_format.channels,
-            rate=audio_format.sample_rate, output=True)
+            rate=audio_format.sample_rate, output=True,
+            stream_callback=self.sink._on_stream_callback)
         self.assertEqual(
             self.sink._stream, self.sink._device.open.return_value)
 
-    def test_music_delivery_writes_frames_to_stream(self):
-        self.sink._stream = mock.Mock()
-        audio_format = mock.Mock()
-        audio_format.sample_type = spotify.SampleType.INT16_NATIVE_ENDIAN
-
+    def test_music_delivery_does_not_write_to_stream(self):
         num_consumed_frames = self.sink._on_music_delivery(
-            mock.sentinel.session, audio_format, mock.sentinel.frames,
-            mock.sentinel.num_frames)
+            mock.sentinel.session, create_audio_format(), b'aaaabbbb', 2)
+
+        self.assertEqual(num_consumed_frames, 2)
+        self.assertEqual(self.sink._stream.write.call_count, 0)
+
+    def test_stream_callback_reads_frames(self):
+        self.sink._on_music_delivery(
+            mock.sentinel.session, create_audio_format(), b'aaaabbbb', 2)
+
+        result = self.sink._on_stream_callback(None, 1, {}, 0)
+
+        self.assertEqual(result, (b'aaaa', self.pyaudio.paContinue))
+
+
+class SinkStatsTest(unittest.TestCase):
+
+    def test_rates(self):
+        stats = spotify.SinkStats(
+            deliveries=10, frames=44100, audio_duration=1.0, elapsed=0.25)
+
+        self.assertEqual(stats.frames_per_second, 176400)
+        self.assertEqual(stats.realtime_factor, 4.0)
+
+    def test_rates_without_elapsed_time(self):
+        stats = spotify.SinkStats(
+            deliveries=1, frames=44100, audio_duration=1.0, elapsed=0.0)
+
+        self.assertEqual(stats.frames_per_second, 0.0)
+        self.assertEqual(stats.realtime_factor, 0.0)
+
+
+class NullSinkTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = mock.Mock()
+        self.session.num_listeners.return_value = 0
+        self.sink = spotify.NullSink(self.session)
+
+    def test_init_connects_to_music_delivery_event(self):
+        self.session.on.assert_called_with(
+            spotify.SessionEvent.MUSIC_DELIVERY, self.sink._on_music_delivery)
+
+    def test_music_delivery_consumes_all_frames(self):
+        num_frames_consumed = self.sink._on_music_delivery(
+            self.session, create_audio_format(), b'\x00' * 8192, 2048)
+
+        self.assertEqual(num_frames_consumed, 2048)
+
+    def test_stats_before_delivery(self):
+        self.assertEqual(self.sink.stats, spotify.SinkStats(0, 0, 0.0, 0.0))
+
+    @mock.patch('spotify.sink._clock')
+    def test_stats(self, clock_mock):
+        clock_mock.side_effect = [10.0, 10.5]
+        audio_format = create_audio_format(sample_rate=4096)
+
+        self.sink._on_music_delivery(
+            self.session, audio_format, b'\x00' * 8192, 2048)
+        self.sink._on_music_delivery(
+            self.session, audio_format, b'\x00' * 4096, 1024)
+
+        self.assertEqual(
+            self.sink.stats, spotify.SinkStats(2, 3072, 0.75, 0.5))
+        self.assertEqual(self.sink.stats.realtime_factor, 1.5)
+
+    def test_reset_stats(self):
+        self.sink._on_music_delivery(
+            self.session, create_audio_format(), b'\x00' * 8192, 2048)
+
+        self.sink.reset_stats()
+
+        self.assertEqual(self.sink.stats, spotify.SinkStats(0, 0, 0.0, 0.0))
+
+
+class FileSinkTestMixin(object):
+
+    def setUp(self):
+        self.session = mock.Mock()
+        self.session.num_listeners.return_value = 0
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.audio_format = create_audio_format(sample_rate=8000, channels=1)
+
+    def create_sink(self, filename):
+        return self.sink_class(
+            self.session, os.path.join(self.tmp_dir, filename))
+
+    def deliver(self, sink, frames):
+        return sink._on_music_delivery(
+            self.session, self.audio_format, frames, len(frames) // 2)
+
+    def read_data(self, path):
+        with open(path, 'rb') as fh:
+            return fh.read()[self.header_size:]
+
+    def test_init_connects_to_end_of_track_event(self):
+        sink = self.create_sink('out')
+
+        self.session.on.assert_any_call(
+            spotify.SessionEvent.END_OF_TRACK, sink._on_end_of_track)
+        sink.off()
+
+    def test_off_disconnects_from_end_of_track_event(self):
+        sink = self.create_sink('out')
+
+        sink.off()
+
+        self.session.off.assert_any_call(
+            spotify.SessionEvent.END_OF_TRACK, sink._on_end_of_track)
+
+    def test_writes_frames_to_file(self):
+        sink = self.create_sink('out')
+
+        self.assertEqual(self.deliver(sink, b'aabb'), 2)
+        self.assertEqual(self.deliver(sink, b'ccdd'), 2)
+        sink.off()
+
+        self.assertEqual(sink.paths, [os.path.join(self.tmp_dir, 'out')])
+        self.assertEqual(self.read_data(sink.paths[0]), b'aabbccdd')
+
+    def test_no_file_is_created_without_frames(self):
+        sink = self.create_sink('out')
+
+        sink.off()
+
+        self.assertEqual(sink.paths, [])
+        self.assertEqual(os.listdir(self.tmp_dir), [])
+
+    def test_starts_new_file_after_end_of_track(self):
+        sink = self.create_sink('track-{index}')
+
+        self.deliver(sink, b'aabb')
+        sink._on_end_of_track(self.session)
+        self.deliver(sink, b'ccdd')
+        sink._on_end_of_track(self.session)
+        sink.off()
+
+        self.assertEqual(sink.paths, [
+            os.path.join(self.tmp_dir, 'track-1'),
+            os.path.join(self.tmp_dir, 'track-2'),
+        ])
+        self.assertEqual(self.read_data(sink.paths[0]), b'aabb')
+        self.assertEqual(self.read_data(sink.paths[1]), b'ccdd')
+
+    def test_keeps_one_file_if_path_has_no_index(self):
+        sink = self.create_sink('out')
+
+        self.deliver(sink, b'aabb')
+        sink._on_end_of_track(self.session)
+        self.deliver(sink, b'ccdd')
+        sink.off()
+
+        self.assertEqual(len(sink.paths), 1)
+        self.assertEqual(self.read_data(sink.paths[0]), b'aabbccdd')
+
+    def test_continues_file_if_path_has_no_index_after_off_and_on(self):
+        sink = self.create_sink('out')
+
+        self.deliver(sink, b'aabb')
+        sink.off()
+        sink.on()
+        self.deliver(sink, b'ccdd')
+        sink.off()
+
+        self.assertEqual(sink.paths, [os.path.join(self.tmp_dir, 'out')])
+        self.assertEqual(self.read_data(sink.paths[0]), b'aabbccdd')
+
+    def test_splits_writes_at_end_of_track(self):
+        sink = self.create_sink('track-{index}')
+        sink._open(self.audio_format)
+        sink._rotate_at.extend([2, 6])
+
+        sink._write(b'aabbcc')
+        sink._write(b'dd')
+        sink._close_device()
+
+        self.assertEqual(
+            [self.read_data(path) for path in sink.paths],
+            [b'aa', b'bbcc', b'dd'])
+
+
+class RawFileSinkTest(FileSinkTestMixin, unittest.TestCase):
+
+    sink_class = spotify.RawFileSink
+    header_size = 0
+
+
+class WavFileSinkTest(FileSinkTestMixin, unittest.TestCase):
+
+    sink_class = spotify.WavFileSink
+    header_size = 44
+
+    def read_header(self, path):
+        with open(path, 'rb') as fh:
+            return struct.unpack(str('<4sI4s4sIHHIIHH4sI'), fh.read(44))
+
+    def test_header_is_patched_with_lengths_on_off(self):
+        sink = self.create_sink('out.wav')
+
+        self.deliver(sink, b'\x00' * 6)
+        sink.off()
+
+        self.assertEqual(self.read_header(sink.paths[0]), (
+            b'RIFF', 42, b'WAVE', b'fmt ', 16, 1, 1, 8000, 16000, 2, 16,
+            b'data', 6))
+
+    def test_header_is_patched_when_file_is_continued(self):
+        sink = self.create_sink('out.wav')
+
+        self.deliver(sink, b'\x00' * 6)
+        sink.off()
+        sink.on()
+        self.deliver(sink, b'\x00' * 4)
+        sink.off()
+
+        self.assertEqual(self.read_header(sink.paths[0]), (
+            b'RIFF', 46, b'WAVE', b'fmt ', 16, 1, 1, 8000, 16000, 2, 16,
+            b'data', 10))
+
+    def test_header_is_patched_when_file_is_rotated(self):
+        sink = self.create_sink('track-{index}.wav')
+
+        self.deliver(sink, b'\x00' * 4)
+        sink._on_end_of_track(self.session)
+        self.deliver(sink, b'\x00' * 8)
+        sink.off()
+
+        self.assertEqual(self.read_header(sink.paths[0])[-1], 4)
+        self.assertEqual(self.read_header(sink.paths[1])[-1], 8)
+
+    def test_samples_are_little_endian(self):
+        sink = self.create_sink('out.wav')
+        samples = array.array(str('h'), [1, -2])
+        if utils.PY2:
+            frames = samples.tostring()
+        else:
+            frames = samples.tobytes()
+
+        self.deliver(sink, frames)
+        sink.off()
+
+        self.assertEqual(
+            self.read_data(sink.paths[0]), struct.pack(str('<hh'), 1, -2))
+
+
+class BranchListener(object):
+
+    def __init__(self, stalled=False):
+        self.running = threading.Event()
+        if not stalled:
+            self.running.set()
+        self.audio_formats = []
+        self.data = b''
+
+    def __call__(self, session, audio_format, frames, num_frames):
+        if not self.running.is_set():
+            return 0
+        self.audio_formats.append(audio_format)
+        self.data += frames
+        return num_frames
+
+
+class TeeSinkTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = mock.Mock()
+        self.session.num_listeners.return_value = 0
+        self.tee = spotify.TeeSink(self.session)
+        self.audio_format = create_audio_format(sample_rate=4)
+
+    def tearDown(self):
+        self.tee.off()
+
+    def add_branch(self, policy=spotify.TeePolicy.BACKPRESSURE, stalled=False):
+        branch = self.tee.add_branch(policy)
+        branch._retry_interval = 0.001
+        listener = BranchListener(stalled=stalled)
+        branch.on(spotify.SessionEvent.MUSIC_DELIVERY, listener)
+        return branch, listener
+
+    def deliver(self, data, audio_format=None):
+        return self.tee._on_music_delivery(
+            self.session, audio_format or self.audio_format, data,
+            len(data) // 4)
+
+    def fill(self, branch):
+        # Fill the ring buffer of a branch with a stalled listener, after the
+        # branch's thread has taken the first frames off the ring buffer.
+        self.assertEqual(self.deliver(b'aaaabbbbccccdddd'), 4)
+        self.assertTrue(wait_for(lambda: branch._ring.num_frames == 0))
+        self.assertEqual(self.deliver(b'eeeeffffgggghhhh'), 4)
+
+    def test_init_connects_to_session_events(self):
+        self.session.on.assert_any_call(
+            spotify.SessionEvent.MUSIC_DELIVERY, self.tee._on_music_delivery)
+        self.session.on.assert_any_call(
+            spotify.SessionEvent.GET_AUDIO_BUFFER_STATS,
+            self.tee._on_get_audio_buffer_stats)
+        self.session.on.assert_any_call(
+            spotify.SessionEvent.END_OF_TRACK, self.tee._on_end_of_track)
+
+    def test_off_disconnects_and_stops_branches(self):
+        branch, listener = self.add_branch()
+        self.deliver(b'aaaa')
+
+        self.tee.off()
+
+        self.session.off.assert_any_call(
+            spotify.SessionEvent.MUSIC_DELIVERY, self.tee._on_music_delivery)
+        self.session.off.assert_any_call(
+            spotify.SessionEvent.GET_AUDIO_BUFFER_STATS,
+            self.tee._on_get_audio_buffer_stats)
+        self.session.off.assert_any_call(
+            spotify.SessionEvent.END_OF_TRACK, self.tee._on_end_of_track)
+        self.assertIsNone(branch._pump)
+
+    def test_add_branch(self):
+        branch = self.tee.add_branch(spotify.TeePolicy.DROP)
+
+        self.assertIsInstance(branch, spotify.TeeBranch)
+        self.assertEqual(branch.policy, spotify.TeePolicy.DROP)
+        self.assertEqual(self.tee.branches, (branch,))
+
+    def test_add_branch_fails_with_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            self.tee.add_branch('foo')
+
+    def test_music_delivery_without_branches_consumes_all_frames(self):
+        self.assertEqual(self.deliver(b'aaaabbbb'), 2)
+
+    def test_music_delivery_passes_frames_to_all_branches(self):
+        branch1, listener1 = self.add_branch()
+        branch2, listener2 = self.add_branch(spotify.TeePolicy.DROP)
+
+        num_frames_consumed = self.deliver(b'aaaabbbb')
+
+        self.assertEqual(num_frames_consumed, 2)
+        self.assertTrue(wait_for(lambda: listener1.data == b'aaaabbbb'))
+        self.assertTrue(wait_for(lambda: listener2.data == b'aaaabbbb'))
+        self.assertEqual(listener1.audio_formats, [self.audio_format])
+        self.assertTrue(wait_for(lambda: branch2.stats.delivered_frames == 2))
+
+    def test_branch_added_during_playback_gets_following_frames(self):
+        self.deliver(b'aaaa')
+        branch, listener = self.add_branch()
+
+        self.deliver(b'bbbb')
+
+        self.assertTrue(wait_for(lambda: listener.data == b'bbbb'))
+
+    def test_branch_without_listener_discards_frames(self):
+        branch = self.tee.add_branch()
+
+        self.deliver(b'aaaabbbb')
+
+        self.assertTrue(wait_for(lambda: branch.buffered_frames == 0))
+
+    def test_frames_not_consumed_by_branch_listener_are_delivered_again(self):
+        branch, listener = self.add_branch(stalled=True)
+        self.deliver(b'aaaabbbb')
+        self.assertTrue(wait_for(lambda: branch._ring.num_frames == 0))
+
+        listener.running.set()
+
+        self.assertTrue(wait_for(lambda: listener.data == b'aaaabbbb'))
+
+    def test_failing_branch_listener_is_logged(self):
+        branch = self.tee.add_branch()
+        branch.on(
+            spotify.SessionEvent.MUSIC_DELIVERY,
+            mock.Mock(side_effect=Exception('Boom')))
+
+        with mock.patch('spotify.sink.logger') as logger_mock:
+            self.deliver(b'aaaa')
+
+            self.assertTrue(wait_for(lambda: logger_mock.exception.called))
+        self.assertTrue(wait_for(lambda: branch.buffered_frames == 0))
+
+    def test_backpressure_policy_consumes_only_what_there_is_room_for(self):
+        branch, listener = self.add_branch(stalled=True)
+        self.fill(branch)
+
+        self.assertEqual(self.deliver(b'iiii'), 0)
+        stats = branch.stats
+        self.assertEqual(stats.buffered_frames, 8)
+        self.assertEqual(stats.lag, 2.0)
+        self.assertEqual(stats.max_lag, 2.0)
+        self.assertEqual(stats.dropped_frames, 0)
+
+        listener.running.set()
+
+        self.assertTrue(wait_for(lambda: branch.stats.delivered_frames == 8))
+        self.assertEqual(listener.data, b'aaaabbbbccccddddeeeeffffgggghhhh')
+        self.assertEqual(branch.stats.lag, 0.0)
+        self.assertEqual(branch.stats.max_lag, 2.0)
+
+    def test_slow_backpressure_branch_slows_down_other_branches(self):
+        slow_branch, slow_listener = self.add_branch(stalled=True)
+        fast_branch, fast_listener = self.add_branch()
+        self.fill(slow_branch)
+
+        self.assertEqual(self.deliver(b'iiii'), 0)
+
+        self.assertTrue(wait_for(
+            lambda: fast_listener.data == b'aaaabbbbccccddddeeeeffffgggghhhh'))
+
+    def test_drop_policy_drops_frames_for_that_branch_only(self):
+        slow_branch, slow_listener = self.add_branch(
+            spotify.TeePolicy.DROP, stalled=True)
+        fast_branch, fast_listener = self.add_branch(spotify.TeePolicy.DROP)
+        self.fill(slow_branch)
+        self.assertTrue(wait_for(lambda: fast_branch.buffered_frames == 0))
+
+        self.assertEqual(self.deliver(b'iiiijjjj'), 2)
+
+        self.assertEqual(slow_branch.stats.dropped_frames, 2)
+        self.assertTrue(wait_for(lambda: fast_listener.data.endswith(
+            b'eeeeffffgggghhhhiiiijjjj')))
+        self.assertEqual(fast_branch.stats.dropped_frames, 0)
+        slow_listener.running.set()
+        self.assertTrue(wait_for(
+            lambda: slow_listener.data == b'aaaabbbbccccddddeeeeffffgggghhhh'))
+
+    def test_block_policy_waits_for_room_in_branch(self):
+        branch, listener = self.add_branch(
+            spotify.TeePolicy.BLOCK, stalled=True)
+        self.fill(branch)
+        result = []
+        delivery = threading.Thread(
+            target=lambda: result.append(self.deliver(b'iiiijjjj')))
+        delivery.start()
+
+        time.sleep(0.05)
+        self.assertEqual(result, [])
+        listener.running.set()
+        delivery.join(1.0)
+
+        self.assertEqual(result, [2])
+        self.assertGreater(branch.stats.blocked_time, 0)
+        self.assertTrue(wait_for(lambda: listener.data.endswith(b'iiiijjjj')))
+
+    def test_block_policy_waits_for_no_more_than_the_ring_buffer_holds(self):
+        branch, listener = self.add_branch(spotify.TeePolicy.BLOCK)
+
+        self.assertEqual(self.deliver(b'aaaabbbbccccddddeeee'), 4)
+
+    def test_removed_branch_stops_getting_frames(self):
+        branch, listener = self.add_branch()
+
+        self.tee.remove_branch(branch)
+        self.deliver(b'aaaa')
+
+        self.assertEqual(self.tee.branches, ())
+        self.assertIsNone(branch._pump)
+        self.assertEqual(listener.data, b'')
+
+    def test_removing_blocking_branch_releases_delivery(self):
+        branch, listener = self.add_branch(
+            spotify.TeePolicy.BLOCK, stalled=True)
+        self.fill(branch)
+        result = []
+        delivery = threading.Thread(
+            target=lambda: result.append(self.deliver(b'iiii')))
+        delivery.start()
+
+        time.sleep(0.01)
+        self.tee.remove_branch(branch)
+        delivery.join(1.0)
+
+        self.assertEqual(result, [1])
+
+    def test_format_change_waits_for_branches_to_pass_on_old_frames(self):
+        branch, listener = self.add_branch(stalled=True)
+        self.deliver(b'aaaa')
+        new_format = create_audio_format(sample_rate=8)
+
+        self.assertEqual(self.deliver(b'bbbb', new_format), 0)
+        listener.running.set()
+        self.assertTrue(wait_for(lambda: branch.buffered_frames == 0))
+
+        self.assertEqual(self.deliver(b'bbbb', new_format), 1)
+        self.assertTrue(wait_for(lambda: listener.data == b'aaaabbbb'))
+        self.assertEqual(
+            listener.audio_formats, [self.audio_format, new_format])
+        self.assertEqual(branch._ring.capacity, 8)
+
+    def test_end_of_track_is_passed_on_after_frames_before_it(self):
+        branch, listener = self.add_branch(stalled=True)
+        data_at_end_of_track = []
+        branch.on(
+            spotify.SessionEvent.END_OF_TRACK,
+            lambda session: data_at_end_of_track.append(listener.data))
+        self.deliver(b'aaaabbbb')
+        self.tee._on_end_of_track(self.session)
+        self.deliver(b'cccc')
+
+        time.sleep(0.01)
+        self.assertEqual(data_at_end_of_track, [])
+        listener.running.set()
+
+        self.assertTrue(wait_for(lambda: listener.data == b'aaaabbbbcccc'))
+        self.assertEqual(data_at_end_of_track, [b'aaaabbbb'])
+
+    def test_end_of_track_before_any_frames_is_passed_on_at_once(self):
+        branch = self.tee.add_branch()
+        end_of_track_mock = mock.Mock()
+        branch.on(spotify.SessionEvent.END_OF_TRACK, end_of_track_mock)
+
+        self.tee._on_end_of_track(self.session)
+
+        end_of_track_mock.assert_called_once_with(branch)
+
+    def test_file_sink_on_branch_starts_new_file_for_each_track(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        branch = self.tee.add_branch(spotify.TeePolicy.BLOCK)
+        sink = spotify.RawFileSink(
+            branch, os.path.join(tmp_dir, 'track-{index}.pcm'))
+
+        self.deliver(b'aaaabbbb')
+        self.tee._on_end_of_track(self.session)
+        self.deliver(b'cccc')
+        self.assertTrue(wait_for(lambda: branch.buffered_frames == 0))
+        sink.off()
+
+        self.assertEqual(sink.paths, [
+            os.path.join(tmp_dir, 'track-1.pcm'),
+            os.path.join(tmp_dir, 'track-2.pcm'),
+        ])
+        with open(sink.paths[0], 'rb') as fh:
+            self.assertEqual(fh.read(), b'aaaabbbb')
+        with open(sink.paths[1], 'rb') as fh:
+            self.assertEqual(fh.read(), b'cccc')
+
+    def test_get_audio_buffer_stats(self):
+        branch1, listener1 = self.add_branch(stalled=True)
+        branch2, listener2 = self.add_branch()
+        branch2.on(
+            spotify.SessionEvent.GET_AUDIO_BUFFER_STATS,
+            lambda session: spotify.AudioBufferStats(7, 3))
+        self.deliver(b'aaaabbbbcccc')
+        self.assertTrue(wait_for(lambda: listener2.data == b'aaaabbbbcccc'))
+
+        stats = self.tee._on_get_audio_buffer_stats(self.session)
+
+        self.assertEqual(stats, spotify.AudioBufferStats(3, 3))
+
+    def test_get_audio_buffer_stats_reports_fewest_buffered_frames(self):
+        branch1, listener1 = self.add_branch(stalled=True)
+        branch2, listener2 = self.add_branch()
+        branch2.on(
+            spotify.SessionEvent.GET_AUDIO_BUFFER_STATS,
+            lambda session: spotify.AudioBufferStats(1, 0))
+        self.deliver(b'aaaabbbbcccc')
+        self.assertTrue(wait_for(lambda: listener2.data == b'aaaabbbbcccc'))
+
+        stats = self.tee._on_get_audio_buffer_stats(self.session)
+
+        self.assertEqual(branch1.buffered_frames, 3)
+        self.assertEqual(stats, spotify.AudioBufferStats(1, 0))
+
+    def test_get_audio_buffer_stats_without_branches(self):
+        stats = self.tee._on_get_audio_buffer_stats(self.session)
+
+        self.assertEqual(stats, spotify.AudioBufferStats(0, 0))
+
+    def test_sinks_can_be_connected_to_branches(self):
+        sink1 = spotify.NullSink(self.tee.add_branch())
+        sink2 = spotify.NullSink(self.tee.add_branch())
+
+        self.deliver(b'aaaabbbb')
 
-        self.sink._stream.write.assert_called_with(
-            mock.sentinel.frames, num_frames=mock.sentinel.num_frames)
-        self.assertEqual(num_consumed_frames, mock.sentinel.num_frames)
+        self.assertTrue(wait_for(lambda: sink1.stats.frames == 2))
+        self.assertTrue(wait_for(lambda: sink2.stats.frames == 2))
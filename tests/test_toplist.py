@@ -88,6 +88,24 @@ class ToplistTest(unittest.TestCase):
         result.complete_event.wait(3)
         callback.assert_called_with(result)
 
+    def test_future_is_done_when_toplist_completes(self, lib_mock):
+        sp_toplistbrowse = spotify.ffi.cast(
+            'sp_toplistbrowse *', spotify.ffi.new('int *'))
+        lib_mock.sp_toplistbrowse_create.return_value = sp_toplistbrowse
+        lib_mock.sp_toplistbrowse_error.return_value = spotify.ErrorType.OK
+
+        result = spotify.Toplist(
+            self.session, type=spotify.ToplistType.TRACKS,
+            region=spotify.ToplistRegion.USER)
+        self.assertFalse(result.future.done())
+
+        toplistbrowse_complete_cb = (
+            lib_mock.sp_toplistbrowse_create.call_args[0][4])
+        userdata = lib_mock.sp_toplistbrowse_create.call_args[0][5]
+        toplistbrowse_complete_cb(sp_toplistbrowse, userdata)
+
+        self.assertIs(result.future.result(timeout=3), result)
+
     def test_toplist_is_gone_before_callback_is_called(self, lib_mock):
         sp_toplistbrowse = spotify.ffi.cast(
             'sp_toplistbrowse *', spotify.ffi.new('int *'))
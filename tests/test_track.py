@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 
 import unittest
+import weakref
 
 import spotify
 import tests
@@ -57,6 +58,25 @@ class TrackTest(unittest.TestCase):
 
         lib_mock.sp_track_add_ref.assert_called_with(sp_track)
 
+    def test_cached_track(self, lib_mock):
+        sp_track = spotify.ffi.new('int *')
+
+        result1 = spotify.Track._cached(self.session, sp_track)
+        result2 = spotify.Track._cached(self.session, sp_track)
+
+        self.assertIsInstance(result1, spotify.Track)
+        self.assertIs(result1, result2)
+        lib_mock.sp_track_add_ref.assert_called_once_with(sp_track)
+
+    def test_cached_track_releases_new_ref_if_already_cached(self, lib_mock):
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track._cached(self.session, sp_track)
+
+        result = spotify.Track._cached(self.session, sp_track, add_ref=False)
+
+        self.assertIs(result, track)
+        lib_mock.sp_track_release.assert_called_once_with(sp_track)
+
     def test_releases_sp_track_when_track_dies(self, lib_mock):
         sp_track = spotify.ffi.new('int *')
 
@@ -66,6 +86,14 @@ class TrackTest(unittest.TestCase):
 
         lib_mock.sp_track_release.assert_called_with(sp_track)
 
+    def test_has_no_instance_dict(self, lib_mock):
+        sp_track = spotify.ffi.new('int *')
+
+        track = spotify.Track(self.session, sp_track=sp_track)
+
+        self.assertFalse(hasattr(track, '__dict__'))
+        self.assertIs(weakref.ref(track)(), track)
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_repr(self, link_mock, lib_mock):
         link_instance_mock = link_mock.return_value
@@ -107,6 +135,17 @@ class TrackTest(unittest.TestCase):
 
         load_mock.assert_called_with(self.session, track, timeout=10)
 
+    @mock.patch('spotify.utils.load_async')
+    def test_load_async(self, load_async_mock, lib_mock):
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+        load_async_mock.return_value = mock.sentinel.future
+
+        result = track.load_async(10)
+
+        load_async_mock.assert_called_with(self.session, track, timeout=10)
+        self.assertIs(result, mock.sentinel.future)
+
     def test_offline_status(self, lib_mock):
         lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
         lib_mock.sp_track_offline_get_status.return_value = 2
@@ -307,6 +346,20 @@ class TrackTest(unittest.TestCase):
         lib_mock.sp_track_set_starred.assert_called_with(
             self.session._sp_session, mock.ANY, 1, 1)
 
+    def test_set_starred_forgets_memoized_starred(self, lib_mock):
+        self.session.memoize_metadata = True
+        lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
+        lib_mock.sp_track_is_loaded.return_value = 1
+        lib_mock.sp_track_is_starred.side_effect = [0, 1]
+        lib_mock.sp_track_set_starred.return_value = spotify.ErrorType.OK
+        sp_track = spotify.ffi.cast('sp_track *', spotify.ffi.new('int *'))
+        track = spotify.Track(self.session, sp_track=sp_track)
+        self.assertIs(track.starred, False)
+
+        track.starred = True
+
+        self.assertIs(track.starred, True)
+
     def test_set_starred_fails_if_error(self, lib_mock):
         tests.create_session()
         lib_mock.sp_track_set_starred.return_value = (
@@ -406,6 +459,22 @@ class TrackTest(unittest.TestCase):
         lib_mock.sp_track_name.assert_called_once_with(sp_track)
         self.assertEqual(result, 'Foo Bar Baz')
 
+    def test_name_is_memoized_if_enabled(self, lib_mock):
+        self.session.memoize_metadata = True
+        lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
+        lib_mock.sp_track_is_loaded.return_value = 1
+        lib_mock.sp_track_name.return_value = spotify.ffi.new(
+            'char[]', b'Foo Bar Baz')
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+
+        result1 = track.name
+        result2 = track.name
+
+        lib_mock.sp_track_name.assert_called_once_with(sp_track)
+        self.assertEqual(result1, 'Foo Bar Baz')
+        self.assertEqual(result2, 'Foo Bar Baz')
+
     def test_name_is_none_if_unloaded(self, lib_mock):
         lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
         lib_mock.sp_track_name.return_value = spotify.ffi.new('char[]', b'')
@@ -492,6 +561,23 @@ class TrackTest(unittest.TestCase):
         lib_mock.sp_track_disc.assert_called_with(sp_track)
         self.assertIsNone(result)
 
+    def test_disc_is_not_memoized(self, lib_mock):
+        # The disc number is only known once the track is part of an album
+        # or artist browser, so a value read before browsing must not stick.
+        self.session.memoize_metadata = True
+        lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
+        lib_mock.sp_track_is_loaded.return_value = 1
+        lib_mock.sp_track_disc.return_value = 0
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+
+        result1 = track.disc
+        lib_mock.sp_track_disc.return_value = 2
+        result2 = track.disc
+
+        self.assertIsNone(result1)
+        self.assertEqual(result2, 2)
+
     def test_disc_fails_if_error(self, lib_mock):
         self.assert_fails_if_error(lib_mock, lambda t: t.disc)
 
@@ -517,9 +603,46 @@ class TrackTest(unittest.TestCase):
         lib_mock.sp_track_index.assert_called_with(sp_track)
         self.assertIsNone(result)
 
+    def test_index_is_not_memoized(self, lib_mock):
+        self.session.memoize_metadata = True
+        lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
+        lib_mock.sp_track_is_loaded.return_value = 1
+        lib_mock.sp_track_index.return_value = 0
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+
+        result1 = track.index
+        lib_mock.sp_track_index.return_value = 7
+        result2 = track.index
+
+        self.assertIsNone(result1)
+        self.assertEqual(result2, 7)
+
     def test_index_fails_if_error(self, lib_mock):
         self.assert_fails_if_error(lib_mock, lambda t: t.index)
 
+    @mock.patch('spotify.fetch_metadata_many')
+    def test_fetch_metadata(self, fetch_mock, lib_mock):
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+        fetch_mock.return_value = [mock.sentinel.metadata]
+
+        result = track.fetch_metadata()
+
+        fetch_mock.assert_called_once_with([track])
+        self.assertEqual(result, mock.sentinel.metadata)
+
+    @mock.patch('spotify.snapshot_many')
+    def test_snapshot(self, snapshot_mock, lib_mock):
+        sp_track = spotify.ffi.new('int *')
+        track = spotify.Track(self.session, sp_track=sp_track)
+        snapshot_mock.return_value = [mock.sentinel.snapshot]
+
+        result = track.snapshot()
+
+        snapshot_mock.assert_called_once_with([track])
+        self.assertEqual(result, mock.sentinel.snapshot)
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_link_creates_link_to_track(self, link_mock, lib_mock):
         sp_track = spotify.ffi.new('int *')
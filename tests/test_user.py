@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 
 import unittest
+import weakref
 
 import spotify
 import tests
@@ -48,6 +49,25 @@ class UserTest(unittest.TestCase):
 
         lib_mock.sp_user_add_ref.assert_called_once_with(sp_user)
 
+    def test_cached_user(self, lib_mock):
+        sp_user = spotify.ffi.new('int *')
+
+        result1 = spotify.User._cached(self.session, sp_user)
+        result2 = spotify.User._cached(self.session, sp_user)
+
+        self.assertIsInstance(result1, spotify.User)
+        self.assertIs(result1, result2)
+        lib_mock.sp_user_add_ref.assert_called_once_with(sp_user)
+
+    def test_cached_user_releases_new_ref_if_already_cached(self, lib_mock):
+        sp_user = spotify.ffi.new('int *')
+        user = spotify.User._cached(self.session, sp_user)
+
+        result = spotify.User._cached(self.session, sp_user, add_ref=False)
+
+        self.assertIs(result, user)
+        lib_mock.sp_user_release.assert_called_once_with(sp_user)
+
     def test_releases_sp_user_when_user_dies(self, lib_mock):
         sp_user = spotify.ffi.new('int *')
 
@@ -57,6 +77,14 @@ class UserTest(unittest.TestCase):
 
         lib_mock.sp_user_release.assert_called_with(sp_user)
 
+    def test_has_no_instance_dict(self, lib_mock):
+        sp_user = spotify.ffi.new('int *')
+
+        user = spotify.User(self.session, sp_user=sp_user)
+
+        self.assertFalse(hasattr(user, '__dict__'))
+        self.assertIs(weakref.ref(user)(), user)
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_repr(self, link_mock, lib_mock):
         link_instance_mock = link_mock.return_value
@@ -109,6 +137,17 @@ class UserTest(unittest.TestCase):
 
         load_mock.assert_called_with(self.session, user, timeout=10)
 
+    @mock.patch('spotify.utils.load_async')
+    def test_load_async(self, load_async_mock, lib_mock):
+        sp_user = spotify.ffi.new('int *')
+        user = spotify.User(self.session, sp_user=sp_user)
+        load_async_mock.return_value = mock.sentinel.future
+
+        result = user.load_async(10)
+
+        load_async_mock.assert_called_with(self.session, user, timeout=10)
+        self.assertIs(result, mock.sentinel.future)
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_link_creates_link_to_user(self, link_mock, lib_mock):
         sp_user = spotify.ffi.new('int *')
@@ -2,6 +2,8 @@
 
 from __future__ import unicode_literals
 
+import sys
+import threading
 import unittest
 
 import spotify
@@ -96,6 +98,111 @@ class EventEmitterTest(unittest.TestCase):
         self.assertEqual(listener_mock1.call_count, 1)
         self.assertEqual(listener_mock2.call_count, 2)
 
+    def test_listener_registered_with_once_is_called_once(self):
+        listener_mock = mock.Mock()
+        emitter = utils.EventEmitter()
+
+        emitter.once('some_event', listener_mock, 123)
+        emitter.emit('some_event', 'abc')
+        emitter.emit('some_event', 'def')
+
+        listener_mock.assert_called_once_with('abc', 123)
+        self.assertEqual(emitter.num_listeners('some_event'), 0)
+
+    def test_once_only_removes_the_listener_that_was_called(self):
+        listener_mock = mock.Mock()
+        emitter = utils.EventEmitter()
+
+        emitter.on('some_event', listener_mock, 1)
+        emitter.once('some_event', listener_mock, 1)
+        emitter.emit('some_event')
+        emitter.emit('some_event')
+
+        self.assertEqual(listener_mock.call_count, 3)
+        self.assertEqual(emitter.num_listeners('some_event'), 1)
+
+    def test_emit_from_other_thread_in_single_threaded_lock_mode(self):
+        spotify.set_lock_mode(spotify.LockMode.SINGLE_THREADED)
+        self.addCleanup(spotify.set_lock_mode, spotify.LockMode.GLOBAL)
+        once_mock = mock.Mock()
+        false_mock = mock.Mock(return_value=False)
+        emitter = utils.EventEmitter()
+        emitter.once('once_event', once_mock)
+        emitter.on('false_event', false_mock)
+        errors = []
+
+        def emit():
+            try:
+                emitter.emit('once_event')
+                emitter.emit('false_event')
+            except Exception as exc:
+                errors.append(exc)
+
+        thread = threading.Thread(target=emit)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(errors, [])
+        once_mock.assert_called_once_with()
+        false_mock.assert_called_once_with()
+        self.assertEqual(emitter.num_listeners(), 0)
+
+    def test_listener_registered_with_once_can_be_removed(self):
+        listener_mock = mock.Mock()
+        emitter = utils.EventEmitter()
+
+        emitter.once('some_event', listener_mock)
+        emitter.off('some_event', listener_mock)
+        emitter.emit('some_event')
+
+        self.assertEqual(listener_mock.call_count, 0)
+
+    def test_listener_registered_with_once_is_removed_before_call(self):
+        emitter = utils.EventEmitter()
+        listener_mock = mock.Mock(
+            side_effect=lambda: emitter.emit('some_event'))
+
+        emitter.once('some_event', listener_mock)
+        emitter.emit('some_event')
+
+        self.assertEqual(listener_mock.call_count, 1)
+
+    def test_listeners_added_while_emitting_are_called_next_time(self):
+        listener_mock2 = mock.Mock()
+        emitter = utils.EventEmitter()
+        listener_mock1 = mock.Mock(
+            side_effect=lambda: emitter.on('some_event', listener_mock2))
+
+        emitter.on('some_event', listener_mock1)
+        emitter.emit('some_event')
+        self.assertEqual(listener_mock2.call_count, 0)
+
+        emitter.emit('some_event')
+        self.assertEqual(listener_mock2.call_count, 1)
+
+    def test_listeners_are_stored_as_tuples(self):
+        emitter = utils.EventEmitter()
+
+        emitter.on('some_event', mock.Mock())
+
+        self.assertIsInstance(emitter._listeners['some_event'], tuple)
+
+    def test_num_listeners_does_not_register_event(self):
+        emitter = utils.EventEmitter()
+
+        emitter.num_listeners('some_event')
+
+        self.assertEqual(emitter._listeners, {})
+
+    def test_removing_last_listener_unregisters_event(self):
+        listener_mock = mock.Mock()
+        emitter = utils.EventEmitter()
+
+        emitter.on('some_event', listener_mock)
+        emitter.off('some_event', listener_mock)
+
+        self.assertEqual(emitter._listeners, {})
+
     def test_num_listeners_returns_total_number_of_listeners(self):
         listener_mock1 = mock.Mock()
         listener_mock2 = mock.Mock()
@@ -152,6 +259,370 @@ class EventEmitterTest(unittest.TestCase):
         self.assertEqual(result, listener_mock.return_value)
 
 
+class FakeExecutor(object):
+
+    def __init__(self):
+        self.tasks = []
+
+    def submit(self, func, *args):
+        self.tasks.append((func, args))
+
+    def run_all(self):
+        while self.tasks:
+            func, args = self.tasks.pop(0)
+            func(*args)
+
+
+class EventEmitterExecutorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = FakeExecutor()
+        self.emitter = utils.EventEmitter()
+
+    def test_listeners_are_called_by_executor(self):
+        listener_mock = mock.Mock()
+        self.emitter.on('some_event', listener_mock, 'user_arg')
+        self.emitter.set_executor(self.executor)
+
+        self.emitter.emit('some_event', 'abc')
+
+        self.assertEqual(listener_mock.call_count, 0)
+        self.executor.run_all()
+        listener_mock.assert_called_once_with('abc', 'user_arg')
+
+    def test_executor_for_single_event(self):
+        listener_mock1 = mock.Mock()
+        listener_mock2 = mock.Mock()
+        self.emitter.on('foo', listener_mock1)
+        self.emitter.on('bar', listener_mock2)
+        self.emitter.set_executor(self.executor, 'foo')
+
+        self.emitter.emit('foo')
+        self.emitter.emit('bar')
+
+        self.assertEqual(listener_mock1.call_count, 0)
+        self.assertEqual(listener_mock2.call_count, 1)
+        self.assertIsNone(self.emitter.get_dispatch_stats('bar'))
+        self.assertIsNotNone(self.emitter.get_dispatch_stats('foo'))
+
+    def test_executor_can_be_removed(self):
+        listener_mock = mock.Mock()
+        self.emitter.on('some_event', listener_mock)
+        self.emitter.set_executor(self.executor)
+        self.emitter.set_executor(None)
+
+        self.emitter.emit('some_event')
+
+        self.assertEqual(listener_mock.call_count, 1)
+        self.assertEqual(self.executor.tasks, [])
+
+    def test_calls_to_each_listener_are_made_in_order_by_one_task(self):
+        calls = []
+        self.emitter.on('some_event', lambda i: calls.append(('a', i)))
+        self.emitter.on('some_event', lambda i: calls.append(('b', i)))
+        self.emitter.set_executor(self.executor)
+
+        for i in range(3):
+            self.emitter.emit('some_event', i)
+
+        self.assertEqual(len(self.executor.tasks), 2)
+        self.executor.run_all()
+        self.assertEqual(
+            calls,
+            [('a', 0), ('a', 1), ('a', 2), ('b', 0), ('b', 1), ('b', 2)])
+
+    @unittest.skipIf(utils.concurrent is None, 'Requires concurrent.futures')
+    def test_calls_are_in_order_with_a_thread_pool(self):
+        concurrent_futures = utils.concurrent.futures
+        calls = []
+        lock = threading.Lock()
+
+        def listener(i):
+            with lock:
+                calls.append(i)
+
+        self.emitter.on('some_event', listener)
+        executor = concurrent_futures.ThreadPoolExecutor(max_workers=4)
+        self.emitter.set_executor(executor)
+
+        for i in range(100):
+            self.emitter.emit('some_event', i)
+        executor.shutdown(wait=True)
+
+        self.assertEqual(calls, list(range(100)))
+
+    @unittest.skipIf(sys.version_info < (3, 4), 'Requires asyncio')
+    def test_asyncio_event_loop_as_executor(self):
+        import asyncio
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        listener_mock = mock.Mock()
+        self.emitter.on('some_event', listener_mock)
+        self.emitter.set_executor(loop)
+
+        self.emitter.emit('some_event', 'abc')
+        loop.run_until_complete(asyncio.sleep(0))
+
+        listener_mock.assert_called_once_with('abc')
+
+    def test_fails_if_executor_is_neither_executor_nor_event_loop(self):
+        with self.assertRaises(TypeError):
+            self.emitter.set_executor(object())
+
+    def test_listener_returning_false_is_removed(self):
+        listener_mock = mock.Mock(return_value=False)
+        self.emitter.on('some_event', listener_mock)
+        self.emitter.set_executor(self.executor)
+
+        self.emitter.emit('some_event')
+        self.executor.run_all()
+        self.emitter.emit('some_event')
+        self.executor.run_all()
+
+        self.assertEqual(listener_mock.call_count, 1)
+
+    @mock.patch('spotify.utils.logger')
+    def test_listener_exception_is_logged(self, logger_mock):
+        listener_mock = mock.Mock(side_effect=[Exception('boom'), None])
+        self.emitter.on('some_event', listener_mock)
+        self.emitter.set_executor(self.executor)
+
+        self.emitter.emit('some_event', 1)
+        self.emitter.emit('some_event', 2)
+        self.executor.run_all()
+
+        self.assertEqual(listener_mock.call_count, 2)
+        self.assertEqual(logger_mock.exception.call_count, 1)
+
+    def test_no_dispatch_stats_without_executor(self):
+        self.assertIsNone(self.emitter.get_dispatch_stats())
+
+    @mock.patch('spotify.utils._clock')
+    def test_dispatch_stats(self, clock_mock):
+        clock_mock.side_effect = [1.0, 2.0, 4.0, 7.0]
+        self.emitter.on('some_event', mock.Mock())
+        self.emitter.set_executor(self.executor)
+
+        self.emitter.emit('some_event')
+        self.emitter.emit('some_event')
+
+        stats = self.emitter.get_dispatch_stats()
+        self.assertEqual(stats.queue_depth, 2)
+        self.assertEqual(stats.max_queue_depth, 2)
+        self.assertEqual(stats.dispatched, 0)
+
+        self.executor.run_all()
+
+        stats = self.emitter.get_dispatch_stats()
+        self.assertEqual(stats.queue_depth, 0)
+        self.assertEqual(stats.max_queue_depth, 2)
+        self.assertEqual(stats.dispatched, 2)
+        self.assertEqual(stats.latency, 8.0)
+        self.assertEqual(stats.max_latency, 5.0)
+
+
+class Listener(object):
+
+    def on_event(self, *args):
+        pass
+
+
+class ListenerStatsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.emitter = utils.EventEmitter()
+
+    def test_no_listener_stats_by_default(self):
+        self.assertIsNone(self.emitter.get_listener_stats())
+
+    @mock.patch('spotify.utils._clock')
+    def test_records_calls_per_event_and_listener(self, clock_mock):
+        clock_mock.side_effect = [1.0, 2.0, 3.0, 6.0, 7.0, 7.5]
+        listener = Listener()
+        self.emitter.on('foo', listener.on_event)
+        self.emitter.on('bar', listener.on_event)
+        self.emitter.enable_listener_stats()
+
+        self.emitter.emit('foo')
+        self.emitter.emit('foo')
+        self.emitter.emit('bar')
+
+        stats = self.emitter.get_listener_stats()
+        name = 'tests.test_utils.Listener.on_event'
+        self.assertEqual(set(stats.keys()), {('foo', name), ('bar', name)})
+        self.assertEqual(
+            stats[('foo', name)],
+            utils.ListenerStats('foo', name, 2, 4.0, 3.0))
+        self.assertEqual(
+            stats[('bar', name)],
+            utils.ListenerStats('bar', name, 1, 0.5, 0.5))
+
+    def test_listener_return_value_is_kept(self):
+        listener_mock = mock.Mock(return_value=False)
+        self.emitter.on('some_event', listener_mock)
+        self.emitter.enable_listener_stats()
+
+        self.emitter.emit('some_event')
+
+        self.assertEqual(self.emitter.num_listeners('some_event'), 0)
+
+    def test_records_failing_listener(self):
+        listener_mock = mock.Mock(side_effect=Exception('boom'))
+        self.emitter.on('some_event', listener_mock)
+        self.emitter.enable_listener_stats()
+
+        with self.assertRaises(Exception):
+            self.emitter.emit('some_event')
+
+        stats = list(self.emitter.get_listener_stats().values())
+        self.assertEqual(stats[0].count, 1)
+
+    def test_records_call(self):
+        self.emitter.on('some_event', mock.Mock(return_value=123))
+        self.emitter.enable_listener_stats()
+
+        result = self.emitter.call('some_event')
+
+        self.assertEqual(result, 123)
+        stats = list(self.emitter.get_listener_stats().values())
+        self.assertEqual(stats[0].count, 1)
+
+    def test_records_calls_made_by_executor(self):
+        executor = FakeExecutor()
+        self.emitter.on('some_event', mock.Mock())
+        self.emitter.set_executor(executor)
+        self.emitter.enable_listener_stats()
+
+        self.emitter.emit('some_event')
+        self.assertEqual(self.emitter.get_listener_stats(), {})
+        executor.run_all()
+
+        stats = list(self.emitter.get_listener_stats().values())
+        self.assertEqual(stats[0].count, 1)
+
+    def test_disable_discards_stats(self):
+        self.emitter.on('some_event', mock.Mock())
+        self.emitter.enable_listener_stats()
+        self.emitter.emit('some_event')
+
+        self.emitter.disable_listener_stats()
+
+        self.assertIsNone(self.emitter.get_listener_stats())
+
+    @mock.patch('spotify.utils.logger')
+    @mock.patch('spotify.utils._clock')
+    def test_slow_listener_is_logged(self, clock_mock, logger_mock):
+        clock_mock.side_effect = [1.0, 1.1, 2.0, 3.0]
+        self.emitter.on('some_event', Listener().on_event)
+        self.emitter.enable_listener_stats(slow_threshold=0.5)
+
+        self.emitter.emit('some_event')
+        self.assertEqual(logger_mock.warning.call_count, 0)
+
+        self.emitter.emit('some_event')
+        logger_mock.warning.assert_called_once_with(
+            mock.ANY, 'tests.test_utils.Listener.on_event', 'some_event', 1.0)
+
+    @mock.patch('spotify.utils.logger')
+    @mock.patch('spotify.utils._clock')
+    def test_slow_listener_hook_is_called(self, clock_mock, logger_mock):
+        clock_mock.side_effect = [1.0, 3.0]
+        hook_mock = mock.Mock()
+        self.emitter.on('some_event', Listener().on_event)
+        self.emitter.enable_listener_stats(
+            slow_threshold=0.5, slow_listener_hook=hook_mock)
+
+        self.emitter.emit('some_event')
+
+        hook_mock.assert_called_once_with(
+            self.emitter, 'some_event', 'tests.test_utils.Listener.on_event',
+            2.0)
+        self.assertEqual(logger_mock.warning.call_count, 0)
+
+    def test_callback_name_of_function(self):
+        def on_event():
+            pass
+
+        name = utils._get_callback_name(on_event)
+
+        self.assertTrue(name.startswith('tests.test_utils.'))
+        self.assertTrue(name.endswith('on_event'))
+
+    def test_callback_name_of_other_callable(self):
+        callback = mock.Mock(spec=[])
+
+        self.assertEqual(utils._get_callback_name(callback), repr(callback))
+
+
+class DeferredEventsTest(unittest.TestCase):
+
+    def tearDown(self):
+        utils.defer_events(None)
+
+    def test_emit_is_deferred_while_deferring_events(self):
+        listener_mock = mock.Mock()
+        emitter = utils.EventEmitter()
+        emitter.on('some_event', listener_mock, 'user_arg')
+        events = []
+        utils.defer_events(events)
+
+        emitter.emit('some_event', 'abc')
+
+        self.assertEqual(listener_mock.call_count, 0)
+        self.assertEqual(events, [(emitter, 'some_event', ('abc',))])
+
+    def test_defer_events_returns_previous_queue(self):
+        events = []
+
+        self.assertIsNone(utils.defer_events(events))
+        self.assertIs(utils.defer_events(None), events)
+
+    def test_emit_from_other_thread_is_not_deferred(self):
+        listener_mock = mock.Mock()
+        emitter = utils.EventEmitter()
+        emitter.on('some_event', listener_mock)
+        events = []
+        utils.defer_events(events)
+
+        thread = threading.Thread(
+            target=emitter.emit, args=('some_event', 'abc'))
+        thread.start()
+        thread.join()
+
+        listener_mock.assert_called_once_with('abc')
+        self.assertEqual(events, [])
+
+    def test_deliver_events_in_emitted_order_across_emitters(self):
+        calls = []
+        emitter1 = utils.EventEmitter()
+        emitter1.on('foo', lambda *args: calls.append(('foo',) + args))
+        emitter2 = utils.EventEmitter()
+        emitter2.on('bar', lambda *args: calls.append(('bar',) + args), 9)
+        events = []
+        utils.defer_events(events)
+        emitter1.emit('foo', 1)
+        emitter2.emit('bar', 2)
+        emitter1.emit('foo', 3)
+        utils.defer_events(None)
+
+        utils.deliver_events(events)
+
+        self.assertEqual(calls, [('foo', 1), ('bar', 2, 9), ('foo', 3)])
+
+    @mock.patch('spotify.utils.logger')
+    def test_deliver_events_continues_if_listener_fails(self, logger_mock):
+        listener_mock = mock.Mock()
+        emitter = utils.EventEmitter()
+        emitter.on('fails', mock.Mock(side_effect=Exception('boom')))
+        emitter.on('works', listener_mock)
+
+        utils.deliver_events(
+            [(emitter, 'fails', ()), (emitter, 'works', ('abc',))])
+
+        listener_mock.assert_called_once_with('abc')
+        self.assertEqual(logger_mock.exception.call_count, 1)
+
+
 class IntEnumTest(unittest.TestCase):
 
     def setUp(self):
@@ -178,6 +649,148 @@ class IntEnumTest(unittest.TestCase):
         self.assertIsNot(self.Foo(1), self.Foo.baz)
 
 
+class GetLibConstantsTest(unittest.TestCase):
+
+    def test_gets_constants_with_prefix(self):
+        constants = utils.get_lib_constants('SP_ALBUMTYPE_')
+
+        self.assertIn(('SP_ALBUMTYPE_ALBUM', 0), constants)
+        self.assertIn(('SP_ALBUMTYPE_SINGLE', 1), constants)
+        self.assertTrue(all(
+            name.startswith('SP_ALBUMTYPE_') for name, _ in constants))
+
+
+class MakeEnumTest(unittest.TestCase):
+
+    def test_adds_constants_with_prefix(self):
+
+        @utils.make_enum('SP_ALBUMTYPE_', 'TYPE_')
+        class Foo(utils.IntEnum):
+            pass
+
+        self.assertEqual(Foo.TYPE_ALBUM, 0)
+        self.assertEqual(repr(Foo.TYPE_SINGLE), '<Foo.TYPE_SINGLE: 1>')
+
+
+class MemoizedTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = tests.create_session()
+        self.session.memoize_metadata = True
+        self.getter = mock.Mock()
+
+        class Wrapper(object):
+            is_loaded = True
+
+            def __init__(self, session):
+                self._session = session
+                self._memo = None
+
+            @property
+            @utils.memoized
+            def name(wrapper):
+                return self.getter()
+
+            @property
+            @utils.memoized(mutable=True)
+            def starred(wrapper):
+                return self.getter()
+
+        self.obj = Wrapper(self.session)
+
+    def test_value_is_only_read_once(self):
+        self.getter.side_effect = ['Foo', 'Bar']
+
+        self.assertEqual(self.obj.name, 'Foo')
+        self.assertEqual(self.obj.name, 'Foo')
+        self.assertEqual(self.getter.call_count, 1)
+
+    def test_value_is_not_memoized_if_disabled(self):
+        self.session.memoize_metadata = False
+        self.getter.side_effect = ['Foo', 'Bar']
+
+        self.assertEqual(self.obj.name, 'Foo')
+        self.assertEqual(self.obj.name, 'Bar')
+        self.assertIsNone(self.obj._memo)
+
+    def test_value_is_not_memoized_until_loaded(self):
+        self.obj.is_loaded = False
+        self.getter.side_effect = [None, 'Foo', 'Bar']
+
+        self.assertIsNone(self.obj.name)
+        self.obj.is_loaded = True
+        self.assertEqual(self.obj.name, 'Foo')
+        self.assertEqual(self.obj.name, 'Foo')
+
+    def test_mutable_value_is_read_again_after_metadata_updated(self):
+        self.getter.side_effect = [True, False]
+
+        self.assertIs(self.obj.starred, True)
+        self.assertIs(self.obj.starred, True)
+        self.session._metadata_generation += 1
+        self.assertIs(self.obj.starred, False)
+        self.assertEqual(self.getter.call_count, 2)
+
+    def test_immutable_value_is_kept_after_metadata_updated(self):
+        self.getter.side_effect = ['Foo', 'Bar']
+
+        self.assertEqual(self.obj.name, 'Foo')
+        self.session._metadata_generation += 1
+        self.assertEqual(self.obj.name, 'Foo')
+
+
+class RequestFutureTest(unittest.TestCase):
+
+    def setUp(self):
+        self.request = mock.Mock()
+        self.request.error = spotify.ErrorType.OK
+        self.request.future = utils.create_request_future(self.request)
+
+    def test_future_is_running_and_cannot_be_cancelled(self):
+        self.assertTrue(self.request.future.running())
+        self.assertFalse(self.request.future.cancel())
+
+    def test_future_keeps_request_alive_until_done(self):
+        future = self.request.future
+
+        self.assertIs(future._request, self.request)
+
+        utils.complete_request_future(self.request)
+
+        self.assertFalse(hasattr(future, '_request'))
+
+    def test_complete_sets_request_as_result(self):
+        utils.complete_request_future(self.request)
+
+        self.assertIs(self.request.future.result(timeout=0), self.request)
+
+    def test_complete_sets_error_as_exception(self):
+        self.request.error = spotify.ErrorType.OTHER_PERMANENT
+
+        utils.complete_request_future(self.request)
+
+        exc = self.request.future.exception(timeout=0)
+        self.assertIsInstance(exc, spotify.LibError)
+        self.assertEqual(exc.error_type, spotify.ErrorType.OTHER_PERMANENT)
+
+    def test_complete_twice_is_ignored(self):
+        utils.complete_request_future(self.request)
+        self.request.error = spotify.ErrorType.OTHER_PERMANENT
+
+        utils.complete_request_future(self.request)
+
+        self.assertIs(self.request.future.result(timeout=0), self.request)
+
+    @mock.patch('spotify.utils.concurrent', None)
+    def test_future_is_none_if_concurrent_futures_is_unavailable(self):
+        request = mock.Mock()
+        request.future = utils.create_request_future(request)
+
+        self.assertIsNone(request.future)
+
+        utils.complete_request_future(request)  # Does not fail
+
+
 @mock.patch('spotify.search.lib', spec=spotify.lib)
 class SequenceTest(unittest.TestCase):
 